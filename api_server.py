@@ -3,131 +3,24 @@
 Simple Flask API server for the Wordle game.
 
 This server provides REST API endpoints for the web interface to communicate with.
+The app is built by the shared factory in src/server/app.py, which loads the
+word list and warms its caches once before the server starts.
 """
 
-from flask import Flask, request, jsonify
-from flask_cors import CORS
 import sys
 import os
 
-# Change to src directory and add to path
-os.chdir(os.path.join(os.path.dirname(__file__), 'src'))
-sys.path.insert(0, os.getcwd())
+# Make the src package importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from game_modes.single_player import SinglePlayerGame
-from game_modes.cheating_host import CheatingHostGame
-from utils.word_loader import get_default_word_list
+from src.server.app import create_app, serve_app
 
-app = Flask(__name__)
-CORS(app)
-
-# Global game instances
-games = {}
-
-@app.route('/api/game/start', methods=['POST'])
-def start_game():
-    """Start a new game."""
-    try:
-        data = request.get_json() or {}
-        game_mode = data.get('mode', 'single')
-        session_id = data.get('session_id', f'session_{len(games)}')
-        
-        # Load word list
-        word_list = get_default_word_list()
-        
-        # Create game based on mode
-        if game_mode == 'single':
-            game = SinglePlayerGame(word_list, max_rounds=6)
-        elif game_mode == 'cheating':
-            game = CheatingHostGame(word_list, max_rounds=6)
-        else:
-            return jsonify({'error': 'Invalid game mode'}), 400
-        
-        # Start the game
-        game.start_game()
-        
-        # Store the game
-        games[session_id] = {
-            'game': game,
-            'mode': game_mode
-        }
-        
-        return jsonify({
-            'success': True,
-            'session_id': session_id,
-            'game_state': game.get_game_state()
-        })
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/game/guess', methods=['POST'])
-def make_guess():
-    """Make a guess in the game."""
-    try:
-        data = request.get_json()
-        if not data:
-            return jsonify({'error': 'No data provided'}), 400
-        
-        session_id = data.get('session_id')
-        guess = data.get('guess')
-        
-        if not session_id or not guess:
-            return jsonify({'error': 'Missing session_id or guess'}), 400
-        
-        if session_id not in games:
-            return jsonify({'error': 'Game not found'}), 404
-        
-        game = games[session_id]['game']
-        result = game.make_guess(guess)
-        
-        return jsonify({
-            'success': True,
-            'result': result,
-            'game_state': game.get_game_state()
-        })
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/game/state/<session_id>', methods=['GET'])
-def get_game_state(session_id):
-    """Get the current game state."""
-    try:
-        if session_id not in games:
-            return jsonify({'error': 'Game not found'}), 404
-        
-        game = games[session_id]['game']
-        return jsonify(game.get_game_state())
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/game/reset/<session_id>', methods=['POST'])
-def reset_game(session_id):
-    """Reset a game."""
-    try:
-        if session_id not in games:
-            return jsonify({'error': 'Game not found'}), 404
-        
-        game = games[session_id]['game']
-        game.start_game()
-        
-        return jsonify({
-            'success': True,
-            'game_state': game.get_game_state()
-        })
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/health', methods=['GET'])
-def health_check():
-    """Health check endpoint."""
-    return jsonify({
-        'status': 'healthy',
-        'active_games': len(games)
-    })
+# Set WORDLE_SNAPSHOT to keep games in progress across restarts, and
+# WORDLE_TOKEN_SECRET to sign player tokens with a key of your own
+app = create_app({
+    'SNAPSHOT_PATH': os.environ.get('WORDLE_SNAPSHOT'),
+    'PLAYER_TOKEN_SECRET': os.environ.get('WORDLE_TOKEN_SECRET')
+})
 
 if __name__ == '__main__':
     print("🚀 Starting Wordle API Server on http://localhost:5001")
@@ -136,6 +29,12 @@ if __name__ == '__main__':
     print("   POST /api/game/guess - Make a guess")
     print("   GET  /api/game/state/<session_id> - Get game state")
     print("   POST /api/game/reset/<session_id> - Reset game")
+    print("   GET  /api/events/session/<session_id> - Stream game updates (SSE)")
     print("   GET  /api/health - Health check")
+    print("   GET  /metrics - Prometheus metrics")
     
-    app.run(host='0.0.0.0', port=5001, debug=True) 
\ No newline at end of file
+    if '--debug' in sys.argv:
+        # Development server with the debugger and reloader
+        app.run(host='0.0.0.0', port=5001, debug=True)
+    else:
+        serve_app(app, '0.0.0.0', 5001)
@@ -10,6 +10,13 @@ This module contains the fundamental game logic for Wordle, including:
 from typing import List, Tuple, Optional, Dict
 from enum import Enum
 import random
+from ..utils.metrics import REGISTRY
+from ..utils.lexicon import as_lexicon
+
+
+GUESSES_SCORED = REGISTRY.counter(
+    'wordle_guesses_scored_total', 'Player guesses scored by the game engine'
+)
 
 
 class LetterResult(Enum):
@@ -19,6 +26,136 @@ class LetterResult(Enum):
     MISS = "miss"    # Letter is not in word (gray)
 
 
+# Base-3 digit for each letter result, used to pack a result into a pattern code
+_RESULT_DIGITS = {
+    LetterResult.MISS: 0,
+    LetterResult.PRESENT: 1,
+    LetterResult.HIT: 2
+}
+_DIGIT_RESULTS = (LetterResult.MISS, LetterResult.PRESENT, LetterResult.HIT)
+
+
+def encode_result(result: List[LetterResult]) -> int:
+    """
+    Pack a guess result into a single pattern code.
+    
+    The code is the base-3 number sum(digit_i * 3**i), where position 0 is
+    the least significant digit and MISS=0, PRESENT=1, HIT=2. A 5-letter
+    result therefore maps to 0..242 (242 means all hits).
+    
+    Args:
+        result: List of LetterResult for each position
+    
+    Returns:
+        Integer pattern code
+    """
+    code = 0
+    for letter_result in reversed(result):
+        code = code * 3 + _RESULT_DIGITS[letter_result]
+    return code
+
+
+def decode_result(code: int, length: int = 5) -> List[LetterResult]:
+    """
+    Unpack a pattern code produced by encode_result.
+    
+    Args:
+        code: Integer pattern code
+        length: Number of letter positions
+    
+    Returns:
+        List of LetterResult for each position
+    """
+    result = []
+    for _ in range(length):
+        code, digit = divmod(code, 3)
+        result.append(_DIGIT_RESULTS[digit])
+    return result
+
+
+def score_guess(guess: str, answer: str) -> List[LetterResult]:
+    """
+    Score a guess against an answer.
+    
+    This implements the exact Wordle scoring logic:
+    1. First pass: Mark all hits (correct letter, correct position) and
+       count the answer letters that were not hit
+    2. Second pass: Mark presents (correct letter, wrong position) while
+       unhit copies of the letter remain
+    3. Remaining letters are misses
+    
+    Args:
+        guess: The guessed word
+        answer: The word being guessed
+    
+    Returns:
+        List of LetterResult for each position
+    """
+    if guess == answer:
+        return [LetterResult.HIT] * 5
+    
+    result = [LetterResult.MISS] * 5
+    unmatched = {}
+    
+    # First pass: Mark hits
+    for i in range(5):
+        letter = answer[i]
+        if guess[i] == letter:
+            result[i] = LetterResult.HIT
+        else:
+            unmatched[letter] = unmatched.get(letter, 0) + 1
+    
+    # Second pass: Mark presents
+    for i in range(5):
+        if result[i] is LetterResult.MISS:
+            remaining = unmatched.get(guess[i])
+            if remaining:
+                result[i] = LetterResult.PRESENT
+                unmatched[guess[i]] = remaining - 1
+    
+    return result
+
+
+# Place value of each position in a pattern code
+_POWERS = (1, 3, 9, 27, 81)
+
+
+def score_code(guess: str, answer: str) -> int:
+    """
+    Score a guess against an answer straight to its pattern code.
+    
+    Equal to ``encode_result(score_guess(guess, answer))`` without building
+    the result list, for solvers that score many pairs.
+    
+    Args:
+        guess: The guessed word
+        answer: The word being guessed
+    
+    Returns:
+        Integer pattern code
+    """
+    if guess == answer:
+        return 242
+    
+    code = 0
+    unmatched = {}
+    missed = []
+    for i in range(5):
+        letter = answer[i]
+        if guess[i] == letter:
+            code += 2 * _POWERS[i]
+        else:
+            unmatched[letter] = unmatched.get(letter, 0) + 1
+            missed.append(i)
+    
+    for i in missed:
+        remaining = unmatched.get(guess[i])
+        if remaining:
+            code += _POWERS[i]
+            unmatched[guess[i]] = remaining - 1
+    return code
+
+
 class GameState(Enum):
     """Enumeration for game states."""
     PLAYING = "playing"
@@ -39,28 +176,18 @@ class WordleGame:
         Initialize a new Wordle game.
         
         Args:
-            word_list: List of valid 5-letter words
+            word_list: List of valid 5-letter words, or a shared Lexicon
+                (which skips re-validating the words)
             max_rounds: Maximum number of guessing rounds (default: 6)
         """
-        self.word_list = [word.upper() for word in word_list]
+        self.lexicon = as_lexicon(word_list)
+        self.word_list = self.lexicon.words
         self.max_rounds = max_rounds
         self.answer = None
         self.current_round = 0
         self.guesses = []
         self.results = []
         self.game_state = GameState.PLAYING
-        
-        # Validate word list
-        self._validate_word_list()
-    
-    def _validate_word_list(self) -> None:
-        """Validate that all words in the word list are 5 letters and alphabetic."""
-        if not self.word_list:
-            raise ValueError("Word list cannot be empty")
-        
-        for word in self.word_list:
-            if not word.isalpha() or len(word) != 5:
-                raise ValueError(f"Invalid word in word list: {word}")
     
     def start_new_game(self, answer: Optional[str] = None) -> None:
         """
@@ -71,7 +198,7 @@ class WordleGame:
         """
         if answer is not None:
             answer = answer.upper()
-            if answer not in self.word_list:
+            if answer not in self.lexicon.word_set:
                 raise ValueError(f"Answer '{answer}' is not in the word list")
             self.answer = answer
         else:
@@ -88,14 +215,14 @@ class WordleGame:
         
         Args:
             guess: The word to validate
-            
+        
         Returns:
             True if the guess is valid, False otherwise
         """
         guess = guess.upper()
         return (len(guess) == 5 and 
                 guess.isalpha() and 
-                guess in self.word_list)
+                guess in self.lexicon.word_set)
     
     def make_guess(self, guess: str) -> Tuple[List[LetterResult], bool]:
         """
@@ -103,10 +230,10 @@ class WordleGame:
         
         Args:
             guess: The word to guess
-            
+        
         Returns:
             Tuple of (letter results, is_correct)
-            
+        
         Raises:
             ValueError: If the guess is invalid
             RuntimeError: If the game is already over
@@ -124,6 +251,7 @@ class WordleGame:
         # Calculate result
         result = self._calculate_result(guess)
         self.results.append(result)
+        GUESSES_SCORED.inc()
         
         # Check if guess is correct
         is_correct = guess == self.answer
@@ -138,39 +266,15 @@ class WordleGame:
     
     def _calculate_result(self, guess: str) -> List[LetterResult]:
         """
-        Calculate the result for a guess.
-        
-        This implements the exact Wordle scoring logic:
-        1. First pass: Mark all hits (correct letter, correct position)
-        2. Second pass: Mark presents (correct letter, wrong position)
-        3. Remaining letters are misses
+        Calculate the result for a guess against the current answer.
         
         Args:
             guess: The guessed word
-            
+        
         Returns:
             List of LetterResult for each position
         """
-        result = [LetterResult.MISS] * 5
-        answer_letters = list(self.answer)
-        guess_letters = list(guess)
-        
-        # First pass: Mark hits
-        for i in range(5):
-            if guess_letters[i] == answer_letters[i]:
-                result[i] = LetterResult.HIT
-                answer_letters[i] = None  # Mark as used
-                guess_letters[i] = None   # Mark as used
-        
-        # Second pass: Mark presents
-        for i in range(5):
-            if guess_letters[i] is not None:
-                if guess_letters[i] in answer_letters:
-                    result[i] = LetterResult.PRESENT
-                    # Remove the first occurrence from answer
-                    answer_letters[answer_letters.index(guess_letters[i])] = None
-        
-        return result
+        return score_guess(guess, self.answer)
     
     def get_game_state(self) -> GameState:
         """Get the current game state."""
@@ -0,0 +1,384 @@
+"""
+Asyncio client for the game API.
+
+This module provides AsyncClientGame, an asyncio counterpart of ClientGame
+with the same start/guess/state/reset methods. Games share an
+AsyncConnectionPool of HTTP/1.1 keep-alive connections, so one process can
+drive thousands of concurrent sessions over a bounded number of sockets:
+    
+    async with AsyncConnectionPool('http://127.0.0.1:8080', max_connections=64) as pool:
+        games = [AsyncClientGame(pool) for _ in range(1000)]
+        await asyncio.gather(*(game.start_game() for game in games))
+        await asyncio.gather(*(game.make_guess('CRANE') for game in games))
+
+The API has no batch endpoints; concurrency comes from pipelining many
+sessions over the pooled connections instead.
+"""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from ..server.sessions import generate_session_id
+
+
+# Errors after which a request may be retried
+_TRANSPORT_ERRORS = (OSError, ConnectionError, asyncio.TimeoutError, asyncio.IncompleteReadError)
+
+# Statuses worth retrying for idempotent requests
+_RETRY_STATUSES = (502, 503, 504)
+
+
+class AsyncHTTPConnection:
+    """
+    Minimal HTTP/1.1 client connection for JSON APIs.
+    
+    The connection is opened lazily, kept alive between requests and
+    reopened after the server closes it.
+    """
+    
+    def __init__(self, host: str, port: int, timeout: float = 30.0):
+        """
+        Initialize the connection.
+        
+        Args:
+            host: Server host
+            port: Server port
+            timeout: Seconds allowed for each request
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+    
+    async def request(self, method: str, path: str,
+                      payload: Optional[Dict[str, Any]] = None) -> Tuple[int, Any]:
+        """
+        Send a request and read the JSON response.
+        
+        Args:
+            method: HTTP method
+            path: Request path
+            payload: JSON body, if any
+        
+        Returns:
+            Tuple of (status code, decoded JSON body or None)
+        """
+        return await asyncio.wait_for(self._request(method, path, payload), self.timeout)
+    
+    async def _request(self, method: str, path: str,
+                       payload: Optional[Dict[str, Any]]) -> Tuple[int, Any]:
+        await self.connect()
+        
+        body = json.dumps(payload).encode() if payload is not None else b''
+        head = (
+            f"{method} {path} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            f"Accept: application/json\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"\r\n"
+        )
+        self._writer.write(head.encode('latin-1') + body)
+        
+        try:
+            status_line = await self._reader.readline()
+            if not status_line:
+                raise ConnectionError("Connection closed by server")
+            status = int(status_line.split()[1])
+            
+            headers = {}
+            while True:
+                line = await self._reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+            
+            if 'content-length' in headers:
+                data = await self._reader.readexactly(int(headers['content-length']))
+            elif headers.get('transfer-encoding') == 'chunked':
+                data = await self._read_chunked()
+            else:
+                data = await self._reader.read()
+                headers['connection'] = 'close'
+        except BaseException:
+            await self.close()
+            raise
+        
+        if headers.get('connection', '').lower() == 'close':
+            await self.close()
+        
+        if data and headers.get('content-type', '').startswith('application/json'):
+            return status, json.loads(data)
+        return status, None
+    
+    async def _read_chunked(self) -> bytes:
+        chunks = []
+        while True:
+            size = int((await self._reader.readline()).split(b';')[0], 16)
+            if size == 0:
+                await self._reader.readline()
+                return b''.join(chunks)
+            chunks.append(await self._reader.readexactly(size))
+            await self._reader.readline()
+    
+    def is_stale(self) -> bool:
+        """Check whether the server has closed the idle connection."""
+        return self._reader is not None and self._reader.at_eof()
+    
+    async def connect(self) -> None:
+        """Open the connection if it is not open yet."""
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.timeout
+            )
+    
+    async def close(self) -> None:
+        """Close the connection if it is open."""
+        writer, self._reader, self._writer = self._writer, None, None
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+
+class AsyncConnectionPool:
+    """
+    Bounded pool of keep-alive connections to one game server.
+    
+    At most ``max_connections`` requests are in flight; further requests
+    wait for a free connection. Failed connection attempts are retried for
+    every request; GET requests are also retried after transport errors and
+    on 502/503/504 responses. Other requests are never sent twice.
+    """
+    
+    def __init__(self, url: str, max_connections: int = 100, timeout: float = 10.0,
+                 retries: int = 3, backoff: float = 0.2):
+        """
+        Initialize the pool (connections are opened on demand).
+        
+        Args:
+            url: Server base URL, e.g. http://127.0.0.1:8080
+            max_connections: Connections kept open to the server
+            timeout: Seconds allowed for connecting and for each request
+            retries: Retry attempts per request (0 disables retries)
+            backoff: Base delay in seconds, doubled after each retry
+        """
+        parts = urlsplit(url)
+        if parts.scheme != 'http':
+            raise ValueError(f"Unsupported URL scheme: {parts.scheme!r}")
+        self.host = parts.hostname or '127.0.0.1'
+        self.port = parts.port or 80
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self._idle: List[AsyncHTTPConnection] = []
+        self._slots = asyncio.Semaphore(max_connections)
+    
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[AsyncHTTPConnection]:
+        """Borrow a connection, waiting for one if all are busy."""
+        async with self._slots:
+            conn = self._idle.pop() if self._idle else AsyncHTTPConnection(
+                self.host, self.port, self.timeout
+            )
+            if conn.is_stale():
+                await conn.close()
+            try:
+                yield conn
+            finally:
+                self._idle.append(conn)
+    
+    async def request(self, method: str, path: str,
+                      payload: Optional[Dict[str, Any]] = None) -> Tuple[int, Any]:
+        """
+        Send a request over a pooled connection.
+        
+        Args:
+            method: HTTP method
+            path: Request path
+            payload: JSON body, if any
+        
+        Returns:
+            Tuple of (status code, decoded JSON body or None)
+        
+        Raises:
+            OSError, asyncio.TimeoutError: If the request failed after all retries
+        """
+        idempotent = method in ('GET', 'HEAD')
+        attempt = 0
+        while True:
+            sent = False
+            try:
+                async with self.connection() as conn:
+                    await conn.connect()
+                    sent = True
+                    status, body = await conn.request(method, path, payload)
+                if not (idempotent and status in _RETRY_STATUSES and attempt < self.retries):
+                    return status, body
+            except _TRANSPORT_ERRORS:
+                if attempt >= self.retries or (sent and not idempotent):
+                    raise
+            await asyncio.sleep(self.backoff * (2 ** attempt))
+            attempt += 1
+    
+    async def close(self) -> None:
+        """Close all idle connections."""
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            await conn.close()
+    
+    async def __aenter__(self) -> 'AsyncConnectionPool':
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+class AsyncClientGame:
+    """
+    Asyncio client-side game, mirroring ClientGame.
+    
+    Each instance plays one session; any number of instances can share a
+    pool.
+    """
+    
+    def __init__(self, pool: AsyncConnectionPool, max_rounds: int = 6):
+        """
+        Initialize the client game.
+        
+        Args:
+            pool: Connection pool to the server
+            max_rounds: Maximum number of guessing rounds
+        """
+        self.pool = pool
+        self.max_rounds = max_rounds
+        self.session_id: Optional[str] = None
+        self.game_state: Dict[str, Any] = {
+            'game_state': 'waiting',
+            'current_round': 0,
+            'max_rounds': max_rounds,
+            'remaining_rounds': max_rounds,
+            'guesses': [],
+            'results': [],
+            'answer': None,
+            'is_game_over': False
+        }
+    
+    async def _make_request(self, endpoint: str, method: str = 'GET', data: Dict = None) -> Dict:
+        """
+        Make a request to the server.
+        
+        Args:
+            endpoint: API endpoint
+            method: HTTP method
+            data: Request data
+        
+        Returns:
+            Response data
+        
+        Raises:
+            RuntimeError: If the server cannot be reached or answers with an error status
+        """
+        if method not in ('GET', 'POST'):
+            raise ValueError(f"Unsupported method: {method}")
+        
+        try:
+            status, body = await self.pool.request(method, endpoint, data)
+        except _TRANSPORT_ERRORS as e:
+            raise RuntimeError(f"Server communication error: {e!r}")
+        
+        if status >= 400:
+            error = body.get('error') if isinstance(body, dict) else None
+            raise RuntimeError(f"Server communication error: HTTP {status}: {error}")
+        return body
+    
+    async def start_game(self, mode: str = 'single', session_id: str = None) -> None:
+        """
+        Start a new game on the server.
+        
+        Args:
+            mode: Game mode ('single', 'daily' or 'cheating')
+            session_id: Optional session ID to reuse
+        """
+        self.session_id = session_id or generate_session_id('client')
+        
+        response = await self._make_request('/api/game/start', 'POST', {
+            'session_id': self.session_id,
+            'mode': mode
+        })
+        
+        self.session_id = response['session_id']
+        self.game_state = response['game_state']
+    
+    async def make_guess(self, guess: str) -> Dict[str, Any]:
+        """
+        Make a guess by sending it to the server.
+        
+        Args:
+            guess: The word to guess
+        
+        Returns:
+            Dictionary containing the result of the guess
+        """
+        if not self.session_id:
+            raise RuntimeError("No active game session. Call start_game() first.")
+        
+        response = await self._make_request('/api/game/guess', 'POST', {
+            'session_id': self.session_id,
+            'guess': guess
+        })
+        
+        self.game_state = response['game_state']
+        return response['result']
+    
+    async def get_game_state(self) -> Dict[str, Any]:
+        """
+        Get the current game state from the server.
+        
+        Returns:
+            Dictionary containing the current game state (the cached state
+            if the server is unavailable)
+        """
+        if not self.session_id:
+            return self.game_state
+        
+        try:
+            self.game_state = await self._make_request(f'/api/game/state/{self.session_id}')
+        except RuntimeError:
+            pass
+        return self.game_state
+    
+    async def reset_game(self) -> None:
+        """Reset the game on the server."""
+        if not self.session_id:
+            raise RuntimeError("No active game session.")
+        
+        response = await self._make_request(f'/api/game/reset/{self.session_id}', 'POST')
+        self.game_state = response['game_state']
+    
+    def is_game_over(self) -> bool:
+        """
+        Check if the game is over.
+        
+        Returns:
+            True if the game is over, False otherwise
+        """
+        return self.game_state.get('is_game_over', False)
+    
+    def get_winner(self) -> Optional[str]:
+        """
+        Get the winner of the game.
+        
+        Returns:
+            Winner identifier or None if no winner
+        """
+        if self.game_state.get('game_state') == 'won':
+            return 'Player'
+        return None
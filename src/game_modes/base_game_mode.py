@@ -8,6 +8,7 @@ ensuring a consistent interface across different implementations.
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
 from ..core.game_engine import WordleGame, LetterResult, GameState
+from ..utils.lexicon import as_lexicon
 
 
 class BaseGameMode(ABC):
@@ -23,12 +24,27 @@ class BaseGameMode(ABC):
         Initialize the game mode.
         
         Args:
-            word_list: List of valid 5-letter words
+            word_list: List of valid 5-letter words, or a shared Lexicon
             max_rounds: Maximum number of guessing rounds
         """
         self.word_list = word_list
+        self.lexicon = as_lexicon(word_list)
         self.max_rounds = max_rounds
-        self.game = WordleGame(word_list, max_rounds)
+        self.game = WordleGame(self.lexicon, max_rounds)
+        
+        # Monotonically increasing version, bumped on every state change
+        self.state_version = 0
+        # Version at which the current guess history started
+        self._history_version = 0
+    
+    def _mark_new_game(self) -> None:
+        """Record that a new game started and the guess history was cleared."""
+        self.state_version += 1
+        self._history_version = self.state_version
+    
+    def _mark_guess(self) -> None:
+        """Record that a guess was added to the history."""
+        self.state_version += 1
     
     @abstractmethod
     def start_game(self, **kwargs) -> None:
@@ -48,7 +64,7 @@ class BaseGameMode(ABC):
         Args:
             guess: The word to guess
             **kwargs: Additional arguments specific to the game mode
-            
+        
         Returns:
             Dictionary containing the result of the guess
         """
@@ -84,13 +100,56 @@ class BaseGameMode(ABC):
         """
         pass
     
+    def get_state_delta(self, since: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the changes made after a given state version.
+        
+        Each guess bumps the version by one, so the guesses made after
+        version ``since`` are a slice of the history rather than a copy of it.
+        
+        Args:
+            since: State version the caller already has
+        
+        Returns:
+            Dictionary with the new guesses, results and counters, or None
+            if the history was reset after ``since`` and a full state is needed
+        """
+        if since < self._history_version or since > self.state_version:
+            return None
+        
+        start = since - self._history_version
+        delta = {
+            'since': since,
+            'guesses': self.game.guesses[start:],
+            'results': self.game.results[start:]
+        }
+        delta.update(self.get_state_summary())
+        return delta
+    
+    def get_state_summary(self) -> Dict[str, Any]:
+        """
+        Get the game's counters without its guess history.
+        
+        Returns:
+            Dictionary with the state version, game state, round counters,
+            whether the game is over and the answer once it is
+        """
+        return {
+            'state_version': self.state_version,
+            'game_state': self.game.get_game_state().value,
+            'current_round': self.game.get_current_round(),
+            'remaining_rounds': self.game.get_remaining_rounds(),
+            'answer': self.game.get_answer(),
+            'is_game_over': self.game.is_game_over()
+        }
+    
     def validate_guess(self, guess: str) -> bool:
         """
         Validate a guess.
         
         Args:
             guess: The word to validate
-            
+        
         Returns:
             True if the guess is valid, False otherwise
         """
@@ -0,0 +1,415 @@
+"""
+Bot players for multiplayer rooms.
+
+This module provides the BotPool, which plays MultiplayerGame rooms with
+solver-driven bots: each bot joins through ``add_player``, waits a
+randomized think time and submits a word through ``make_guess``, chosen
+from the answers still consistent with its own results. A skill between 0
+and 1 sets how often a bot plays the most informative candidate rather
+than any consistent word, or an inconsistent word as a careless human
+would.
+
+Bots are cheap enough to run tens of thousands in one process. A bot is
+a small record with no thread of its own; its think time is a timer on a
+shared TimerWheel. Its surviving candidates are a node in a tree shared
+through the Lexicon: the candidates left after a guess and its result are
+computed once and reused by every bot with the same history, and so is
+each node's most informative guess.
+"""
+
+import random
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .multiplayer import MultiplayerGame
+from ..core.game_engine import GameState, encode_result, score_code
+from ..utils.lexicon import Lexicon
+from ..utils.timer_wheel import Timer, TimerWheel
+
+
+# Children kept per candidates node; beyond it, narrowed sets are computed
+# for the bot that asked and not shared, which bounds the tree's size
+MAX_CHILDREN = 1024
+
+# Pattern rows (one byte per lexicon word) kept per lexicon
+MAX_PATTERN_ROWS = 2048
+
+# Guesses tried, and answers scored against each, when looking for a
+# node's most informative guess
+BEST_GUESS_SAMPLE = 32
+BEST_ANSWER_SAMPLE = 128
+
+
+def _spread(indices: Tuple[int, ...], count: int) -> Tuple[int, ...]:
+    """Pick up to count evenly spaced entries, so a node's choice is deterministic."""
+    if len(indices) <= count:
+        return indices
+    step = len(indices) / count
+    return tuple(indices[int(i * step)] for i in range(count))
+
+
+class Candidates:
+    """
+    Answers consistent with a sequence of guesses and results.
+    
+    Nodes hold lexicon indices, are immutable once built and are shared
+    between bots; see CandidateTree.
+    """
+    
+    __slots__ = ('indices', 'children', 'best')
+    
+    def __init__(self, indices: Tuple[int, ...]):
+        self.indices = indices
+        # guess index * 243 + pattern code -> narrowed node
+        self.children: Dict[int, 'Candidates'] = {}
+        # Index of the most informative guess, once computed
+        self.best: Optional[int] = None
+    
+    def __len__(self) -> int:
+        return len(self.indices)
+
+
+class CandidateTree:
+    """
+    Candidate sets of a lexicon, narrowed once and shared by every bot.
+    
+    Narrowing a large set uses the guess's pattern row, the pattern codes
+    of the guess against every word, computed once per guessed word;
+    small sets are scored directly.
+    """
+    
+    def __init__(self, lexicon: Lexicon):
+        """
+        Initialize the tree.
+        
+        Args:
+            lexicon: Lexicon whose words are the possible answers
+        """
+        self.lexicon = lexicon
+        self.words = lexicon.words
+        self.index = {word: i for i, word in enumerate(self.words)}
+        self.root = Candidates(tuple(range(len(self.words))))
+        self._rows: Dict[int, bytes] = {}
+    
+    def row(self, guess: int) -> bytes:
+        """
+        Get the pattern codes of a guess against every word.
+        
+        Args:
+            guess: Lexicon index of the guess
+        
+        Returns:
+            One pattern code per lexicon word
+        """
+        row = self._rows.get(guess)
+        if row is None:
+            word = self.words[guess]
+            row = bytes([score_code(word, answer) for answer in self.words])
+            if len(self._rows) < MAX_PATTERN_ROWS:
+                self._rows[guess] = row
+        return row
+    
+    def narrow(self, node: Candidates, guess: str, pattern: int) -> Candidates:
+        """
+        Get the candidates left after a guess scored with a pattern.
+        
+        Args:
+            node: Candidates before the guess
+            guess: Guessed word, from the lexicon
+            pattern: Result as an encode_result code
+        
+        Returns:
+            Narrowed node (node itself if nothing was ruled out)
+        """
+        g = self.index[guess]
+        key = g * 243 + pattern
+        child = node.children.get(key)
+        if child is not None:
+            return child
+        
+        if g in self._rows or len(node) * 4 >= len(self.words):
+            row = self.row(g)
+            indices = tuple([i for i in node.indices if row[i] == pattern])
+        else:
+            words = self.words
+            indices = tuple([i for i in node.indices if score_code(guess, words[i]) == pattern])
+        if len(indices) == len(node):
+            return node
+        child = Candidates(indices)
+        if len(node.children) < MAX_CHILDREN:
+            # Another thread may have built the same node; keep the first
+            child = node.children.setdefault(key, child)
+        return child
+    
+    def best_guess(self, node: Candidates) -> str:
+        """
+        Get the candidate that splits the others into the most result patterns.
+        
+        Args:
+            node: Candidates to choose from
+        
+        Returns:
+            Most informative candidate, among an evenly spaced sample
+        """
+        if node.best is None:
+            if len(node) <= 2:
+                node.best = node.indices[0]
+            else:
+                answers = _spread(node.indices, BEST_ANSWER_SAMPLE)
+                node.best = max(_spread(node.indices, BEST_GUESS_SAMPLE),
+                                key=lambda g: self._split(g, answers))
+        return self.words[node.best]
+    
+    def choose(self, node: Candidates, skill: float, rng: random.Random) -> str:
+        """
+        Pick a player's next word.
+        
+        With probability ``skill`` the player plays its candidates' most
+        informative word. Otherwise it plays a random candidate, or half
+        as often as that (at skill 0) a random word that ignores its
+        results, as a careless player might.
+        
+        Args:
+            node: The player's candidates
+            skill: Chance of playing the best guess, 0 to 1
+            rng: Random generator to draw from
+        
+        Returns:
+            Word to guess
+        """
+        if not len(node):
+            node = self.root
+        roll = rng.random()
+        if roll < skill:
+            return self.best_guess(node)
+        if roll < skill + (1.0 - skill) * 2 / 3:
+            return self.words[rng.choice(node.indices)]
+        return rng.choice(self.words)
+    
+    def _split(self, guess: int, answers: Tuple[int, ...]) -> int:
+        """Count the distinct patterns a guess gives against some answers."""
+        row = self._rows.get(guess)
+        if row is not None:
+            return len({row[i] for i in answers})
+        word, words = self.words[guess], self.words
+        return len({score_code(word, words[i]) for i in answers})
+
+
+def candidate_tree(lexicon: Lexicon) -> CandidateTree:
+    """Get the lexicon's shared candidate tree."""
+    return lexicon.table('bot_candidates', lambda: CandidateTree(lexicon))
+
+
+class Bot:
+    """A bot playing one room; see BotPool."""
+    
+    __slots__ = ('player_id', 'room_id', 'room', 'skill', 'think_time', 'node', 'timer')
+    
+    def __init__(self, player_id: str, room_id: str, room: MultiplayerGame, skill: float,
+                 think_time: float, node: Candidates):
+        self.player_id = player_id
+        self.room_id = room_id
+        self.room = room
+        self.skill = skill
+        self.think_time = think_time
+        self.node = node
+        # Pending think-time timer, None while the bot waits for a round
+        self.timer: Optional[Timer] = None
+
+
+class BotPool:
+    """
+    Drives bot players in any number of multiplayer rooms.
+    
+    The pool follows each room with bots through a room listener: when a
+    game starts or a round advances, every bot that still has to guess in
+    the round gets a timer for its think time; when it fires, the bot picks
+    a word and submits it. Timers run on the given wheel, which the caller
+    keeps advancing (``TimerWheel.start``).
+    
+    Guesses are submitted with ``submit(room_id, player_id, word)``, which
+    returns the ``make_guess`` result; by default it calls the room
+    directly. A host that serializes access to its rooms (such as the
+    RoomManager's shard locks) passes its own.
+    """
+    
+    def __init__(self, lexicon: Lexicon, timers: TimerWheel,
+                 submit: Optional[Callable[[str, str, str], Dict[str, Any]]] = None,
+                 seed: Optional[int] = None):
+        """
+        Initialize the pool.
+        
+        Args:
+            lexicon: Lexicon of the rooms the bots play
+            timers: Wheel the bots' think times are scheduled on
+            submit: Function making a bot's guess (defaults to the room's make_guess)
+            seed: Seed for the bots' choices and think times
+        """
+        self.lexicon = lexicon
+        self.timers = timers
+        self.submit = submit or self._make_guess
+        self.tree = candidate_tree(lexicon)
+        # One generator for every bot, not one state per bot
+        self._random = random.Random(seed)
+        # room_id -> {player_id: Bot}
+        self._rooms: Dict[str, Dict[str, Bot]] = {}
+        self._count = 0
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def count(self, room_id: str) -> int:
+        """Get the number of bots in a room."""
+        return len(self._rooms.get(room_id, ()))
+    
+    def is_bot(self, room_id: str, player_id: str) -> bool:
+        """Check whether a room's player is one of the pool's bots."""
+        return player_id in self._rooms.get(room_id, ())
+    
+    def add(self, room_id: str, room: MultiplayerGame, player_id: str,
+            name: Optional[str] = None, skill: float = 0.5,
+            think_time: float = 5.0) -> Dict[str, Any]:
+        """
+        Add a bot to a room as a new player.
+        
+        Args:
+            room_id: Room identifier
+            room: Room to join
+            player_id: The bot's player id
+            name: Display name (defaults to 'Bot <n>')
+            skill: Chance of playing the most informative candidate, 0 to 1
+            think_time: Mean seconds before each guess
+        
+        Returns:
+            The room's join result
+        """
+        self.adopt(room_id, room, player_id, skill, think_time)
+        joined = room.add_player(player_id, name or f'Bot {len(room.players) + 1}')
+        if joined['success']:
+            self._wake(self._rooms[room_id][player_id])
+        else:
+            self.discard(room_id, player_id)
+        return joined
+    
+    def adopt(self, room_id: str, room: MultiplayerGame, player_id: str,
+              skill: float = 0.5, think_time: float = 5.0) -> Bot:
+        """
+        Let the pool play a room's player, who may join right after.
+        
+        Args:
+            room_id: Room identifier
+            room: The player's room
+            player_id: Player to play
+            skill: Chance of playing the most informative candidate, 0 to 1
+            think_time: Mean seconds before each guess
+        
+        Returns:
+            The new bot
+        
+        Raises:
+            ValueError: If skill or think_time is out of range
+        """
+        if not 0.0 <= skill <= 1.0:
+            raise ValueError('skill must be between 0 and 1')
+        if think_time < 0:
+            raise ValueError('think_time cannot be negative')
+        
+        node = self.tree.root
+        player = room.players.get(player_id)
+        if player is not None and room.answer is not None:
+            # A restored bot continues from the results it already has
+            for guess, result in zip(player.guesses, player.results):
+                node = self.tree.narrow(node, guess, encode_result(result))
+        room.set_bot(player_id, skill, think_time)
+        bot = Bot(player_id, room_id, room, skill, think_time, node)
+        with self._lock:
+            bots = self._rooms.get(room_id)
+            if bots is None:
+                bots = self._rooms[room_id] = {}
+                room.add_listener(
+                    lambda event_type, data: self._on_room_event(room_id, event_type, data)
+                )
+            if player_id not in bots:
+                self._count += 1
+            bots[player_id] = bot
+        if player_id in room.players:
+            self._wake(bot)
+        return bot
+    
+    def discard(self, room_id: str, player_id: str) -> None:
+        """Stop playing one bot."""
+        with self._lock:
+            bot = self._rooms.get(room_id, {}).pop(player_id, None)
+            if bot is None:
+                return
+            self._count -= 1
+        bot.room.bots.pop(player_id, None)
+        self._cancel(bot)
+    
+    def discard_room(self, room_id: str) -> None:
+        """Stop playing every bot of a room that was closed."""
+        with self._lock:
+            bots = self._rooms.pop(room_id, None)
+            if not bots:
+                return
+            self._count -= len(bots)
+        for bot in bots.values():
+            self._cancel(bot)
+    
+    def _on_room_event(self, room_id: str, event_type: str, data: Dict[str, Any]) -> None:
+        bots = self._rooms.get(room_id)
+        if not bots:
+            return
+        if event_type == 'game_started':
+            for bot in list(bots.values()):
+                self._cancel(bot)
+                bot.node = self.tree.root
+                self._wake(bot)
+        elif event_type == 'round_advanced':
+            for bot in list(bots.values()):
+                self._wake(bot)
+        elif event_type == 'game_over':
+            for bot in list(bots.values()):
+                self._cancel(bot)
+        elif event_type == 'player_left' and data['player_id'] in bots:
+            self.discard(room_id, data['player_id'])
+    
+    def _wake(self, bot: Bot) -> None:
+        """Schedule a bot's next guess if it has one to make in the current round."""
+        room = bot.room
+        player = room.players.get(bot.player_id)
+        if (bot.timer is not None or player is None or room.answer is None
+                or room.game_state != GameState.PLAYING
+                or len(player.guesses) != room.current_round):
+            return  # Already guessed this round, or eliminated
+        # Humans vary around their usual pace
+        delay = bot.think_time * self._random.uniform(0.5, 1.5)
+        bot.timer = self.timers.schedule(delay, self._act, bot)
+    
+    def _cancel(self, bot: Bot) -> None:
+        timer, bot.timer = bot.timer, None
+        if timer is not None:
+            self.timers.cancel(timer)
+    
+    def _act(self, bot: Bot) -> None:
+        """Timer callback: make a bot's guess after its think time."""
+        bot.timer = None
+        if self._rooms.get(bot.room_id, {}).get(bot.player_id) is not bot:
+            return
+        word = self.tree.choose(bot.node, bot.skill, self._random)
+        result = self.submit(bot.room_id, bot.player_id, word)
+        if result.get('success'):
+            bot.node = self.tree.narrow(bot.node, word, encode_result(result['result']))
+        # Try again if the guess was refused; an eliminated bot stops here
+        self._wake(bot)
+    
+    def _make_guess(self, room_id: str, player_id: str, word: str) -> Dict[str, Any]:
+        bot = self._rooms.get(room_id, {}).get(player_id)
+        if bot is None:
+            return {'success': False, 'error': 'Player not found in game'}
+        return bot.room.make_guess(word, player_id)
+    
+    def room_bots(self, room_id: str) -> List[Bot]:
+        """Get a room's bots."""
+        return list(self._rooms.get(room_id, {}).values())
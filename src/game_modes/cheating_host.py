@@ -6,10 +6,43 @@ The host adapts the answer based on the player's guesses to make the game harder
 """
 
 import random
-from typing import List, Dict, Any, Optional, Set
-from base_game_mode import BaseGameMode
-from core.game_engine import LetterResult, GameState
-from utils.word_loader import filter_words_by_pattern
+from typing import List, Dict, Any, Optional, Set, Tuple
+from .base_game_mode import BaseGameMode
+from ..core.game_engine import WordleGame, LetterResult, GameState, score_guess
+from ..utils.word_loader import filter_words_by_pattern
+from ..utils.metrics import REGISTRY, CacheStats
+from ..utils.lexicon import Lexicon
+
+
+PARTITIONS_COMPUTED = REGISTRY.counter(
+    'wordle_cheating_partitions_total', 'Candidate partitions computed by the cheating host'
+)
+PARTITION_SECONDS = REGISTRY.histogram(
+    'wordle_cheating_partition_seconds', 'Time spent partitioning cheating host candidates'
+)
+FIRST_PARTITION_CACHE = CacheStats(REGISTRY, 'cheating_first_partition')
+
+
+def precompute_first_partitions(lexicon: Lexicon) -> Dict[str, Any]:
+    """
+    Precompute the cheating host's answer for every possible first guess.
+    
+    The first guess is always partitioned against the full lexicon, so its
+    outcome depends only on the guess. The table is stored on the lexicon
+    and shared by every cheating host game built from it.
+    
+    Args:
+        lexicon: Shared lexicon
+        
+    Returns:
+        Table mapping each guess to (worst result, remaining candidates)
+    """
+    table = lexicon.table('cheating_first_partition', dict)
+    probe = CheatingHostGame(lexicon)
+    for guess in lexicon.words:
+        if guess not in table:
+            table[guess] = probe._partition(guess)
+    return table
 
 
 class CheatingHostGame(BaseGameMode):
@@ -32,7 +65,7 @@ class CheatingHostGame(BaseGameMode):
             max_rounds: Maximum number of guessing rounds
         """
         super().__init__(word_list, max_rounds)
-        self.candidate_words = word_list.copy()
+        self.candidate_words = list(self.lexicon.words)
         self.answer = None
         self.player_name = "Player"
     
@@ -44,9 +77,10 @@ class CheatingHostGame(BaseGameMode):
             player_name: Name of the player
         """
         self.player_name = player_name
-        self.candidate_words = self.word_list.copy()
+        self.candidate_words = list(self.lexicon.words)
         self.answer = None
-        self.game = WordleGame(self.word_list, self.max_rounds)
+        self.game = WordleGame(self.lexicon, self.max_rounds)
+        self._mark_new_game()
         # Don't set an answer yet - it will be determined after the first guess
     
     def make_guess(self, guess: str) -> Dict[str, Any]:
@@ -76,6 +110,7 @@ class CheatingHostGame(BaseGameMode):
             
             # Now make the guess with the determined answer
             result, is_correct = self.game.make_guess(guess)
+            self._mark_guess()
             
             return {
                 'success': True,
@@ -105,13 +140,18 @@ class CheatingHostGame(BaseGameMode):
         Args:
             guess: The player's first guess
         """
-        # Calculate the worst possible result for this guess
-        worst_result = self._find_worst_result(guess)
+        # The first guess is partitioned against the full lexicon, so the
+        # outcome can be shared by every game using the same lexicon
+        partitions = self.lexicon.table('cheating_first_partition', dict)
+        cached = partitions.get(guess)
+        if cached is None:
+            FIRST_PARTITION_CACHE.miss()
+            cached = self._partition(guess)
+            partitions[guess] = cached
+        else:
+            FIRST_PARTITION_CACHE.hit()
         
-        # Filter candidates to only include words that could produce this result
-        self.candidate_words = filter_words_by_pattern(
-            self.candidate_words, guess, worst_result
-        )
+        self.candidate_words = list(cached[1])
         
         # Select the answer from remaining candidates
         self.answer = self.candidate_words[0] if self.candidate_words else None
@@ -120,6 +160,25 @@ class CheatingHostGame(BaseGameMode):
             # Start the game with this answer
             self.game.start_new_game(self.answer)
     
+    def _partition(self, guess: str) -> Tuple[List[LetterResult], Tuple[str, ...]]:
+        """
+        Find the worst result for a guess and the candidates consistent with it.
+        
+        Args:
+            guess: The guessed word
+            
+        Returns:
+            Tuple of (worst result, remaining candidate words)
+        """
+        with PARTITION_SECONDS.time():
+            # Calculate the worst possible result for this guess
+            worst_result = self._find_worst_result(guess)
+            
+            # Filter candidates to only include words that could produce this result
+            candidates = filter_words_by_pattern(self.candidate_words, guess, worst_result)
+        PARTITIONS_COMPUTED.inc()
+        return worst_result, tuple(candidates)
+    
     def _find_worst_result(self, guess: str) -> List[LetterResult]:
         """
         Find the worst possible result for a given guess.
@@ -159,25 +218,7 @@ class CheatingHostGame(BaseGameMode):
         Returns:
             List of LetterResult for the guess against this candidate
         """
-        result = [LetterResult.MISS] * 5
-        answer_letters = list(candidate)
-        guess_letters = list(guess)
-        
-        # First pass: Mark hits
-        for i in range(5):
-            if guess_letters[i] == answer_letters[i]:
-                result[i] = LetterResult.HIT
-                answer_letters[i] = None
-                guess_letters[i] = None
-        
-        # Second pass: Mark presents
-        for i in range(5):
-            if guess_letters[i] is not None:
-                if guess_letters[i] in answer_letters:
-                    result[i] = LetterResult.PRESENT
-                    answer_letters[answer_letters.index(guess_letters[i])] = None
-        
-        return result
+        return score_guess(guess, candidate)
     
     def _score_result(self, result: List[LetterResult]) -> int:
         """
@@ -199,6 +240,22 @@ class CheatingHostGame(BaseGameMode):
         # Prioritize hits over presents (hits are worth more)
         return hits * 10 + presents
     
+    def get_state_delta(self, since: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the changes made after a given state version.
+        
+        Args:
+            since: State version the caller already has
+            
+        Returns:
+            Delta dictionary including the candidate count, or None if a full
+            state is needed
+        """
+        delta = super().get_state_delta(since)
+        if delta is not None:
+            delta['candidates_remaining'] = len(self.candidate_words)
+        return delta
+    
     def get_game_state(self) -> Dict[str, Any]:
         """
         Get the current state of the cheating host game.
@@ -216,7 +273,8 @@ class CheatingHostGame(BaseGameMode):
             'answer': self.game.get_answer(),
             'player_name': self.player_name,
             'is_game_over': self.game.is_game_over(),
-            'candidates_remaining': len(self.candidate_words)
+            'candidates_remaining': len(self.candidate_words),
+            'state_version': self.state_version
         }
     
     def is_game_over(self) -> bool:
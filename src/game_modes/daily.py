@@ -0,0 +1,184 @@
+"""
+Daily puzzle Wordle game mode.
+
+This module implements the daily puzzle: every player gets the same answer
+for a given (UTC) day, chosen deterministically from the lexicon. Because
+the answer is shared, the feedback for every valid guess against it is
+computed once per day and each guess becomes a dictionary lookup shared by
+every session playing that day.
+"""
+
+import random
+import threading
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from .single_player import SinglePlayerGame
+from ..core.game_engine import WordleGame, LetterResult, score_guess
+from ..utils.lexicon import Lexicon
+from ..utils.metrics import REGISTRY
+
+
+# Day of puzzle number 0
+DAILY_EPOCH = date(2021, 6, 19)
+
+# Seed of the answer order, so every server picks the same daily answer
+DAILY_SEED = 'wordle-daily'
+
+PUZZLES_BUILT = REGISTRY.counter(
+    'wordle_daily_puzzles_built_total', 'Daily puzzle feedback tables computed'
+)
+
+_puzzles_lock = threading.Lock()
+
+
+def utc_today() -> date:
+    """Get the current UTC date, which decides the daily puzzle."""
+    return datetime.now(timezone.utc).date()
+
+
+class DailyPuzzle:
+    """
+    The answer of one day and the feedback for every valid guess against it.
+    
+    The feedback lists are shared by every game of the day and must not be
+    modified.
+    """
+    
+    def __init__(self, lexicon: Lexicon, day: date):
+        """
+        Choose the day's answer and precompute its feedback table.
+        
+        Args:
+            lexicon: Shared lexicon
+            day: Puzzle date
+        """
+        self.day = day
+        self.number = (day - DAILY_EPOCH).days
+        order = _answer_order(lexicon)
+        self.answer = order[self.number % len(order)]
+        answer = self.answer
+        self.feedback: Dict[str, List[LetterResult]] = {
+            word: score_guess(word, answer) for word in lexicon.words
+        }
+        PUZZLES_BUILT.inc()
+
+
+def _answer_order(lexicon: Lexicon) -> List[str]:
+    """Get the lexicon's words in daily answer order (a fixed shuffle)."""
+    def shuffled() -> List[str]:
+        order = list(lexicon.words)
+        random.Random(DAILY_SEED).shuffle(order)
+        return order
+    
+    return lexicon.table('daily_answer_order', shuffled)
+
+
+def daily_puzzle(lexicon: Lexicon, day: Optional[date] = None,
+                 build_ahead: bool = True) -> DailyPuzzle:
+    """
+    Get the puzzle of a day, building it on first use.
+    
+    Puzzles of yesterday, today and tomorrow are cached on the lexicon;
+    others are built for the caller and dropped. Once today's puzzle is in
+    use tomorrow's is built in the background, so the first games after
+    the rollover find it ready.
+    
+    Args:
+        lexicon: Shared lexicon
+        day: Puzzle date (defaults to today in UTC)
+        build_ahead: Whether today's puzzle starts building tomorrow's
+    
+    Returns:
+        The shared DailyPuzzle
+    """
+    today = utc_today()
+    day = day or today
+    puzzles = lexicon.table('daily_puzzles', dict)
+    puzzle = puzzles.get(day)
+    if puzzle is None:
+        # Built outside the lock so a background build never stalls
+        # requests; a rare duplicate build is discarded
+        built = DailyPuzzle(lexicon, day)
+        yesterday = today - timedelta(days=1)
+        tomorrow = today + timedelta(days=1)
+        with _puzzles_lock:
+            puzzle = puzzles.setdefault(day, built)
+            for stale in [d for d in puzzles if not yesterday <= d <= tomorrow]:
+                del puzzles[stale]
+    
+    tomorrow = today + timedelta(days=1)
+    if build_ahead and day == today and tomorrow not in puzzles:
+        _build_ahead(lexicon, tomorrow)
+    return puzzle
+
+
+def _build_ahead(lexicon: Lexicon, day: date) -> None:
+    """Build a day's puzzle in a background thread, once."""
+    pending = lexicon.table('daily_pending', set)
+    with _puzzles_lock:
+        if day in pending:
+            return
+        pending.add(day)
+    
+    def build() -> None:
+        try:
+            daily_puzzle(lexicon, day, build_ahead=False)
+        finally:
+            with _puzzles_lock:
+                pending.discard(day)
+    
+    threading.Thread(target=build, name='daily-puzzle', daemon=True).start()
+
+
+class _DailyEngine(WordleGame):
+    """Game engine that scores guesses from a daily puzzle's feedback table."""
+    
+    puzzle: Optional[DailyPuzzle] = None
+    
+    def _calculate_result(self, guess: str) -> List[LetterResult]:
+        return self.puzzle.feedback[guess]
+
+
+class DailyGame(SinglePlayerGame):
+    """
+    Daily puzzle Wordle game implementation.
+    
+    Plays like the single player game, except that the answer is the one
+    shared by everyone on the day the game starts.
+    """
+    
+    def __init__(self, word_list: List[str], max_rounds: int = 6):
+        """
+        Initialize the daily puzzle game.
+        
+        Args:
+            word_list: List of valid 5-letter words, or a shared Lexicon
+            max_rounds: Maximum number of guessing rounds
+        """
+        super().__init__(word_list, max_rounds)
+        self.game = _DailyEngine(self.lexicon, max_rounds)
+        self.puzzle: Optional[DailyPuzzle] = None
+    
+    def start_game(self, day: Optional[date] = None, player_name: str = "Player") -> None:
+        """
+        Start the daily puzzle.
+        
+        Args:
+            day: Puzzle date (defaults to today in UTC)
+            player_name: Name of the player
+        """
+        self.puzzle = daily_puzzle(self.lexicon, day)
+        self.game.puzzle = self.puzzle
+        super().start_game(answer=self.puzzle.answer, player_name=player_name)
+    
+    def get_game_state(self) -> Dict[str, Any]:
+        """
+        Get the current state of the daily game.
+        
+        Returns:
+            Dictionary containing the current game state and the puzzle number
+        """
+        state = super().get_game_state()
+        state['puzzle_number'] = self.puzzle.number if self.puzzle else None
+        return state
@@ -7,9 +7,52 @@ Multiple players can compete against each other in real-time.
 
 import time
 import random
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Callable, Tuple
 from .base_game_mode import BaseGameMode
-from ..core.game_engine import WordleGame, GameState, LetterResult
+from ..core.game_engine import WordleGame, GameState, LetterResult, GUESSES_SCORED, score_guess
+from ..utils.ranking import Leaderboard
+
+
+class Player:
+    """
+    One player's record in a multiplayer room.
+    
+    Records are slotted so rooms with thousands of players stay small.
+    Fields can also be read and set by name (``player['score']``), like
+    the dictionaries that held them before.
+    """
+    
+    __slots__ = ('id', 'name', 'guesses', 'results', 'score', 'is_connected',
+                 'last_activity', 'has_won', 'rounds_to_win')
+    
+    def __init__(self, player_id: str, name: str, last_activity: float = 0.0):
+        """
+        Initialize a player who has not guessed yet.
+        
+        Args:
+            player_id: Unique player identifier
+            name: Display name
+            last_activity: Time of the player's last action
+        """
+        self.id = player_id
+        self.name = name
+        self.guesses: List[str] = []
+        self.results: List[List[LetterResult]] = []
+        self.score = 0
+        self.is_connected = True
+        self.last_activity = last_activity
+        self.has_won = False
+        self.rounds_to_win: Optional[int] = None
+    
+    def __getitem__(self, field: str) -> Any:
+        if field not in self.__slots__:
+            raise KeyError(field)
+        return getattr(self, field)
+    
+    def __setitem__(self, field: str, value: Any) -> None:
+        if field not in self.__slots__:
+            raise KeyError(field)
+        setattr(self, field, value)
 
 
 class MultiplayerGame(BaseGameMode):
@@ -20,6 +63,7 @@ class MultiplayerGame(BaseGameMode):
     - Multiple players guess the same word
     - Players can see each other's progress
     - First player to guess correctly wins
+    - A player who lets a round end without guessing is eliminated
     - If no one guesses correctly, player with best score wins
     """
     
@@ -34,13 +78,102 @@ class MultiplayerGame(BaseGameMode):
         """
         super().__init__(word_list, max_rounds)
         self.max_players = max_players
-        self.players = {}  # player_id -> player_data
+        self.players: Dict[str, Player] = {}
+        # Players ranked by score, then fewest guesses, kept up to date on
+        # every change so reading the leaderboard never sorts
+        self.ranking = Leaderboard()
         self.answer = None
         self.game_state = GameState.PLAYING
         self.current_round = 0
         self.round_start_time = None
         self.round_duration = 30  # seconds per round
+        self.listeners: List[Callable[[str, Dict[str, Any]], None]] = []
+        # Source of every timestamp, replaced while a room log is replayed
+        self.clock: Callable[[], float] = time.time
+        # Called as journal(action, time, *arguments) with the inputs of each
+        # change, before listeners hear of it; see set_journal
+        self.journal: Optional[Callable[..., None]] = None
+        # Players who have guessed in the current round, and players who
+        # let an earlier round end without guessing, so the end of a round
+        # is detected without scanning every player
+        self.round_guesses = 0
+        self.eliminated = 0
+        # player_id -> (skill, think_time) of the players a bot plays, kept
+        # with the room so snapshots and logs bring the bots back
+        self.bots: Dict[str, Tuple[float, float]] = {}
+        # guess -> (result, round score) against _memo_answer; in large
+        # rooms many players submit the same word
+        self._result_memo: Dict[str, Tuple[List[LetterResult], int]] = {}
+        self._memo_answer: Optional[str] = None
+        # Room state as of _state_cache['state_version'], its player
+        # summaries in join order, each summary's position, and the players
+        # whose summaries are out of date; see get_game_state
+        self._state_cache: Optional[Dict[str, Any]] = None
+        self._summaries: Optional[List[Dict[str, Any]]] = None
+        self._positions: Dict[str, int] = {}
+        self._stale: Set[str] = set()
+    
+    def _changed(self, *player_ids: str) -> None:
+        """
+        Record a change to the room, invalidating the cached state.
+        
+        Args:
+            *player_ids: Players whose own data changed
+        """
+        self.state_version += 1
+        self._stale.update(player_ids)
+    
+    def add_listener(self, listener: Callable[[str, Dict[str, Any]], None]) -> None:
+        """
+        Register a callback for room events.
+        
+        Listeners are called as ``listener(event_type, data)`` after each
+        change: 'player_joined', 'player_left', 'game_started', 'guess',
+        'round_advanced' and 'game_over'. Event data never includes guessed
+        words or the answer while the game is in progress.
+        
+        Args:
+            listener: Callback to register
+        """
+        self.listeners.append(listener)
+    
+    def set_journal(self, journal: Optional[Callable[..., None]]) -> None:
+        """
+        Record every change to the room with its inputs, for replay.
+        
+        Unlike listener events, journal entries carry guessed words and the
+        answer, so the room can be rebuilt by repeating them: a change is
+        journaled as ``journal(action, time, *arguments)`` with the clock
+        reading it used, once it is known to succeed. The actions are
+        ('join', player_id, player_name), ('leave', player_id),
+        ('start', answer), ('guess', player_id, word, result),
+        ('expire', round_index) and ('bot', player_id, skill, think_time).
+        
+        Args:
+            journal: Callback to record changes with, or None to stop
+        """
+        self.journal = journal
+    
+    def set_bot(self, player_id: str, skill: float, think_time: float) -> None:
+        """
+        Record that a bot plays a player, with the settings it plays with.
         
+        Args:
+            player_id: Player played by the bot (who may join right after)
+            skill: The bot's skill
+            think_time: The bot's mean think time
+        """
+        if self.bots.get(player_id) == (skill, think_time):
+            return
+        if self.journal is not None:
+            self.journal('bot', self.clock(), player_id, skill, think_time)
+        self.bots[player_id] = (skill, think_time)
+    
+    def _notify(self, event_type: str, data: Dict[str, Any]) -> None:
+        """Send an event to all registered listeners."""
+        for listener in self.listeners:
+            listener(event_type, data)
+    
     def add_player(self, player_id: str, player_name: str) -> Dict[str, Any]:
         """
         Add a player to the game.
@@ -48,7 +181,7 @@ class MultiplayerGame(BaseGameMode):
         Args:
             player_id: Unique player identifier
             player_name: Display name for the player
-            
+        
         Returns:
             Dictionary with player info and game state
         """
@@ -64,19 +197,19 @@ class MultiplayerGame(BaseGameMode):
                 'error': f"Player {player_id} is already in the game."
             }
         
-        player_data = {
-            'id': player_id,
-            'name': player_name,
-            'guesses': [],
-            'results': [],
-            'score': 0,
-            'is_connected': True,
-            'last_activity': time.time(),
-            'has_won': False,
-            'rounds_to_win': None
-        }
-        
-        self.players[player_id] = player_data
+        now = self.clock()
+        if self.journal is not None:
+            self.journal('join', now, player_id, player_name)
+        player = self.players[player_id] = Player(player_id, player_name, now)
+        if self._is_eliminated(player):
+            self.eliminated += 1  # Joined after the first round
+        self.ranking.update(player_id, 0, 0)
+        self._changed(player_id)
+        self._notify('player_joined', {
+            'player_id': player_id,
+            'player_name': player_name,
+            'player_count': len(self.players)
+        })
         
         return {
             'success': True,
@@ -92,7 +225,7 @@ class MultiplayerGame(BaseGameMode):
         
         Args:
             player_id: Player identifier to remove
-            
+        
         Returns:
             Dictionary with result info
         """
@@ -102,12 +235,28 @@ class MultiplayerGame(BaseGameMode):
                 'error': f"Player {player_id} not found in game."
             }
         
-        player_name = self.players[player_id]['name']
-        del self.players[player_id]
+        if self.journal is not None:
+            self.journal('leave', self.clock(), player_id)
+        player = self.players.pop(player_id)
+        self.bots.pop(player_id, None)
+        player_name = player.name
+        if len(player.guesses) > self.current_round:
+            self.round_guesses -= 1
+        elif self._is_eliminated(player):
+            self.eliminated -= 1
+        self.ranking.remove(player_id)
+        self._summaries = None
+        self._changed(player_id)
+        self._notify('player_left', {
+            'player_id': player_id,
+            'player_count': len(self.players)
+        })
         
         # Check if game should end due to insufficient players
-        if len(self.players) < 2 and self.game_state == GameState.PLAYING:
+        if len(self.players) < 2 and self.game_state == GameState.PLAYING and self.answer is not None:
             self.game_state = GameState.LOST
+            self._changed()
+            self._notify('game_over', {'winner': None, 'answer': self.answer})
             return {
                 'success': True,
                 'message': f"Game ended: {player_name} left. Need at least 2 players.",
@@ -120,32 +269,43 @@ class MultiplayerGame(BaseGameMode):
             'game_state': self.get_game_state()
         }
     
-    def start_game(self, **kwargs) -> None:
+    def start_game(self, answer: Optional[str] = None, **kwargs) -> None:
         """
         Start the multiplayer game.
         
         Args:
+            answer: Word to play, random if None (given when replaying)
             **kwargs: Additional arguments (ignored)
         """
         if len(self.players) < 2:
             raise ValueError("Need at least 2 players to start the game.")
         
         # Select a random answer
-        self.answer = random.choice(self.word_list)
+        answer = answer or random.choice(self.lexicon.words)
+        now = self.clock()
+        if self.journal is not None:
+            self.journal('start', now, answer)
+        self.answer = answer
         
         # Reset all players
-        for player_data in self.players.values():
-            player_data['guesses'] = []
-            player_data['results'] = []
-            player_data['score'] = 0
-            player_data['has_won'] = False
-            player_data['rounds_to_win'] = None
+        for player in self.players.values():
+            player.guesses = []
+            player.results = []
+            player.score = 0
+            self.ranking.update(player.id, 0, 0)
+            player.has_won = False
+            player.rounds_to_win = None
         
         self.game_state = GameState.PLAYING
         self.current_round = 0
-        self.round_start_time = time.time()
-        
-        print(f"🎮 Multiplayer game started! Answer: {self.answer}")
+        self.round_guesses = 0
+        self.eliminated = 0
+        self.round_start_time = now
+        self._changed(*self.players)
+        self._notify('game_started', {
+            'round_duration': self.round_duration,
+            'max_rounds': self.max_rounds
+        })
     
     def make_guess(self, guess: str, player_id: str) -> Dict[str, Any]:
         """
@@ -154,7 +314,7 @@ class MultiplayerGame(BaseGameMode):
         Args:
             guess: The word to guess
             player_id: Player making the guess
-            
+        
         Returns:
             Dictionary containing the result of the guess
         """
@@ -170,15 +330,21 @@ class MultiplayerGame(BaseGameMode):
                 'error': 'Game is not in progress'
             }
         
-        player_data = self.players[player_id]
+        player = self.players[player_id]
         
         # Check if player already made a guess this round
-        if len(player_data['guesses']) > self.current_round:
+        if len(player.guesses) > self.current_round:
             return {
                 'success': False,
                 'error': 'Already made a guess this round'
             }
         
+        if self._is_eliminated(player):
+            return {
+                'success': False,
+                'error': 'Eliminated: a round ended without your guess'
+            }
+        
         # Validate guess
         if not self.validate_guess(guess):
             return {
@@ -188,74 +354,93 @@ class MultiplayerGame(BaseGameMode):
         
         guess = guess.upper()
         
-        # Calculate result
-        result = self._calculate_result(guess)
+        # Calculate result and score for this round
+        result, round_score = self._score_guess(guess)
+        GUESSES_SCORED.inc()
+        now = self.clock()
+        if self.journal is not None:
+            self.journal('guess', now, player_id, guess, result)
         
         # Update player data
-        player_data['guesses'].append(guess)
-        player_data['results'].append(result)
-        player_data['last_activity'] = time.time()
-        
-        # Calculate score for this round
-        round_score = self._calculate_round_score(result)
-        player_data['score'] += round_score
+        player.guesses.append(guess)
+        player.results.append(result)
+        player.last_activity = now
+        self.round_guesses += 1
+        
+        player.score += round_score
+        self.ranking.update(player_id, player.score, len(player.guesses))
+        self._changed(player_id)
+        self._notify('guess', {
+            'player_id': player_id,
+            'result': result,
+            'round_score': round_score,
+            'guesses_made': len(player.guesses),
+            'score': player.score,
+            'is_correct': guess == self.answer
+        })
         
         # Check if player won
         if guess == self.answer:
-            player_data['has_won'] = True
-            player_data['rounds_to_win'] = len(player_data['guesses'])
+            player.has_won = True
+            player.rounds_to_win = len(player.guesses)
             self.game_state = GameState.WON
+            self._changed(player_id)
+            self._notify('game_over', {'winner': player_id, 'answer': self.answer})
             return {
                 'success': True,
                 'result': result,
                 'is_correct': True,
                 'round_score': round_score,
-                'total_score': player_data['score'],
+                'total_score': player.score,
                 'game_state': self.get_game_state(),
-                'message': f"🎉 {player_data['name']} wins in {len(player_data['guesses'])} rounds!"
+                'message': f"🎉 {player.name} wins in {len(player.guesses)} rounds!"
             }
         
         # Check if round should end
-        self._check_round_end()
+        self._check_round_end(now)
         
         return {
             'success': True,
             'result': result,
             'is_correct': False,
             'round_score': round_score,
-            'total_score': player_data['score'],
+            'total_score': player.score,
             'game_state': self.get_game_state()
         }
     
+    def _score_guess(self, guess: str) -> Tuple[List[LetterResult], int]:
+        """
+        Get the result and round score of a guess, computed once per word.
+        
+        Players who submit the same word share the result list, which is
+        never modified.
+        
+        Args:
+            guess: The guessed word (uppercase)
+        
+        Returns:
+            Tuple of (result, round score)
+        """
+        if self._memo_answer != self.answer:
+            self._result_memo.clear()
+            self._memo_answer = self.answer
+        scored = self._result_memo.get(guess)
+        if scored is None:
+            result = self._calculate_result(guess)
+            scored = self._result_memo[guess] = (result, self._calculate_round_score(result))
+        return scored
+    
     def _calculate_result(self, guess: str) -> List[LetterResult]:
         """
         Calculate the result for a guess.
         
         Args:
             guess: The guessed word
-            
+        
         Returns:
             List of LetterResult for each position
         """
-        result = [LetterResult.MISS] * 5
-        answer_letters = list(self.answer)
-        guess_letters = list(guess)
-        
-        # First pass: Mark hits
-        for i in range(5):
-            if guess_letters[i] == answer_letters[i]:
-                result[i] = LetterResult.HIT
-                answer_letters[i] = None
-                guess_letters[i] = None
-        
-        # Second pass: Mark presents
-        for i in range(5):
-            if guess_letters[i] is not None:
-                if guess_letters[i] in answer_letters:
-                    result[i] = LetterResult.PRESENT
-                    answer_letters[answer_letters.index(guess_letters[i])] = None
-        
-        return result
+        return score_guess(guess, self.answer)
     
     def _calculate_round_score(self, result: List[LetterResult]) -> int:
         """
@@ -263,7 +448,7 @@ class MultiplayerGame(BaseGameMode):
         
         Args:
             result: List of LetterResult for the guess
-            
+        
         Returns:
             Integer score for the round
         """
@@ -273,24 +458,64 @@ class MultiplayerGame(BaseGameMode):
         # Scoring: hits are worth more than presents
         return hits * 10 + presents
     
-    def _check_round_end(self) -> None:
+    def _check_round_end(self, now: float) -> None:
         """Check if the current round should end."""
-        # Check if all players have made their guesses
-        all_guessed = all(len(player['guesses']) > self.current_round 
-                         for player in self.players.values())
+        # Check if all players still in the game have made their guesses
+        all_guessed = self.round_guesses >= len(self.players) - self.eliminated
         
         # Check if round time limit is reached
-        time_elapsed = time.time() - self.round_start_time
+        time_elapsed = now - self.round_start_time
         time_expired = time_elapsed >= self.round_duration
         
         if all_guessed or time_expired:
-            self.current_round += 1
-            
-            # Check if game should end
-            if self.current_round >= self.max_rounds:
-                self._end_game()
-            else:
-                self.round_start_time = time.time()
+            self._advance_round()
+    
+    def _advance_round(self) -> None:
+        """Move on to the next round, ending the game after the last one."""
+        # Everyone still in the game who did not guess this round is out
+        self.eliminated = len(self.players) - self.round_guesses
+        self.current_round += 1
+        self.round_guesses = 0
+        self._changed()
+        
+        # Check if game should end
+        if self.current_round >= self.max_rounds or self.eliminated >= len(self.players):
+            self._end_game()
+        else:
+            self.round_start_time = self.clock()
+            self._notify('round_advanced', {'current_round': self.current_round})
+    
+    def expire_round(self, round_index: int) -> bool:
+        """
+        End a round whose time limit has passed, even if nobody guessed.
+        
+        Called by a scheduler at the round's deadline; does nothing if the
+        game has moved past that round in the meantime.
+        
+        Args:
+            round_index: Round the deadline was set for
+        
+        Returns:
+            True if the round was ended
+        """
+        if (self.answer is None or self.game_state != GameState.PLAYING
+                or self.current_round != round_index):
+            return False
+        if self.journal is not None:
+            self.journal('expire', self.clock(), round_index)
+        self._advance_round()
+        return True
+    
+    def round_deadline(self) -> Optional[float]:
+        """
+        Get the time (as ``time.time()``) at which the current round expires.
+        
+        Returns:
+            Deadline, or None if no round is running
+        """
+        if self.answer is None or self.game_state != GameState.PLAYING or self.round_start_time is None:
+            return None
+        return self.round_start_time + self.round_duration
     
     def _end_game(self) -> None:
         """End the game and determine the winner."""
@@ -301,54 +526,93 @@ class MultiplayerGame(BaseGameMode):
         best_score = -1
         winner = None
         
-        for player_id, player_data in self.players.items():
-            if player_data['score'] > best_score:
-                best_score = player_data['score']
+        for player_id, player in self.players.items():
+            if player.score > best_score:
+                best_score = player.score
                 winner = player_id
         
         if winner:
-            self.players[winner]['has_won'] = True
+            self.players[winner].has_won = True
             self.game_state = GameState.WON
-        
-        print(f"🏁 Game ended! Winner: {self.players[winner]['name'] if winner else 'None'}")
+            self._changed(winner)
+        self._notify('game_over', {'winner': winner, 'answer': self.answer})
     
     def get_game_state(self) -> Dict[str, Any]:
         """
         Get the current state of the multiplayer game.
         
+        The state is rebuilt only after the room changes, and only the
+        summaries of players who changed are rebuilt, so repeated reads cost
+        O(1) and a guess or a join costs O(1) plus a copy of the summary
+        list. The ``players`` list is shared between reads and must not be
+        modified.
+        
         Returns:
             Dictionary containing the current game state
         """
+        state = self._state_cache
+        if state is None or state['state_version'] != self.state_version:
+            state = self._state_cache = self._build_state()
+        
         # Calculate remaining time in current round
         remaining_time = 0
         if self.round_start_time and self.game_state == GameState.PLAYING:
-            elapsed = time.time() - self.round_start_time
+            elapsed = self.clock() - self.round_start_time
             remaining_time = max(0, self.round_duration - elapsed)
-        
-        # Get player summaries (without revealing answers)
-        player_summaries = []
-        for player_data in self.players.values():
-            summary = {
-                'id': player_data['id'],
-                'name': player_data['name'],
-                'score': player_data['score'],
-                'guesses_made': len(player_data['guesses']),
-                'has_won': player_data['has_won'],
-                'rounds_to_win': player_data['rounds_to_win'],
-                'is_connected': player_data['is_connected'],
-                'last_activity': player_data['last_activity']
-            }
-            player_summaries.append(summary)
+        return dict(state, remaining_time=remaining_time)
+    
+    def _is_eliminated(self, player: Player) -> bool:
+        """Check if a player let a round of the running game end without guessing."""
+        return self.answer is not None and len(player.guesses) < self.current_round
+    
+    @staticmethod
+    def _player_summary(player: Player) -> Dict[str, Any]:
+        """Get a player's public summary, which never reveals guessed words."""
+        return {
+            'id': player.id,
+            'name': player.name,
+            'score': player.score,
+            'guesses_made': len(player.guesses),
+            'has_won': player.has_won,
+            'rounds_to_win': player.rounds_to_win,
+            'is_connected': player.is_connected,
+            'last_activity': player.last_activity
+        }
+    
+    def _build_state(self) -> Dict[str, Any]:
+        """Build the room state for the current version, without the clock."""
+        player_summaries = self._summaries
+        if player_summaries is None or len(self._stale) * 2 > len(player_summaries):
+            player_summaries = [self._player_summary(player) for player in self.players.values()]
+            self._positions = {player_id: i for i, player_id in enumerate(self.players)}
+        else:
+            # Copied, so states handed out earlier keep their own list
+            player_summaries = list(player_summaries)
+            # Players who joined since are the last ones in join order
+            # (a departure rebuilds the whole list)
+            if len(self.players) > len(player_summaries):
+                for player in list(self.players.values())[len(player_summaries):]:
+                    self._positions[player.id] = len(player_summaries)
+                    player_summaries.append(self._player_summary(player))
+                    self._stale.discard(player.id)
+            for player_id in self._stale:
+                player_summaries[self._positions[player_id]] = self._player_summary(
+                    self.players[player_id]
+                )
+        self._summaries = player_summaries
+        self._stale.clear()
         
         return {
+            'state_version': self.state_version,
             'game_state': self.game_state.value,
             'current_round': self.current_round,
             'max_rounds': self.max_rounds,
             'remaining_rounds': max(0, self.max_rounds - self.current_round),
-            'remaining_time': remaining_time,
+            'remaining_time': 0,
             'round_duration': self.round_duration,
             'players': player_summaries,
             'player_count': len(self.players),
+            'eliminated_players': self.eliminated,
             'max_players': self.max_players,
             'answer': self.answer if self.game_state != GameState.PLAYING else None,
             'is_game_over': self.game_state != GameState.PLAYING
@@ -358,25 +622,28 @@ class MultiplayerGame(BaseGameMode):
         """
         Get the state for a specific player.
         
+        The view shares the cached room state, so reading it for every
+        player costs O(players) rather than O(players ** 2).
+        
         Args:
             player_id: Player identifier
-            
+        
         Returns:
             Dictionary containing the player's game state
         """
         if player_id not in self.players:
             raise ValueError(f"Player {player_id} not found")
         
-        player_data = self.players[player_id]
+        player = self.players[player_id]
         
         return {
             'player_id': player_id,
-            'player_name': player_data['name'],
-            'guesses': player_data['guesses'],
-            'results': player_data['results'],
-            'score': player_data['score'],
-            'has_won': player_data['has_won'],
-            'rounds_to_win': player_data['rounds_to_win'],
+            'player_name': player.name,
+            'guesses': player.guesses,
+            'results': player.results,
+            'score': player.score,
+            'has_won': player.has_won,
+            'rounds_to_win': player.rounds_to_win,
             'game_state': self.get_game_state()
         }
     
@@ -396,11 +663,26 @@ class MultiplayerGame(BaseGameMode):
         Returns:
             Winner player ID or None if no winner
         """
-        for player_id, player_data in self.players.items():
-            if player_data['has_won']:
+        for player_id, player in self.players.items():
+            if player.has_won:
                 return player_id
         return None
     
+    def rebuild_indexes(self) -> None:
+        """Recount and rank the players and drop the cached state, after players were set directly."""
+        self._state_cache = None
+        self._summaries = None
+        self._stale.clear()
+        self.ranking.clear()
+        self.round_guesses = 0
+        self.eliminated = 0
+        for player_id, player in self.players.items():
+            self.ranking.update(player_id, player.score, len(player.guesses))
+            if len(player.guesses) > self.current_round:
+                self.round_guesses += 1
+            elif self._is_eliminated(player):
+                self.eliminated += 1
+    
     def get_leaderboard(self) -> List[Dict[str, Any]]:
         """
         Get the current leaderboard.
@@ -408,18 +690,16 @@ class MultiplayerGame(BaseGameMode):
         Returns:
             List of players sorted by score (highest first)
         """
-        players = list(self.players.values())
-        players.sort(key=lambda p: (p['score'], -len(p['guesses'])), reverse=True)
-        
         leaderboard = []
-        for i, player in enumerate(players):
+        for i, (player_id, _score) in enumerate(self.ranking.top()):
+            player = self.players[player_id]
             leaderboard.append({
                 'rank': i + 1,
-                'player_id': player['id'],
-                'player_name': player['name'],
-                'score': player['score'],
-                'guesses_made': len(player['guesses']),
-                'has_won': player['has_won']
+                'player_id': player.id,
+                'player_name': player.name,
+                'score': player.score,
+                'guesses_made': len(player.guesses),
+                'has_won': player.has_won
             })
         
         return leaderboard 
\ No newline at end of file
@@ -8,11 +8,16 @@ The server manages the game state and clients connect to play.
 import json
 import threading
 import time
-from typing import List, Dict, Any, Optional
-from flask import Flask, request, jsonify
-from flask_cors import CORS
+from typing import List, Dict, Any, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from .base_game_mode import BaseGameMode
 from ..core.game_engine import WordleGame, GameState
+from ..server.app import create_app, serve_app
+from ..server.sessions import generate_session_id
 
 
 class ServerGame(BaseGameMode):
@@ -20,10 +25,12 @@ class ServerGame(BaseGameMode):
     Server-side game implementation for server/client mode.
     
     This class manages the game state on the server side and provides
-    REST API endpoints for clients to interact with.
+    REST API endpoints for clients to interact with. The app itself comes
+    from the shared factory in ``src.server.app``.
     """
     
-    def __init__(self, word_list: List[str], max_rounds: int = 6, port: int = 5000):
+    def __init__(self, word_list: List[str], max_rounds: int = 6, port: int = 5000,
+                 max_players: int = 4):
         """
         Initialize the server game.
         
@@ -31,131 +38,48 @@ class ServerGame(BaseGameMode):
             word_list: List of valid 5-letter words
             max_rounds: Maximum number of guessing rounds
             port: Port to run the server on
+            max_players: Default size of multiplayer rooms
         """
         super().__init__(word_list, max_rounds)
         self.port = port
-        self.app = Flask(__name__)
-        CORS(self.app)  # Enable CORS for web clients
-        self.active_games = {}  # Store active games by session ID
-        self._setup_routes()
+        # Tables are precomputed in start_server, right before serving
+        self.app = create_app({
+            'LEXICON': self.lexicon,
+            'MAX_ROUNDS': max_rounds,
+            'ROOM_MAX_PLAYERS': max_players,
+            'WARM_UP': False
+        })
+        self.server = self.app.extensions['wordle']
+        self.active_games = self.server.sessions  # Active games by session ID
+        self.events = self.server.events
+        self.metrics = self.server.metrics
     
-    def _setup_routes(self):
-        """Set up Flask routes for the API."""
-        
-        @self.app.route('/api/game/start', methods=['POST'])
-        def start_game():
-            """Start a new game."""
-            try:
-                data = request.get_json() or {}
-                session_id = data.get('session_id', f'session_{int(time.time())}')
-                game_mode = data.get('mode', 'single')
-                
-                # Create new game
-                if game_mode == 'single':
-                    game = SinglePlayerGame(self.word_list, self.max_rounds)
-                    game.start_game()
-                elif game_mode == 'cheating':
-                    game = CheatingHostGame(self.word_list, self.max_rounds)
-                    game.start_game()
-                else:
-                    return jsonify({'error': 'Invalid game mode'}), 400
-                
-                self.active_games[session_id] = game
-                
-                return jsonify({
-                    'session_id': session_id,
-                    'game_state': game.get_game_state(),
-                    'message': 'Game started successfully'
-                })
-            
-            except Exception as e:
-                return jsonify({'error': str(e)}), 500
-        
-        @self.app.route('/api/game/guess', methods=['POST'])
-        def make_guess():
-            """Make a guess in the game."""
-            try:
-                data = request.get_json()
-                if not data:
-                    return jsonify({'error': 'No data provided'}), 400
-                
-                session_id = data.get('session_id')
-                guess = data.get('guess')
-                
-                if not session_id or not guess:
-                    return jsonify({'error': 'Missing session_id or guess'}), 400
-                
-                if session_id not in self.active_games:
-                    return jsonify({'error': 'Game not found'}), 404
-                
-                game = self.active_games[session_id]
-                result = game.make_guess(guess)
-                
-                return jsonify({
-                    'result': result,
-                    'game_state': game.get_game_state()
-                })
-            
-            except Exception as e:
-                return jsonify({'error': str(e)}), 500
-        
-        @self.app.route('/api/game/state/<session_id>', methods=['GET'])
-        def get_game_state(session_id):
-            """Get the current game state."""
-            try:
-                if session_id not in self.active_games:
-                    return jsonify({'error': 'Game not found'}), 404
-                
-                game = self.active_games[session_id]
-                return jsonify(game.get_game_state())
-            
-            except Exception as e:
-                return jsonify({'error': str(e)}), 500
-        
-        @self.app.route('/api/game/reset/<session_id>', methods=['POST'])
-        def reset_game(session_id):
-            """Reset a game."""
-            try:
-                if session_id not in self.active_games:
-                    return jsonify({'error': 'Game not found'}), 404
-                
-                game = self.active_games[session_id]
-                game.start_game()
-                
-                return jsonify({
-                    'message': 'Game reset successfully',
-                    'game_state': game.get_game_state()
-                })
-            
-            except Exception as e:
-                return jsonify({'error': str(e)}), 500
-        
-        @self.app.route('/api/health', methods=['GET'])
-        def health_check():
-            """Health check endpoint."""
-            return jsonify({
-                'status': 'healthy',
-                'active_games': len(self.active_games),
-                'timestamp': time.time()
-            })
-    
-    def start_server(self, host: str = '0.0.0.0', debug: bool = False):
+    def start_server(self, host: str = '0.0.0.0', debug: bool = False, **options):
         """
-        Start the Flask server.
+        Start the server.
         
         Args:
             host: Host to bind to
-            debug: Enable debug mode
+            debug: Use Flask's development server with the debugger and reloader
+            **options: Options for the production server (threads, keep_alive,
+                request_timeout, graceful_timeout)
         """
         print(f"🚀 Starting Wordle server on {host}:{self.port}")
-        print(f"📊 API endpoints:")
-        print(f"   POST /api/game/start - Start a new game")
-        print(f"   POST /api/game/guess - Make a guess")
-        print(f"   GET  /api/game/state/<session_id> - Get game state")
-        print(f"   POST /api/game/reset/<session_id> - Reset game")
-        print(f"   GET  /api/health - Health check")
+        print("📊 API endpoints:")
+        print("   POST /api/game/start - Start a new game")
+        print("   POST /api/game/guess - Make a guess")
+        print("   GET  /api/game/state/<session_id> - Get game state")
+        print("   POST /api/game/reset/<session_id> - Reset game")
+        print("   GET  /api/events/session/<session_id> - Stream game updates (SSE)")
+        print("   GET  /api/health - Health check")
+        print("   GET  /metrics - Prometheus metrics")
+        print("   POST /api/admin/drain - Stop new games and snapshot sessions")
         
-        self.app.run(host=host, port=self.port, debug=debug)
+        self.server.warm_up()
+        if debug:
+            self.app.run(host=host, port=self.port, debug=True)
+        else:
+            serve_app(self.app, host, self.port, **options)
     
     # Required BaseGameMode methods (not used in server mode)
     def start_game(self, **kwargs):
@@ -186,17 +110,43 @@ class ClientGame(BaseGameMode):
     This class communicates with the server to play the game.
     """
     
-    def __init__(self, word_list: List[str], max_rounds: int = 6, server_url: str = 'http://localhost:5000'):
+    def __init__(self, word_list: List[str], max_rounds: int = 6, server_url: str = 'http://localhost:5000',
+                 pool_size: int = 4, timeout: Union[float, Tuple[float, float]] = (3.05, 10.0),
+                 retries: int = 3, backoff: float = 0.2, state_ttl: Optional[float] = 5.0,
+                 validate_guesses: bool = True):
         """
         Initialize the client game.
         
+        Requests go through a pooled ``requests.Session``, so the TCP
+        connection to the server is kept alive between calls. Failed
+        connection attempts are retried for every request; GET requests are
+        also retried on read errors and on 502/503/504 responses, honouring
+        Retry-After. Guesses and resets are never sent twice.
+        
+        Guesses missing from the word list, or made after the game ended,
+        are rejected without contacting the server. The state returned by
+        the last start, guess or reset is reused by get_game_state until it
+        is ``state_ttl`` seconds old.
+        
         Args:
-            word_list: List of valid 5-letter words (for validation)
+            word_list: List of valid 5-letter words, or a shared Lexicon
             max_rounds: Maximum number of guessing rounds
             server_url: URL of the server
+            pool_size: Connections kept open to the server
+            timeout: Seconds to wait for a response, or (connect, read)
+            retries: Retry attempts per request (0 disables retries)
+            backoff: Base delay in seconds, doubled after each retry
+            state_ttl: Seconds a known state is served without a request
+                (None keeps it until the next change, 0 always refreshes)
+            validate_guesses: Check guesses against the word list locally
         """
         super().__init__(word_list, max_rounds)
         self.server_url = server_url.rstrip('/')
+        self.timeout = timeout
+        self.session = self._create_http_session(pool_size, retries, backoff)
+        self.state_ttl = state_ttl
+        self.validate_guesses = validate_guesses
+        self._state_time: Optional[float] = None
         self.session_id = None
         self.game_state = {
             'game_state': 'waiting',
@@ -209,6 +159,30 @@ class ClientGame(BaseGameMode):
             'is_game_over': False
         }
     
+    @staticmethod
+    def _create_http_session(pool_size: int, retries: int, backoff: float) -> requests.Session:
+        """Create the keep-alive HTTP session used for all server calls."""
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=backoff,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({'GET', 'HEAD'}),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    def close(self) -> None:
+        """Close the pooled connections to the server."""
+        self.session.close()
+    
     def _make_request(self, endpoint: str, method: str = 'GET', data: Dict = None) -> Dict:
         """
         Make a request to the server.
@@ -217,22 +191,17 @@ class ClientGame(BaseGameMode):
             endpoint: API endpoint
             method: HTTP method
             data: Request data
-            
+        
         Returns:
             Response data
         """
-        import requests
+        if method not in ('GET', 'POST'):
+            raise ValueError(f"Unsupported method: {method}")
         
         url = f"{self.server_url}{endpoint}"
         
         try:
-            if method == 'GET':
-                response = requests.get(url)
-            elif method == 'POST':
-                response = requests.post(url, json=data)
-            else:
-                raise ValueError(f"Unsupported method: {method}")
-            
+            response = self.session.request(method, url, json=data, timeout=self.timeout)
             response.raise_for_status()
             return response.json()
         
@@ -250,7 +219,7 @@ class ClientGame(BaseGameMode):
         if session_id:
             self.session_id = session_id
         else:
-            self.session_id = f"client_{int(time.time())}"
+            self.session_id = generate_session_id('client')
         
         data = {
             'session_id': self.session_id,
@@ -263,7 +232,35 @@ class ClientGame(BaseGameMode):
             raise RuntimeError(f"Failed to start game: {response['error']}")
         
         self.session_id = response['session_id']
-        self.game_state = response['game_state']
+        self._set_state(response['game_state'])
+    
+    def _set_state(self, state: Dict[str, Any]) -> None:
+        """Remember the latest state received from the server."""
+        self.game_state = state
+        self._state_time = time.monotonic()
+    
+    def _state_is_fresh(self) -> bool:
+        """Check whether the cached state can be served without a request."""
+        if self._state_time is None:
+            return False
+        if self.state_ttl is None:
+            return True
+        return time.monotonic() - self._state_time < self.state_ttl
+    
+    def _local_rejection(self, guess: str) -> Optional[Dict[str, Any]]:
+        """Get the server's answer to a guess when it is known in advance."""
+        if self.game_state.get('is_game_over'):
+            error = "Game is already over"
+        elif self.validate_guesses and not self.validate_guess(guess):
+            error = f"Invalid guess: {guess}"
+        else:
+            return None
+        return {
+            'success': False,
+            'error': error,
+            'round': self.game_state.get('current_round', 0),
+            'remaining_rounds': self.game_state.get('remaining_rounds', self.max_rounds)
+        }
     
     def make_guess(self, guess: str) -> Dict[str, Any]:
         """
@@ -271,13 +268,17 @@ class ClientGame(BaseGameMode):
         
         Args:
             guess: The word to guess
-            
+        
         Returns:
             Dictionary containing the result of the guess
         """
         if not self.session_id:
             raise RuntimeError("No active game session. Call start_game() first.")
         
+        rejection = self._local_rejection(guess)
+        if rejection is not None:
+            return rejection
+        
         data = {
             'session_id': self.session_id,
             'guess': guess
@@ -291,22 +292,25 @@ class ClientGame(BaseGameMode):
                 'error': response['error']
             }
         
-        self.game_state = response['game_state']
+        self._set_state(response['game_state'])
         return response['result']
     
-    def get_game_state(self) -> Dict[str, Any]:
+    def get_game_state(self, refresh: bool = False) -> Dict[str, Any]:
         """
-        Get the current game state from the server.
+        Get the current game state.
+        
+        Args:
+            refresh: Fetch the state from the server even if the cached one is fresh
         
         Returns:
             Dictionary containing the current game state
         """
-        if not self.session_id:
+        if not self.session_id or (not refresh and self._state_is_fresh()):
             return self.game_state
         
         try:
             response = self._make_request(f'/api/game/state/{self.session_id}')
-            self.game_state = response
+            self._set_state(response)
             return response
         except Exception as e:
             # Return cached state if server is unavailable
@@ -342,9 +346,4 @@ class ClientGame(BaseGameMode):
         if 'error' in response:
             raise RuntimeError(f"Failed to reset game: {response['error']}")
         
-        self.game_state = response['game_state']
-
-
-# Import the game mode classes
-from .single_player import SinglePlayerGame
-from .cheating_host import CheatingHostGame 
\ No newline at end of file
+        self._set_state(response['game_state'])
@@ -41,6 +41,7 @@ class SinglePlayerGame(BaseGameMode):
         """
         self.player_name = player_name
         self.game.start_new_game(answer)
+        self._mark_new_game()
     
     def make_guess(self, guess: str) -> Dict[str, Any]:
         """
@@ -54,6 +55,7 @@ class SinglePlayerGame(BaseGameMode):
         """
         try:
             result, is_correct = self.game.make_guess(guess)
+            self._mark_guess()
             
             return {
                 'success': True,
@@ -94,7 +96,8 @@ class SinglePlayerGame(BaseGameMode):
             'results': self.game.get_results(),
             'answer': self.game.get_answer(),
             'player_name': self.player_name,
-            'is_game_over': self.game.is_game_over()
+            'is_game_over': self.game.is_game_over(),
+            'state_version': self.state_version
         }
     
     def is_game_over(self) -> bool:
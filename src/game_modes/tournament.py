@@ -0,0 +1,411 @@
+"""
+Tournament brackets played by bot players.
+
+This module provides the Tournament, which seeds entrants into a bracket
+of matches and advances it as results come in, and the TournamentRunner,
+which plays the bracket's matches with solver-driven players across a
+pool of worker processes.
+
+Each match is a series of boards, the same for every match of a bracket
+round. In multiplayer mode the match's entrants share a MultiplayerGame
+per board; in single mode each entrant plays each board in a
+SinglePlayerGame of its own. The best ``advance`` entrants of a match go
+through to the next round. A match only waits for the matches that feed
+it, not for its whole round, so workers stay busy as the bracket narrows.
+Standings are a Leaderboard updated as each match is recorded.
+
+Matches are sent to workers as small tuples, in batches, and each worker
+builds its lexicon and candidate tree once, so the cost of handing a
+match to a worker stays small next to playing it:
+    
+    python -m src.tools.tournament --entrants 512 --workers 4
+"""
+
+import math
+import multiprocessing
+import random
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Deque, Dict, List, Optional, Sequence, Set, Tuple
+
+from .bots import CandidateTree, candidate_tree
+from .multiplayer import MultiplayerGame
+from .single_player import SinglePlayerGame
+from ..core.game_engine import encode_result
+from ..utils.lexicon import Lexicon
+from ..utils.ranking import Leaderboard
+
+
+MODES = ('multiplayer', 'single')
+
+# (match id, mode, entrant ids, skills, boards, max rounds, seed)
+MatchSpec = Tuple[int, str, Tuple[str, ...], Tuple[float, ...], Tuple[str, ...], int, Optional[int]]
+
+
+class Match:
+    """One match of a bracket; see Tournament."""
+    
+    __slots__ = ('match_id', 'round', 'entrants', 'parent', 'waiting', 'ranking')
+    
+    def __init__(self, match_id: int, round_index: int, parent: Optional['Match']):
+        self.match_id = match_id
+        self.round = round_index
+        self.entrants: List[str] = []
+        self.parent = parent
+        # Feeding matches still to be recorded
+        self.waiting = 0
+        # Entrants best first, once recorded
+        self.ranking: Optional[List[str]] = None
+
+
+class Tournament:
+    """
+    Single-elimination bracket of multi-entrant matches.
+    
+    Round 0 spreads the entrants over matches of up to ``match_size``, in
+    seed order across the matches so that top seeds meet late. Each later
+    match takes the best ``advance`` of ``match_size // advance`` earlier
+    matches, until one final match is left. A match with a single entrant
+    is a bye.
+    
+    Matches are taken with ``take_ready`` and their points given back with
+    ``record``, in any order; neither depends on how the match was played.
+    """
+    
+    def __init__(self, entrants: Sequence[str], lexicon: Lexicon, match_size: int = 4,
+                 advance: int = 2, boards: int = 3, mode: str = 'multiplayer',
+                 max_rounds: int = 6, seed: Optional[int] = None):
+        """
+        Seed the bracket.
+        
+        Args:
+            entrants: Entrant ids, best seed first
+            lexicon: Lexicon the boards' answers are drawn from
+            match_size: Entrants per match
+            advance: Entrants of each match who go through (divides match_size)
+            boards: Boards per match
+            mode: 'multiplayer' or 'single'
+            max_rounds: Guesses allowed per board
+            seed: Seed for the boards and the matches' players
+        
+        Raises:
+            ValueError: If the entrants or the format are invalid
+        """
+        if len(set(entrants)) != len(entrants) or len(entrants) < 2:
+            raise ValueError('A tournament needs at least two distinct entrants')
+        if mode not in MODES:
+            raise ValueError(f'mode must be one of {", ".join(MODES)}')
+        if not 0 < advance < match_size or match_size % advance:
+            raise ValueError('advance must be a proper divisor of match_size')
+        if boards < 1:
+            raise ValueError('boards must be at least 1')
+        
+        self.lexicon = lexicon
+        self.match_size = match_size
+        self.advance = advance
+        self.mode = mode
+        self.max_rounds = max_rounds
+        self.seed = seed
+        self.seeds = {entrant: i for i, entrant in enumerate(entrants)}
+        self.matches: List[Match] = []
+        self.champion: Optional[str] = None
+        # Ranked by rounds reached, then total points
+        self.standings = Leaderboard()
+        self.points: Dict[str, int] = dict.fromkeys(entrants, 0)
+        self._ready: Deque[Match] = deque()
+        
+        self.rounds = self._build(len(entrants))
+        first_round = [match for match in self.matches if match.round == 0]
+        for i, entrant in enumerate(entrants):
+            first_round[i % len(first_round)].entrants.append(entrant)
+            self.standings.update(entrant, 0, 0)
+        
+        rng = random.Random(seed)
+        self.boards = [tuple(rng.sample(lexicon.words, min(boards, len(lexicon))))
+                       for _ in range(self.rounds)]
+        for match in first_round:
+            self._ready_or_bye(match)
+    
+    def _build(self, entrant_count: int) -> int:
+        """Create the bracket's matches from the final down; return the round count."""
+        fan_in = self.match_size // self.advance
+        sizes = [math.ceil(entrant_count / self.match_size)]
+        while sizes[-1] > 1:
+            sizes.append(math.ceil(sizes[-1] / fan_in))
+        
+        parents: List[Optional[Match]] = [None]
+        for round_index in range(len(sizes) - 1, -1, -1):
+            matches = []
+            for i in range(sizes[round_index]):
+                parent = parents[i // fan_in]
+                match = Match(len(self.matches), round_index, parent)
+                if parent is not None:
+                    parent.waiting += 1
+                self.matches.append(match)
+                matches.append(match)
+            parents = matches
+        self.matches.sort(key=lambda match: (match.round, match.match_id))
+        for match_id, match in enumerate(self.matches):
+            match.match_id = match_id
+        return len(sizes)
+    
+    @property
+    def is_finished(self) -> bool:
+        """Check whether the final has been recorded."""
+        return self.champion is not None
+    
+    def take_ready(self, limit: Optional[int] = None) -> List[Match]:
+        """
+        Take matches whose entrants are all known, to be played.
+        
+        Args:
+            limit: Most matches to take (all if None)
+        
+        Returns:
+            Matches, oldest first
+        """
+        count = len(self._ready) if limit is None else min(limit, len(self._ready))
+        return [self._ready.popleft() for _ in range(count)]
+    
+    def spec(self, match: Match, skills: Dict[str, float]) -> MatchSpec:
+        """
+        Describe a match for play_match.
+        
+        Args:
+            match: Match to play
+            skills: Skill of each entrant (0.5 if missing)
+        
+        Returns:
+            Picklable match description
+        """
+        seed = None if self.seed is None else self.seed * 1000003 + match.match_id
+        return (match.match_id, self.mode, tuple(match.entrants),
+                tuple(skills.get(entrant, 0.5) for entrant in match.entrants),
+                self.boards[match.round], self.max_rounds, seed)
+    
+    def record(self, match_id: int, points: Dict[str, int]) -> None:
+        """
+        Record a played match and advance its best entrants.
+        
+        Args:
+            match_id: Match played
+            points: Points of each of its entrants
+        
+        Raises:
+            ValueError: If the match is not waiting for a result
+        """
+        match = self.matches[match_id]
+        if match.ranking is not None or match.waiting:
+            raise ValueError(f'Match {match_id} is not being played')
+        
+        for entrant in match.entrants:
+            self.points[entrant] += points.get(entrant, 0)
+        match.ranking = sorted(
+            match.entrants, key=lambda entrant: (-points.get(entrant, 0), self.seeds[entrant])
+        )
+        self._advance(match)
+    
+    def _advance(self, match: Match) -> None:
+        """Send a recorded match's best entrants on and update the standings."""
+        parent = match.parent
+        # Only the final's winner goes beyond its round
+        through = match.ranking[:self.advance if parent is not None else 1]
+        for entrant in match.ranking:
+            reached = match.round + (entrant in through)
+            self.standings.update(entrant, reached, -self.points[entrant])
+        
+        if parent is None:
+            self.champion = match.ranking[0]
+            return
+        parent.entrants.extend(through)
+        parent.waiting -= 1
+        if not parent.waiting:
+            parent.entrants.sort(key=self.seeds.__getitem__)
+            self._ready_or_bye(parent)
+    
+    def _ready_or_bye(self, match: Match) -> None:
+        if len(match.entrants) > 1:
+            self._ready.append(match)
+        else:
+            match.ranking = list(match.entrants)
+            self._advance(match)
+
+
+_worker_tree: Optional[CandidateTree] = None
+
+
+def _init_worker(words: List[str]) -> None:
+    """Build a worker's lexicon and candidate tree once, for all its matches."""
+    global _worker_tree
+    _worker_tree = candidate_tree(Lexicon(words))
+
+
+def _play_batch(specs: List[MatchSpec]) -> Tuple[List[Tuple[int, Dict[str, int]]], float]:
+    """Play matches in a worker; return their points and the seconds spent."""
+    started = time.perf_counter()
+    results = [(spec[0], play_match(_worker_tree, spec)) for spec in specs]
+    return results, time.perf_counter() - started
+
+
+def play_match(tree: CandidateTree, spec: MatchSpec) -> Dict[str, int]:
+    """
+    Play a match with solver-driven players.
+    
+    In multiplayer mode an entrant's points are its room score on each
+    board; in single mode they are the guesses it had left when it solved
+    each board, plus one.
+    
+    Args:
+        tree: Candidate tree of the lexicon
+        spec: Match from Tournament.spec
+    
+    Returns:
+        Points of each entrant
+    """
+    _match_id, mode, entrants, skills, boards, max_rounds, seed = spec
+    rng = random.Random(seed)
+    points = dict.fromkeys(entrants, 0)
+    for answer in boards:
+        if mode == 'multiplayer':
+            _play_room(tree, entrants, skills, answer, max_rounds, rng, points)
+        else:
+            for entrant, skill in zip(entrants, skills):
+                points[entrant] += _play_single(tree, skill, answer, max_rounds, rng)
+    return points
+
+
+def _play_room(tree: CandidateTree, entrants: Tuple[str, ...], skills: Tuple[float, ...],
+               answer: str, max_rounds: int, rng: random.Random, points: Dict[str, int]) -> None:
+    room = MultiplayerGame(tree.lexicon, max_rounds=max_rounds, max_players=len(entrants))
+    for entrant in entrants:
+        room.add_player(entrant, entrant)
+    room.start_game(answer=answer)
+    
+    nodes = dict.fromkeys(entrants, tree.root)
+    order = list(zip(entrants, skills))
+    while not room.is_game_over():
+        # Who answers first in a round is a race
+        rng.shuffle(order)
+        for entrant, skill in order:
+            word = tree.choose(nodes[entrant], skill, rng)
+            result = room.make_guess(word, entrant)
+            if not result['success']:
+                break
+            nodes[entrant] = tree.narrow(nodes[entrant], word, encode_result(result['result']))
+    
+    for entrant in entrants:
+        points[entrant] += room.players[entrant].score
+
+
+def _play_single(tree: CandidateTree, skill: float, answer: str, max_rounds: int,
+                 rng: random.Random) -> int:
+    game = SinglePlayerGame(tree.lexicon, max_rounds=max_rounds)
+    game.start_game(answer=answer)
+    node = tree.root
+    while not game.is_game_over():
+        word = tree.choose(node, skill, rng)
+        result = game.make_guess(word)
+        if result['is_correct']:
+            return result['remaining_rounds'] + 1
+        node = tree.narrow(node, word, encode_result(result['result']))
+    return 0
+
+
+class TournamentRunner:
+    """
+    Plays a Tournament's matches in parallel on worker processes.
+    
+    Ready matches are split into batches of at most ``batch_size``, but
+    small enough that every worker gets one, and new matches are sent as
+    soon as a batch comes back. With ``workers=0`` matches are played in
+    the calling process.
+    """
+    
+    def __init__(self, tournament: Tournament, skills: Optional[Dict[str, float]] = None,
+                 workers: Optional[int] = None, batch_size: int = 16):
+        """
+        Initialize the runner.
+        
+        Args:
+            tournament: Tournament to play
+            skills: Skill of each entrant, 0 to 1 (0.5 if missing)
+            workers: Worker processes (defaults to the CPU count)
+            batch_size: Most matches sent to a worker at once
+        """
+        self.tournament = tournament
+        self.skills = skills or {}
+        self.workers = multiprocessing.cpu_count() if workers is None else workers
+        self.batch_size = batch_size
+        self.matches_played = 0
+        # Time spent playing matches, and in run() overall
+        self.play_seconds = 0.0
+        self.wall_seconds = 0.0
+    
+    def run(self) -> Tournament:
+        """
+        Play every match of the tournament.
+        
+        Returns:
+            The finished tournament
+        """
+        started = time.perf_counter()
+        if self.workers == 0:
+            tree = candidate_tree(self.tournament.lexicon)
+            while not self.tournament.is_finished:
+                specs = [self.tournament.spec(match, self.skills)
+                         for match in self.tournament.take_ready()]
+                batch_started = time.perf_counter()
+                results = [(spec[0], play_match(tree, spec)) for spec in specs]
+                self._record((results, time.perf_counter() - batch_started))
+        else:
+            self._run_pool()
+        self.wall_seconds = time.perf_counter() - started
+        return self.tournament
+    
+    def _run_pool(self) -> None:
+        # Spawned, not forked: the host may have threads running (a server's
+        # timer wheel, for one) that a fork would copy mid-operation
+        pool = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker, initargs=(self.tournament.lexicon.words,)
+        )
+        pending: Set[Future] = set()
+        with pool:
+            while True:
+                ready = self.tournament.take_ready()
+                if ready:
+                    size = max(1, min(self.batch_size, math.ceil(len(ready) / self.workers)))
+                    for i in range(0, len(ready), size):
+                        specs = [self.tournament.spec(match, self.skills)
+                                 for match in ready[i:i + size]]
+                        pending.add(pool.submit(_play_batch, specs))
+                if not pending:
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._record(future.result())
+    
+    def _record(self, batch: Tuple[List[Tuple[int, Dict[str, int]]], float]) -> None:
+        results, seconds = batch
+        for match_id, points in results:
+            self.tournament.record(match_id, points)
+        self.matches_played += len(results)
+        self.play_seconds += seconds
+    
+    def summary(self) -> Dict[str, Any]:
+        """
+        Get the run's statistics.
+        
+        Returns:
+            Matches played, seconds, and the fraction of worker time spent
+            playing (the rest is scheduling and transfer overhead)
+        """
+        capacity = self.wall_seconds * max(1, self.workers)
+        return {
+            'matches': self.matches_played,
+            'wall_seconds': round(self.wall_seconds, 3),
+            'play_seconds': round(self.play_seconds, 3),
+            'utilization': round(self.play_seconds / capacity, 3) if capacity else 0.0,
+            'champion': self.tournament.champion
+        }
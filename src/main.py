@@ -11,16 +11,18 @@ import sys
 import os
 from typing import List
 
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add the project root to the Python path so the src package is importable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.game_engine import LetterResult
-from game_modes.single_player import SinglePlayerGame
-from game_modes.cheating_host import CheatingHostGame
-from game_modes.server_client import ServerGame, ClientGame
-from game_modes.multiplayer import MultiplayerGame
-from utils.word_loader import get_default_word_list
-from ui.text_ui import TextUI
+from src.core.game_engine import LetterResult
+from src.game_modes.single_player import SinglePlayerGame
+from src.game_modes.cheating_host import CheatingHostGame
+from src.game_modes.daily import DailyGame
+from src.game_modes.server_client import ServerGame, ClientGame
+from src.game_modes.multiplayer import MultiplayerGame
+from src.server.app import create_app, serve_app
+from src.utils.word_loader import get_default_word_list
+from src.ui.text_ui import TextUI
 
 
 def parse_arguments():
@@ -29,7 +31,7 @@ def parse_arguments():
     
     parser.add_argument(
         '--mode',
-        choices=['single', 'cheating', 'server', 'client', 'multiplayer'],
+        choices=['single', 'daily', 'cheating', 'server', 'serve', 'client', 'multiplayer'],
         default='single',
         help='Game mode to play (default: single)'
     )
@@ -68,6 +70,87 @@ def parse_arguments():
         help='Server port (for server/client mode)'
     )
     
+    # Production serving arguments
+    parser.add_argument(
+        '--threads',
+        type=int,
+        default=8,
+        help='Worker threads per process (for serve mode, default: 8)'
+    )
+    
+    parser.add_argument(
+        '--keep-alive',
+        type=float,
+        default=5.0,
+        help='Seconds to keep idle connections open, 0 to disable (for serve mode, default: 5)'
+    )
+    
+    parser.add_argument(
+        '--request-timeout',
+        type=float,
+        default=30.0,
+        help='Socket timeout while handling a request (for serve mode, default: 30)'
+    )
+    
+    parser.add_argument(
+        '--graceful-timeout',
+        type=float,
+        default=10.0,
+        help='Seconds to let in-flight requests finish on shutdown (for serve mode, default: 10)'
+    )
+    
+    parser.add_argument(
+        '--snapshot',
+        type=str,
+        help='Session snapshot file: restored on start, written on shutdown (for serve mode)'
+    )
+    
+    parser.add_argument(
+        '--leaderboard',
+        type=str,
+        help='Cross-room leaderboard file: loaded on start, saved every minute (for serve mode)'
+    )
+    
+    parser.add_argument(
+        '--room-log',
+        type=str,
+        help='Directory of per-room event logs, replayed on start after a crash (for serve mode)'
+    )
+    
+    parser.add_argument(
+        '--token-secret',
+        type=str,
+        default=os.environ.get('WORDLE_TOKEN_SECRET'),
+        help='Key that signs player tokens, default $WORDLE_TOKEN_SECRET (for serve mode)'
+    )
+    
+    parser.add_argument(
+        '--profile-rate',
+        type=int,
+        default=0,
+        help='Profile one game request in this many, see /api/admin/profile (for serve mode)'
+    )
+    
+    parser.add_argument(
+        '--access-log',
+        action='store_true',
+        help='Log every request (for serve mode)'
+    )
+    
+    parser.add_argument(
+        '--room-size',
+        type=int,
+        default=4,
+        help='Players per room unless the creator asks for another size (for serve mode, default: 4)'
+    )
+    
+    parser.add_argument(
+        '--room-limit',
+        type=int,
+        default=1000,
+        help='Largest room size clients may ask for (for serve mode, default: 1000)'
+    )
+    
     # Multiplayer specific arguments
     parser.add_argument(
         '--players',
@@ -83,7 +166,7 @@ def load_word_list(args) -> List[str]:
     """Load the word list based on command line arguments."""
     if args.word_list:
         try:
-            from utils.word_loader import load_word_list
+            from src.utils.word_loader import load_word_list
             return load_word_list(args.word_list)
         except Exception as e:
             print(f"Error loading word list: {e}")
@@ -97,10 +180,24 @@ def create_game_mode(args, word_list: List[str]):
     """Create the appropriate game mode based on arguments."""
     if args.mode == 'single':
         return SinglePlayerGame(word_list, args.max_rounds)
+    elif args.mode == 'daily':
+        return DailyGame(word_list, args.max_rounds)
     elif args.mode == 'cheating':
         return CheatingHostGame(word_list, args.max_rounds)
     elif args.mode == 'server':
         return ServerGame(word_list, args.max_rounds, args.port)
+    elif args.mode == 'serve':
+        return create_app({
+            'WORD_LIST': word_list,
+            'MAX_ROUNDS': args.max_rounds,
+            'SNAPSHOT_PATH': args.snapshot,
+            'PLAYER_TOKEN_SECRET': args.token_secret,
+            'LEADERBOARD_PATH': args.leaderboard,
+            'ROOM_LOG_DIR': args.room_log,
+            'ROOM_MAX_PLAYERS': args.room_size,
+            'ROOM_PLAYER_LIMIT': args.room_limit,
+            'PROFILE_SAMPLE_RATE': args.profile_rate
+        })
     elif args.mode == 'client':
         server_url = f"http://{args.host}:{args.port}"
         return ClientGame(word_list, args.max_rounds, server_url)
@@ -117,11 +214,29 @@ def run_server_mode(game: ServerGame, args):
     print("Press Ctrl+C to stop the server")
     
     try:
-        game.start_server(host='0.0.0.0', debug=True)
+        game.start_server(host='0.0.0.0')
     except KeyboardInterrupt:
         print("\n🛑 Server stopped by user")
 
 
+def run_serve_mode(app, args):
+    """Run the API with the production server until SIGTERM or Ctrl+C."""
+    host = '0.0.0.0' if args.host == 'localhost' else args.host
+    print(f"🚀 Serving Wordle API on http://{host}:{args.port}")
+    print(f"⚙️  {args.threads} thread(s), "
+          f"keep-alive {args.keep_alive}s, request timeout {args.request_timeout}s")
+    
+    serve_app(
+        app, host, args.port,
+        threads=args.threads,
+        keep_alive=args.keep_alive,
+        request_timeout=args.request_timeout,
+        graceful_timeout=args.graceful_timeout,
+        access_log=args.access_log
+    )
+    print("🛑 Server stopped")
+
+
 def run_client_mode(game: ClientGame, args):
     """Run the client mode."""
     print(f"🔗 Connecting to server at http://{args.host}:{args.port}")
@@ -134,7 +249,7 @@ def run_client_mode(game: ClientGame, args):
         # Create UI and run game
         ui = TextUI()
         ui.run_game(game)
-        
+    
     except Exception as e:
         print(f"❌ Failed to connect to server: {e}")
         print("Make sure the server is running first with: python src/main.py --mode server")
@@ -176,23 +291,25 @@ def main():
         # Run appropriate mode
         if args.mode == 'server':
             run_server_mode(game, args)
+        elif args.mode == 'serve':
+            run_serve_mode(game, args)
         elif args.mode == 'client':
             run_client_mode(game, args)
         elif args.mode == 'multiplayer':
             run_multiplayer_mode(game, args)
         else:
-            # Single player or cheating mode
+            # Single player, daily or cheating mode
             ui = TextUI()
             
             # Start game
             if args.mode == 'single':
                 game.start_game(answer=args.answer)
-            elif args.mode == 'cheating':
+            elif args.mode in ('daily', 'cheating'):
                 game.start_game()
             
             # Run the game
             ui.run_game(game)
-        
+    
     except KeyboardInterrupt:
         print("\n🛑 Game interrupted by user")
         sys.exit(0)
@@ -0,0 +1 @@
+# API server infrastructure package
\ No newline at end of file
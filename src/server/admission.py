@@ -0,0 +1,139 @@
+"""
+Admission control for the game API.
+
+This module provides token-bucket rate limiting (per client and global)
+and a concurrency guard for CPU-heavy routes. Both reject immediately
+instead of queueing, so an overloaded server answers 429/503 quickly and
+keeps serving the requests it has admitted.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at a fixed rate.
+    
+    Each request takes one token; requests arriving at an empty bucket are
+    rejected. The bucket allows bursts up to its capacity.
+    """
+    
+    __slots__ = ('rate', 'capacity', 'tokens', 'updated', '_lock')
+    
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize a full bucket.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+        """
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+        
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def try_acquire(self, now: Optional[float] = None) -> float:
+        """
+        Take one token if available.
+        
+        Args:
+            now: Current monotonic time (defaults to time.monotonic())
+        
+        Returns:
+            0.0 if a token was taken, otherwise the seconds until one is available
+        """
+        if now is None:
+            now = time.monotonic()
+        
+        with self._lock:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """
+    Per-client token buckets with a bounded number of tracked clients.
+    
+    Buckets are kept in least-recently-used order; when the limit is
+    reached the least recently seen client's bucket is dropped. A dropped
+    client simply starts again with a full bucket, so memory stays bounded
+    without ever blocking a request.
+    """
+    
+    def __init__(self, rate: float, burst: float, max_clients: int = 10000):
+        """
+        Initialize the limiter.
+        
+        Args:
+            rate: Requests per second allowed for each client
+            burst: Burst size for each client
+            max_clients: Maximum number of client buckets kept in memory
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self._buckets: 'OrderedDict[str, TokenBucket]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def allow(self, client_key: str) -> float:
+        """
+        Check whether a client may make a request, consuming a token if so.
+        
+        Args:
+            client_key: Client identifier (e.g. remote address)
+        
+        Returns:
+            0.0 if allowed, otherwise the seconds the client should wait
+        """
+        with self._lock:
+            bucket = self._buckets.get(client_key)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.burst)
+                self._buckets[client_key] = bucket
+                if len(self._buckets) > self.max_clients:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(client_key)
+        return bucket.try_acquire()
+    
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class InFlightLimiter:
+    """
+    Non-blocking cap on the number of concurrent requests.
+    
+    ``try_acquire`` never waits; callers that do not get a slot should
+    reject the request straight away.
+    """
+    
+    def __init__(self, max_in_flight: int):
+        """
+        Initialize the limiter.
+        
+        Args:
+            max_in_flight: Maximum number of concurrently admitted requests
+        """
+        self.max_in_flight = max_in_flight
+        self._semaphore = threading.BoundedSemaphore(max_in_flight)
+    
+    def try_acquire(self) -> bool:
+        """Take a slot if one is free."""
+        return self._semaphore.acquire(blocking=False)
+    
+    def release(self) -> None:
+        """Give a slot back."""
+        self._semaphore.release()
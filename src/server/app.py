@@ -0,0 +1,994 @@
+"""
+Flask application factory for the game API.
+
+This module builds the API app used by both ``api_server.py`` and the
+``server`` game mode. The lexicon and its precomputed tables are loaded
+once when the app is created and shared by every game it starts, so a
+request only does the work its game needs.
+"""
+
+import hmac
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from flask import Flask, Response, request
+from flask_cors import CORS
+
+from .sessions import SessionRegistry, generate_session_id
+from .wire import WordleJSONProvider, api_response, state_response, instrument_compression
+from .events import EventBroker, format_sse, session_channel, room_channel
+from .monitoring import instrument_app, metrics_response
+from .admission import RateLimiter, TokenBucket, InFlightLimiter
+from .serving import serve, UPGRADE_ENVIRON_KEY
+from .snapshot import save_snapshot, load_snapshot
+from .profiling import RequestProfiler, instrument_profiler
+from .rooms import RoomManager, RoomError
+from .room_log import RoomLog
+from .websocket import WebSocketHub, accept_key, compact_event
+from ..game_modes.base_game_mode import BaseGameMode
+from ..game_modes.single_player import SinglePlayerGame
+from ..game_modes.cheating_host import CheatingHostGame, precompute_first_partitions
+from ..game_modes.daily import DailyGame
+from ..utils.lexicon import Lexicon
+from ..utils.metrics import MetricsRegistry
+from ..utils.ranking import Leaderboard
+from ..utils.timer_wheel import TimerWheel
+from ..utils.word_loader import get_default_word_list, load_word_list
+
+
+logger = logging.getLogger(__name__)
+
+# Settings understood by create_app; anything else in the config is
+# passed through to app.config unchanged
+DEFAULT_CONFIG: Dict[str, Any] = {
+    'LEXICON': None,               # Prebuilt Lexicon (takes precedence over the word list)
+    'WORD_LIST': None,             # List of words
+    'WORD_LIST_PATH': None,        # Word list file, used when no list is given
+    'MAX_ROUNDS': 6,
+    'SESSION_SHARDS': 16,
+    'SESSION_IDLE_TIMEOUT': 3600,  # Seconds before an idle session is evicted
+    'ROOM_SHARDS': 16,
+    'ROOM_IDLE_TIMEOUT': 600,      # Seconds before an idle multiplayer room is closed
+    'ROOM_MAX_PLAYERS': 4,         # Default room size, also used by quick match
+    'ROOM_PLAYER_LIMIT': 1000,     # Largest max_players a client may ask for
+    'ROOM_TIMER_TICK': 0.1,        # Resolution of round deadlines in seconds
+    'BOT_THINK_TIME': 5.0,         # Default mean seconds a bot player takes to guess
+    'PLAYER_TOKEN_SECRET': None,   # Key of player tokens (if unset, generated; see load_token_secret)
+    'LEADERBOARD_PATH': None,      # Cross-room leaderboard file, loaded on start
+    'LEADERBOARD_SAVE_INTERVAL': 60,  # Seconds between leaderboard saves
+    'ROOM_LOG_DIR': None,          # Per-room event logs, replayed on start after a crash
+    'ROOM_LOG_FLUSH_INTERVAL': 1.0,   # Seconds between flushes of buffered room events
+    'ROOM_LOG_CHECKPOINT_INTERVAL': 1000,  # Room events between checkpoints
+    'ROOM_LOG_MAX_OPEN_FILES': 64,  # Room log files kept open at once
+    'ROOM_LOG_KEEP_CLOSED': False,  # Move closed rooms' logs to closed/ instead of deleting them
+    'START_RATE': 2,               # Game starts per second per client
+    'START_BURST': 10,
+    'GLOBAL_START_RATE': 500,      # Game starts per second across all clients
+    'GLOBAL_START_BURST': 1000,
+    'MAX_RATE_LIMITED_CLIENTS': 10000,
+    'MAX_HEAVY_IN_FLIGHT': 16,     # Concurrent cheating host requests
+    'SSE_HEARTBEAT': 15.0,         # Seconds between heartbeats on idle event streams
+    'SSE_MAX_BUFFER': 1024 * 1024,  # Unsent bytes before a slow event stream is dropped
+    'WS_PING_INTERVAL': 30.0,      # Seconds between WebSocket pings
+    'WS_MAX_BUFFER': 1024 * 1024,  # Unsent bytes before a slow WebSocket is dropped
+    'WARM_UP': True,               # Precompute tables before serving
+    'WARM_UP_PARTITIONS': False,   # Also score every cheating first guess (O(N^2) in the lexicon)
+    'SNAPSHOT_PATH': None,         # Session snapshot written on shutdown, restored on start
+    'ADMIN_TOKEN': None,           # X-Admin-Token for /api/admin (loopback only if unset)
+    'PROFILE_SAMPLE_RATE': 0,      # Profile one game request in this many (0 disables)
+    'COMPRESS_MIN_SIZE': 512,      # Gzip/deflate bodies from this size (None disables)
+    'COMPRESS_LEVEL': 6,
+}
+
+
+def load_lexicon(config: Dict[str, Any]) -> Lexicon:
+    """
+    Build the lexicon described by an app config.
+    
+    Args:
+        config: App configuration
+    
+    Returns:
+        Lexicon from LEXICON, WORD_LIST, WORD_LIST_PATH or the default list
+    """
+    if config.get('LEXICON') is not None:
+        return config['LEXICON']
+    if config.get('WORD_LIST') is not None:
+        return Lexicon(config['WORD_LIST'])
+    if config.get('WORD_LIST_PATH'):
+        return Lexicon(load_word_list(config['WORD_LIST_PATH']))
+    return Lexicon(get_default_word_list())
+
+
+# Key file of generated player token secrets, kept next to the snapshot or
+# in the room log directory so restored rooms accept their players' tokens
+TOKEN_SECRET_SUFFIX = '.key'
+TOKEN_SECRET_FILE = 'player_tokens.key'
+
+
+def load_token_secret(config: Dict[str, Any]) -> Optional[bytes]:
+    """
+    Get the key that signs player tokens.
+    
+    PLAYER_TOKEN_SECRET is used when set. Otherwise, if rooms outlive the
+    process (SNAPSHOT_PATH or ROOM_LOG_DIR), a random key is generated once
+    and kept in a file beside them, so tokens stay valid after a restart.
+    
+    Args:
+        config: App configuration
+    
+    Returns:
+        Token key, or None for a random per-process key
+    """
+    if config.get('PLAYER_TOKEN_SECRET'):
+        return config['PLAYER_TOKEN_SECRET'].encode('utf-8')
+    if config.get('SNAPSHOT_PATH'):
+        path = config['SNAPSHOT_PATH'] + TOKEN_SECRET_SUFFIX
+    elif config.get('ROOM_LOG_DIR'):
+        os.makedirs(config['ROOM_LOG_DIR'], exist_ok=True)
+        path = os.path.join(config['ROOM_LOG_DIR'], TOKEN_SECRET_FILE)
+    else:
+        return None
+    
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        pass
+    secret = os.urandom(32)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(secret)
+    logger.info("Generated the player token key in %s", path)
+    return secret
+
+
+class GameServer:
+    """
+    Shared state and routes of the game API.
+    
+    One instance is created per app and stored in
+    ``app.extensions['wordle']``. It owns the lexicon, the session store,
+    the event broker, the metrics registry and the admission limiters.
+    """
+    
+    def __init__(self, app: Flask, lexicon: Lexicon):
+        """
+        Initialize the server state and register the routes.
+        
+        Args:
+            app: Flask app to serve from
+            lexicon: Lexicon shared by every game
+        """
+        config = app.config
+        self.app = app
+        self.lexicon = lexicon
+        self.max_rounds = config['MAX_ROUNDS']
+        self.warm_up_partitions = config['WARM_UP_PARTITIONS']
+        self.sessions = SessionRegistry(
+            shard_count=config['SESSION_SHARDS'],
+            idle_timeout=config['SESSION_IDLE_TIMEOUT']
+        )
+        self.events = EventBroker(
+            heartbeat_interval=config['SSE_HEARTBEAT'], max_buffer=config['SSE_MAX_BUFFER']
+        )
+        self.sockets = WebSocketHub(
+            max_buffer=config['WS_MAX_BUFFER'], ping_interval=config['WS_PING_INTERVAL']
+        )
+        
+        # Points scored in every room, across restarts if a file is set
+        self.leaderboard_path = config['LEADERBOARD_PATH']
+        self.leaderboard_interval = config['LEADERBOARD_SAVE_INTERVAL']
+        if self.leaderboard_path and os.path.exists(self.leaderboard_path):
+            self.leaderboard = Leaderboard.load(self.leaderboard_path)
+        else:
+            self.leaderboard = Leaderboard()
+        # Every change to every room, if a directory is set
+        self.room_log = None
+        if config['ROOM_LOG_DIR']:
+            self.room_log = RoomLog(
+                config['ROOM_LOG_DIR'], lexicon,
+                checkpoint_interval=config['ROOM_LOG_CHECKPOINT_INTERVAL'],
+                max_open_files=config['ROOM_LOG_MAX_OPEN_FILES'],
+                keep_closed=config['ROOM_LOG_KEEP_CLOSED']
+            )
+        self.rooms = RoomManager(
+            lexicon, self.max_rounds,
+            max_players=config['ROOM_MAX_PLAYERS'],
+            player_limit=config['ROOM_PLAYER_LIMIT'],
+            shard_count=config['ROOM_SHARDS'],
+            idle_timeout=config['ROOM_IDLE_TIMEOUT'],
+            on_create=self._bind_room,
+            on_evict=self._close_room,
+            timers=TimerWheel(tick=config['ROOM_TIMER_TICK']),
+            leaderboard=self.leaderboard,
+            secret=load_token_secret(config)
+        )
+        self.bot_think_time = config['BOT_THINK_TIME']
+        if self.leaderboard_path:
+            self._schedule_leaderboard_save()
+        if self.room_log is not None:
+            self._schedule_room_log_flush(config['ROOM_LOG_FLUSH_INTERVAL'])
+        self.metrics = MetricsRegistry()
+        
+        # Admission control: per-client and global start rate limits, and a
+        # cap on concurrent CPU-heavy (cheating mode) requests
+        self.start_limiter = RateLimiter(
+            rate=config['START_RATE'], burst=config['START_BURST'],
+            max_clients=config['MAX_RATE_LIMITED_CLIENTS']
+        )
+        self.global_start_limiter = TokenBucket(
+            rate=config['GLOBAL_START_RATE'], capacity=config['GLOBAL_START_BURST']
+        )
+        self.heavy_requests = InFlightLimiter(max_in_flight=config['MAX_HEAVY_IN_FLIGHT'])
+        
+        # Set once the server is being drained for a restart: no new games
+        self.draining = False
+        self.snapshot_path = config['SNAPSHOT_PATH']
+        self.admin_token = config['ADMIN_TOKEN']
+        
+        # Opt-in sampling profiler, read from /api/admin/profile
+        self.profiler = None
+        if config['PROFILE_SAMPLE_RATE']:
+            self.profiler = RequestProfiler(config['PROFILE_SAMPLE_RATE'])
+            instrument_profiler(app, self.profiler)
+        
+        if config['COMPRESS_MIN_SIZE'] is not None:
+            instrument_compression(app, config['COMPRESS_MIN_SIZE'], config['COMPRESS_LEVEL'])
+        
+        self._setup_metrics()
+        self._setup_routes()
+        self._setup_room_routes()
+    
+    def warm_up(self) -> None:
+        """
+        Precompute shared tables so the first requests do not pay for them.
+        
+        This builds the daily puzzles of today and tomorrow and plays one
+        guess in each mode. The cheating host's first-guess partition table
+        scores every word against every other, so it is only filled up front
+        with WARM_UP_PARTITIONS; otherwise each entry is built on first use.
+        """
+        if self.warm_up_partitions:
+            precompute_first_partitions(self.lexicon)
+        
+        for mode in ('single', 'daily', 'cheating'):
+            game = self.create_game(mode)
+            game.make_guess(self.lexicon.words[0])
+    
+    def drain(self) -> None:
+        """Stop starting new games and end open event streams and sockets."""
+        self.draining = True
+        self.events.close()
+        self.sockets.close()
+        if self.room_log is not None:
+            self.room_log.flush()
+    
+    def _bind_room(self, room_id: str, room: Any) -> None:
+        """Forward a room's events to its SSE and WebSocket subscribers and its log."""
+        self.events.bind_room(room_id, room)
+        self.sockets.bind_room(room_id, room, room_channel(room_id))
+        if self.room_log is not None:
+            self.room_log.attach(room_id, room)
+    
+    def _close_room(self, room_id: str, room: Any) -> None:
+        """Mark a reclaimed or abandoned room's log as closed."""
+        if self.room_log is not None:
+            self.room_log.close(room_id, room)
+    
+    def _schedule_room_log_flush(self, interval: float) -> None:
+        """Flush the buffered room events every interval seconds."""
+        def flush() -> None:
+            try:
+                if self.room_log is not None:
+                    self.room_log.flush()
+            finally:
+                self._schedule_room_log_flush(interval)
+        
+        self.rooms.timers.schedule(interval, flush)
+        self.rooms.timers.start()
+    
+    def _schedule_leaderboard_save(self) -> None:
+        """Save the leaderboard every LEADERBOARD_SAVE_INTERVAL seconds."""
+        def save() -> None:
+            try:
+                self.save_leaderboard()
+            finally:
+                self._schedule_leaderboard_save()
+        
+        self.rooms.timers.schedule(self.leaderboard_interval, save)
+        self.rooms.timers.start()
+    
+    def save_leaderboard(self) -> Optional[int]:
+        """
+        Write the cross-room leaderboard to LEADERBOARD_PATH.
+        
+        Returns:
+            Number of players written, or None if no path is configured
+        """
+        if not self.leaderboard_path:
+            return None
+        return self.leaderboard.save(self.leaderboard_path)
+    
+    def save_snapshot(self, path: Optional[str] = None) -> Optional[Dict[str, int]]:
+        """
+        Write all live sessions and rooms to a snapshot file.
+        
+        Args:
+            path: Snapshot file (defaults to the SNAPSHOT_PATH setting)
+        
+        Returns:
+            Counts of saved sessions and rooms, or None if no path is configured
+        """
+        path = path or self.snapshot_path
+        if not path:
+            return None
+        
+        start = time.perf_counter()
+        counts = save_snapshot(path, self.lexicon, self.sessions.items(), self.rooms.items())
+        logger.info("Saved %d sessions and %d rooms to %s in %.2fs",
+                    counts['sessions'], counts['rooms'], path, time.perf_counter() - start)
+        return counts
+    
+    def restore_snapshot(self, path: Optional[str] = None) -> int:
+        """
+        Load sessions and rooms from a snapshot file and remove the file.
+        
+        The file is removed so that a later crash cannot bring back games
+        that have moved on since.
+        
+        Args:
+            path: Snapshot file (defaults to the SNAPSHOT_PATH setting)
+        
+        Returns:
+            Number of restored sessions
+        """
+        path = path or self.snapshot_path
+        if not path or not os.path.exists(path):
+            return 0
+        
+        start = time.perf_counter()
+        sessions, rooms = load_snapshot(path, self.lexicon)
+        for session_id, game in sessions:
+            self.sessions[session_id] = game
+        self.rooms.restore(rooms)
+        os.remove(path)
+        logger.info("Restored %d sessions and %d rooms from %s in %.2fs",
+                    len(sessions), len(rooms), path, time.perf_counter() - start)
+        return len(sessions)
+    
+    def recover_rooms(self) -> int:
+        """
+        Rebuild the rooms left open by a crash by replaying their logs.
+        
+        Rooms already present, e.g. restored from a snapshot, are kept.
+        
+        Returns:
+            Number of recovered rooms
+        """
+        if self.room_log is None:
+            return 0
+        
+        start = time.perf_counter()
+        rooms = self.room_log.recover(skip=self.rooms)
+        self.rooms.restore(rooms)
+        if rooms:
+            logger.info("Recovered %d rooms from %s in %.2fs",
+                        len(rooms), self.room_log.directory, time.perf_counter() - start)
+        return len(rooms)
+    
+    def create_game(self, mode: str) -> Optional[BaseGameMode]:
+        """
+        Create and start a game on the shared lexicon.
+        
+        Args:
+            mode: 'single', 'daily' or 'cheating'
+        
+        Returns:
+            Started game, or None if the mode is unknown
+        """
+        if mode == 'single':
+            game = SinglePlayerGame(self.lexicon, self.max_rounds)
+        elif mode == 'daily':
+            game = DailyGame(self.lexicon, self.max_rounds)
+        elif mode == 'cheating':
+            game = CheatingHostGame(self.lexicon, self.max_rounds)
+        else:
+            return None
+        game.start_game()
+        return game
+    
+    def _reject(self, status: int, reason: str, retry_after: float = 0):
+        """
+        Build a fast rejection response for an overloaded or rate-limited request.
+        
+        Args:
+            status: 429 for rate limiting, 503 for overload
+            reason: Short machine-readable reason, also used as a metric label
+            retry_after: Seconds the client should wait before retrying
+        
+        Returns:
+            Tuple of (response, status code)
+        """
+        self.rejected_requests.labels(reason).inc()
+        error = 'Too many requests' if status == 429 else 'Server busy'
+        response, status = api_response({'error': error, 'reason': reason}, status)
+        response.headers['Retry-After'] = str(max(1, int(retry_after + 0.999)))
+        return response, status
+    
+    def _setup_metrics(self) -> None:
+        """Register server metrics and instrument the Flask app."""
+        instrument_app(self.app, self.metrics)
+        self.metrics.gauge_function(
+            'wordle_sessions_active', 'Sessions held in the session store',
+            lambda: len(self.sessions)
+        )
+        self.metrics.counter_function(
+            'wordle_session_evictions_total', 'Idle sessions evicted from the session store',
+            lambda: self.sessions.evictions
+        )
+        self.metrics.gauge_function(
+            'wordle_rooms_active', 'Multiplayer rooms held by the room manager',
+            lambda: len(self.rooms)
+        )
+        self.metrics.counter_function(
+            'wordle_room_evictions_total', 'Idle multiplayer rooms closed',
+            lambda: self.rooms.rooms.evictions
+        )
+        self.metrics.gauge_function(
+            'wordle_room_deadlines_pending', 'Round deadlines waiting in the timer wheel',
+            lambda: len(self.rooms.timers)
+        )
+        self.metrics.gauge_function(
+            'wordle_bots_active', 'Bot players seated in multiplayer rooms',
+            lambda: len(self.rooms.bots) if self.rooms.bots is not None else 0
+        )
+        self.metrics.gauge_function(
+            'wordle_event_streams_open', 'Open Server-Sent Events streams',
+            self.events.subscriber_count
+        )
+        self.metrics.gauge_function(
+            'wordle_websockets_open', 'Open room WebSocket connections',
+            lambda: len(self.sockets)
+        )
+        self.metrics.gauge_function(
+            'wordle_room_logs_open', 'Multiplayer rooms writing an event log',
+            lambda: len(self.room_log) if self.room_log is not None else 0
+        )
+        self.rejected_requests = self.metrics.counter(
+            'wordle_requests_rejected_total', 'Requests rejected by admission control',
+            ('reason',)
+        )
+    
+    def _is_admin(self) -> bool:
+        """Check that the current request may use the admin routes."""
+        if self.admin_token:
+            token = request.headers.get('X-Admin-Token', '')
+            return hmac.compare_digest(token, self.admin_token)
+        return request.remote_addr in ('127.0.0.1', '::1')
+    
+    def _publish_state(self, session_id: str, game: BaseGameMode, event_type: str) -> None:
+        """
+        Push a session's change to its event stream, if anyone is following it.
+        
+        Args:
+            session_id: Session identifier
+            game: Game whose state changed
+            event_type: 'state' for a full snapshot, 'guess' for the latest guess only
+        """
+        channel = session_channel(session_id)
+        if not self.events.has_subscribers(channel):
+            return
+        
+        if event_type == 'guess':
+            data = game.get_state_delta(game.state_version - 1)
+        else:
+            data = game.get_game_state()
+        self.events.publish(channel, event_type, data)
+    
+    def _event_stream(self, channel: str, snapshot: Callable[[], Any]) -> Response:
+        """
+        Answer a request to follow a channel as Server-Sent Events.
+        
+        On the pooled server the socket is handed to the broker's hub once
+        the response head is sent, so the stream holds no worker thread.
+        Other servers get a generator that keeps one worker busy.
+        
+        Args:
+            channel: Channel to follow
+            snapshot: Returns the state sent as the first event; called
+                after subscribing so no later event is missed
+        
+        Returns:
+            The event-stream response
+        """
+        last_event_id = request.headers.get('Last-Event-ID', type=int)
+        headers = {'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        upgrade = request.environ.get(UPGRADE_ENVIRON_KEY)
+        if upgrade is None:
+            stream = self.events.stream(
+                channel, initial=('state', snapshot()), last_event_id=last_event_id
+            )
+            return Response(stream, mimetype='text/event-stream', headers=headers)
+        
+        conn, missed = self.events.subscribe(channel, last_event_id)
+        try:
+            initial = format_sse('state', snapshot()) + missed
+        except Exception:
+            self.events.cancel(conn)
+            raise
+        upgrade(lambda sock, buffered: self.events.attach(conn, sock, initial))
+        return Response(iter(()), mimetype='text/event-stream', headers=headers)
+    
+    def _setup_routes(self) -> None:
+        """Set up Flask routes for the API."""
+        app = self.app
+        
+        @app.route('/api/game/start', methods=['POST'])
+        def start_game():
+            """Start a new game."""
+            try:
+                if self.draining:
+                    return self._reject(503, 'draining', 5)
+                wait = self.start_limiter.allow(request.remote_addr or 'unknown')
+                if wait:
+                    return self._reject(429, 'client_rate', wait)
+                wait = self.global_start_limiter.try_acquire()
+                if wait:
+                    return self._reject(429, 'global_rate', wait)
+                
+                data = request.get_json(silent=True) or {}
+                session_id = data.get('session_id') or generate_session_id('session')
+                game_mode = data.get('mode', 'single')
+                
+                if game_mode == 'cheating':
+                    if not self.heavy_requests.try_acquire():
+                        return self._reject(503, 'overloaded')
+                    try:
+                        game = self.create_game(game_mode)
+                    finally:
+                        self.heavy_requests.release()
+                else:
+                    game = self.create_game(game_mode)
+                
+                if game is None:
+                    return api_response({'error': 'Invalid game mode'}, 400)
+                
+                if not self.sessions.add(session_id, game):
+                    return api_response({'error': 'Session id already in use'}, 409)
+                self._publish_state(session_id, game, 'state')
+                
+                return api_response({
+                    'success': True,
+                    'session_id': session_id,
+                    'game_state': game.get_game_state(),
+                    'message': 'Game started successfully'
+                })
+            
+            except Exception as e:
+                return api_response({'error': str(e)}, 500)
+        
+        @app.route('/api/game/guess', methods=['POST'])
+        def make_guess():
+            """Make a guess in the game."""
+            try:
+                data = request.get_json(silent=True)
+                if not data:
+                    return api_response({'error': 'No data provided'}, 400)
+                
+                session_id = data.get('session_id')
+                guess = data.get('guess')
+                
+                if not session_id or not guess:
+                    return api_response({'error': 'Missing session_id or guess'}, 400)
+                
+                game = self.sessions.get(session_id)
+                if game is None:
+                    return api_response({'error': 'Game not found'}, 404)
+                
+                version = game.state_version
+                if isinstance(game, CheatingHostGame):
+                    if not self.heavy_requests.try_acquire():
+                        return self._reject(503, 'overloaded')
+                    try:
+                        result = game.make_guess(guess)
+                    finally:
+                        self.heavy_requests.release()
+                else:
+                    result = game.make_guess(guess)
+                if game.state_version != version:
+                    self._publish_state(session_id, game, 'guess')
+                
+                # fields=minimal skips the full state, whose guess history
+                # the client already has from earlier responses, and the
+                # counters the result already carries
+                payload = {'success': True, 'result': result}
+                if (data.get('fields') or request.args.get('fields')) == 'minimal':
+                    payload.update(
+                        (key, value) for key, value in game.get_state_summary().items()
+                        if key not in result
+                    )
+                else:
+                    payload['game_state'] = game.get_game_state()
+                return api_response(payload)
+            
+            except Exception as e:
+                return api_response({'error': str(e)}, 500)
+        
+        @app.route('/api/game/state/<session_id>', methods=['GET'])
+        def get_game_state(session_id):
+            """Get the current game state."""
+            try:
+                game = self.sessions.get(session_id)
+                if game is None:
+                    return api_response({'error': 'Game not found'}, 404)
+                return state_response(session_id, game)
+            
+            except Exception as e:
+                return api_response({'error': str(e)}, 500)
+        
+        @app.route('/api/game/reset/<session_id>', methods=['POST'])
+        def reset_game(session_id):
+            """Reset a game."""
+            try:
+                game = self.sessions.get(session_id)
+                if game is None:
+                    return api_response({'error': 'Game not found'}, 404)
+                
+                game.start_game()
+                self._publish_state(session_id, game, 'state')
+                
+                return api_response({
+                    'success': True,
+                    'message': 'Game reset successfully',
+                    'game_state': game.get_game_state()
+                })
+            
+            except Exception as e:
+                return api_response({'error': str(e)}, 500)
+        
+        @app.route('/api/events/session/<session_id>', methods=['GET'])
+        def session_events(session_id):
+            """Stream a session's state changes as Server-Sent Events."""
+            game = self.sessions.get(session_id)
+            if game is None:
+                return api_response({'error': 'Game not found'}, 404)
+            return self._event_stream(session_channel(session_id), game.get_game_state)
+        
+        @app.route('/api/admin/drain', methods=['POST'])
+        def drain():
+            """Stop new games and snapshot the live sessions and leaderboard before a restart."""
+            if not self._is_admin():
+                return api_response({'error': 'Forbidden'}, 403)
+            
+            try:
+                self.drain()
+                counts = self.save_snapshot()
+                self.save_leaderboard()
+                return api_response({
+                    'success': True,
+                    'draining': True,
+                    'active_games': len(self.sessions),
+                    'snapshot': self.snapshot_path if counts is not None else None
+                })
+            
+            except Exception as e:
+                return api_response({'error': str(e)}, 500)
+        
+        @app.route('/api/admin/profile', methods=['GET'])
+        def profile():
+            """Report the sampled profiles of the game routes."""
+            if not self._is_admin():
+                return api_response({'error': 'Forbidden'}, 403)
+            if self.profiler is None:
+                return api_response({'error': 'Profiling is disabled'}, 404)
+            
+            endpoint = request.args.get('route') or None
+            if endpoint is not None and endpoint not in self.profiler.endpoints:
+                return api_response({'error': f'Unknown route: {endpoint}'}, 400)
+            
+            try:
+                if request.args.get('format') == 'pstats':
+                    body = Response(self.profiler.dump(endpoint), mimetype='application/octet-stream')
+                else:
+                    report = self.profiler.report(
+                        endpoint,
+                        sort=request.args.get('sort', 'cumulative'),
+                        limit=request.args.get('limit', 40, type=int)
+                    )
+                    samples = ', '.join(
+                        f'{name}={count}' for name, count in sorted(self.profiler.samples().items())
+                    )
+                    body = Response(f"Samples: {samples or 'none'}\n\n{report}", mimetype='text/plain')
+            except KeyError as e:
+                return api_response({'error': f'Unknown sort key: {e}'}, 400)
+            
+            if request.args.get('reset') == '1':
+                self.profiler.reset()
+            return body
+        
+        @app.route('/metrics', methods=['GET'])
+        def metrics():
+            """Expose metrics in the Prometheus text format."""
+            return metrics_response(self.metrics)
+        
+        @app.route('/api/health', methods=['GET'])
+        def health_check():
+            """Health check endpoint."""
+            return api_response({
+                'status': 'draining' if self.draining else 'healthy',
+                'active_games': len(self.sessions),
+                'words': len(self.lexicon),
+                'timestamp': time.time()
+            })
+    
+    def _setup_room_routes(self) -> None:
+        """Set up Flask routes for multiplayer rooms."""
+        app = self.app
+        
+        def player_name(data: Dict[str, Any]) -> str:
+            return str(data.get('player_name') or 'Player')[:32]
+        
+        def player_id(data: Dict[str, Any]) -> Optional[str]:
+            # Clients that keep their id (and its token) across rooms build
+            # up one leaderboard entry; otherwise each join gets a fresh id
+            value = data.get('player_id')
+            if value is None:
+                return None
+            if not isinstance(value, str) or not 0 < len(value) <= 64:
+                raise RoomError('player_id must be a string of 1 to 64 characters')
+            return value
+        
+        def credentials(data: Any) -> Tuple[str, str]:
+            # Actions on behalf of a player need the token issued on joining
+            player, token = data.get('player_id'), data.get('player_token')
+            if not player or not token:
+                raise RoomError('Missing player_id or player_token')
+            return player, token
+        
+        @app.errorhandler(RoomError)
+        def room_error(e):
+            return api_response({'success': False, 'error': str(e)}, e.status)
+        
+        @app.route('/api/rooms', methods=['POST'])
+        def create_room():
+            """Create a room with the caller as its first player."""
+            if self.draining:
+                return self._reject(503, 'draining', 5)
+            wait = self.start_limiter.allow(request.remote_addr or 'unknown')
+            if wait:
+                return self._reject(429, 'client_rate', wait)
+            
+            data = request.get_json(silent=True) or {}
+            max_players = data.get('max_players')
+            if max_players is not None and not isinstance(max_players, int):
+                return api_response({'error': 'max_players must be an integer'}, 400)
+            room_id, joined = self.rooms.create_room(
+                player_name(data), player_id(data), max_players=max_players,
+                token=data.get('player_token')
+            )
+            joined['room_id'] = room_id
+            return api_response(joined, 201)
+        
+        @app.route('/api/rooms/quickmatch', methods=['POST'])
+        def quick_match():
+            """Place the caller in the oldest open room, or a new one."""
+            if self.draining:
+                return self._reject(503, 'draining', 5)
+            wait = self.start_limiter.allow(request.remote_addr or 'unknown')
+            if wait:
+                return self._reject(429, 'client_rate', wait)
+            
+            data = request.get_json(silent=True) or {}
+            room_id, joined = self.rooms.quick_match(
+                player_name(data), player_id(data), data.get('player_token')
+            )
+            joined['room_id'] = room_id
+            return api_response(joined)
+        
+        @app.route('/api/rooms/<room_id>/join', methods=['POST'])
+        def join_room(room_id):
+            """Join a room; the game starts once the room is full."""
+            data = request.get_json(silent=True) or {}
+            joined = self.rooms.join(
+                room_id, player_name(data), player_id(data), data.get('player_token')
+            )
+            joined['room_id'] = room_id
+            return api_response(joined)
+        
+        @app.route('/api/rooms/<room_id>/leave', methods=['POST'])
+        def leave_room(room_id):
+            """Leave a room; the last player out closes it."""
+            data = request.get_json(silent=True) or {}
+            return api_response(self.rooms.leave(room_id, *credentials(data)))
+        
+        @app.route('/api/rooms/<room_id>/start', methods=['POST'])
+        def start_room(room_id):
+            """Start a room's game without waiting for it to fill."""
+            data = request.get_json(silent=True) or {}
+            state = self.rooms.start(room_id, *credentials(data))
+            return api_response({'success': True, 'game_state': state})
+        
+        @app.route('/api/rooms/<room_id>/bots', methods=['POST'])
+        def room_bots(room_id):
+            """Fill free seats of a room with bot players."""
+            if self.draining:
+                return self._reject(503, 'draining', 5)
+            data = request.get_json(silent=True) or {}
+            player, token = credentials(data)
+            count = data.get('count')
+            if count is not None and not isinstance(count, int):
+                return api_response({'error': 'count must be an integer'}, 400)
+            skill = data.get('skill', 0.5)
+            think_time = data.get('think_time', self.bot_think_time)
+            if not all(isinstance(value, (int, float)) for value in (skill, think_time)):
+                return api_response({'error': 'skill and think_time must be numbers'}, 400)
+            
+            added = self.rooms.add_bots(
+                room_id, player, token, count, skill=float(skill), think_time=float(think_time)
+            )
+            added['room_id'] = room_id
+            return api_response(added)
+        
+        @app.route('/api/rooms/<room_id>/guess', methods=['POST'])
+        def room_guess(room_id):
+            """Make a player's guess in a room."""
+            data = request.get_json(silent=True) or {}
+            player, token = credentials(data)
+            guess = data.get('guess')
+            if not guess:
+                return api_response({'error': 'Missing guess'}, 400)
+            
+            result = self.rooms.guess(room_id, player, token, guess)
+            # fields=minimal leaves out the room summary, which followers of
+            # the room's event stream already have
+            if (data.get('fields') or request.args.get('fields')) == 'minimal':
+                result.pop('game_state', None)
+            return api_response(result, 200 if result['success'] else 400)
+        
+        @app.route('/api/rooms/<room_id>', methods=['GET'])
+        def room_state(room_id):
+            """Get a room's state, or one player's view of it."""
+            state = self.rooms.state(
+                room_id, request.args.get('player_id') or None, request.args.get('player_token')
+            )
+            return api_response({'success': True, 'room_id': room_id, 'state': state})
+        
+        @app.route('/api/leaderboard', methods=['GET'])
+        def leaderboard():
+            """Get the top players across all rooms."""
+            limit = min(max(request.args.get('limit', 10, type=int), 1), 100)
+            offset = max(request.args.get('offset', 0, type=int), 0)
+            top = self.leaderboard.top(limit, start=offset)
+            return api_response({
+                'success': True,
+                'players': len(self.leaderboard),
+                'leaderboard': [
+                    {'rank': offset + i + 1, 'player_id': member, 'score': score}
+                    for i, (member, score) in enumerate(top)
+                ]
+            })
+        
+        @app.route('/api/leaderboard/<player_id>', methods=['GET'])
+        def leaderboard_rank(player_id):
+            """Get one player's rank across all rooms."""
+            rank = self.leaderboard.rank(player_id)
+            if rank is None:
+                return api_response({'error': 'Player not ranked'}, 404)
+            return api_response({
+                'success': True,
+                'player_id': player_id,
+                'rank': rank,
+                'score': self.leaderboard.score(player_id),
+                'players': len(self.leaderboard)
+            })
+        
+        @app.route('/api/ws/room/<room_id>', methods=['GET'])
+        def room_socket_http(room_id):
+            """Refuse plain HTTP requests for a room socket."""
+            return api_response({'error': 'Expected a WebSocket upgrade'}, 400)
+        
+        @app.route('/api/ws/room/<room_id>', methods=['GET'], websocket=True)
+        def room_socket(room_id):
+            """Follow a room's events over a WebSocket, as one of its players."""
+            key = request.headers.get('Sec-WebSocket-Key')
+            if not key:
+                return api_response({'error': 'Missing Sec-WebSocket-Key'}, 400)
+            if request.headers.get('Sec-WebSocket-Version') != '13':
+                response, status = api_response({'error': 'Unsupported WebSocket version'}, 426)
+                response.headers['Sec-WebSocket-Version'] = '13'
+                return response, status
+            upgrade = request.environ.get(UPGRADE_ENVIRON_KEY)
+            if upgrade is None:
+                return api_response({'error': 'WebSockets need the production server'}, 501)
+            self.rooms.check_player(room_id, *credentials(request.args))
+            
+            # Subscribe before the snapshot so no event falls between the two
+            conn = self.sockets.subscribe(room_channel(room_id))
+            try:
+                initial = compact_event('state', self.rooms.state(room_id))
+            except RoomError:
+                self.sockets.cancel(conn)
+                raise
+            upgrade(lambda sock, buffered: self.sockets.attach(conn, sock, initial, buffered))
+            response = Response(status=101)
+            del response.headers['Content-Type']
+            response.headers['Upgrade'] = 'websocket'
+            response.headers['Connection'] = 'Upgrade'
+            response.headers['Sec-WebSocket-Accept'] = accept_key(key)
+            return response
+        
+        @app.route('/api/events/room/<room_id>', methods=['GET'])
+        def room_events(room_id):
+            """Stream a room's events as Server-Sent Events to one of its players."""
+            self.rooms.check_player(room_id, *credentials(request.args))
+            return self._event_stream(room_channel(room_id), lambda: self.rooms.state(room_id))
+
+
+def create_app(config: Optional[Dict[str, Any]] = None) -> Flask:
+    """
+    Create the game API app.
+    
+    The lexicon is loaded and validated here, once, and unless WARM_UP is
+    disabled the precomputed tables are built before the app is returned,
+    so the server is warm before it accepts traffic.
+    
+    Args:
+        config: Settings overriding DEFAULT_CONFIG
+    
+    Returns:
+        Configured Flask app; its GameServer is in app.extensions['wordle']
+    """
+    app = Flask(__name__)
+    app.config.update(DEFAULT_CONFIG)
+    if config:
+        app.config.update(config)
+    
+    app.json = WordleJSONProvider(app)
+    CORS(app)  # Enable CORS for web clients
+    
+    server = GameServer(app, load_lexicon(app.config))
+    app.extensions['wordle'] = server
+    
+    server.restore_snapshot()
+    server.recover_rooms()
+    if app.config['WARM_UP']:
+        server.warm_up()
+    
+    return app
+
+
+def serve_app(app: Flask, host: str = '0.0.0.0', port: int = 8080, **options) -> None:
+    """
+    Serve an app from create_app with the production server.
+    
+    On SIGTERM the server stops starting games, finishes in-flight
+    requests and then writes the session snapshot and the leaderboard and
+    closes the room logs, if they are configured.
+    
+    Sessions and rooms live in process memory, so the app is served from a
+    single process; scale it with threads, or run several instances behind
+    a proxy that keeps each client on one instance.
+    
+    Args:
+        app: App created by create_app
+        host: Host to bind to
+        port: Port to bind to
+        **options: Options for serving.serve (threads, keep_alive, ...)
+    
+    Raises:
+        ValueError: If more than one process is requested
+    """
+    if options.pop('processes', 1) > 1:
+        # Separate processes share no memory, so sessions, rooms and event
+        # streams would each be visible to only one of them
+        raise ValueError("Games are kept in process memory; serve them from one process")
+    
+    server = app.extensions['wordle']
+    serve(app, host, port, on_drain=server.drain, **options)
+    server.save_snapshot()
+    server.save_leaderboard()
+    if server.room_log is not None:
+        server.room_log.shutdown()
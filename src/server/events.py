@@ -0,0 +1,290 @@
+"""
+Server-Sent Events support for the game API.
+
+This module provides a small publish/subscribe broker. Game routes publish
+state changes to named channels (``session:<id>`` or ``room:<id>``) and
+clients follow a channel through a ``text/event-stream`` response instead of
+polling the state endpoints. On the pooled server the response socket is
+detached from its worker and written by an EventStreamHub thread, so open
+streams cost no worker threads.
+"""
+
+import json
+import socket
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Tuple
+
+from .fanout import SocketHub, _Connection
+from .wire import WordleJSONProvider
+
+
+def session_channel(session_id: str) -> str:
+    """Get the channel name for a single-player session."""
+    return f"session:{session_id}"
+
+
+def room_channel(room_id: str) -> str:
+    """Get the channel name for a multiplayer room."""
+    return f"room:{room_id}"
+
+
+def format_sse(event_type: str, data: Any, event_id: Optional[int] = None) -> bytes:
+    """
+    Serialize an event in the Server-Sent Events wire format.
+    
+    Args:
+        event_type: Event name sent in the ``event:`` field
+        data: JSON-serializable payload
+        event_id: Optional id sent in the ``id:`` field
+    
+    Returns:
+        Encoded event, terminated by a blank line
+    """
+    body = json.dumps(data, separators=(',', ':'), default=WordleJSONProvider.default)
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event_type}")
+    lines.append(f"data: {body}")
+    return ('\n'.join(lines) + '\n\n').encode('utf-8')
+
+
+# Comment line sent to keep idle connections (and proxies) alive
+HEARTBEAT = b": heartbeat\n\n"
+
+
+class _Channel:
+    """Recent events and subscriber bookkeeping for one channel."""
+    
+    __slots__ = ('condition', 'events', 'last_id', 'subscribers')
+    
+    def __init__(self, history_size: int):
+        self.condition = threading.Condition()
+        self.events: Deque[Tuple[int, bytes]] = deque(maxlen=history_size)
+        self.last_id = 0
+        self.subscribers = 0
+
+
+class EventStreamHub(SocketHub):
+    """
+    Owns detached event-stream sockets and sends them heartbeats.
+    
+    Clients send nothing after the request, so input is ignored and only
+    end-of-file or a failed write ends a stream.
+    """
+    
+    name = 'event-stream'
+    
+    def __init__(self, on_drop: Callable[[str], None], max_buffer: int = 1024 * 1024,
+                 heartbeat_interval: float = 15.0):
+        """
+        Initialize the hub; its thread starts with the first stream.
+        
+        Args:
+            on_drop: Called with the channel of every stream that ends
+            max_buffer: Unsent bytes allowed per stream before it is dropped
+            heartbeat_interval: Seconds between heartbeats
+        """
+        super().__init__(max_buffer=max_buffer, keepalive_interval=heartbeat_interval)
+        self._on_drop = on_drop
+    
+    def _keepalive(self, now: float) -> None:
+        for subscribers in list(self._channels.values()):
+            for conn in list(subscribers):
+                self._send(conn, HEARTBEAT)
+    
+    def _dropped(self, conn: _Connection) -> None:
+        self._on_drop(conn.channel)
+
+
+class EventBroker:
+    """
+    Publish/subscribe hub for Server-Sent Events.
+    
+    Channels only exist while someone is subscribed, so publishing to a
+    channel nobody follows is a single dictionary lookup. Each event is
+    serialized once and the same bytes are written to every subscriber.
+    
+    Streams are served in one of two ways. Detached streams (``subscribe``
+    then ``attach``) hand their socket to the broker's EventStreamHub.
+    ``stream`` is a generator for servers that cannot detach a socket; it
+    keeps the worker thread serving it busy until the client leaves.
+    """
+    
+    def __init__(self, history_size: int = 32, heartbeat_interval: float = 15.0,
+                 max_buffer: int = 1024 * 1024):
+        """
+        Initialize the broker.
+        
+        Args:
+            history_size: Number of recent events kept per channel for
+                clients reconnecting with ``Last-Event-ID``
+            heartbeat_interval: Seconds of inactivity before a heartbeat is sent
+            max_buffer: Unsent bytes allowed per detached stream before it is dropped
+        """
+        self.history_size = history_size
+        self.heartbeat_interval = heartbeat_interval
+        self._channels: Dict[str, _Channel] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self.hub = EventStreamHub(self._hub_dropped, max_buffer, heartbeat_interval)
+    
+    def has_subscribers(self, channel: str) -> bool:
+        """Check if anyone is currently following a channel."""
+        return channel in self._channels
+    
+    def subscriber_count(self) -> int:
+        """Get the total number of open streams across all channels."""
+        return sum(ch.subscribers for ch in list(self._channels.values()))
+    
+    def publish(self, channel: str, event_type: str, data: Any) -> Optional[int]:
+        """
+        Publish an event to a channel.
+        
+        Args:
+            channel: Channel name
+            event_type: Event name
+            data: JSON-serializable payload
+        
+        Returns:
+            The event id, or None if the channel has no subscribers
+        """
+        ch = self._channels.get(channel)
+        if ch is None:
+            return None
+        
+        with ch.condition:
+            ch.last_id += 1
+            message = format_sse(event_type, data, ch.last_id)
+            ch.events.append((ch.last_id, message))
+            ch.condition.notify_all()
+            self.hub.publish(channel, message)
+            return ch.last_id
+    
+    def subscribe(self, channel: str,
+                  last_event_id: Optional[int] = None) -> Tuple[_Connection, bytes]:
+        """
+        Start a detached stream (called from a worker thread).
+        
+        Events published from now on are queued for the stream, so a
+        snapshot taken after this call misses none of them.
+        
+        Args:
+            channel: Channel name
+            last_event_id: Resume after this event id if it is still buffered
+        
+        Returns:
+            A handle to pass to attach or cancel, and the encoded buffered
+            events the client missed
+        """
+        ch = self._subscribe(channel)
+        with ch.condition:
+            conn = self.hub.subscribe(channel)
+            cursor = self._cursor(ch, last_event_id)
+            missed = b''.join(message for event_id, message in ch.events if event_id > cursor)
+        if conn.dropped:
+            self._unsubscribe(channel, ch)  # The broker is closed
+        return conn, missed
+    
+    def attach(self, conn: _Connection, sock: socket.socket, initial: bytes = b'') -> None:
+        """
+        Hand a stream's socket to the hub once its response head is sent.
+        
+        Args:
+            conn: Handle returned by subscribe
+            sock: Socket of the stream
+            initial: Encoded events sent before any new one, e.g. a snapshot
+        """
+        self.hub.attach(conn, sock, initial)
+    
+    def cancel(self, conn: _Connection) -> None:
+        """Drop a detached stream whose socket will never be attached."""
+        self.hub.cancel(conn)
+    
+    def stream(self, channel: str, initial: Optional[Tuple[str, Any]] = None,
+               last_event_id: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Follow a channel as a stream of encoded events.
+        
+        Args:
+            channel: Channel name
+            initial: Optional (event type, data) sent first, e.g. a state snapshot
+            last_event_id: Resume after this event id if it is still buffered
+        
+        Yields:
+            Encoded SSE events and heartbeats until the broker is closed or
+            the client disconnects
+        """
+        ch = self._subscribe(channel)
+        try:
+            with ch.condition:
+                cursor = self._cursor(ch, last_event_id)
+            
+            if initial is not None:
+                yield format_sse(initial[0], initial[1])
+            
+            while not self._closed:
+                with ch.condition:
+                    if ch.last_id == cursor:
+                        ch.condition.wait(self.heartbeat_interval)
+                    pending = [message for event_id, message in ch.events if event_id > cursor]
+                    cursor = ch.last_id
+                
+                if self._closed:
+                    break
+                if pending:
+                    yield b''.join(pending)
+                else:
+                    yield HEARTBEAT
+        finally:
+            self._unsubscribe(channel, ch)
+    
+    def close(self) -> None:
+        """End all open streams, e.g. during shutdown."""
+        self._closed = True
+        for ch in list(self._channels.values()):
+            with ch.condition:
+                ch.condition.notify_all()
+        self.hub.close()
+    
+    @staticmethod
+    def _cursor(ch: _Channel, last_event_id: Optional[int]) -> int:
+        """Get the id after which a new subscriber's events start."""
+        if last_event_id is not None and ch.events and ch.events[0][0] <= last_event_id + 1:
+            return min(last_event_id, ch.last_id)
+        return ch.last_id
+    
+    def _subscribe(self, channel: str) -> _Channel:
+        """Register a subscriber, creating the channel if needed."""
+        with self._lock:
+            ch = self._channels.get(channel)
+            if ch is None:
+                ch = _Channel(self.history_size)
+                self._channels[channel] = ch
+            ch.subscribers += 1
+            return ch
+    
+    def _unsubscribe(self, channel: str, ch: _Channel) -> None:
+        """Remove a subscriber, dropping the channel once nobody follows it."""
+        with self._lock:
+            ch.subscribers -= 1
+            if ch.subscribers <= 0 and self._channels.get(channel) is ch:
+                del self._channels[channel]
+    
+    def _hub_dropped(self, channel: str) -> None:
+        """Remove a detached subscriber once the hub has closed its stream."""
+        ch = self._channels.get(channel)
+        if ch is not None:
+            self._unsubscribe(channel, ch)
+    
+    def bind_room(self, room_id: str, game: Any) -> None:
+        """
+        Forward a multiplayer room's events to its channel.
+        
+        Args:
+            room_id: Room identifier
+            game: MultiplayerGame instance
+        """
+        channel = room_channel(room_id)
+        game.add_listener(lambda event_type, data: self.publish(channel, event_type, data))
@@ -0,0 +1,359 @@
+"""
+Selector-driven fan-out of events to detached sockets.
+
+Routes that stream events take their socket over from the pooled HTTP
+server through its upgrade hook and hand it to a SocketHub. One hub thread
+owns every such socket through a selector, so open streams cost no worker
+threads. Each published message is encoded once by the caller and the
+same bytes are queued on every subscriber of its channel. Protocols plug
+in through ``_received``, ``_keepalive`` and ``_goodbye``.
+"""
+
+import logging
+import selectors
+import socket
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Set, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class _Connection:
+    """One subscriber, owned by the hub thread; its socket arrives after the response head."""
+    
+    __slots__ = ('sock', 'channel', 'out', 'out_size', 'last_seen', 'closing', 'dropped')
+    
+    def __init__(self, channel: str):
+        self.sock: Optional[socket.socket] = None
+        self.channel = channel
+        self.out: Deque[memoryview] = deque()
+        self.out_size = 0
+        self.last_seen = time.monotonic()
+        self.closing = False
+        self.dropped = False
+
+
+class SocketHub:
+    """
+    Owns detached sockets and fans messages out to them.
+    
+    ``publish`` may be called from any thread: it queues the message for
+    the hub thread, which writes it to every subscriber of the channel
+    without blocking. A subscriber whose unsent output grows past
+    ``max_buffer`` is disconnected rather than slowing everyone down.
+    
+    Subscribing takes two steps so no message is lost while the response
+    head is written: ``subscribe`` is called before the state snapshot is
+    taken and messages queue on the connection from then on, and
+    ``attach`` hands over the socket once the head has been sent.
+    """
+    
+    # Used in the hub thread's name and in log messages
+    name = 'socket'
+    connection_class = _Connection
+    
+    def __init__(self, max_buffer: int = 1024 * 1024, keepalive_interval: float = 30.0):
+        """
+        Initialize the hub; its thread starts with the first connection.
+        
+        Args:
+            max_buffer: Unsent bytes allowed per socket before it is dropped
+            keepalive_interval: Seconds between calls to ``_keepalive``
+        """
+        self.max_buffer = max_buffer
+        self.keepalive_interval = keepalive_interval
+        self._selector = selectors.DefaultSelector()
+        self._wakeup_read, self._wakeup_write = socket.socketpair()
+        self._wakeup_read.setblocking(False)
+        self._wakeup_write.setblocking(False)
+        self._selector.register(self._wakeup_read, selectors.EVENT_READ)
+        # New subscribers, (connection, socket, initial bytes, buffered input)
+        # handovers, and (channel, message) pairs to send
+        self._incoming: Deque[_Connection] = deque()
+        self._attaching: Deque[Tuple[_Connection, Optional[socket.socket], bytes, bytes]] = deque()
+        self._outgoing: Deque[Tuple[str, bytes]] = deque()
+        self._channels: Dict[str, Set[_Connection]] = {}
+        # Subscriber count per channel, including pending ones; readable from any thread
+        self._subscribed: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.dropped = 0
+    
+    def __len__(self) -> int:
+        return sum(len(conns) for conns in list(self._channels.values()))
+    
+    def has_subscribers(self, channel: str) -> bool:
+        """Check if any socket follows a channel."""
+        return bool(self._subscribed.get(channel))
+    
+    def subscribe(self, channel: str) -> _Connection:
+        """
+        Start following a channel (called from a worker thread).
+        
+        Messages published from now on are queued until the socket is
+        attached, so a snapshot taken after this call misses nothing.
+        
+        Args:
+            channel: Channel to follow
+        
+        Returns:
+            Connection handle to pass to attach or cancel
+        """
+        conn = self.connection_class(channel)
+        with self._lock:
+            if self._closed:
+                conn.dropped = True
+                return conn
+            self._subscribed[channel] = self._subscribed.get(channel, 0) + 1
+            self._incoming.append(conn)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=f'{self.name}-hub', daemon=True)
+                self._thread.start()
+        self._wake()
+        return conn
+    
+    def attach(self, conn: _Connection, sock: socket.socket, initial: Optional[bytes] = None,
+               buffered: bytes = b'') -> None:
+        """
+        Take over a detached socket (called from a worker thread).
+        
+        Args:
+            conn: Handle returned by subscribe
+            sock: Socket whose response head has been sent
+            initial: Optional bytes sent before any message, e.g. a state snapshot
+            buffered: Bytes the HTTP server already read past the request
+        """
+        sock.setblocking(False)
+        with self._lock:
+            if self._closed or conn.dropped:
+                sock.close()
+                return
+            self._attaching.append((conn, sock, initial or b'', buffered))
+        self._wake()
+    
+    def cancel(self, conn: _Connection) -> None:
+        """Drop a subscription whose socket will never be attached."""
+        with self._lock:
+            if self._closed or conn.dropped:
+                return
+            self._attaching.append((conn, None, b'', b''))
+        self._wake()
+    
+    def publish(self, channel: str, message: bytes) -> bool:
+        """
+        Send a message to every socket following a channel.
+        
+        Args:
+            channel: Channel name
+            message: Encoded message, shared by all subscribers
+        
+        Returns:
+            True if the channel had subscribers
+        """
+        if not self._subscribed.get(channel):
+            return False
+        self._outgoing.append((channel, message))
+        self._wake()
+        return True
+    
+    def close(self) -> None:
+        """Say goodbye to every socket and stop the hub."""
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+        self._wake()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(5)
+    
+    def _received(self, conn: _Connection, data: bytes) -> None:
+        """Handle bytes sent by a client; ignored unless a protocol needs them."""
+    
+    def _keepalive(self, now: float) -> None:
+        """Called every keepalive interval to keep idle sockets open."""
+    
+    def _goodbye(self) -> bytes:
+        """Get the bytes written to every socket when the hub shuts down."""
+        return b''
+    
+    def _dropped(self, conn: _Connection) -> None:
+        """Called once a connection has been unsubscribed."""
+    
+    def _wake(self) -> None:
+        try:
+            self._wakeup_write.send(b'\0')
+        except (BlockingIOError, OSError):
+            pass  # A wakeup is already pending, or the hub is closed
+    
+    def _run(self) -> None:
+        next_keepalive = time.monotonic() + self.keepalive_interval
+        try:
+            while not self._closed:
+                timeout = max(0.0, next_keepalive - time.monotonic())
+                for key, events in self._selector.select(timeout):
+                    conn = key.data
+                    if conn is None:
+                        try:
+                            while self._wakeup_read.recv(4096):
+                                pass
+                        except BlockingIOError:
+                            pass
+                        continue
+                    if events & selectors.EVENT_READ:
+                        self._read(conn)
+                    if events & selectors.EVENT_WRITE and not conn.dropped:
+                        self._flush(conn)
+                
+                self._adopt()
+                self._fan_out()
+                
+                now = time.monotonic()
+                if now >= next_keepalive:
+                    self._keepalive(now)
+                    next_keepalive = now + self.keepalive_interval
+        finally:
+            self._shutdown()
+    
+    def _adopt(self) -> None:
+        """Add new subscribers and register the sockets handed over for them."""
+        while self._incoming:
+            conn = self._incoming.popleft()
+            self._channels.setdefault(conn.channel, set()).add(conn)
+        
+        while self._attaching:
+            conn, sock, initial, buffered = self._attaching.popleft()
+            if conn.dropped:
+                if sock is not None:
+                    sock.close()
+                continue
+            if sock is None:
+                self._drop(conn)
+                continue
+            conn.sock = sock
+            conn.last_seen = time.monotonic()
+            # The snapshot goes ahead of the messages queued since subscribe
+            if initial:
+                conn.out.appendleft(memoryview(initial))
+                conn.out_size += len(initial)
+            self._selector.register(sock, selectors.EVENT_READ | selectors.EVENT_WRITE, conn)
+            self._flush(conn)
+            if buffered and not conn.dropped:
+                self._received(conn, buffered)
+    
+    def _fan_out(self) -> None:
+        """Write queued messages to their subscribers."""
+        while self._outgoing:
+            channel, message = self._outgoing.popleft()
+            for conn in list(self._channels.get(channel, ())):
+                self._send(conn, message)
+    
+    def _send(self, conn: _Connection, data: bytes) -> None:
+        # Nothing follows a close
+        if conn.closing or conn.dropped:
+            return
+        if not conn.out and conn.sock is not None:
+            try:
+                sent = conn.sock.send(data)
+            except BlockingIOError:
+                sent = 0
+            except OSError:
+                self._drop(conn)
+                return
+            if sent == len(data):
+                return
+            data = data[sent:]
+            self._selector.modify(conn.sock, selectors.EVENT_READ | selectors.EVENT_WRITE, conn)
+        
+        conn.out.append(memoryview(data))
+        conn.out_size += len(data)
+        if conn.out_size > self.max_buffer:
+            logger.info("Dropping slow %s subscriber of %s", self.name, conn.channel)
+            self._drop(conn)
+    
+    def _flush(self, conn: _Connection) -> None:
+        while conn.out:
+            chunk = conn.out[0]
+            try:
+                sent = conn.sock.send(chunk)
+            except BlockingIOError:
+                return
+            except OSError:
+                self._drop(conn)
+                return
+            conn.out_size -= sent
+            if sent < len(chunk):
+                conn.out[0] = chunk[sent:]
+                return
+            conn.out.popleft()
+        
+        if conn.closing:
+            self._drop(conn)
+        else:
+            self._selector.modify(conn.sock, selectors.EVENT_READ, conn)
+    
+    def _read(self, conn: _Connection) -> None:
+        try:
+            data = conn.sock.recv(65536)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b''
+        if not data:
+            self._drop(conn)
+            return
+        conn.last_seen = time.monotonic()
+        self._received(conn, data)
+    
+    def _drop(self, conn: _Connection) -> None:
+        """Unsubscribe a connection and close its socket."""
+        if conn.dropped:
+            return
+        conn.dropped = True
+        subscribers = self._channels.get(conn.channel)
+        if subscribers is not None:
+            subscribers.discard(conn)
+            if not subscribers:
+                del self._channels[conn.channel]
+        with self._lock:
+            remaining = self._subscribed.get(conn.channel, 0) - 1
+            if remaining > 0:
+                self._subscribed[conn.channel] = remaining
+            else:
+                self._subscribed.pop(conn.channel, None)
+        self._dropped(conn)
+        if conn.sock is None:
+            return
+        try:
+            self._selector.unregister(conn.sock)
+        except (KeyError, ValueError):
+            pass
+        conn.sock.close()
+        self.dropped += 1
+    
+    def _shutdown(self) -> None:
+        goodbye = self._goodbye()
+        conns = [conn for subscribers in self._channels.values() for conn in subscribers]
+        socks = [conn.sock for conn in conns]
+        socks += [sock for _, sock, _, _ in self._attaching]
+        for sock in socks:
+            if sock is None:
+                continue
+            if goodbye:
+                try:
+                    sock.send(goodbye)
+                except OSError:
+                    pass
+            sock.close()
+        for conn in conns + list(self._incoming):
+            conn.dropped = True
+            self._dropped(conn)
+        self._channels.clear()
+        self._subscribed.clear()
+        self._incoming.clear()
+        self._attaching.clear()
+        self._selector.close()
+        self._wakeup_read.close()
+        self._wakeup_write.close()
@@ -0,0 +1,61 @@
+"""
+Request instrumentation and the metrics endpoint.
+
+This module attaches per-route latency histograms and an in-flight request
+gauge to a Flask app and renders metrics for Prometheus scraping.
+"""
+
+import time
+from typing import Optional
+
+from flask import Flask, Response, g, request
+
+from ..utils.metrics import MetricsRegistry, REGISTRY
+
+
+PROMETHEUS_MIMETYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def instrument_app(app: Flask, registry: MetricsRegistry) -> None:
+    """
+    Record latency and concurrency for every request handled by an app.
+    
+    Args:
+        app: Flask app to instrument
+        registry: Registry that receives the HTTP metrics
+    """
+    latency = registry.histogram(
+        'wordle_http_request_duration_seconds', 'Request latency by route',
+        ('route', 'method')
+    )
+    in_flight = registry.gauge(
+        'wordle_http_requests_in_flight', 'Requests currently being handled'
+    )
+    
+    @app.before_request
+    def _start_timer():
+        g.metrics_start = time.perf_counter()
+        in_flight.inc()
+    
+    @app.teardown_request
+    def _record_latency(exc: Optional[BaseException]):
+        start = g.pop('metrics_start', None)
+        if start is None:
+            return
+        in_flight.dec()
+        rule = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        latency.labels(rule, request.method).observe(time.perf_counter() - start)
+
+
+def metrics_response(registry: MetricsRegistry) -> Response:
+    """
+    Render a server registry together with the engine-level metrics.
+    
+    Args:
+        registry: Server registry (HTTP and session metrics)
+    
+    Returns:
+        Response in the Prometheus text exposition format
+    """
+    body = registry.render() + REGISTRY.render()
+    return Response(body, content_type=PROMETHEUS_MIMETYPE)
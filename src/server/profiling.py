@@ -0,0 +1,156 @@
+"""
+Sampled request profiling.
+
+This module profiles one in every N requests to the game routes with
+cProfile and aggregates the results per route in memory. Unsampled
+requests only pay for a counter increment, so the profiler can stay on in
+production and show where time goes under real traffic.
+"""
+
+import cProfile
+import io
+import itertools
+import marshal
+import pstats
+import threading
+from typing import Dict, Iterable, Optional
+
+from flask import Flask, g, request
+
+
+# Routes that run game logic
+GAME_ENDPOINTS = ('start_game', 'make_guess', 'get_game_state', 'reset_game')
+
+
+class RequestProfiler:
+    """
+    Aggregated cProfile statistics for a sample of requests.
+    """
+    
+    def __init__(self, sample_rate: int, endpoints: Iterable[str] = GAME_ENDPOINTS):
+        """
+        Initialize the profiler.
+        
+        Args:
+            sample_rate: Profile one request in this many (0 disables profiling)
+            endpoints: Flask endpoint names eligible for sampling
+        """
+        self.sample_rate = sample_rate
+        self.endpoints = frozenset(endpoints)
+        self._counter = itertools.count()
+        self._stats: Dict[str, pstats.Stats] = {}
+        self._samples: Dict[str, int] = {}
+        self._lock = threading.Lock()
+    
+    def should_sample(self) -> bool:
+        """Decide whether the next request is profiled."""
+        return next(self._counter) % self.sample_rate == 0
+    
+    def record(self, endpoint: str, profile: cProfile.Profile) -> None:
+        """
+        Add a finished profile to its route's statistics.
+        
+        Args:
+            endpoint: Flask endpoint name
+            profile: Disabled profiler holding one request
+        """
+        profile.create_stats()
+        with self._lock:
+            stats = self._stats.get(endpoint)
+            if stats is None:
+                self._stats[endpoint] = pstats.Stats(profile)
+            else:
+                stats.add(profile)
+            self._samples[endpoint] = self._samples.get(endpoint, 0) + 1
+    
+    def samples(self) -> Dict[str, int]:
+        """Get the number of profiled requests per route."""
+        with self._lock:
+            return dict(self._samples)
+    
+    def reset(self) -> None:
+        """Drop all collected statistics."""
+        with self._lock:
+            self._stats.clear()
+            self._samples.clear()
+    
+    def _merged(self, endpoint: Optional[str]) -> Optional[pstats.Stats]:
+        """Combine the statistics of one route, or of all routes."""
+        with self._lock:
+            if endpoint:
+                selected = [self._stats[endpoint]] if endpoint in self._stats else []
+            else:
+                selected = list(self._stats.values())
+            if not selected:
+                return None
+            merged = pstats.Stats(stream=io.StringIO())
+            merged.add(*selected)
+        return merged
+    
+    def report(self, endpoint: Optional[str] = None, sort: str = 'cumulative',
+               limit: int = 40) -> str:
+        """
+        Render statistics as pstats text.
+        
+        Args:
+            endpoint: Route to report on (all routes if None)
+            sort: pstats sort key, e.g. 'cumulative' or 'tottime'
+            limit: Number of functions to list
+        
+        Returns:
+            Report text
+        """
+        merged = self._merged(endpoint)
+        if merged is None:
+            return "No samples collected\n"
+        
+        out = io.StringIO()
+        merged.stream = out
+        merged.strip_dirs().sort_stats(sort).print_stats(limit)
+        return out.getvalue()
+    
+    def dump(self, endpoint: Optional[str] = None) -> bytes:
+        """
+        Serialize statistics in the binary pstats format.
+        
+        The result can be saved to a file and opened with
+        ``pstats.Stats(path)`` or tools such as snakeviz.
+        
+        Args:
+            endpoint: Route to dump (all routes if None)
+        
+        Returns:
+            Marshalled statistics (empty if there are none)
+        """
+        merged = self._merged(endpoint)
+        if merged is None:
+            return b''
+        return marshal.dumps(merged.stats)
+
+
+def instrument_profiler(app: Flask, profiler: RequestProfiler) -> None:
+    """
+    Profile a sample of an app's requests.
+    
+    Args:
+        app: Flask app to instrument
+        profiler: Profiler receiving the samples
+    """
+    endpoints = profiler.endpoints
+    
+    @app.before_request
+    def _start_profile():
+        if request.endpoint in endpoints and profiler.should_sample():
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                return  # Another profiler is already active in this thread
+            g.profile = profile
+    
+    @app.teardown_request
+    def _stop_profile(exc: Optional[BaseException]):
+        profile = g.pop('profile', None)
+        if profile is not None:
+            profile.disable()
+            profiler.record(request.endpoint, profile)
@@ -0,0 +1,541 @@
+"""
+Append-only event logs for multiplayer rooms.
+
+Every change to a room (a player joining or leaving, a bot taking a seat,
+a game starting, a guess, a round running out of time) is appended to the room's own log file
+as a small fixed-layout binary record. Records are buffered per room and
+written out through a bounded cache of open files, so any number of rooms
+can be logged with a fixed number of file descriptors. Words are stored as
+indices into the lexicon, guess results as pattern codes and players by
+their order of arrival in the log, so a guess takes 18 bytes.
+
+A room can be rebuilt after a crash by replaying its log. Every
+``checkpoint_interval`` records the room's full state is written as a
+checkpoint, in the session snapshot encoding, so a replay starts from the
+last checkpoint rather than from the first record. The log of a room that
+closes is deleted (or moved aside, to be read offline with read_room_log),
+so the directory only holds the rooms a restart has to bring back.
+
+A log can only be read with the word list it was written with; the lexicon
+fingerprint stored at the start of the file is checked on read.
+"""
+
+import logging
+import os
+import pickle
+import re
+import struct
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from ..core.game_engine import encode_result
+from ..game_modes.multiplayer import MultiplayerGame
+from ..utils.lexicon import Lexicon
+from .snapshot import _Decoder, _Encoder, _word_index, lexicon_fingerprint
+
+
+logger = logging.getLogger(__name__)
+
+LOG_MAGIC = b'WRLG'
+LOG_FORMAT = 1
+LOG_SUFFIX = '.log'
+# Subdirectory closed logs are moved to when they are kept
+CLOSED_DIRECTORY = 'closed'
+
+# Magic, format and the lexicon fingerprint
+_HEADER = struct.Struct('<4sB8s')
+# Action code and time of every record, followed by the action's fields
+_RECORD = struct.Struct('<Bd')
+_JOIN = struct.Struct('<HH')       # id and name lengths, followed by both in UTF-8
+_PLAYER = struct.Struct('<I')      # player number (leave)
+_WORD = struct.Struct('<I')        # answer index (start)
+_GUESS = struct.Struct('<IIB')     # player number, word index, pattern code
+_ROUND = struct.Struct('<H')       # round index (expire)
+_LENGTH = struct.Struct('<I')      # checkpoint length, followed by the checkpoint
+_BOT = struct.Struct('<Hdd')       # id length, skill and think time, followed by the id
+
+JOIN, LEAVE, START, GUESS, EXPIRE, CHECKPOINT, CLOSE, BOT = range(1, 9)
+
+_ROOM_ID = re.compile(r'^[A-Za-z0-9_-]{1,128}$')
+
+
+def _read_exact(f, size: int) -> Optional[bytes]:
+    """Read exactly size bytes, or None at the end of a (possibly cut) file."""
+    data = f.read(size)
+    return data if len(data) == size else None
+
+
+def read_room_log(path: str, lexicon: Lexicon) -> Iterator[Tuple[Any, ...]]:
+    """
+    Read the records of a room log.
+    
+    A record cut short by a crash ends the log; everything before it is
+    returned.
+    
+    Args:
+        path: Log file
+        lexicon: Lexicon the log was written with
+    
+    Yields:
+        Tuples starting with the action and its time:
+        ('join', time, player_id, player_name), ('leave', time, player_id),
+        ('start', time, answer), ('guess', time, player_id, word, pattern),
+        ('expire', time, round_index), ('bot', time, player_id, skill,
+        think_time), ('checkpoint', time, room_record) and ('close', time)
+    
+    Raises:
+        ValueError: If the file is not a room log for this word list
+    """
+    words = lexicon.words
+    with open(path, 'rb') as f:
+        header = _read_exact(f, _HEADER.size)
+        if header is None:
+            raise ValueError(f"Not a room log: {path}")
+        magic, log_format, fingerprint = _HEADER.unpack(header)
+        if magic != LOG_MAGIC or log_format != LOG_FORMAT:
+            raise ValueError(f"Unsupported room log format: {path}")
+        if fingerprint != bytes.fromhex(lexicon_fingerprint(lexicon)):
+            raise ValueError("Room log was written with a different word list")
+        
+        # Player numbers, assigned in order of arrival
+        players: List[Optional[str]] = []
+        while True:
+            record = _read_exact(f, _RECORD.size)
+            if record is None:
+                return
+            action, when = _RECORD.unpack(record)
+            
+            if action == JOIN:
+                lengths = _read_exact(f, _JOIN.size)
+                if lengths is None:
+                    return
+                id_length, name_length = _JOIN.unpack(lengths)
+                text = _read_exact(f, id_length + name_length)
+                if text is None:
+                    return
+                player_id = text[:id_length].decode('utf-8')
+                players.append(player_id)
+                yield ('join', when, player_id, text[id_length:].decode('utf-8'))
+            elif action == LEAVE:
+                fields = _read_exact(f, _PLAYER.size)
+                if fields is None:
+                    return
+                yield ('leave', when, players[_PLAYER.unpack(fields)[0]])
+            elif action == START:
+                fields = _read_exact(f, _WORD.size)
+                if fields is None:
+                    return
+                yield ('start', when, words[_WORD.unpack(fields)[0]])
+            elif action == GUESS:
+                fields = _read_exact(f, _GUESS.size)
+                if fields is None:
+                    return
+                number, word, pattern = _GUESS.unpack(fields)
+                yield ('guess', when, players[number], words[word], pattern)
+            elif action == EXPIRE:
+                fields = _read_exact(f, _ROUND.size)
+                if fields is None:
+                    return
+                yield ('expire', when, _ROUND.unpack(fields)[0])
+            elif action == CHECKPOINT:
+                length = _read_exact(f, _LENGTH.size)
+                payload = length and _read_exact(f, _LENGTH.unpack(length)[0])
+                if payload is None:
+                    return
+                room_record, players = pickle.loads(payload)
+                yield ('checkpoint', when, room_record)
+            elif action == BOT:
+                fields = _read_exact(f, _BOT.size)
+                if fields is None:
+                    return
+                id_length, skill, think_time = _BOT.unpack(fields)
+                text = _read_exact(f, id_length)
+                if text is None:
+                    return
+                yield ('bot', when, text.decode('utf-8'), skill, think_time)
+            elif action == CLOSE:
+                yield ('close', when)
+            else:
+                raise ValueError(f"Unknown room log record {action} in {path}")
+
+
+def replay_room_log(path: str, lexicon: Lexicon) -> Tuple[MultiplayerGame, bool]:
+    """
+    Rebuild a room from its log.
+    
+    The room is decoded from the last checkpoint and the records after it
+    are applied in order, each with the clock reading it was made at, so
+    the room ends up exactly as it was. As with session snapshots, rounds
+    do not run down while the room was away: the running round resumes
+    with the time it had left at the last record.
+    
+    Only replay logs this server wrote: checkpoints are unpickled.
+    
+    Args:
+        path: Log file
+        lexicon: Lexicon the log was written with
+    
+    Returns:
+        Tuple of (room, whether the room was closed)
+    
+    Raises:
+        ValueError: If the file is not a room log for this word list or
+            holds no checkpoint
+    """
+    checkpoint = None
+    pending: List[Tuple[Any, ...]] = []
+    for entry in read_room_log(path, lexicon):
+        if entry[0] == 'checkpoint':
+            checkpoint = entry[2]
+            pending = []
+        else:
+            pending.append(entry)
+    if checkpoint is None:
+        raise ValueError(f"Room log has no checkpoint: {path}")
+    
+    room = _Decoder(lexicon, downtime=0.0).game(checkpoint)
+    now = 0.0
+    room.clock = lambda: now
+    closed = False
+    for action, now, *args in pending:
+        if action == 'join':
+            room.add_player(args[0], args[1])
+        elif action == 'leave':
+            room.remove_player(args[0])
+        elif action == 'start':
+            room.start_game(answer=args[0])
+        elif action == 'guess':
+            room.make_guess(args[1], args[0])
+        elif action == 'expire':
+            room.expire_round(args[0])
+        elif action == 'bot':
+            room.set_bot(*args)
+        elif action == 'close':
+            closed = True
+    room.clock = time.time
+    
+    if room.round_start_time is not None and pending:
+        room.round_start_time += max(0.0, time.time() - pending[-1][1])
+    return room, closed
+
+
+class _RoomWriter:
+    """Journal of one room: encodes its changes and buffers them for its log."""
+    
+    def __init__(self, log: 'RoomLog', room_id: str, room: MultiplayerGame):
+        self.log = log
+        self.room_id = room_id
+        self.room = room
+        self.encoder = _Encoder(log.lexicon)
+        self.index = _word_index(log.lexicon)
+        self.checkpoint_interval = log.checkpoint_interval
+        self.buffer_size = log.buffer_size
+        # Player numbers of the players in the room, and the next number
+        self.numbers: Dict[str, int] = {}
+        self.next_number = 0
+        self.records = 0
+        self.buffer = bytearray()
+        self.closed = False
+        self.lock = threading.Lock()
+        
+        path = log.path(room_id)
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            self.buffer += _HEADER.pack(
+                LOG_MAGIC, LOG_FORMAT, bytes.fromhex(lexicon_fingerprint(log.lexicon))
+            )
+        # Continued logs restart their player numbers with this checkpoint
+        self._checkpoint(room.clock())
+    
+    def _checkpoint(self, now: float) -> None:
+        """Buffer the room's current state (lock held)."""
+        # Players keep their numbers from here on, in join order
+        self.numbers = {player_id: i for i, player_id in enumerate(self.room.players)}
+        self.next_number = len(self.numbers)
+        payload = pickle.dumps(
+            (self.encoder.game(self.room), list(self.numbers)), protocol=pickle.HIGHEST_PROTOCOL
+        )
+        self.buffer += _RECORD.pack(CHECKPOINT, now) + _LENGTH.pack(len(payload)) + payload
+        self.records = 0
+    
+    def __call__(self, action: str, now: float, *args: Any) -> None:
+        """Append one change; called by the room before the change is applied."""
+        with self.lock:
+            if self.closed:
+                return
+            if self.records >= self.checkpoint_interval:
+                # The room has not changed yet, so the checkpoint precedes the record
+                self._checkpoint(now)
+            self.records += 1
+            
+            if action == 'guess':
+                player_id, word, result = args
+                record = _GUESS.pack(self.numbers[player_id], self.index[word], encode_result(result))
+                code = GUESS
+            elif action == 'join':
+                player_id, player_name = args
+                self.numbers[player_id] = self.next_number
+                self.next_number += 1
+                encoded_id = player_id.encode('utf-8')
+                encoded_name = player_name.encode('utf-8')
+                record = _JOIN.pack(len(encoded_id), len(encoded_name)) + encoded_id + encoded_name
+                code = JOIN
+            elif action == 'leave':
+                record = _PLAYER.pack(self.numbers.pop(args[0]))
+                code = LEAVE
+            elif action == 'start':
+                record = _WORD.pack(self.index[args[0]])
+                code = START
+            elif action == 'expire':
+                record = _ROUND.pack(args[0])
+                code = EXPIRE
+            elif action == 'bot':
+                player_id, skill, think_time = args
+                encoded_id = player_id.encode('utf-8')
+                record = _BOT.pack(len(encoded_id), skill, think_time) + encoded_id
+                code = BOT
+            else:
+                raise ValueError(f"Unknown room action: {action}")
+            self.buffer += _RECORD.pack(code, now) + record
+            
+            if len(self.buffer) >= self.buffer_size:
+                try:
+                    self._write()
+                except OSError as e:
+                    # Kept in the buffer for the next flush
+                    logger.warning("Could not write room log %s: %s", self.room_id, e)
+    
+    def _write(self) -> None:
+        """Write the buffered records to the file (lock held)."""
+        if self.buffer:
+            self.log._append(self.room_id, self.buffer)
+            self.buffer = bytearray()
+    
+    def flush(self) -> None:
+        with self.lock:
+            if not self.closed:
+                self._write()
+    
+    def close(self, mark_closed: bool) -> None:
+        """Write what is buffered and stop logging, recording the closing if the room closed."""
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            if mark_closed:
+                self.buffer += _RECORD.pack(CLOSE, time.time())
+            self._write()
+    
+    def discard(self) -> None:
+        """Stop logging and drop what is buffered."""
+        with self.lock:
+            self.closed = True
+            self.buffer = bytearray()
+
+
+class RoomLog:
+    """
+    Event logs of every room in one directory, one file per room.
+    
+    Records are buffered in memory and reach the file when a room's buffer
+    fills, on flush, or when the room closes, so a crash loses at most
+    what was written since the last flush. At most ``max_open_files``
+    files are open at once; the least recently written is closed to make
+    room for another.
+    """
+    
+    def __init__(self, directory: str, lexicon: Lexicon, checkpoint_interval: int = 1000,
+                 buffer_size: int = 64 * 1024, max_open_files: int = 64,
+                 keep_closed: bool = False):
+        """
+        Initialize the logs, creating the directory if needed.
+        
+        Args:
+            directory: Directory holding one log file per room
+            lexicon: Lexicon shared by every room
+            checkpoint_interval: Records between checkpoints of a room
+            buffer_size: Bytes buffered per room before they are written out
+            max_open_files: Most log files kept open at once
+            keep_closed: Move the logs of closed rooms to the ``closed``
+                subdirectory instead of deleting them
+        """
+        self.directory = directory
+        self.lexicon = lexicon
+        self.checkpoint_interval = checkpoint_interval
+        self.buffer_size = buffer_size
+        self.max_open_files = max_open_files
+        self.keep_closed = keep_closed
+        self._writers: Dict[str, _RoomWriter] = {}
+        self._lock = threading.Lock()
+        # Open files, least recently written first
+        self._files: 'OrderedDict[str, BinaryIO]' = OrderedDict()
+        self._files_lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+    
+    def __len__(self) -> int:
+        return len(self._writers)
+    
+    def path(self, room_id: str) -> str:
+        """
+        Get the log file of a room.
+        
+        Raises:
+            ValueError: If the room id cannot be used as a file name
+        """
+        if not _ROOM_ID.match(room_id):
+            raise ValueError(f"Invalid room id for a log file: {room_id!r}")
+        return os.path.join(self.directory, room_id + LOG_SUFFIX)
+    
+    def closed_path(self, room_id: str) -> str:
+        """Get where the log of a closed room is kept with ``keep_closed``."""
+        return os.path.join(self.directory, CLOSED_DIRECTORY, os.path.basename(self.path(room_id)))
+    
+    def open_files(self) -> int:
+        """Get the number of log files currently open."""
+        return len(self._files)
+    
+    def _append(self, room_id: str, data: bytes) -> None:
+        """Append bytes to a room's file, opening it if needed."""
+        with self._files_lock:
+            f = self._files.pop(room_id, None)
+            if f is None:
+                if len(self._files) >= self.max_open_files:
+                    self._files.popitem(last=False)[1].close()
+                f = open(self.path(room_id), 'ab', buffering=0)
+            self._files[room_id] = f
+            f.write(data)
+    
+    def _release(self, room_id: str) -> None:
+        """Close a room's file if it is open."""
+        with self._files_lock:
+            f = self._files.pop(room_id, None)
+        if f is not None:
+            f.close()
+    
+    def attach(self, room_id: str, room: MultiplayerGame) -> None:
+        """
+        Start logging a new or restored room.
+        
+        The log starts (or, for a restored room, continues) with a
+        checkpoint of the room as it is now, written out before this
+        returns, so a room whose log cannot be written fails here.
+        
+        Args:
+            room_id: Room identifier
+            room: Room to log
+        
+        Raises:
+            OSError: If the log cannot be written
+        """
+        with self._lock:
+            old = self._writers.pop(room_id, None)
+        if old is not None:
+            old.close(mark_closed=False)
+        writer = _RoomWriter(self, room_id, room)
+        try:
+            writer.flush()
+        except OSError:
+            self._release(room_id)
+            raise
+        with self._lock:
+            self._writers[room_id] = writer
+        room.set_journal(writer)
+    
+    def close(self, room_id: str, room: Optional[MultiplayerGame] = None) -> None:
+        """
+        Stop logging a room that closed; replays will not bring it back.
+        
+        The log is deleted, or moved to the ``closed`` subdirectory with a
+        closing record if closed logs are kept.
+        
+        Args:
+            room_id: Room identifier
+            room: The room, to detach the log from
+        """
+        with self._lock:
+            writer = self._writers.pop(room_id, None)
+        if writer is None:
+            return
+        if room is not None:
+            room.set_journal(None)
+        try:
+            if self.keep_closed:
+                writer.close(mark_closed=True)
+            else:
+                writer.discard()
+            self._release(room_id)
+            self._retire(room_id)
+        except OSError as e:
+            logger.warning("Could not close room log %s: %s", room_id, e)
+    
+    def _retire(self, room_id: str) -> None:
+        """Delete or move aside the log of a closed room."""
+        path = self.path(room_id)
+        if self.keep_closed:
+            os.makedirs(os.path.dirname(self.closed_path(room_id)), exist_ok=True)
+            os.replace(path, self.closed_path(room_id))
+        elif os.path.exists(path):
+            os.remove(path)
+    
+    def flush(self) -> None:
+        """Write every room's buffered records to its file."""
+        with self._lock:
+            writers = list(self._writers.values())
+        for writer in writers:
+            try:
+                writer.flush()
+            except OSError as e:
+                logger.warning("Could not write room log %s: %s", writer.room_id, e)
+    
+    def shutdown(self) -> None:
+        """Flush and close every log, leaving the rooms to be replayed on the next start."""
+        with self._lock:
+            writers = list(self._writers.values())
+            self._writers.clear()
+        for writer in writers:
+            writer.room.set_journal(None)
+            try:
+                writer.close(mark_closed=False)
+            except OSError as e:
+                logger.warning("Could not write room log %s: %s", writer.room_id, e)
+        with self._files_lock:
+            files = list(self._files.values())
+            self._files.clear()
+        for f in files:
+            f.close()
+    
+    def recover(self, skip: Any = ()) -> List[Tuple[str, MultiplayerGame]]:
+        """
+        Rebuild the rooms whose logs do not end with their closing.
+        
+        Logs of rooms that closed or emptied are retired like the logs of
+        rooms closed while running. Logs that cannot be read are logged
+        and left in place.
+        
+        Args:
+            skip: Room ids not to rebuild (e.g. rooms restored from a snapshot)
+        
+        Returns:
+            (room id, room) pairs, not yet logged to
+        """
+        rooms = []
+        for name in sorted(os.listdir(self.directory)):
+            if not name.endswith(LOG_SUFFIX):
+                continue
+            room_id = name[:-len(LOG_SUFFIX)]
+            if room_id in skip:
+                continue
+            try:
+                room, closed = replay_room_log(os.path.join(self.directory, name), self.lexicon)
+            except (ValueError, KeyError, IndexError, pickle.UnpicklingError) as e:
+                logger.warning("Could not replay room log %s: %s", name, e)
+                continue
+            if not closed and room.players:
+                rooms.append((room_id, room))
+                continue
+            try:
+                self._retire(room_id)
+            except OSError as e:
+                logger.warning("Could not retire room log %s: %s", name, e)
+        return rooms
@@ -0,0 +1,540 @@
+"""
+Multiplayer room hosting.
+
+This module provides the RoomManager, which hosts many concurrent
+MultiplayerGame rooms. Rooms are stored in a sharded SessionRegistry and
+every room operation runs under the lock of the room's shard, so rooms in
+different shards never contend. Idle rooms are reclaimed by the registry's
+idle eviction.
+
+Quick match keeps the rooms that are waiting for players in insertion
+order and places a player in the oldest open room, or in a new room when
+none is open, in amortized O(1): rooms that filled up, started or were
+reclaimed since they were listed are dropped as quick match reaches them.
+
+Players prove who they are with a secret token issued when they join: an
+HMAC of their player id under the manager's secret. Every action on behalf
+of a player, and joining under an existing id (which carries the player's
+leaderboard entry), needs the token, so the player ids that rooms show to
+everyone are not credentials.
+
+With a TimerWheel, each running room has a timer set for its round
+deadline, so rounds advance and games end on time even when no player
+makes a request, and free seats can be filled with bot players driven by
+the same wheel. With a Leaderboard, every point scored in any room by a
+player who is not a bot is added to the player's total there.
+"""
+
+import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .sessions import SessionRegistry, generate_session_id
+from ..game_modes.bots import BotPool
+from ..game_modes.multiplayer import MultiplayerGame
+from ..utils.lexicon import Lexicon
+from ..utils.ranking import Leaderboard
+from ..utils.timer_wheel import Timer, TimerWheel
+
+
+# Default limit on the size of the rooms clients create
+MAX_ROOM_PLAYERS = 1000
+
+
+class RoomError(Exception):
+    """A room operation that cannot be performed, with an HTTP status."""
+    
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+def is_started(room: MultiplayerGame) -> bool:
+    """Check whether a room's game has been started."""
+    return room.answer is not None
+
+
+def is_open(room: MultiplayerGame) -> bool:
+    """Check whether a room is waiting for more players."""
+    return not is_started(room) and len(room.players) < room.max_players
+
+
+class RoomManager:
+    """
+    Sharded store of multiplayer rooms with quick-match placement.
+    
+    Methods raise RoomError for requests that cannot be served (unknown
+    room, full room, ...); everything else is the room's own result.
+    """
+    
+    def __init__(self, lexicon: Lexicon, max_rounds: int = 6, max_players: int = 4,
+                 shard_count: int = 16, idle_timeout: Optional[float] = 600,
+                 on_create: Optional[Callable[[str, MultiplayerGame], None]] = None,
+                 on_evict: Optional[Callable[[str, MultiplayerGame], None]] = None,
+                 timers: Optional[TimerWheel] = None,
+                 leaderboard: Optional[Leaderboard] = None,
+                 secret: Optional[bytes] = None,
+                 player_limit: int = MAX_ROOM_PLAYERS):
+        """
+        Initialize the manager.
+        
+        Args:
+            lexicon: Lexicon shared by every room
+            max_rounds: Rounds per game
+            max_players: Default room size (also the quick-match room size)
+            shard_count: Number of shards (rounded up to a power of two)
+            idle_timeout: Seconds without activity after which a room is
+                reclaimed (None disables reclaiming)
+            on_create: Optional callback called with (room_id, room) for
+                each new or restored room
+            on_evict: Optional callback called with (room_id, room) for
+                each room that is reclaimed or closed by its last player leaving
+            timers: Timer wheel that expires rounds at their deadline and
+                runs bot players (without one, rounds only end when a player
+                guesses and rooms cannot have bots)
+            leaderboard: Cross-room ranking credited with every point scored
+            secret: Key of the player tokens (random if not given, so tokens
+                only last as long as the process)
+            player_limit: Largest room size a client may ask for
+        
+        Raises:
+            ValueError: If the default room size is outside 2..player_limit
+        """
+        if not 2 <= max_players <= player_limit:
+            raise ValueError(f"max_players must be between 2 and {player_limit}")
+        
+        self.lexicon = lexicon
+        self.max_rounds = max_rounds
+        self.max_players = max_players
+        self.player_limit = player_limit
+        self.on_create = on_create
+        self.on_evict = on_evict
+        self.timers = timers
+        self.leaderboard = leaderboard
+        self._secret = secret or os.urandom(32)
+        # Pending round deadline of each running room
+        self._deadlines: Dict[str, Timer] = {}
+        self.bots: Optional[BotPool] = None
+        if timers is not None:
+            self.bots = BotPool(lexicon, timers, submit=self._bot_guess)
+        self.rooms = SessionRegistry(
+            shard_count=shard_count, idle_timeout=idle_timeout, on_evict=self._removed
+        )
+        self._mask = self.rooms.shard_count - 1
+        self._locks = [threading.Lock() for _ in range(self.rooms.shard_count)]
+        
+        # Open quick-match rooms, oldest first
+        self._lobby: 'OrderedDict[str, None]' = OrderedDict()
+        self._lobby_lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self.rooms)
+    
+    def __contains__(self, room_id: object) -> bool:
+        return room_id in self.rooms
+    
+    def _lock(self, room_id: str) -> threading.Lock:
+        """Get the lock of a room's shard."""
+        return self._locks[hash(room_id) & self._mask]
+    
+    def _get(self, room_id: str) -> MultiplayerGame:
+        room = self.rooms.get(room_id)
+        if room is None:
+            raise RoomError('Room not found', 404)
+        return room
+    
+    def player_token(self, player_id: str) -> str:
+        """Get the secret token that proves a player id."""
+        return hmac.new(self._secret, player_id.encode('utf-8'), hashlib.sha256).hexdigest()[:32]
+    
+    def _check_token(self, player_id: str, token: Optional[str]) -> None:
+        """Raise RoomError unless a token is the player's."""
+        if not isinstance(token, str) or not hmac.compare_digest(
+                token.encode('utf-8'), self.player_token(player_id).encode('ascii')):
+            raise RoomError('Invalid player token', 403)
+    
+    def _identify(self, player_id: Optional[str], token: Optional[str]) -> str:
+        """Get the id a joining player plays as: a new one, or one they hold the token of."""
+        if player_id is None:
+            return generate_session_id('player')
+        self._check_token(player_id, token)
+        return player_id
+    
+    def _issued(self, joined: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the player's token to a join result."""
+        if joined.get('success'):
+            joined['player_token'] = self.player_token(joined['player_id'])
+        return joined
+    
+    def _player_room(self, room_id: str, player_id: str, token: Optional[str]) -> MultiplayerGame:
+        """Get a room for an action by one of its players (room lock held)."""
+        room = self._get(room_id)
+        self._check_token(player_id, token)
+        if player_id not in room.players:
+            raise RoomError('Player not found in room', 403)
+        return room
+    
+    def check_player(self, room_id: str, player_id: str, token: Optional[str]) -> None:
+        """
+        Check that a caller is a player of a room.
+        
+        Args:
+            room_id: Room identifier
+            player_id: Player id given by the caller
+            token: Player token given by the caller
+        
+        Raises:
+            RoomError: If the room is unknown, the token is wrong or the
+                player is not in the room
+        """
+        with self._lock(room_id):
+            self._player_room(room_id, player_id, token)
+    
+    def _removed(self, room_id: str, room: MultiplayerGame) -> None:
+        # Sweeps run while a room lock may be held, so the lobby lock is not
+        # taken here; quick match drops reclaimed rooms when it reaches them
+        self._cancel_deadline(room_id)
+        if self.bots is not None:
+            self.bots.discard_room(room_id)
+        if self.on_evict is not None:
+            self.on_evict(room_id, room)
+    
+    def _update_lobby(self, room_id: str, room: MultiplayerGame) -> None:
+        """Add or remove a quick-match room from the lobby after a change."""
+        with self._lobby_lock:
+            if is_open(room) and room_id in self.rooms:
+                self._lobby.setdefault(room_id, None)
+            else:
+                self._lobby.pop(room_id, None)
+    
+    def create_room(self, player_name: str, player_id: Optional[str] = None,
+                    max_players: Optional[int] = None, room_id: Optional[str] = None,
+                    token: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
+        """
+        Create a room with its first player.
+        
+        Args:
+            player_name: Display name of the creator
+            player_id: Existing player id (generated if not given)
+            max_players: Room size (defaults to the manager's)
+            room_id: Room id (generated if not given)
+            token: Token of player_id
+        
+        Returns:
+            Tuple of (room id, the creator's join result with its player_token)
+        """
+        max_players = max_players or self.max_players
+        if not 2 <= max_players <= self.player_limit:
+            raise RoomError(f'max_players must be between 2 and {self.player_limit}')
+        
+        player_id = self._identify(player_id, token)
+        room_id, room, joined = self._new_room(player_name, player_id, max_players, room_id)
+        self._update_lobby(room_id, room)
+        return room_id, self._issued(joined)
+    
+    def _new_room(self, player_name: str, player_id: str, max_players: int,
+                  room_id: Optional[str] = None) -> Tuple[str, MultiplayerGame, Dict[str, Any]]:
+        """Create and register a room with its first player, without listing it."""
+        room_id = room_id or generate_session_id('room')
+        room = MultiplayerGame(self.lexicon, self.max_rounds, max_players)
+        # The room is private until it is registered, so no lock is needed
+        joined = room.add_player(player_id, player_name)
+        if not self.rooms.add(room_id, room):
+            raise RoomError('Room already exists', 409)
+        try:
+            self._bind(room_id, room)
+        except OSError as e:
+            # Nobody has seen the room yet (its log could not be created)
+            self.rooms.pop(room_id, None)
+            raise RoomError(f'Room could not be created: {e.strerror or e}', 503) from e
+        return room_id, room, joined
+    
+    def _bind(self, room_id: str, room: MultiplayerGame) -> None:
+        """Follow a new room's rounds and notify on_create."""
+        if self.timers is not None or self.leaderboard is not None:
+            room.add_listener(
+                lambda event_type, data: self._on_room_event(room_id, room, event_type, data)
+            )
+        if self.on_create is not None:
+            self.on_create(room_id, room)
+    
+    def _on_room_event(self, room_id: str, room: MultiplayerGame, event_type: str,
+                       data: Dict[str, Any]) -> None:
+        # Room events are sent with the room's shard lock held
+        if event_type == 'guess':
+            if self.leaderboard is not None and not self._is_bot(room_id, data['player_id']):
+                self.leaderboard.add(data['player_id'], data['round_score'])
+        elif self.timers is None:
+            return
+        elif event_type in ('game_started', 'round_advanced'):
+            self._schedule_deadline(room_id, room)
+        elif event_type == 'game_over':
+            self._cancel_deadline(room_id)
+    
+    def _is_bot(self, room_id: str, player_id: str) -> bool:
+        return self.bots is not None and self.bots.is_bot(room_id, player_id)
+    
+    def _schedule_deadline(self, room_id: str, room: MultiplayerGame) -> None:
+        """Replace a room's pending deadline with its current round's."""
+        self._cancel_deadline(room_id)
+        deadline = room.round_deadline()
+        if deadline is None:
+            return
+        self._deadlines[room_id] = self.timers.schedule(
+            deadline - time.time(), self._expire_round, room_id, room.current_round
+        )
+        self.timers.start()
+    
+    def _cancel_deadline(self, room_id: str) -> None:
+        timer = self._deadlines.pop(room_id, None)
+        if timer is not None:
+            self.timers.cancel(timer)
+    
+    def _expire_round(self, room_id: str, round_index: int) -> None:
+        """Timer callback: end a round that ran out of time."""
+        with self._lock(room_id):
+            room = self.rooms.get(room_id)
+            if room is None:
+                return
+            self._deadlines.pop(room_id, None)
+            # Advancing the round schedules the next deadline
+            room.expire_round(round_index)
+    
+    def join(self, room_id: str, player_name: str, player_id: Optional[str] = None,
+             token: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Add a player to a room; the game starts once the room is full.
+        
+        Args:
+            room_id: Room identifier
+            player_name: Display name of the player
+            player_id: Existing player id (generated if not given)
+            token: Token of player_id
+        
+        Returns:
+            The room's join result with the player's player_token
+        """
+        player_id = self._identify(player_id, token)
+        with self._lock(room_id):
+            room = self._get(room_id)
+            if is_started(room) and not room.is_game_over():
+                raise RoomError('Game already in progress', 409)
+            joined = self._join_locked(room, player_name, player_id)
+        self._update_lobby(room_id, room)
+        return self._issued(joined)
+    
+    def _join_locked(self, room: MultiplayerGame, player_name: str,
+                     player_id: str) -> Dict[str, Any]:
+        joined = room.add_player(player_id, player_name)
+        if not joined['success']:
+            raise RoomError(joined['error'], 409)
+        if len(room.players) >= room.max_players:
+            room.start_game()
+            joined['game_state'] = room.get_game_state()
+        return joined
+    
+    def quick_match(self, player_name: str, player_id: Optional[str] = None,
+                    token: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
+        """
+        Place a player in the oldest open room, creating one if none is open.
+        
+        Args:
+            player_name: Display name of the player
+            player_id: Existing player id (generated if not given)
+            token: Token of player_id
+        
+        Returns:
+            Tuple of (room id, the player's join result with its player_token)
+        """
+        player_id = self._identify(player_id, token)
+        with self._lobby_lock:
+            while self._lobby:
+                room_id = next(iter(self._lobby))
+                with self._lock(room_id):
+                    room = self.rooms.get(room_id)
+                    if room is not None and is_open(room):
+                        joined = self._join_locked(room, player_name, player_id)
+                        if not is_open(room):
+                            del self._lobby[room_id]
+                        return room_id, self._issued(joined)
+                # Filled, started or reclaimed since it was listed
+                del self._lobby[room_id]
+            
+            room_id, _room, joined = self._new_room(player_name, player_id, self.max_players)
+            self._lobby[room_id] = None
+            return room_id, self._issued(joined)
+    
+    def leave(self, room_id: str, player_id: str, token: Optional[str]) -> Dict[str, Any]:
+        """
+        Remove a player from a room; rooms left empty or with only bots are closed.
+        
+        Args:
+            room_id: Room identifier
+            player_id: Player leaving
+            token: The player's token
+        
+        Returns:
+            The room's leave result
+        """
+        with self._lock(room_id):
+            room = self._player_room(room_id, player_id, token)
+            left = room.remove_player(player_id)
+            if len(room.players) <= (self.bots.count(room_id) if self.bots is not None else 0):
+                self.rooms.pop(room_id, None)
+                self._removed(room_id, room)
+        self._update_lobby(room_id, room)
+        return left
+    
+    def start(self, room_id: str, player_id: str, token: Optional[str]) -> Dict[str, Any]:
+        """
+        Start (or restart) a room's game before it is full.
+        
+        Args:
+            room_id: Room identifier
+            player_id: Player asking to start, who must be in the room
+            token: The player's token
+        
+        Returns:
+            The room's game state
+        """
+        with self._lock(room_id):
+            room = self._player_room(room_id, player_id, token)
+            if is_started(room) and not room.is_game_over():
+                raise RoomError('Game already in progress', 409)
+            try:
+                room.start_game()
+            except ValueError as e:
+                raise RoomError(str(e), 409)
+            state = room.get_game_state()
+        self._update_lobby(room_id, room)
+        return state
+    
+    def add_bots(self, room_id: str, player_id: str, token: Optional[str],
+                 count: Optional[int] = None, skill: float = 0.5,
+                 think_time: float = 5.0) -> Dict[str, Any]:
+        """
+        Seat bot players in a room; the game starts if the room fills up.
+        
+        Args:
+            room_id: Room identifier
+            player_id: Player asking for bots, who must be in the room
+            token: The player's token
+            count: Number of bots (defaults to every free seat)
+            skill: Chance of each bot playing its best guess, 0 to 1
+            think_time: Mean seconds each bot takes to guess
+        
+        Returns:
+            The new bots' ids and the room's game state
+        """
+        if self.bots is None:
+            raise RoomError('Bot players need a timer wheel', 501)
+        if not 0.0 <= skill <= 1.0:
+            raise RoomError('skill must be between 0 and 1')
+        if count is not None and count < 1:
+            raise RoomError('count must be at least 1')
+        
+        with self._lock(room_id):
+            room = self._player_room(room_id, player_id, token)
+            if is_started(room) and not room.is_game_over():
+                raise RoomError('Game already in progress', 409)
+            if not 0.0 <= think_time <= room.round_duration:
+                raise RoomError(f'think_time must be between 0 and {room.round_duration} seconds')
+            free = room.max_players - len(room.players)
+            count = count or free
+            if not 0 < count <= free:
+                raise RoomError(f'Room has {free} free seats', 409)
+            
+            bot_ids = []
+            for _ in range(count):
+                bot_id = generate_session_id('bot')
+                # Adopted before joining, so a bot that fills the room plays
+                self.bots.adopt(room_id, room, bot_id, skill, think_time)
+                self._join_locked(room, f'Bot {len(room.players) + 1}', bot_id)
+                bot_ids.append(bot_id)
+            state = room.get_game_state()
+        self._update_lobby(room_id, room)
+        return {'success': True, 'bot_ids': bot_ids, 'game_state': state}
+    
+    def _bot_guess(self, room_id: str, player_id: str, word: str) -> Dict[str, Any]:
+        """Submit a bot's guess (called by the bot pool from the timer wheel)."""
+        with self._lock(room_id):
+            room = self.rooms.get(room_id)
+            if room is None:
+                return {'success': False, 'error': 'Room not found'}
+            if not is_started(room):
+                return {'success': False, 'error': 'Game has not started'}
+            return room.make_guess(word, player_id)
+    
+    def guess(self, room_id: str, player_id: str, token: Optional[str],
+              guess: str) -> Dict[str, Any]:
+        """
+        Make a player's guess in a room.
+        
+        Args:
+            room_id: Room identifier
+            player_id: Player guessing
+            token: The player's token
+            guess: Guessed word
+        
+        Returns:
+            The room's guess result
+        """
+        with self._lock(room_id):
+            room = self._player_room(room_id, player_id, token)
+            if not is_started(room):
+                raise RoomError('Game has not started', 409)
+            return room.make_guess(guess, player_id)
+    
+    def state(self, room_id: str, player_id: Optional[str] = None,
+              token: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get a room's state, or one player's view of it.
+        
+        The room summary shows no guessed words and is public; a player's
+        view includes their guesses and needs their token.
+        
+        Args:
+            room_id: Room identifier
+            player_id: Player whose guesses to include (room summary if None)
+            token: The player's token
+        
+        Returns:
+            Room or player state
+        """
+        with self._lock(room_id):
+            if player_id is None:
+                return self._get(room_id).get_game_state()
+            room = self._player_room(room_id, player_id, token)
+            return room.get_player_state(player_id)
+    
+    def restore(self, rooms: List[Tuple[str, MultiplayerGame]]) -> None:
+        """
+        Register rooms loaded from a snapshot or replayed from their logs.
+        
+        The room's bot players are handed back to the bot pool.
+        
+        Args:
+            rooms: (room id, room) pairs
+        """
+        for room_id, room in rooms:
+            self.rooms[room_id] = room
+            self._bind(room_id, room)
+            if self.timers is not None:
+                with self._lock(room_id):
+                    self._schedule_deadline(room_id, room)
+                    for player_id, (skill, think_time) in list(room.bots.items()):
+                        if player_id in room.players:
+                            self.bots.adopt(room_id, room, player_id, skill, think_time)
+            self._update_lobby(room_id, room)
+    
+    def items(self) -> List[Tuple[str, MultiplayerGame]]:
+        """Get a snapshot of all (room id, room) pairs."""
+        return self.rooms.items()
+    
+    def lobby_size(self) -> int:
+        """Get the number of rooms listed for quick match."""
+        return len(self._lobby)
@@ -0,0 +1,506 @@
+"""
+Production HTTP serving for the game API.
+
+This module serves a WSGI app from one process with a fixed pool of
+worker threads, instead of Flask's development server. Connections use
+HTTP/1.1 keep-alive; between requests an idle connection waits in a
+poller instead of holding a worker thread. Requests beyond the queue limit
+are answered with 503 straight away, and SIGTERM/SIGINT stop accepting
+connections and let in-flight requests finish before exiting.
+
+The game API keeps its sessions, rooms and streams in process memory, so
+it is always served from a single process. To use more cores, run several
+servers behind a proxy that sends each client to the same one.
+"""
+
+import logging
+import queue
+import selectors
+import signal
+import socket
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional
+
+from werkzeug.exceptions import InternalServerError
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+from werkzeug.wsgi import LimitedStream
+
+
+logger = logging.getLogger(__name__)
+
+# Written directly to the socket when the request queue is full
+BUSY_RESPONSE = (
+    b"HTTP/1.1 503 Service Unavailable\r\n"
+    b"Content-Length: 0\r\n"
+    b"Connection: close\r\n"
+    b"Retry-After: 1\r\n"
+    b"\r\n"
+)
+
+# WSGI environ key of the connection takeover hook. An app answering with
+# 101 Switching Protocols, or with a 200 whose body it writes itself (an
+# event stream), calls ``environ[UPGRADE_ENVIRON_KEY](callback)``; once the
+# response head is sent the server stops handling the connection and calls
+# ``callback(socket, buffered_bytes)``. A taken-over 200 body is neither
+# chunked nor length-delimited: it ends when the connection is closed
+UPGRADE_ENVIRON_KEY = 'wordle.upgrade'
+
+# Unread request bodies up to this size are skipped to keep the connection
+# open; larger ones close it instead
+MAX_BODY_DRAIN = 1024 * 1024
+
+
+class _RequestHandler(WSGIRequestHandler):
+    """
+    Keep-alive request handler for PooledWSGIServer.
+    
+    Each call to ``resume`` handles one request. Afterwards the connection
+    is either closed or handed to the server's poller, which gives it back
+    to a worker once the next request arrives.
+    """
+    
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True  # Small responses must not wait for ACKs
+    
+    def __init__(self, request, client_address, server):
+        # socketserver handles the whole connection in __init__; here the
+        # connection outlives a single worker call
+        self.request = request
+        self.client_address = client_address
+        self.server = server
+        self.timeout = server.request_timeout
+        self.detached = False
+        self.setup()
+        self.resume()
+    
+    def resume(self) -> None:
+        """Handle the next request, then park or close the connection."""
+        while True:
+            try:
+                self.handle()
+            except Exception:
+                self.close_connection = True
+                self.server.handle_error(self.request, self.client_address)
+            
+            if self.detached:
+                return  # Taken over after a protocol upgrade
+            if self.close_connection or self.server.draining:
+                self.close()
+                return
+            if not self._has_buffered_input():
+                self.server._park(self)
+                return
+    
+    def handle(self) -> None:
+        """Handle a single request, ignoring dropped connections."""
+        self.close_connection = True
+        try:
+            self.handle_one_request()
+        except (ConnectionError, TimeoutError) as e:
+            self.connection_dropped(e)
+            self.close_connection = True
+    
+    def close(self) -> None:
+        """Close the connection."""
+        try:
+            self.finish()
+        except OSError:
+            pass
+        finally:
+            self.server.shutdown_request(self.request)
+    
+    def _has_buffered_input(self) -> bool:
+        """Check, without blocking, for a pipelined request already read."""
+        self.connection.setblocking(False)
+        try:
+            return bool(self.rfile.peek(1))
+        except OSError:
+            return False
+        finally:
+            self.connection.settimeout(self.timeout)
+    
+    def _take_buffered_input(self) -> bytes:
+        """Get, without blocking, whatever the client sent past this request."""
+        self.connection.setblocking(False)
+        try:
+            return bytes(self.rfile.peek(65536) or b'')
+        except OSError:
+            return b''
+    
+    def end_headers(self) -> None:
+        if not self.close_connection and (self.server.draining or not self.server.keep_alive):
+            self.send_header('Connection', 'close')
+        super().end_headers()
+    
+    def run_wsgi(self) -> None:
+        """
+        Run the app for one request, leaving the connection reusable.
+        
+        Werkzeug's implementation always closes the connection and then
+        discards whatever is left on the socket, which would swallow the
+        next request on a keep-alive connection. This version only skips
+        the unread rest of the declared request body.
+        """
+        environ = self.make_environ()
+        body = None
+        if environ.get('wsgi.input_terminated'):
+            # Chunked request body: the end is only known to the app
+            self.close_connection = True
+        else:
+            try:
+                length = int(environ.get('CONTENT_LENGTH') or 0)
+            except ValueError:
+                length = 0
+                self.close_connection = True
+            body = LimitedStream(self.rfile, length)
+            environ['wsgi.input'] = body
+        
+        upgrades = []
+        environ[UPGRADE_ENVIRON_KEY] = upgrades.append
+        
+        response_start = None
+        headers_sent = False
+        chunked = False
+        code = 0
+        
+        def write(data: bytes) -> None:
+            nonlocal headers_sent, chunked, code
+            if not headers_sent:
+                headers_sent = True
+                status, headers = response_start
+                code_str, _, reason = status.partition(' ')
+                code = int(code_str)
+                self.send_response(code, reason)
+                has_length = False
+                for key, value in headers:
+                    self.send_header(key, value)
+                    has_length = has_length or key.lower() == 'content-length'
+                
+                if upgrades and code == 200:
+                    self.close_connection = True
+                    self.send_header('Connection', 'close')
+                elif not (has_length or environ['REQUEST_METHOD'] == 'HEAD'
+                          or 100 <= code < 200 or code in (204, 304)):
+                    if self.request_version == 'HTTP/1.1':
+                        chunked = True
+                        self.send_header('Transfer-Encoding', 'chunked')
+                    elif not self.close_connection:
+                        # The end of the body is marked by closing the connection
+                        self.send_header('Connection', 'close')
+                self.end_headers()
+            
+            if data:
+                if chunked:
+                    self.wfile.write(b'%x\r\n%s\r\n' % (len(data), data))
+                else:
+                    self.wfile.write(data)
+        
+        def start_response(status, headers, exc_info=None):
+            nonlocal response_start
+            if exc_info and headers_sent:
+                raise exc_info[1].with_traceback(exc_info[2])
+            response_start = (status, headers)
+            return write
+        
+        def execute(app) -> None:
+            iterable = app(environ, start_response)
+            try:
+                for data in iterable:
+                    write(data)
+                if not headers_sent:
+                    write(b'')
+                if chunked:
+                    self.wfile.write(b'0\r\n\r\n')
+            finally:
+                if hasattr(iterable, 'close'):
+                    iterable.close()
+        
+        try:
+            execute(self.server.app)
+        except (ConnectionError, TimeoutError) as e:
+            self.connection_dropped(e, environ)
+            self.close_connection = True
+            return
+        except Exception:
+            logger.exception("Error on request %s %s", self.command, self.path)
+            self.close_connection = True
+            if not headers_sent:
+                try:
+                    execute(InternalServerError())
+                except Exception:
+                    pass
+            return
+        
+        if upgrades and code in (101, 200):
+            self.detached = True
+            upgrades[0](self.connection, self._take_buffered_input())
+            return
+        
+        if body is not None and not self.close_connection and not body.is_exhausted:
+            if body.limit - body.tell() > MAX_BODY_DRAIN:
+                self.close_connection = True
+            else:
+                body.exhaust()
+    
+    def log_request(self, code='-', size='-') -> None:
+        if self.server.access_log:
+            super().log_request(code, size)
+
+
+class _KeepAlivePoller:
+    """
+    Watches idle keep-alive connections on a single thread.
+    
+    A parked connection is handed back to the worker pool as soon as it
+    becomes readable, and closed once it has been idle for the keep-alive
+    timeout.
+    """
+    
+    def __init__(self, server: 'PooledWSGIServer'):
+        self.server = server
+        self._selector = selectors.DefaultSelector()
+        self._wakeup_read, self._wakeup_write = socket.socketpair()
+        self._wakeup_read.setblocking(False)
+        self._wakeup_write.setblocking(False)
+        self._selector.register(self._wakeup_read, selectors.EVENT_READ)
+        self._incoming: Deque[_RequestHandler] = deque()
+        # Parked handlers by idle deadline; insertion order is deadline order
+        self._parked: Dict[_RequestHandler, float] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='wsgi-keepalive', daemon=True)
+    
+    def start(self) -> None:
+        self._thread.start()
+    
+    def park(self, handler: _RequestHandler) -> None:
+        """Hand over an idle connection (called from worker threads)."""
+        with self._lock:
+            if not self._closed:
+                self._incoming.append(handler)
+                handler = None
+        if handler is not None:
+            handler.close()
+            return
+        try:
+            self._wakeup_write.send(b'\0')
+        except BlockingIOError:
+            pass  # A wakeup is already pending
+    
+    def stop(self) -> None:
+        """Stop polling and close every idle connection."""
+        with self._lock:
+            self._closed = True
+        try:
+            self._wakeup_write.send(b'\0')
+        except BlockingIOError:
+            pass
+        self._thread.join()
+        
+        for handler in list(self._parked) + list(self._incoming):
+            handler.close()
+        self._parked.clear()
+        self._incoming.clear()
+        self._selector.close()
+        self._wakeup_read.close()
+        self._wakeup_write.close()
+    
+    def _run(self) -> None:
+        keep_alive = self.server.keep_alive
+        while not self._closed:
+            timeout = keep_alive
+            if self._parked:
+                timeout = max(0.0, next(iter(self._parked.values())) - time.monotonic())
+            
+            for key, _ in self._selector.select(timeout):
+                handler = key.data
+                if handler is None:
+                    try:
+                        while self._wakeup_read.recv(4096):
+                            pass
+                    except BlockingIOError:
+                        pass
+                    continue
+                self._selector.unregister(handler.connection)
+                del self._parked[handler]
+                self.server._pending.put(handler)
+            
+            now = time.monotonic()
+            while self._incoming:
+                handler = self._incoming.popleft()
+                self._selector.register(handler.connection, selectors.EVENT_READ, handler)
+                self._parked[handler] = now + keep_alive
+            
+            while self._parked:
+                handler, deadline = next(iter(self._parked.items()))
+                if deadline > now:
+                    break
+                self._selector.unregister(handler.connection)
+                del self._parked[handler]
+                handler.close()
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """
+    WSGI server with a bounded worker thread pool.
+    
+    Accepted connections wait in a bounded queue for a free worker. A fixed
+    number of threads keeps latency predictable under load: when the queue
+    is full, new connections get an immediate 503 instead of waiting behind
+    work the server cannot finish in time.
+    """
+    
+    multithread = True
+    multiprocess = False
+    request_queue_size = 1024  # Listen backlog
+    
+    def __init__(self, host: str, port: int, app, threads: int = 8,
+                 keep_alive: float = 5.0, request_timeout: float = 30.0,
+                 graceful_timeout: float = 10.0, max_queued: Optional[int] = None,
+                 access_log: bool = False, on_drain: Optional[Callable[[], None]] = None):
+        """
+        Bind the server socket.
+        
+        Args:
+            host: Host to bind to
+            port: Port to bind to (0 picks a free port)
+            app: WSGI application
+            threads: Number of worker threads
+            keep_alive: Seconds an idle connection is kept open (0 disables keep-alive)
+            request_timeout: Seconds allowed for each socket read or write during a request
+            graceful_timeout: Seconds to wait for in-flight requests on shutdown
+            max_queued: Accepted connections allowed to wait for a worker
+                (defaults to four per thread)
+            access_log: Log every request
+            on_drain: Called when shutdown starts, e.g. to end event streams
+        """
+        super().__init__(host, port, app, handler=_RequestHandler)
+        self.threads = threads
+        self.keep_alive = keep_alive
+        self.request_timeout = request_timeout
+        self.graceful_timeout = graceful_timeout
+        self.access_log = access_log
+        self.on_drain = on_drain
+        self.draining = False
+        self.rejected = 0
+        self.max_queued = max_queued or threads * 4
+        # New connections as (socket, address), parked connections coming
+        # back as their handler, and None telling a worker to exit
+        self._pending: 'queue.Queue' = queue.Queue()
+        self._workers = []
+        self._poller: Optional[_KeepAlivePoller] = None
+    
+    @property
+    def bound_port(self) -> int:
+        """Port the server socket is actually bound to."""
+        return self.socket.getsockname()[1]
+    
+    def process_request(self, request, client_address) -> None:
+        """Queue an accepted connection for the worker pool, or shed it."""
+        if self._pending.qsize() < self.max_queued:
+            self._pending.put((request, client_address))
+        else:
+            self.rejected += 1
+            try:
+                request.sendall(BUSY_RESPONSE)
+            except OSError:
+                pass
+            self.shutdown_request(request)
+    
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        """
+        Serve until stop() is called, then drain in-flight requests.
+        
+        Threads are started here rather than in __init__ so that each
+        pre-forked process runs its own pool.
+        """
+        self._poller = _KeepAlivePoller(self)
+        self._poller.start()
+        self._workers = [
+            threading.Thread(target=self._work, name=f"wsgi-worker-{i}", daemon=True)
+            for i in range(self.threads)
+        ]
+        for worker in self._workers:
+            worker.start()
+        
+        try:
+            super().serve_forever(poll_interval)
+        finally:
+            self._drain()
+    
+    def stop(self) -> None:
+        """
+        Stop accepting connections and drain; safe to call from a signal handler.
+        """
+        # Responses from here on tell clients to close their connection
+        self.draining = True
+        threading.Thread(target=self.shutdown, name='wsgi-shutdown', daemon=True).start()
+    
+    def _work(self) -> None:
+        """Worker loop: handle queued connections until told to exit."""
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            if isinstance(item, _RequestHandler):
+                item.resume()
+                continue
+            
+            request, client_address = item
+            try:
+                self.RequestHandlerClass(request, client_address, self)
+            except Exception:
+                self.handle_error(request, client_address)
+                self.shutdown_request(request)
+    
+    def _park(self, handler: _RequestHandler) -> None:
+        """Wait for the next request on a connection without holding a worker."""
+        if self.keep_alive and self._poller is not None:
+            self._poller.park(handler)
+        else:
+            handler.close()
+    
+    def _drain(self) -> None:
+        """Finish in-flight requests and close idle connections."""
+        self.draining = True
+        if self._poller is not None:
+            self._poller.stop()
+        
+        if self.on_drain is not None:
+            self.on_drain()
+        
+        for _ in self._workers:
+            self._pending.put(None)
+        
+        deadline = time.monotonic() + self.graceful_timeout
+        for worker in self._workers:
+            worker.join(max(0.0, deadline - time.monotonic()))
+        
+        unfinished = sum(1 for worker in self._workers if worker.is_alive())
+        if unfinished:
+            logger.warning("Shutting down with %d requests still running", unfinished)
+
+
+def serve(app, host: str = '0.0.0.0', port: int = 8080, threads: int = 8,
+          **options) -> None:
+    """
+    Serve a WSGI app until SIGTERM or SIGINT.
+    
+    Args:
+        app: WSGI application, fully initialized
+        host: Host to bind to
+        port: Port to bind to
+        threads: Worker threads
+        **options: Further PooledWSGIServer options (keep_alive,
+            request_timeout, graceful_timeout, max_queued, access_log, on_drain)
+    """
+    server = PooledWSGIServer(host, port, app, threads=threads, **options)
+    
+    def stop(signum, frame) -> None:
+        server.stop()
+    
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    server.serve_forever()
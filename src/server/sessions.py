@@ -0,0 +1,262 @@
+"""
+Session identifiers and the sharded session registry.
+
+This module provides collision-free session id generation and a registry
+that spreads sessions across independently locked shards, so that concurrent
+game starts and lookups do not contend on a single dictionary.
+"""
+
+import os
+import threading
+import time
+from itertools import islice
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+# Crockford base32 alphabet (no I, L, O, U) used by ULIDs
+_ULID_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+
+def _encode_base32(value: int, length: int) -> str:
+    """Encode an integer as a fixed-width Crockford base32 string."""
+    chars = []
+    for _ in range(length):
+        chars.append(_ULID_ALPHABET[value & 31])
+        value >>= 5
+    return ''.join(reversed(chars))
+
+
+def generate_session_id(prefix: str = 'session') -> str:
+    """
+    Generate a collision-free session identifier.
+    
+    The id follows the ULID layout: a 48-bit millisecond timestamp followed
+    by 80 random bits, encoded as 26 Crockford base32 characters. Ids sort by
+    creation time and are unique even when many are created in the same
+    millisecond.
+    
+    Args:
+        prefix: Prefix prepended to the id (e.g. 'session' or 'client')
+    
+    Returns:
+        Session identifier such as 'session_01J9ZK3M8Q...'
+    """
+    timestamp = int(time.time() * 1000) & ((1 << 48) - 1)
+    randomness = int.from_bytes(os.urandom(10), 'big')
+    ulid = _encode_base32(timestamp, 10) + _encode_base32(randomness, 16)
+    return f"{prefix}_{ulid}" if prefix else ulid
+
+
+class SessionRegistry(MutableMapping):
+    """
+    Thread-safe mapping of session id to game, sharded by id hash.
+    
+    Each shard is an independent dictionary guarded by its own lock, so
+    operations on different sessions rarely contend. The registry behaves
+    like a regular dictionary for callers.
+    
+    With an idle timeout, sessions that have not been accessed for that long
+    are evicted. Every insert sweeps one shard, so eviction work is spread
+    evenly over requests instead of needing a background thread.
+    """
+    
+    def __init__(self, shard_count: int = 16, idle_timeout: Optional[float] = None,
+                 on_evict: Optional[Callable[[str, Any], None]] = None):
+        """
+        Initialize the registry.
+        
+        Args:
+            shard_count: Number of shards (rounded up to a power of two)
+            idle_timeout: Seconds without access after which a session is
+                evicted (None disables eviction)
+            on_evict: Optional callback called with (session_id, game) for
+                each evicted session
+        """
+        if shard_count < 1:
+            raise ValueError("shard_count must be at least 1")
+        
+        size = 1
+        while size < shard_count:
+            size <<= 1
+        
+        self._mask = size - 1
+        self._shards: List[Dict[str, Any]] = [{} for _ in range(size)]
+        self._locks = [threading.Lock() for _ in range(size)]
+        self._last_access: List[Dict[str, float]] = [{} for _ in range(size)]
+        self.idle_timeout = idle_timeout
+        self.on_evict = on_evict
+        self.evictions = 0
+        self._sweep_cursor = 0
+        self._evictions_lock = threading.Lock()
+    
+    @property
+    def shard_count(self) -> int:
+        """Get the number of shards."""
+        return len(self._shards)
+    
+    def _shard_index(self, session_id: str) -> int:
+        """Get the shard index for a session id."""
+        return hash(session_id) & self._mask
+    
+    def __getitem__(self, session_id: str) -> Any:
+        # Single dict reads and writes are atomic under the GIL, so lookups skip the lock
+        index = self._shard_index(session_id)
+        game = self._shards[index][session_id]
+        if self.idle_timeout is not None:
+            self._touch(index, session_id)
+        return game
+    
+    def get(self, session_id: str, default: Any = None) -> Any:
+        """Get the game for a session id, or default if it is not registered."""
+        index = self._shard_index(session_id)
+        game = self._shards[index].get(session_id, default)
+        if self.idle_timeout is not None and game is not default:
+            self._touch(index, session_id)
+        return game
+    
+    def _touch(self, index: int, session_id: str) -> None:
+        """Record an access to a session found without holding its shard lock."""
+        with self._locks[index]:
+            # The session may have been evicted or removed since it was read
+            if session_id in self._shards[index]:
+                self._mark_accessed(index, session_id)
+    
+    def _mark_accessed(self, index: int, session_id: str) -> None:
+        """Move a session to the most-recently-used end of its shard's access order (shard lock held)."""
+        last_access = self._last_access[index]
+        last_access.pop(session_id, None)
+        last_access[session_id] = time.monotonic()
+    
+    def __contains__(self, session_id: object) -> bool:
+        if not isinstance(session_id, str):
+            return False
+        return session_id in self._shards[self._shard_index(session_id)]
+    
+    def __setitem__(self, session_id: str, game: Any) -> None:
+        index = self._shard_index(session_id)
+        with self._locks[index]:
+            self._shards[index][session_id] = game
+            self._mark_accessed(index, session_id)
+        self._sweep_next_shard()
+    
+    def __delitem__(self, session_id: str) -> None:
+        index = self._shard_index(session_id)
+        with self._locks[index]:
+            del self._shards[index][session_id]
+            self._last_access[index].pop(session_id, None)
+    
+    def add(self, session_id: str, game: Any) -> bool:
+        """
+        Register a game only if the session id is not already taken.
+        
+        Args:
+            session_id: Session identifier
+            game: Game instance to store
+        
+        Returns:
+            True if the game was added, False if the id was already in use
+        """
+        index = self._shard_index(session_id)
+        with self._locks[index]:
+            shard = self._shards[index]
+            if session_id in shard:
+                return False
+            shard[session_id] = game
+            self._mark_accessed(index, session_id)
+        self._sweep_next_shard()
+        return True
+    
+    def pop(self, session_id: str, *default: Any) -> Any:
+        """Remove a session and return its game."""
+        index = self._shard_index(session_id)
+        with self._locks[index]:
+            self._last_access[index].pop(session_id, None)
+            return self._shards[index].pop(session_id, *default)
+    
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+    
+    def keys(self) -> List[str]:
+        """Get a snapshot of all session ids."""
+        return [session_id for session_id, _ in self.items()]
+    
+    def values(self) -> List[Any]:
+        """Get a snapshot of all games."""
+        return [game for _, game in self.items()]
+    
+    def items(self) -> List[Tuple[str, Any]]:
+        """Get a snapshot of all (session id, game) pairs."""
+        snapshot = []
+        for index, shard in enumerate(self._shards):
+            with self._locks[index]:
+                snapshot.extend(shard.items())
+        return snapshot
+    
+    def clear(self) -> None:
+        """Remove all sessions."""
+        for index, shard in enumerate(self._shards):
+            with self._locks[index]:
+                shard.clear()
+                self._last_access[index].clear()
+    
+    def shard_sizes(self) -> List[int]:
+        """Get the number of sessions held by each shard."""
+        return [len(shard) for shard in self._shards]
+    
+    def evict_idle(self) -> int:
+        """
+        Evict every session that has been idle longer than the idle timeout.
+        
+        Returns:
+            Number of sessions evicted
+        """
+        if self.idle_timeout is None:
+            return 0
+        return sum(self._sweep_shard(index) for index in range(len(self._shards)))
+    
+    def _sweep_next_shard(self) -> None:
+        """Sweep one shard for idle sessions, rotating through the shards."""
+        if self.idle_timeout is None:
+            return
+        index = self._sweep_cursor
+        self._sweep_cursor = (index + 1) & self._mask
+        self._sweep_shard(index)
+    
+    def _sweep_shard(self, index: int) -> int:
+        """
+        Evict idle sessions from one shard and return how many were removed.
+        
+        The access order keeps the least recently used sessions first, so
+        the sweep stops at the first session that is still fresh and costs
+        O(evicted + 1).
+        """
+        cutoff = time.monotonic() - self.idle_timeout
+        evicted = []
+        with self._locks[index]:
+            shard = self._shards[index]
+            last_access = self._last_access[index]
+            fresh = False
+            while not fresh:
+                batch = list(islice(last_access.items(), 64))
+                if not batch:
+                    break
+                for session_id, accessed in batch:
+                    if last_access.get(session_id, accessed) >= cutoff:
+                        fresh = True
+                        break
+                    last_access.pop(session_id, None)
+                    game = shard.pop(session_id, None)
+                    if game is not None:
+                        evicted.append((session_id, game))
+        
+        if evicted:
+            with self._evictions_lock:
+                self.evictions += len(evicted)
+            if self.on_evict is not None:
+                for session_id, game in evicted:
+                    self.on_evict(session_id, game)
+        return len(evicted)
@@ -0,0 +1,256 @@
+"""
+Session snapshots for restarts.
+
+This module serializes live games into a compact snapshot file and
+rebuilds them on the next start, so a deploy does not end the games in
+progress. Each game is flattened into a tuple of small integers: words are
+stored as indices into the lexicon and guess results as pattern codes, and
+the whole snapshot is written with a single pickle call.
+
+A snapshot can only be restored with the same word list it was written
+with; the lexicon fingerprint stored in the file is checked on load.
+"""
+
+import hashlib
+import os
+import pickle
+import time
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..core.game_engine import GameState, encode_result, decode_result
+from ..game_modes.base_game_mode import BaseGameMode
+from ..game_modes.single_player import SinglePlayerGame
+from ..game_modes.cheating_host import CheatingHostGame
+from ..game_modes.daily import DailyGame
+from ..game_modes.multiplayer import MultiplayerGame, Player
+from ..utils.lexicon import Lexicon
+
+
+SNAPSHOT_FORMAT = 1
+
+_STATE_CODES = {GameState.PLAYING: 0, GameState.WON: 1, GameState.LOST: 2}
+_CODE_STATES = (GameState.PLAYING, GameState.WON, GameState.LOST)
+
+# Decoded result for every pattern code, copied on restore
+_RESULTS = tuple(tuple(decode_result(code)) for code in range(243))
+
+# Order of the fields stored for each multiplayer player
+_PLAYER_FIELDS = ('id', 'name', 'score', 'is_connected', 'last_activity', 'has_won', 'rounds_to_win')
+
+
+def lexicon_fingerprint(lexicon: Lexicon) -> str:
+    """
+    Get a short fingerprint identifying a word list.
+    
+    Args:
+        lexicon: Lexicon to fingerprint
+    
+    Returns:
+        Hex digest of the words in order
+    """
+    return lexicon.table(
+        'fingerprint',
+        lambda: hashlib.blake2b('\n'.join(lexicon.words).encode(), digest_size=8).hexdigest()
+    )
+
+
+def _word_index(lexicon: Lexicon) -> Dict[str, int]:
+    """Get the position of each word in the lexicon."""
+    return lexicon.table('word_index', lambda: {word: i for i, word in enumerate(lexicon.words)})
+
+
+class _Encoder:
+    """Flattens games built on one lexicon into tuples."""
+    
+    def __init__(self, lexicon: Lexicon):
+        self.index = _word_index(lexicon)
+        self.all_words = len(lexicon.words)
+    
+    def word(self, word: Optional[str]) -> Optional[int]:
+        return None if word is None else self.index[word]
+    
+    def words(self, words: List[str]) -> Tuple[int, ...]:
+        index = self.index
+        return tuple([index[word] for word in words])
+    
+    def results(self, results) -> Tuple[int, ...]:
+        return tuple([encode_result(result) for result in results])
+    
+    def game(self, game: BaseGameMode) -> tuple:
+        """Flatten one game mode instance."""
+        if isinstance(game, MultiplayerGame):
+            players = tuple(
+                tuple(getattr(player, field) for field in _PLAYER_FIELDS)
+                + (self.words(player.guesses), self.results(player.results))
+                for player in game.players.values()
+            )
+            return (
+                'm', game.max_rounds, game.state_version, game._history_version,
+                game.max_players, self.word(game.answer), _STATE_CODES[game.game_state],
+                game.current_round, game.round_start_time, game.round_duration, players,
+                dict(game.bots)
+            )
+        
+        engine = game.game
+        engine_record = (
+            self.word(engine.answer), self.words(engine.guesses),
+            self.results(engine.results), _STATE_CODES[engine.game_state]
+        )
+        if isinstance(game, CheatingHostGame):
+            candidates = game.candidate_words
+            # Before the first guess every word is still a candidate
+            packed = None if len(candidates) == self.all_words else self.words(candidates)
+            return ('c', game.max_rounds, game.state_version, game._history_version,
+                    game.player_name, engine_record, self.word(game.answer), packed)
+        if isinstance(game, DailyGame):
+            return ('d', game.max_rounds, game.state_version, game._history_version,
+                    game.player_name, engine_record, game.puzzle.day.toordinal())
+        if isinstance(game, SinglePlayerGame):
+            return ('s', game.max_rounds, game.state_version, game._history_version,
+                    game.player_name, engine_record)
+        raise TypeError(f"Cannot snapshot {type(game).__name__}")
+
+
+class _Decoder:
+    """Rebuilds games from tuples produced by _Encoder."""
+    
+    def __init__(self, lexicon: Lexicon, downtime: float):
+        self.lexicon = lexicon
+        self.words_list = lexicon.words
+        self.downtime = downtime
+    
+    def word(self, index: Optional[int]) -> Optional[str]:
+        return None if index is None else self.words_list[index]
+    
+    def words(self, indices: Tuple[int, ...]) -> List[str]:
+        words = self.words_list
+        return [words[i] for i in indices]
+    
+    def results(self, codes: Tuple[int, ...]) -> list:
+        return [list(_RESULTS[code]) for code in codes]
+    
+    def _restore_engine(self, game: BaseGameMode, record: tuple) -> None:
+        answer, guesses, results, state = record
+        engine = game.game
+        engine.answer = self.word(answer)
+        engine.guesses = self.words(guesses)
+        engine.results = self.results(results)
+        engine.current_round = len(guesses)
+        engine.game_state = _CODE_STATES[state]
+    
+    def game(self, record: tuple) -> BaseGameMode:
+        """Rebuild one game mode instance."""
+        kind, max_rounds, state_version, history_version = record[:4]
+        
+        if kind == 's':
+            game = SinglePlayerGame(self.lexicon, max_rounds)
+            game.player_name = record[4]
+            self._restore_engine(game, record[5])
+        elif kind == 'd':
+            game = DailyGame(self.lexicon, max_rounds)
+            game.start_game(day=date.fromordinal(record[6]), player_name=record[4])
+            self._restore_engine(game, record[5])
+        elif kind == 'c':
+            game = CheatingHostGame(self.lexicon, max_rounds)
+            game.player_name = record[4]
+            self._restore_engine(game, record[5])
+            game.answer = self.word(record[6])
+            if record[7] is not None:
+                game.candidate_words = self.words(record[7])
+        elif kind == 'm':
+            (max_players, answer, state, current_round, round_start_time,
+             round_duration, players) = record[4:11]
+            # Records written before bots were kept have no bot settings
+            bots = record[11] if len(record) > 11 else {}
+            game = MultiplayerGame(self.lexicon, max_rounds, max_players)
+            game.answer = self.word(answer)
+            game.game_state = _CODE_STATES[state]
+            game.current_round = current_round
+            # Rounds do not run down while the server is restarting
+            game.round_start_time = (
+                None if round_start_time is None else round_start_time + self.downtime
+            )
+            game.round_duration = round_duration
+            for record in players:
+                player = Player(record[0], record[1])
+                for field, value in zip(_PLAYER_FIELDS, record):
+                    player[field] = value
+                player.guesses = self.words(record[-2])
+                player.results = self.results(record[-1])
+                game.players[player.id] = player
+            game.bots = {
+                player_id: settings for player_id, settings in bots.items()
+                if player_id in game.players
+            }
+            game.rebuild_indexes()
+        else:
+            raise ValueError(f"Unknown game record type: {kind!r}")
+        
+        game.state_version = state_version
+        game._history_version = history_version
+        return game
+
+
+def save_snapshot(path: str, lexicon: Lexicon,
+                  sessions: Iterable[Tuple[str, BaseGameMode]],
+                  rooms: Iterable[Tuple[str, MultiplayerGame]] = ()) -> Dict[str, int]:
+    """
+    Write live games to a snapshot file.
+    
+    The file is written next to its destination and renamed into place, so
+    a crash never leaves a partial snapshot behind.
+    
+    Args:
+        path: Snapshot file path
+        lexicon: Lexicon all games were built on
+        sessions: (session id, game) pairs
+        rooms: (room id, multiplayer game) pairs
+    
+    Returns:
+        Number of sessions and rooms written
+    """
+    encoder = _Encoder(lexicon)
+    session_records = [(session_id, encoder.game(game)) for session_id, game in sessions]
+    room_records = [(room_id, encoder.game(game)) for room_id, game in rooms]
+    
+    snapshot = (SNAPSHOT_FORMAT, lexicon_fingerprint(lexicon), time.time(),
+                session_records, room_records)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, path)
+    
+    return {'sessions': len(session_records), 'rooms': len(room_records)}
+
+
+def load_snapshot(path: str, lexicon: Lexicon) -> Tuple[List[Tuple[str, BaseGameMode]],
+                                                        List[Tuple[str, MultiplayerGame]]]:
+    """
+    Read games back from a snapshot file.
+    
+    Only load snapshots this server wrote: the file is unpickled.
+    
+    Args:
+        path: Snapshot file path
+        lexicon: Lexicon to rebuild the games on
+    
+    Returns:
+        Tuple of ([(session id, game)], [(room id, multiplayer game)])
+    
+    Raises:
+        ValueError: If the snapshot format or word list does not match
+    """
+    with open(path, 'rb') as f:
+        snapshot = pickle.load(f)
+    
+    snapshot_format, fingerprint, written_at, session_records, room_records = snapshot
+    if snapshot_format != SNAPSHOT_FORMAT:
+        raise ValueError(f"Unsupported snapshot format: {snapshot_format}")
+    if fingerprint != lexicon_fingerprint(lexicon):
+        raise ValueError("Snapshot was written with a different word list")
+    
+    decoder = _Decoder(lexicon, downtime=max(0.0, time.time() - written_at))
+    sessions = [(session_id, decoder.game(record)) for session_id, record in session_records]
+    rooms = [(room_id, decoder.game(record)) for room_id, record in room_records]
+    return sessions, rooms
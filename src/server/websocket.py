@@ -0,0 +1,283 @@
+"""
+WebSocket fan-out for multiplayer rooms.
+
+This module implements the server side of RFC 6455 on top of the pooled
+HTTP server: a route answers the upgrade request and hands the socket to a
+WebSocketHub, a SocketHub (see fanout) whose one thread owns every
+upgraded socket through a selector, so open sockets cost no worker
+threads. Each published event is serialized and framed once, and the same
+bytes are queued on every subscriber of its channel. Clients only listen; room actions stay on the
+HTTP routes.
+"""
+
+import base64
+import hashlib
+import json
+import struct
+from typing import Any, Dict, Optional, Tuple
+
+from . import fanout
+from .wire import WordleJSONProvider
+from ..core.game_engine import encode_result
+
+
+_GUID = b'258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+CLOSE_NORMAL = 1000
+CLOSE_GOING_AWAY = 1001
+CLOSE_PROTOCOL_ERROR = 1002
+CLOSE_TOO_BIG = 1009
+
+# Largest client frame accepted; clients only send control frames
+MAX_CLIENT_FRAME = 64 * 1024
+
+
+def accept_key(key: str) -> str:
+    """
+    Compute the Sec-WebSocket-Accept value for a handshake.
+    
+    Args:
+        key: Client's Sec-WebSocket-Key header
+    
+    Returns:
+        Value for the Sec-WebSocket-Accept response header
+    """
+    digest = hashlib.sha1(key.strip().encode('ascii') + _GUID).digest()
+    return base64.b64encode(digest).decode('ascii')
+
+
+def encode_frame(opcode: int, payload: bytes = b'') -> bytes:
+    """
+    Build an unmasked, unfragmented server frame.
+    
+    Args:
+        opcode: Frame opcode
+        payload: Frame payload
+    
+    Returns:
+        The encoded frame
+    """
+    length = len(payload)
+    if length < 126:
+        header = struct.pack('!BB', 0x80 | opcode, length)
+    elif length < 1 << 16:
+        header = struct.pack('!BBH', 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack('!BBQ', 0x80 | opcode, 127, length)
+    return header + payload
+
+
+def close_frame(code: int, reason: str = '') -> bytes:
+    """Build a close frame with a status code."""
+    return encode_frame(OP_CLOSE, struct.pack('!H', code) + reason.encode('utf-8'))
+
+
+def compact_event(event_type: str, data: Dict[str, Any]) -> bytes:
+    """
+    Encode a room event as a text frame.
+    
+    Guess results are sent as their base-3 pattern code instead of a list
+    of letter results.
+    
+    Args:
+        event_type: Room event name
+        data: Event data from MultiplayerGame
+    
+    Returns:
+        Text frame with ``{"type": event_type, ...data}`` as compact JSON
+    """
+    message = {'type': event_type}
+    message.update(data)
+    if 'result' in message:
+        message['pattern'] = encode_result(message.pop('result'))
+    body = json.dumps(message, separators=(',', ':'), default=WordleJSONProvider.default)
+    return encode_frame(OP_TEXT, body.encode('utf-8'))
+
+
+class FrameParser:
+    """
+    Incremental parser for masked client frames.
+    
+    Feed it bytes as they arrive and collect complete (opcode, payload)
+    frames. Fragmented messages are reassembled.
+    """
+    
+    def __init__(self, max_size: int = MAX_CLIENT_FRAME):
+        self.max_size = max_size
+        self._buffer = bytearray()
+        self._fragments: Optional[Tuple[int, bytearray]] = None
+    
+    def feed(self, data: bytes) -> list:
+        """
+        Add received bytes.
+        
+        Args:
+            data: Bytes read from the socket
+        
+        Returns:
+            List of complete (opcode, payload) messages
+        
+        Raises:
+            ValueError: On a protocol violation, with the close code as args[1]
+        """
+        self._buffer += data
+        messages = []
+        while True:
+            frame = self._next_frame()
+            if frame is None:
+                return messages
+            fin, opcode, payload = frame
+            if opcode >= OP_CLOSE:
+                if not fin or len(payload) > 125:
+                    raise ValueError('Invalid control frame', CLOSE_PROTOCOL_ERROR)
+                messages.append((opcode, payload))
+            elif opcode == OP_CONTINUATION:
+                if self._fragments is None:
+                    raise ValueError('Unexpected continuation frame', CLOSE_PROTOCOL_ERROR)
+                self._fragments[1].extend(payload)
+                if len(self._fragments[1]) > self.max_size:
+                    raise ValueError('Message too big', CLOSE_TOO_BIG)
+                if fin:
+                    messages.append((self._fragments[0], bytes(self._fragments[1])))
+                    self._fragments = None
+            elif fin:
+                messages.append((opcode, payload))
+            else:
+                self._fragments = (opcode, bytearray(payload))
+    
+    def _next_frame(self) -> Optional[Tuple[bool, int, bytes]]:
+        buffer = self._buffer
+        if len(buffer) < 2:
+            return None
+        first, second = buffer[0], buffer[1]
+        if first & 0x70:
+            raise ValueError('Reserved bits set', CLOSE_PROTOCOL_ERROR)
+        if not second & 0x80:
+            raise ValueError('Client frames must be masked', CLOSE_PROTOCOL_ERROR)
+        
+        length = second & 0x7F
+        offset = 2
+        if length == 126:
+            if len(buffer) < 4:
+                return None
+            length = struct.unpack_from('!H', buffer, 2)[0]
+            offset = 4
+        elif length == 127:
+            if len(buffer) < 10:
+                return None
+            length = struct.unpack_from('!Q', buffer, 2)[0]
+            offset = 10
+        if length > self.max_size:
+            raise ValueError('Frame too big', CLOSE_TOO_BIG)
+        if len(buffer) < offset + 4 + length:
+            return None
+        
+        mask = buffer[offset:offset + 4]
+        start = offset + 4
+        masked = bytes(buffer[start:start + length])
+        del buffer[:start + length]
+        # Unmask the whole payload with one big-int XOR
+        key = int.from_bytes((mask * (length // 4 + 1))[:length], 'big')
+        payload = (int.from_bytes(masked, 'big') ^ key).to_bytes(length, 'big')
+        return bool(first & 0x80), first & 0x0F, payload
+
+
+class _Connection(fanout._Connection):
+    """One subscriber, with a parser for the control frames it sends."""
+    
+    __slots__ = ('parser',)
+    
+    def __init__(self, channel: str):
+        super().__init__(channel)
+        self.parser = FrameParser()
+
+
+class WebSocketHub(fanout.SocketHub):
+    """
+    Owns upgraded sockets and fans events out to them.
+    
+    ``publish`` may be called from any thread: it takes a frame encoded
+    once and queues it for the hub thread, which writes it to every
+    subscriber of the channel without blocking. A subscriber whose unsent
+    output grows past ``max_buffer`` is disconnected rather than slowing
+    everyone down.
+    
+    Subscribing takes two steps so no event is lost during the handshake:
+    ``subscribe`` is called before the state snapshot is taken and events
+    queue on the connection from then on, and ``attach`` hands over the
+    socket once the 101 response has been written.
+    """
+    
+    name = 'websocket'
+    connection_class = _Connection
+    
+    def __init__(self, max_buffer: int = 1024 * 1024, ping_interval: float = 30.0):
+        """
+        Initialize the hub; its thread starts with the first connection.
+        
+        Args:
+            max_buffer: Unsent bytes allowed per socket before it is dropped
+            ping_interval: Seconds between pings; sockets silent for three
+                intervals are closed
+        """
+        super().__init__(max_buffer=max_buffer, keepalive_interval=ping_interval)
+        self.ping_interval = ping_interval
+    
+    def bind_room(self, room_id: str, game: Any, channel: str) -> None:
+        """
+        Forward a multiplayer room's events to a channel as compact frames.
+        
+        Args:
+            room_id: Room identifier
+            game: MultiplayerGame instance
+            channel: Channel name for the room
+        """
+        def forward(event_type: str, data: Dict[str, Any]) -> None:
+            if self._subscribed.get(channel):
+                self.publish(channel, compact_event(event_type, data))
+        
+        game.add_listener(forward)
+    
+    def _received(self, conn: _Connection, data: bytes) -> None:
+        try:
+            messages = conn.parser.feed(data)
+        except ValueError as e:
+            self._close(conn, e.args[1], e.args[0])
+            return
+        for opcode, payload in messages:
+            if opcode == OP_PING:
+                self._send(conn, encode_frame(OP_PONG, payload))
+            elif opcode == OP_CLOSE:
+                code = struct.unpack('!H', payload[:2])[0] if len(payload) >= 2 else CLOSE_NORMAL
+                self._close(conn, code if code < 5000 else CLOSE_PROTOCOL_ERROR)
+                return
+            # Pongs and data messages only refresh last_seen
+    
+    def _close(self, conn: _Connection, code: int, reason: str = '') -> None:
+        """Start the closing handshake; the socket is dropped once flushed."""
+        if conn.closing:
+            return
+        self._send(conn, close_frame(code, reason))
+        conn.closing = True
+        if not conn.out and not conn.dropped:
+            self._drop(conn)
+    
+    def _keepalive(self, now: float) -> None:
+        """Ping every socket and close the ones that stopped answering."""
+        ping = encode_frame(OP_PING)
+        for subscribers in list(self._channels.values()):
+            for conn in list(subscribers):
+                if now - conn.last_seen > 3 * self.ping_interval:
+                    self._drop(conn)
+                else:
+                    self._send(conn, ping)
+    
+    def _goodbye(self) -> bytes:
+        return close_frame(CLOSE_GOING_AWAY, 'Server shutting down')
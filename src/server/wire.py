@@ -0,0 +1,451 @@
+"""
+Wire formats for the game API.
+
+This module handles response encoding and content negotiation. JSON is the
+default format. Clients that send ``Accept: application/msgpack`` receive a
+compact MessagePack encoding instead, in which every guess result is packed
+into a single pattern code (see ``encode_result`` in the game engine) and
+enums are sent as their string values.
+
+The ``msgpack`` package is used when it is installed; otherwise a built-in
+encoder/decoder for the subset of MessagePack the API needs (nil, booleans,
+integers, floats, strings, binary, arrays and maps) is used.
+
+Responses above a size threshold are compressed with gzip or deflate when
+the client's ``Accept-Encoding`` allows it (see ``instrument_compression``).
+"""
+
+import gzip
+import struct
+import zlib
+from enum import Enum
+from typing import Any, Dict, Optional, Tuple
+
+from flask import Flask, Response, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+
+from ..core.game_engine import LetterResult, encode_result
+from ..utils.metrics import REGISTRY, CacheStats
+
+try:
+    import msgpack as _msgpack
+except ImportError:  # pragma: no cover - depends on the environment
+    _msgpack = None
+
+
+JSON_MIMETYPE = 'application/json'
+MSGPACK_MIMETYPE = 'application/msgpack'
+
+# Accepted aliases for MessagePack in the Accept header
+_MSGPACK_ALIASES = (MSGPACK_MIMETYPE, 'application/x-msgpack')
+
+# Content codings offered to clients, in order of preference
+_ENCODINGS = ('gzip', 'deflate')
+
+# Conditional state requests answered with 304 count as hits
+_STATE_CACHE = CacheStats(REGISTRY, 'state_etag')
+
+
+class WordleJSONProvider(DefaultJSONProvider):
+    """JSON provider that serializes enums (e.g. LetterResult) as their values."""
+    
+    @staticmethod
+    def default(o: Any) -> Any:
+        if isinstance(o, Enum):
+            return o.value
+        return DefaultJSONProvider.default(o)
+
+
+def compact(obj: Any) -> Any:
+    """
+    Convert a response payload into its compact form.
+    
+    Guess results (lists of LetterResult) become integer pattern codes and
+    other enums become their values.
+    
+    Args:
+        obj: Payload to convert
+    
+    Returns:
+        Compact payload containing only plain Python types
+    """
+    if isinstance(obj, dict):
+        return {key: compact(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        if obj and isinstance(obj[0], LetterResult):
+            return encode_result(obj)
+        return [compact(item) for item in obj]
+    if isinstance(obj, Enum):
+        return obj.value
+    return obj
+
+
+def negotiate_mimetype() -> str:
+    """
+    Pick the response mimetype from the current request's Accept header.
+    
+    Returns:
+        MSGPACK_MIMETYPE if the client prefers MessagePack, JSON_MIMETYPE otherwise
+    """
+    accept = request.accept_mimetypes
+    best = accept.best_match((JSON_MIMETYPE,) + _MSGPACK_ALIASES, default=JSON_MIMETYPE)
+    if best in _MSGPACK_ALIASES and accept[best] > accept[JSON_MIMETYPE]:
+        return MSGPACK_MIMETYPE
+    return JSON_MIMETYPE
+
+
+def api_response(payload: Dict[str, Any], status: int = 200) -> Tuple[Response, int]:
+    """
+    Encode an API payload in the format negotiated with the client.
+    
+    Args:
+        payload: Response payload
+        status: HTTP status code
+    
+    Returns:
+        Tuple of (response, status code) suitable for returning from a view
+    """
+    if negotiate_mimetype() == MSGPACK_MIMETYPE:
+        response = Response(packb(compact(payload)), mimetype=MSGPACK_MIMETYPE)
+    else:
+        response = jsonify(payload)
+    response.vary.add('Accept')
+    return response, status
+
+
+def state_etag(session_id: str, version: int, since: Optional[int] = None) -> str:
+    """
+    Build the entity tag for a session's state at a given version.
+    
+    Args:
+        session_id: Session identifier
+        version: State version of the session's game
+        since: Version a delta response starts from (None for the full state)
+    
+    Returns:
+        Entity tag value (without quotes)
+    """
+    if since is not None:
+        return f"{session_id}.{version}-{since}"
+    return f"{session_id}.{version}"
+
+
+def state_response(session_id: str, game: Any) -> Tuple[Response, int]:
+    """
+    Build a conditional, optionally incremental, game state response.
+    
+    A request whose ``If-None-Match`` matches the current version gets an
+    empty 304 without the state being rebuilt. A ``since=<version>`` query
+    argument returns only the guesses made after that version when possible.
+    A delta has its own ETag, so it is never taken for the full state of the
+    same version.
+    
+    Args:
+        session_id: Session identifier
+        game: Game mode instance with a ``state_version``
+    
+    Returns:
+        Tuple of (response, status code)
+    """
+    version = game.state_version
+    since = request.args.get('since', type=int)
+    etag = state_etag(session_id, version)
+    delta_etag = state_etag(session_id, version, since) if since is not None else None
+    
+    for current in (etag, delta_etag):
+        if current is not None and request.if_none_match.contains_weak(current):
+            _STATE_CACHE.hit()
+            response = Response(status=304)
+            response.set_etag(current)
+            return response, 304
+    
+    _STATE_CACHE.miss()
+    payload = None
+    if since is not None:
+        payload = game.get_state_delta(since)
+    if payload is None:
+        payload = game.get_game_state()
+    else:
+        etag = delta_etag
+    
+    response, status = api_response(payload)
+    response.set_etag(etag)
+    return response, status
+
+
+def compress_response(response: Response, min_size: int, level: int = 6) -> Response:
+    """
+    Compress a response body with the best encoding the client accepts.
+    
+    Streamed responses (e.g. Server-Sent Events), bodiless statuses, bodies
+    smaller than ``min_size`` and responses that already carry a
+    Content-Encoding are returned unchanged. A strong ETag is weakened,
+    since the compressed bytes differ from the identity representation.
+    
+    Args:
+        response: Response to compress
+        min_size: Smallest body size in bytes worth compressing
+        level: zlib compression level (1-9)
+    
+    Returns:
+        The same response, compressed in place if applicable
+    """
+    if (response.direct_passthrough or response.is_streamed
+            or response.status_code < 200 or response.status_code in (204, 304)
+            or 'Content-Encoding' in response.headers):
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    encoding = request.accept_encodings.best_match(_ENCODINGS)
+    if encoding is None:
+        return response
+    
+    body = response.get_data()
+    if len(body) < min_size:
+        return response
+    
+    if encoding == 'gzip':
+        response.set_data(gzip.compress(body, compresslevel=level, mtime=0))
+    else:
+        response.set_data(zlib.compress(body, level))
+    response.headers['Content-Encoding'] = encoding
+    
+    etag, weak = response.get_etag()
+    if etag is not None and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def instrument_compression(app: Flask, min_size: int, level: int = 6) -> None:
+    """
+    Compress an app's responses when the client accepts it.
+    
+    Args:
+        app: Flask app to instrument
+        min_size: Smallest body size in bytes worth compressing
+        level: zlib compression level (1-9)
+    """
+    @app.after_request
+    def _compress(response: Response) -> Response:
+        return compress_response(response, min_size, level)
+
+
+def packb(obj: Any) -> bytes:
+    """
+    Serialize an object to MessagePack bytes.
+    
+    Args:
+        obj: Object made of plain Python types
+    
+    Returns:
+        MessagePack encoded bytes
+    """
+    if _msgpack is not None:
+        return _msgpack.packb(obj, use_bin_type=True)
+    
+    out = bytearray()
+    _pack_into(obj, out)
+    return bytes(out)
+
+
+def unpackb(data: bytes) -> Any:
+    """
+    Deserialize MessagePack bytes.
+    
+    Args:
+        data: MessagePack encoded bytes
+    
+    Returns:
+        Decoded object
+    
+    Raises:
+        ValueError: If the data is malformed or uses unsupported types
+    """
+    if _msgpack is not None:
+        return _msgpack.unpackb(data, raw=False)
+    
+    obj, offset = _unpack_from(memoryview(data), 0)
+    if offset != len(data):
+        raise ValueError("Trailing data after MessagePack object")
+    return obj
+
+
+def _pack_into(obj: Any, out: bytearray) -> None:
+    """Append the MessagePack encoding of obj to out."""
+    if obj is None:
+        out.append(0xc0)
+    elif obj is True:
+        out.append(0xc3)
+    elif obj is False:
+        out.append(0xc2)
+    elif isinstance(obj, int):
+        _pack_int(obj, out)
+    elif isinstance(obj, float):
+        out.append(0xcb)
+        out += struct.pack('>d', obj)
+    elif isinstance(obj, str):
+        data = obj.encode('utf-8')
+        size = len(data)
+        if size < 32:
+            out.append(0xa0 | size)
+        elif size < 0x100:
+            out += struct.pack('>BB', 0xd9, size)
+        elif size < 0x10000:
+            out += struct.pack('>BH', 0xda, size)
+        else:
+            out += struct.pack('>BI', 0xdb, size)
+        out += data
+    elif isinstance(obj, (bytes, bytearray)):
+        size = len(obj)
+        if size < 0x100:
+            out += struct.pack('>BB', 0xc4, size)
+        elif size < 0x10000:
+            out += struct.pack('>BH', 0xc5, size)
+        else:
+            out += struct.pack('>BI', 0xc6, size)
+        out += obj
+    elif isinstance(obj, (list, tuple)):
+        size = len(obj)
+        if size < 16:
+            out.append(0x90 | size)
+        elif size < 0x10000:
+            out += struct.pack('>BH', 0xdc, size)
+        else:
+            out += struct.pack('>BI', 0xdd, size)
+        for item in obj:
+            _pack_into(item, out)
+    elif isinstance(obj, dict):
+        size = len(obj)
+        if size < 16:
+            out.append(0x80 | size)
+        elif size < 0x10000:
+            out += struct.pack('>BH', 0xde, size)
+        else:
+            out += struct.pack('>BI', 0xdf, size)
+        for key, value in obj.items():
+            _pack_into(key, out)
+            _pack_into(value, out)
+    elif isinstance(obj, Enum):
+        _pack_into(obj.value, out)
+    else:
+        raise TypeError(f"Cannot serialize object of type {type(obj).__name__}")
+
+
+def _pack_int(value: int, out: bytearray) -> None:
+    """Append the smallest MessagePack integer encoding of value to out."""
+    if 0 <= value < 0x80:
+        out.append(value)
+    elif -32 <= value < 0:
+        out += struct.pack('>b', value)
+    elif value >= 0:
+        if value < 0x100:
+            out += struct.pack('>BB', 0xcc, value)
+        elif value < 0x10000:
+            out += struct.pack('>BH', 0xcd, value)
+        elif value < 0x100000000:
+            out += struct.pack('>BI', 0xce, value)
+        else:
+            out += struct.pack('>BQ', 0xcf, value)
+    else:
+        if value >= -0x80:
+            out += struct.pack('>Bb', 0xd0, value)
+        elif value >= -0x8000:
+            out += struct.pack('>Bh', 0xd1, value)
+        elif value >= -0x80000000:
+            out += struct.pack('>Bi', 0xd2, value)
+        else:
+            out += struct.pack('>Bq', 0xd3, value)
+
+
+# Fixed-size MessagePack types: type byte -> (struct format, size)
+_FIXED_FORMATS = {
+    0xca: ('>f', 4), 0xcb: ('>d', 8),
+    0xcc: ('>B', 1), 0xcd: ('>H', 2), 0xce: ('>I', 4), 0xcf: ('>Q', 8),
+    0xd0: ('>b', 1), 0xd1: ('>h', 2), 0xd2: ('>i', 4), 0xd3: ('>q', 8)
+}
+
+# Length-prefixed MessagePack types: type byte -> (kind, length format, size)
+_SIZED_FORMATS = {
+    0xc4: ('bin', '>B', 1), 0xc5: ('bin', '>H', 2), 0xc6: ('bin', '>I', 4),
+    0xd9: ('str', '>B', 1), 0xda: ('str', '>H', 2), 0xdb: ('str', '>I', 4),
+    0xdc: ('array', '>H', 2), 0xdd: ('array', '>I', 4),
+    0xde: ('map', '>H', 2), 0xdf: ('map', '>I', 4)
+}
+
+
+def _unpack_from(data: memoryview, offset: int) -> Tuple[Any, int]:
+    """Decode one MessagePack object starting at offset."""
+    if offset >= len(data):
+        raise ValueError("Unexpected end of MessagePack data")
+    
+    byte = data[offset]
+    offset += 1
+    
+    if byte < 0x80:
+        return byte, offset
+    if byte >= 0xe0:
+        return byte - 0x100, offset
+    if 0x80 <= byte <= 0x8f:
+        return _unpack_map(data, offset, byte & 0x0f)
+    if 0x90 <= byte <= 0x9f:
+        return _unpack_array(data, offset, byte & 0x0f)
+    if 0xa0 <= byte <= 0xbf:
+        return _unpack_str(data, offset, byte & 0x1f)
+    if byte == 0xc0:
+        return None, offset
+    if byte == 0xc2:
+        return False, offset
+    if byte == 0xc3:
+        return True, offset
+    
+    if byte in _FIXED_FORMATS:
+        fmt, size = _FIXED_FORMATS[byte]
+        _check_available(data, offset, size)
+        return struct.unpack_from(fmt, data, offset)[0], offset + size
+    
+    if byte in _SIZED_FORMATS:
+        kind, fmt, size = _SIZED_FORMATS[byte]
+        _check_available(data, offset, size)
+        length = struct.unpack_from(fmt, data, offset)[0]
+        offset += size
+        if kind == 'bin':
+            _check_available(data, offset, length)
+            return bytes(data[offset:offset + length]), offset + length
+        if kind == 'str':
+            return _unpack_str(data, offset, length)
+        if kind == 'array':
+            return _unpack_array(data, offset, length)
+        return _unpack_map(data, offset, length)
+    
+    raise ValueError(f"Unsupported MessagePack type byte: 0x{byte:02x}")
+
+
+def _check_available(data: memoryview, offset: int, size: int) -> None:
+    """Raise ValueError if fewer than size bytes remain after offset."""
+    if offset + size > len(data):
+        raise ValueError("Unexpected end of MessagePack data")
+
+
+def _unpack_str(data: memoryview, offset: int, length: int) -> Tuple[str, int]:
+    """Decode a UTF-8 string of the given length."""
+    _check_available(data, offset, length)
+    return bytes(data[offset:offset + length]).decode('utf-8'), offset + length
+
+
+def _unpack_array(data: memoryview, offset: int, length: int) -> Tuple[list, int]:
+    """Decode an array with the given number of items."""
+    items = []
+    for _ in range(length):
+        item, offset = _unpack_from(data, offset)
+        items.append(item)
+    return items, offset
+
+
+def _unpack_map(data: memoryview, offset: int, length: int) -> Tuple[dict, int]:
+    """Decode a map with the given number of entries."""
+    result = {}
+    for _ in range(length):
+        key, offset = _unpack_from(data, offset)
+        value, offset = _unpack_from(data, offset)
+        result[key] = value
+    return result, offset
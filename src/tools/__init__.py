@@ -0,0 +1 @@
+# Developer tools package
\ No newline at end of file
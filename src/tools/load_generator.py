@@ -0,0 +1,266 @@
+"""
+Load generator for the game API.
+
+This module drives concurrent virtual players through the same
+start -> guess x N -> state flow that ClientGame uses and reports
+throughput and latency percentiles per endpoint. Players are asyncio tasks,
+each holding one HTTP/1.1 keep-alive connection, so a single process can
+simulate hundreds of them without threads.
+
+Without ``--url`` a server is started in a separate local process with
+admission limits raised, so nothing leaves the machine:
+    
+    python -m src.tools.load_generator --players 50 --duration 20
+    python -m src.tools.load_generator --url http://127.0.0.1:8080 --cheating-ratio 0.5
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import signal
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from ..game_modes.async_client import AsyncHTTPConnection
+
+
+class EndpointStats:
+    """Latencies and status codes recorded for one endpoint."""
+    
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.statuses: Counter = Counter()
+    
+    def record(self, status: int, latency: float) -> None:
+        """Record one request (status 0 means a connection error or timeout)."""
+        self.latencies.append(latency)
+        self.statuses[status] += 1
+    
+    def percentile(self, fraction: float) -> float:
+        """Get a latency percentile in seconds (nearest rank)."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+        return ordered[index]
+
+
+class LoadGenerator:
+    """
+    Runs virtual players against a game server and collects statistics.
+    """
+    
+    ENDPOINTS = ('start', 'guess', 'state')
+    
+    def __init__(self, url: str, words: List[str], players: int = 20, duration: float = 10.0,
+                 guesses: int = 6, cheating_ratio: float = 0.2, seed: Optional[int] = None,
+                 timeout: float = 30.0):
+        """
+        Initialize the generator.
+        
+        Args:
+            url: Server base URL, e.g. http://127.0.0.1:8080
+            words: Words the virtual players guess from
+            players: Number of concurrent virtual players
+            duration: Seconds to generate load for
+            guesses: Maximum guesses per game
+            cheating_ratio: Fraction of games started in cheating mode
+            seed: Random seed for reproducible runs
+            timeout: Seconds allowed for each request
+        """
+        parts = urlsplit(url)
+        self.host = parts.hostname or '127.0.0.1'
+        self.port = parts.port or 80
+        self.words = words
+        self.players = players
+        self.duration = duration
+        self.guesses = guesses
+        self.cheating_ratio = cheating_ratio
+        self.timeout = timeout
+        self.random = random.Random(seed)
+        self.stats: Dict[str, EndpointStats] = {name: EndpointStats() for name in self.ENDPOINTS}
+        self.games: Counter = Counter()
+        self.elapsed = 0.0
+    
+    async def _timed(self, conn: AsyncHTTPConnection, endpoint: str, method: str,
+                     path: str, payload: Optional[Dict[str, Any]] = None) -> Tuple[int, Any]:
+        """Make a request and record its latency under an endpoint name."""
+        start = time.perf_counter()
+        try:
+            status, body = await conn.request(method, path, payload)
+        except (OSError, ConnectionError, ValueError, asyncio.TimeoutError,
+                asyncio.IncompleteReadError):
+            status, body = 0, None
+        self.stats[endpoint].record(status, time.perf_counter() - start)
+        return status, body
+    
+    async def _player(self, deadline: float) -> None:
+        """Play games back to back until the deadline."""
+        conn = AsyncHTTPConnection(self.host, self.port, self.timeout)
+        rng = random.Random(self.random.random())
+        try:
+            while time.monotonic() < deadline:
+                mode = 'cheating' if rng.random() < self.cheating_ratio else 'single'
+                status, body = await self._timed(
+                    conn, 'start', 'POST', '/api/game/start', {'mode': mode}
+                )
+                if status != 200:
+                    # Back off briefly when rejected or failing
+                    await asyncio.sleep(0.05)
+                    continue
+                
+                session_id = body['session_id']
+                self.games[mode] += 1
+                for _ in range(self.guesses):
+                    if time.monotonic() >= deadline:
+                        break
+                    status, body = await self._timed(conn, 'guess', 'POST', '/api/game/guess', {
+                        'session_id': session_id,
+                        'guess': rng.choice(self.words)
+                    })
+                    if status != 200 or body['game_state']['is_game_over']:
+                        break
+                
+                await self._timed(conn, 'state', 'GET', f'/api/game/state/{session_id}')
+        finally:
+            await conn.close()
+    
+    async def run(self) -> 'LoadGenerator':
+        """
+        Run all virtual players for the configured duration.
+        
+        Returns:
+            self, with statistics filled in
+        """
+        start = time.monotonic()
+        deadline = start + self.duration
+        await asyncio.gather(*(self._player(deadline) for _ in range(self.players)))
+        self.elapsed = time.monotonic() - start
+        return self
+    
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get throughput and latency percentiles per endpoint.
+        
+        Returns:
+            Dictionary mapping endpoint name to its statistics (latencies in ms)
+        """
+        summary = {}
+        for name, stats in self.stats.items():
+            count = len(stats.latencies)
+            summary[name] = {
+                'requests': count,
+                'rps': count / self.elapsed if self.elapsed else 0.0,
+                'p50_ms': stats.percentile(0.50) * 1000,
+                'p90_ms': stats.percentile(0.90) * 1000,
+                'p99_ms': stats.percentile(0.99) * 1000,
+                'max_ms': max(stats.latencies, default=0.0) * 1000,
+                'statuses': dict(stats.statuses)
+            }
+        return summary
+    
+    def format_report(self) -> str:
+        """
+        Format the results as a text table.
+        
+        Returns:
+            Report text
+        """
+        summary = self.summary()
+        total = sum(row['requests'] for row in summary.values())
+        lines = [
+            f"{self.players} players, {self.elapsed:.1f}s, "
+            f"{total} requests ({total / self.elapsed if self.elapsed else 0:.0f} req/s), "
+            f"games: {dict(self.games)}",
+            f"{'endpoint':<8} {'requests':>9} {'req/s':>8} {'p50 ms':>8} {'p90 ms':>8} "
+            f"{'p99 ms':>8} {'max ms':>8}  statuses"
+        ]
+        for name, row in summary.items():
+            statuses = ' '.join(f"{code}:{n}" for code, n in sorted(row['statuses'].items()))
+            lines.append(
+                f"{name:<8} {row['requests']:>9} {row['rps']:>8.0f} {row['p50_ms']:>8.2f} "
+                f"{row['p90_ms']:>8.2f} {row['p99_ms']:>8.2f} {row['max_ms']:>8.2f}  {statuses}"
+            )
+        return '\n'.join(lines)
+
+
+def _run_local_server(port_queue, threads: int, word_list_path: Optional[str]) -> None:
+    """Serve the API on a free local port (runs in a child process)."""
+    from ..server.app import create_app
+    from ..server.serving import PooledWSGIServer
+    
+    app = create_app({
+        'WORD_LIST_PATH': word_list_path,
+        # Every virtual player shares one address; measure the server, not the limits
+        'START_RATE': 1e9,
+        'START_BURST': 1e9,
+        'GLOBAL_START_RATE': 1e9,
+        'GLOBAL_START_BURST': 1e9,
+        'MAX_HEAVY_IN_FLIGHT': 1024
+    })
+    server = PooledWSGIServer('127.0.0.1', 0, app, threads=threads, max_queued=4096)
+    signal.signal(signal.SIGTERM, lambda signum, frame: server.stop())
+    port_queue.put(server.bound_port)
+    server.serve_forever()
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Wordle API load generator')
+    parser.add_argument('--url', help='Server to test (default: start a local server)')
+    parser.add_argument('--players', type=int, default=20, help='Concurrent virtual players (default: 20)')
+    parser.add_argument('--duration', type=float, default=10.0, help='Seconds to run (default: 10)')
+    parser.add_argument('--guesses', type=int, default=6, help='Maximum guesses per game (default: 6)')
+    parser.add_argument('--cheating-ratio', type=float, default=0.2,
+                        help='Fraction of games in cheating mode (default: 0.2)')
+    parser.add_argument('--server-threads', type=int, default=8,
+                        help='Worker threads of the local server (default: 8)')
+    parser.add_argument('--word-list', help='Word list file for guesses (and the local server)')
+    parser.add_argument('--seed', type=int, help='Random seed')
+    parser.add_argument('--json', action='store_true', help='Print the summary as JSON')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the load generator from the command line."""
+    args = parse_arguments(argv)
+    
+    from ..utils.word_loader import get_default_word_list, load_word_list
+    words = load_word_list(args.word_list) if args.word_list else get_default_word_list()
+    
+    server_process = None
+    url = args.url
+    if url is None:
+        port_queue = multiprocessing.Queue()
+        server_process = multiprocessing.Process(
+            target=_run_local_server, args=(port_queue, args.server_threads, args.word_list),
+            daemon=True
+        )
+        server_process.start()
+        url = f"http://127.0.0.1:{port_queue.get(timeout=60)}"
+        print(f"Started local server at {url}", file=sys.stderr)
+    
+    try:
+        generator = LoadGenerator(
+            url, words, players=args.players, duration=args.duration, guesses=args.guesses,
+            cheating_ratio=args.cheating_ratio, seed=args.seed
+        )
+        asyncio.run(generator.run())
+    finally:
+        if server_process is not None:
+            server_process.terminate()
+            server_process.join(15)
+    
+    if args.json:
+        print(json.dumps(generator.summary(), indent=2))
+    else:
+        print(generator.format_report())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Tournament simulator.
+
+This module plays a bracket of bot entrants with the TournamentRunner and
+prints the final standings and how well the worker processes were used.
+Entrant skills are spread evenly from 0 to 1:
+    
+    python -m src.tools.tournament --entrants 512 --workers 4
+    python -m src.tools.tournament --entrants 64 --mode single --boards 5 --json
+"""
+
+import argparse
+import json
+from typing import List, Optional
+
+from ..game_modes.tournament import MODES, Tournament, TournamentRunner
+from ..utils.lexicon import Lexicon
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Wordle tournament simulator')
+    parser.add_argument('--entrants', type=int, default=256, help='Bot entrants (default: 256)')
+    parser.add_argument('--match-size', type=int, default=4, help='Entrants per match (default: 4)')
+    parser.add_argument('--advance', type=int, default=2,
+                        help='Entrants going through from each match (default: 2)')
+    parser.add_argument('--boards', type=int, default=3, help='Boards per match (default: 3)')
+    parser.add_argument('--mode', choices=MODES, default='multiplayer',
+                        help='Game played on each board (default: multiplayer)')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count, 0 plays inline)')
+    parser.add_argument('--batch-size', type=int, default=16,
+                        help='Most matches sent to a worker at once (default: 16)')
+    parser.add_argument('--word-list', help='Word list file for the boards')
+    parser.add_argument('--top', type=int, default=10, help='Standings to print (default: 10)')
+    parser.add_argument('--seed', type=int, help='Random seed')
+    parser.add_argument('--json', action='store_true', help='Print the summary as JSON')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run a tournament from the command line."""
+    args = parse_arguments(argv)
+    
+    from ..utils.word_loader import get_default_word_list, load_word_list
+    words = load_word_list(args.word_list) if args.word_list else get_default_word_list()
+    
+    entrants = [f'bot{i:05d}' for i in range(args.entrants)]
+    skills = {entrant: i / max(1, len(entrants) - 1) for i, entrant in enumerate(entrants)}
+    tournament = Tournament(
+        entrants, Lexicon(words), match_size=args.match_size, advance=args.advance,
+        boards=args.boards, mode=args.mode, seed=args.seed
+    )
+    runner = TournamentRunner(tournament, skills, workers=args.workers, batch_size=args.batch_size)
+    runner.run()
+    
+    standings = [
+        {'entrant': entrant, 'skill': round(skills[entrant], 3),
+         'rounds': rounds, 'points': tournament.points[entrant]}
+        for entrant, rounds in tournament.standings.top(args.top)
+    ]
+    if args.json:
+        print(json.dumps({'summary': runner.summary(), 'standings': standings}, indent=2))
+        return
+    
+    summary = runner.summary()
+    print(f"{summary['matches']} matches in {summary['wall_seconds']:.2f}s on "
+          f"{runner.workers} workers, {summary['utilization']:.0%} of worker time playing")
+    print(f"{'entrant':<10} {'skill':>6} {'rounds':>7} {'points':>8}")
+    for row in standings:
+        print(f"{row['entrant']:<10} {row['skill']:>6.2f} {row['rounds']:>7} {row['points']:>8}")
+
+
+if __name__ == '__main__':
+    main()
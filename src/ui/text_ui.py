@@ -104,21 +104,14 @@ class TextUI:
         state = game.get_game_state()
         
         # Find current player (player with fewest guesses)
-        current_player = None
-        min_guesses = float('inf')
+        current = min(state['players'], key=lambda player: player['guesses_made'], default=None)
         
-        for player_data in state['players']:
-            player_id = player_data['id']
-            player_state = game.get_player_state(player_id)
-            if len(player_state['guesses']) < min_guesses:
-                min_guesses = len(player_state['guesses'])
-                current_player = player_id
-        
-        if not current_player:
+        if not current:
             print("❌ No players available")
             return
         
-        player_name = game.get_player_state(current_player)['player_name']
+        current_player = current['id']
+        player_name = current['name']
         print(f"\n🎯 {player_name}'s turn:")
         
         while True:
@@ -148,7 +141,7 @@ class TextUI:
                     break
                 else:
                     print(f"❌ {result['error']}")
-                    
+            
             except KeyboardInterrupt:
                 print("\n\n👋 Thanks for playing!")
                 exit(0)
@@ -167,8 +160,9 @@ class TextUI:
         if state['game_state'] == 'won':
             winner = game.get_winner()
             if winner:
-                winner_name = game.get_player_state(winner)['player_name']
-                winner_rounds = game.get_player_state(winner)['rounds_to_win']
+                winner_state = game.get_player_state(winner)
+                winner_name = winner_state['player_name']
+                winner_rounds = winner_state['rounds_to_win']
                 print(f"🎉 {winner_name} wins in {winner_rounds} rounds!")
         else:
             print(f"😔 No one guessed correctly! The word was {state['answer']}")
@@ -181,7 +175,7 @@ class TextUI:
         print("\n" + "="*50)
         print("Thanks for playing! 👋")
         print("="*50)
-
+    
     def _display_game_state(self, game):
         """Display the current game state."""
         state = game.get_game_state()
@@ -234,7 +228,7 @@ class TextUI:
                     break
                 else:
                     print(f"❌ {result['error']}")
-                    
+            
             except KeyboardInterrupt:
                 print("\n\n👋 Thanks for playing!")
                 exit(0)
@@ -0,0 +1,86 @@
+"""
+Shared, pre-validated word lists.
+
+This module provides the Lexicon class: a word list that is upper-cased and
+validated once, backed by a hash set for O(1) membership tests, and able to
+hold precomputed tables that every game built from it can share.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+
+class Lexicon:
+    """
+    Immutable, validated word list shared between games.
+    
+    Building a game from a Lexicon skips re-validating the words, and guess
+    validation becomes a set lookup instead of a list scan.
+    """
+    
+    def __init__(self, words: Iterable[str]):
+        """
+        Build and validate a lexicon.
+        
+        Args:
+            words: 5-letter words (any case)
+        
+        Raises:
+            ValueError: If the list is empty or contains an invalid word
+        """
+        self.words: List[str] = [word.upper() for word in words]
+        
+        if not self.words:
+            raise ValueError("Word list cannot be empty")
+        
+        for word in self.words:
+            if not word.isalpha() or len(word) != 5:
+                raise ValueError(f"Invalid word in word list: {word}")
+        
+        self.word_set = frozenset(self.words)
+        self._tables: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+    
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and word.upper() in self.word_set
+    
+    def __len__(self) -> int:
+        return len(self.words)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.words)
+    
+    def table(self, name: str, factory: Callable[[], Any]) -> Any:
+        """
+        Get a precomputed table, building it on first use.
+        
+        Args:
+            name: Table name
+            factory: Callable that builds the table
+        
+        Returns:
+            The shared table
+        """
+        table = self._tables.get(name)
+        if table is None:
+            with self._lock:
+                table = self._tables.get(name)
+                if table is None:
+                    table = factory()
+                    self._tables[name] = table
+        return table
+
+
+def as_lexicon(words: Iterable[str]) -> Lexicon:
+    """
+    Get a Lexicon for a word list, reusing it if it already is one.
+    
+    Args:
+        words: Lexicon or iterable of words
+    
+    Returns:
+        Lexicon instance
+    """
+    if isinstance(words, Lexicon):
+        return words
+    return Lexicon(words)
@@ -0,0 +1,296 @@
+"""
+Low-overhead metrics with Prometheus text exposition.
+
+This module provides counters, gauges and histograms that can stay enabled
+in production. Updates never take a lock: each thread writes to its own
+cell and the cells are only summed when the metrics are scraped.
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+# Default latency buckets in seconds
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class _ThreadCells:
+    """
+    Per-thread accumulator cells.
+    
+    Each thread gets its own list of numbers on first use; only that thread
+    writes to it. Readers sum all cells. Cells of threads that have exited
+    are folded into a retired total so short-lived threads do not leak.
+    """
+    
+    def __init__(self, size: int):
+        self._size = size
+        self._local = threading.local()
+        self._cells: List[Tuple[threading.Thread, List[float]]] = []
+        self._retired = [0] * size
+        self._lock = threading.Lock()
+    
+    def cell(self) -> List[float]:
+        """Get the calling thread's cell, creating it on first use."""
+        try:
+            return self._local.cell
+        except AttributeError:
+            pass
+        
+        cell = [0] * self._size
+        with self._lock:
+            self._fold_dead_cells()
+            self._cells.append((threading.current_thread(), cell))
+        self._local.cell = cell
+        return cell
+    
+    def _fold_dead_cells(self) -> None:
+        """Merge cells of exited threads into the retired totals (lock held)."""
+        alive = []
+        for thread, cell in self._cells:
+            if thread.is_alive():
+                alive.append((thread, cell))
+            else:
+                for i, value in enumerate(cell):
+                    self._retired[i] += value
+        self._cells = alive
+    
+    def totals(self) -> List[float]:
+        """Sum all cells."""
+        with self._lock:
+            totals = list(self._retired)
+            for _, cell in self._cells:
+                for i, value in enumerate(cell):
+                    totals[i] += value
+        return totals
+
+
+class Counter:
+    """Monotonically increasing counter."""
+    
+    def __init__(self):
+        self._cells = _ThreadCells(1)
+    
+    def inc(self, amount: float = 1) -> None:
+        """Increase the counter."""
+        self._cells.cell()[0] += amount
+    
+    def value(self) -> float:
+        """Get the current total."""
+        return self._cells.totals()[0]
+
+
+class Gauge:
+    """Value that can go up and down, such as in-flight requests."""
+    
+    def __init__(self):
+        self._cells = _ThreadCells(1)
+    
+    def inc(self, amount: float = 1) -> None:
+        """Increase the gauge."""
+        self._cells.cell()[0] += amount
+    
+    def dec(self, amount: float = 1) -> None:
+        """Decrease the gauge."""
+        self._cells.cell()[0] -= amount
+    
+    def value(self) -> float:
+        """Get the current value."""
+        return self._cells.totals()[0]
+
+
+class Histogram:
+    """Distribution of observed values over fixed buckets."""
+    
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        # One cell per bucket, one for +Inf, then the running sum
+        self._cells = _ThreadCells(len(self.buckets) + 2)
+    
+    def observe(self, value: float) -> None:
+        """Record an observation."""
+        cell = self._cells.cell()
+        cell[bisect.bisect_left(self.buckets, value)] += 1
+        cell[-1] += value
+    
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the duration of the enclosed block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+    
+    def snapshot(self) -> Tuple[List[Tuple[float, float]], float, float]:
+        """
+        Get cumulative bucket counts, the total count and the sum.
+        
+        Returns:
+            Tuple of ([(upper bound, cumulative count)], count, sum)
+        """
+        totals = self._cells.totals()
+        cumulative = []
+        running = 0
+        for bound, count in zip(self.buckets + (float('inf'),), totals[:-1]):
+            running += count
+            cumulative.append((bound, running))
+        return cumulative, running, totals[-1]
+
+
+class _Family:
+    """A named metric with optional labels."""
+    
+    def __init__(self, kind: str, name: str, documentation: str,
+                 labelnames: Sequence[str], factory: Callable[[], object]):
+        self.kind = kind
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._factory = factory
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+    
+    def labels(self, *values: str):
+        """Get the child metric for the given label values."""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            with self._lock:
+                child = self._children.setdefault(values, self._factory())
+        return child
+    
+    def children(self) -> List[Tuple[Tuple[str, ...], object]]:
+        """Get a snapshot of all (label values, child) pairs."""
+        return list(self._children.items())
+
+
+class MetricsRegistry:
+    """
+    Collection of metrics rendered together in Prometheus text format.
+    """
+    
+    def __init__(self):
+        self._families: Dict[str, _Family] = {}
+        self._functions: Dict[str, Tuple[str, str, Callable[[], float]]] = {}
+        self._lock = threading.Lock()
+    
+    def _register(self, kind: str, name: str, documentation: str,
+                  labelnames: Sequence[str], factory: Callable[[], object]):
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = _Family(kind, name, documentation, labelnames, factory)
+                self._families[name] = family
+            elif family.kind != kind:
+                raise ValueError(f"Metric {name} already registered as a {family.kind}")
+        return family if family.labelnames else family.labels()
+    
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """Register (or get) a counter; returns the family if it has labels."""
+        return self._register('counter', name, documentation, labelnames, Counter)
+    
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """Register (or get) a gauge; returns the family if it has labels."""
+        return self._register('gauge', name, documentation, labelnames, Gauge)
+    
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """Register (or get) a histogram; returns the family if it has labels."""
+        return self._register('histogram', name, documentation, labelnames,
+                              lambda: Histogram(buckets))
+    
+    def gauge_function(self, name: str, documentation: str, function: Callable[[], float]) -> None:
+        """Register a gauge whose value is computed when the metrics are scraped."""
+        with self._lock:
+            self._functions[name] = ('gauge', documentation, function)
+    
+    def counter_function(self, name: str, documentation: str, function: Callable[[], float]) -> None:
+        """Register a counter whose value is read from elsewhere when scraped."""
+        with self._lock:
+            self._functions[name] = ('counter', documentation, function)
+    
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+        
+        Returns:
+            Metrics text
+        """
+        lines = []
+        
+        for name, (kind, documentation, function) in sorted(self._functions.items()):
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f"{name} {_format_value(function())}")
+        
+        for name, family in sorted(self._families.items()):
+            lines.append(f"# HELP {name} {family.documentation}")
+            lines.append(f"# TYPE {name} {family.kind}")
+            for values, child in sorted(family.children()):
+                labels = list(zip(family.labelnames, values))
+                if family.kind == 'histogram':
+                    buckets, count, total = child.snapshot()
+                    for bound, cumulative in buckets:
+                        le = '+Inf' if bound == float('inf') else _format_value(bound)
+                        lines.append(f"{name}_bucket{_format_labels(labels + [('le', le)])} {cumulative}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {count}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(total)}")
+                else:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(child.value())}")
+        
+        return '\n'.join(lines) + '\n'
+
+
+def _format_labels(labels: List[Tuple[str, str]]) -> str:
+    """Format label pairs as {name="value",...}."""
+    if not labels:
+        return ''
+    pairs = (f'{key}="{_escape_label(value)}"' for key, value in labels)
+    return '{' + ','.join(pairs) + '}'
+
+
+def _escape_label(value: str) -> str:
+    """Escape a label value for the exposition format."""
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value without a trailing .0 for whole numbers."""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+class CacheStats:
+    """Hit/miss counters for a named cache, recorded in a shared family."""
+    
+    def __init__(self, registry: MetricsRegistry, cache: str):
+        family = registry.counter(
+            'wordle_cache_requests_total', 'Cache lookups by cache and result',
+            ('cache', 'result')
+        )
+        self.hits = family.labels(cache, 'hit')
+        self.misses = family.labels(cache, 'miss')
+    
+    def hit(self) -> None:
+        """Record a cache hit."""
+        self.hits.inc()
+    
+    def miss(self) -> None:
+        """Record a cache miss."""
+        self.misses.inc()
+    
+    def hit_ratio(self) -> Optional[float]:
+        """Get the fraction of lookups that hit, or None if there were none."""
+        hits = self.hits.value()
+        total = hits + self.misses.value()
+        return hits / total if total else None
+
+
+# Process-wide registry for engine-level metrics
+REGISTRY = MetricsRegistry()
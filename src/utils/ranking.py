@@ -0,0 +1,344 @@
+"""
+Incrementally maintained rankings.
+
+This module provides an indexed skip list and a Leaderboard built on it.
+Score changes move one entry in O(log n), and the top K entries or the
+rank of any member are read in O(log n + K) without sorting, so a
+leaderboard can be updated on every guess and read on every turn.
+"""
+
+import itertools
+import os
+import pickle
+import random
+import threading
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+
+LEADERBOARD_FORMAT = 1
+
+_MAX_LEVEL = 32
+# Chance that a node also appears on the next level up
+_LEVEL_UP = 0.25
+
+
+class _Node:
+    __slots__ = ('key', 'next', 'width')
+    
+    def __init__(self, key: Any, level: int):
+        self.key = key
+        self.next: List[Optional['_Node']] = [None] * level
+        # Number of level-0 steps to next[i] (to the end of the list if None)
+        self.width = [0] * level
+
+
+class IndexedSkipList:
+    """
+    Sorted collection of unique keys with positional access.
+    
+    Each link stores how many entries it skips, so the position of a key
+    and the key at a position are both found in O(log n) expected time.
+    """
+    
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize an empty list.
+        
+        Args:
+            seed: Seed for the level choice (for reproducible layouts)
+        """
+        self._head = _Node(None, _MAX_LEVEL)
+        self._level = 1
+        self._size = 0
+        self._random = random.Random(seed).random
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __iter__(self) -> Iterator[Any]:
+        node = self._head.next[0]
+        while node is not None:
+            yield node.key
+            node = node.next[0]
+    
+    def _random_level(self) -> int:
+        level = 1
+        while level < _MAX_LEVEL and self._random() < _LEVEL_UP:
+            level += 1
+        return level
+    
+    def insert(self, key: Any) -> None:
+        """
+        Add a key.
+        
+        Args:
+            key: Key to add; must not already be in the list
+        """
+        update = [self._head] * _MAX_LEVEL
+        rank = [0] * _MAX_LEVEL
+        node = self._head
+        for i in range(self._level - 1, -1, -1):
+            rank[i] = rank[i + 1] if i + 1 < self._level else 0
+            while node.next[i] is not None and node.next[i].key < key:
+                rank[i] += node.width[i]
+                node = node.next[i]
+            update[i] = node
+        
+        level = self._random_level()
+        if level > self._level:
+            for i in range(self._level, level):
+                self._head.width[i] = self._size
+            self._level = level
+        
+        new = _Node(key, level)
+        for i in range(level):
+            prev = update[i]
+            new.next[i] = prev.next[i]
+            prev.next[i] = new
+            new.width[i] = prev.width[i] - (rank[0] - rank[i])
+            prev.width[i] = rank[0] - rank[i] + 1
+        for i in range(level, self._level):
+            update[i].width[i] += 1
+        self._size += 1
+    
+    def remove(self, key: Any) -> None:
+        """
+        Remove a key.
+        
+        Args:
+            key: Key to remove
+        
+        Raises:
+            KeyError: If the key is not in the list
+        """
+        update = [self._head] * _MAX_LEVEL
+        node = self._head
+        for i in range(self._level - 1, -1, -1):
+            while node.next[i] is not None and node.next[i].key < key:
+                node = node.next[i]
+            update[i] = node
+        
+        target = node.next[0]
+        if target is None or target.key != key:
+            raise KeyError(key)
+        
+        for i in range(self._level):
+            prev = update[i]
+            if prev.next[i] is target:
+                prev.width[i] += target.width[i] - 1
+                prev.next[i] = target.next[i]
+            else:
+                prev.width[i] -= 1
+        while self._level > 1 and self._head.next[self._level - 1] is None:
+            self._level -= 1
+        self._size -= 1
+    
+    def index(self, key: Any) -> int:
+        """
+        Get the 0-based position of a key.
+        
+        Raises:
+            KeyError: If the key is not in the list
+        """
+        position = 0
+        node = self._head
+        for i in range(self._level - 1, -1, -1):
+            while node.next[i] is not None and node.next[i].key <= key:
+                position += node.width[i]
+                node = node.next[i]
+        if node is self._head or node.key != key:
+            raise KeyError(key)
+        return position - 1
+    
+    def _node_at(self, index: int) -> _Node:
+        if not 0 <= index < self._size:
+            raise IndexError(index)
+        target = index + 1
+        position = 0
+        node = self._head
+        for i in range(self._level - 1, -1, -1):
+            while node.next[i] is not None and position + node.width[i] <= target:
+                position += node.width[i]
+                node = node.next[i]
+        return node
+    
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += self._size
+        return self._node_at(index).key
+    
+    def iter_from(self, index: int) -> Iterator[Any]:
+        """Iterate over the keys from a position onwards."""
+        if index >= self._size:
+            return
+        node: Optional[_Node] = self._node_at(max(0, index))
+        while node is not None:
+            yield node.key
+            node = node.next[0]
+
+
+class Leaderboard:
+    """
+    Members ranked by score, highest first.
+    
+    Ties are broken by a secondary value (lower first), then by the order
+    in which members first appeared. Safe to share between threads.
+    """
+    
+    def __init__(self):
+        self._ranks = IndexedSkipList()
+        # member -> (-score, tiebreak, arrival, member), its skip list key
+        self._keys: Dict[Hashable, Tuple[Any, Any, int, Hashable]] = {}
+        self._arrivals = itertools.count()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def __contains__(self, member: object) -> bool:
+        return member in self._keys
+    
+    def _set(self, member: Hashable, score: Any, tiebreak: Any) -> None:
+        """Move a member to its new position (lock held)."""
+        old = self._keys.get(member)
+        if old is not None:
+            if old[0] == -score and old[1] == tiebreak:
+                return
+            self._ranks.remove(old)
+            arrival = old[2]
+        else:
+            arrival = next(self._arrivals)
+        key = (-score, tiebreak, arrival, member)
+        self._ranks.insert(key)
+        self._keys[member] = key
+    
+    def update(self, member: Hashable, score: Any, tiebreak: Any = 0) -> None:
+        """
+        Set a member's score, adding the member if needed.
+        
+        Args:
+            member: Member identifier
+            score: New score
+            tiebreak: Secondary ordering among equal scores (lower ranks higher)
+        """
+        with self._lock:
+            self._set(member, score, tiebreak)
+    
+    def add(self, member: Hashable, points: Any) -> Any:
+        """
+        Add points to a member's score, starting from 0 for new members.
+        
+        Args:
+            member: Member identifier
+            points: Points to add
+        
+        Returns:
+            The member's new score
+        """
+        with self._lock:
+            old = self._keys.get(member)
+            score = points - old[0] if old is not None else points
+            self._set(member, score, old[1] if old is not None else 0)
+            return score
+    
+    def remove(self, member: Hashable) -> bool:
+        """
+        Remove a member.
+        
+        Returns:
+            True if the member was ranked
+        """
+        with self._lock:
+            key = self._keys.pop(member, None)
+            if key is None:
+                return False
+            self._ranks.remove(key)
+            return True
+    
+    def clear(self) -> None:
+        """Remove every member."""
+        with self._lock:
+            self._ranks = IndexedSkipList()
+            self._keys.clear()
+    
+    def score(self, member: Hashable) -> Optional[Any]:
+        """Get a member's score, or None if the member is not ranked."""
+        key = self._keys.get(member)
+        return None if key is None else -key[0]
+    
+    def rank(self, member: Hashable) -> Optional[int]:
+        """
+        Get a member's 1-based rank.
+        
+        Returns:
+            Rank, or None if the member is not ranked
+        """
+        with self._lock:
+            key = self._keys.get(member)
+            if key is None:
+                return None
+            return self._ranks.index(key) + 1
+    
+    def top(self, count: Optional[int] = None, start: int = 0) -> List[Tuple[Hashable, Any]]:
+        """
+        Get the highest ranked members.
+        
+        Args:
+            count: Number of members (all if None)
+            start: 0-based rank to start from, for paging
+        
+        Returns:
+            List of (member, score), best first
+        """
+        with self._lock:
+            keys = self._ranks.iter_from(start)
+            if count is not None:
+                keys = itertools.islice(keys, count)
+            return [(key[3], -key[0]) for key in keys]
+    
+    def save(self, path: str) -> int:
+        """
+        Write the ranking to a file.
+        
+        The members are written in rank order as flat (member, score,
+        tiebreak) tuples, next to the destination and renamed into place.
+        
+        Args:
+            path: Destination file
+        
+        Returns:
+            Number of members written
+        """
+        with self._lock:
+            entries = [(key[3], -key[0], key[1]) for key in self._ranks]
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as f:
+            pickle.dump((LEADERBOARD_FORMAT, entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+        return len(entries)
+    
+    @classmethod
+    def load(cls, path: str) -> 'Leaderboard':
+        """
+        Read a ranking written by save.
+        
+        Only load files this server wrote: the file is unpickled.
+        
+        Args:
+            path: File to read
+        
+        Returns:
+            The restored Leaderboard, with ties in their saved order
+        
+        Raises:
+            ValueError: If the file format is not supported
+        """
+        with open(path, 'rb') as f:
+            board_format, entries = pickle.load(f)
+        if board_format != LEADERBOARD_FORMAT:
+            raise ValueError(f"Unsupported leaderboard format: {board_format}")
+        
+        board = cls()
+        for member, score, tiebreak in entries:
+            board._set(member, score, tiebreak)
+        return board
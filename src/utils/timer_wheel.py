@@ -0,0 +1,214 @@
+"""
+Hierarchical timer wheel.
+
+This module provides a scheduler for large numbers of coarse deadlines,
+such as multiplayer round expiry. Scheduling and cancelling a timer are
+O(1); advancing the wheel only touches the timers that are due, plus an
+occasional cascade of a higher level's slot into the level below, so the
+cost does not grow with the number of pending timers.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class Timer:
+    """A scheduled callback; pass it to TimerWheel.cancel to cancel it."""
+    
+    __slots__ = ('expires', 'callback', 'args', 'slot')
+    
+    def __init__(self, expires: int, callback: Callable[..., Any], args: tuple):
+        self.expires = expires
+        self.callback = callback
+        self.args = args
+        # Slot holding the timer, None once it has fired or been cancelled
+        self.slot: Optional[Dict['Timer', None]] = None
+    
+    @property
+    def pending(self) -> bool:
+        """Check whether the timer has neither fired nor been cancelled."""
+        return self.slot is not None
+
+
+class TimerWheel:
+    """
+    Hierarchical timing wheel with a fixed tick.
+    
+    Level 0 has one slot per tick; each higher level has one slot per full
+    turn of the level below. A timer is placed on the lowest level whose
+    span covers its delay and moves down a level each time the slot it is
+    in comes round, until it fires from level 0. Deadlines are rounded up
+    to the next tick, so a timer never fires early.
+    
+    Callbacks run on the thread that advances the wheel (the background
+    thread after ``start``) without the wheel's lock held, so they may
+    schedule and cancel timers.
+    """
+    
+    def __init__(self, tick: float = 0.1, slot_bits: int = 8, levels: int = 4,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the wheel.
+        
+        Args:
+            tick: Resolution in seconds
+            slot_bits: log2 of the number of slots per level
+            levels: Number of levels; delays beyond
+                ``tick * 2 ** (slot_bits * levels)`` are re-cascaded
+            clock: Monotonic clock in seconds
+        """
+        if tick <= 0:
+            raise ValueError("tick must be positive")
+        
+        self.tick = tick
+        self._bits = slot_bits
+        self._mask = (1 << slot_bits) - 1
+        self._levels: List[List[Dict[Timer, None]]] = [
+            [{} for _ in range(1 << slot_bits)] for _ in range(levels)
+        ]
+        self._span = 1 << (slot_bits * levels)
+        self._clock = clock
+        self._origin = clock()
+        self._now = 0  # Last tick processed
+        self._count = 0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def _place(self, timer: Timer) -> None:
+        """Put a timer in the slot that covers its expiry (lock held)."""
+        delay = timer.expires - self._now
+        if delay <= 0:
+            # Due now: the slot of the tick being processed fires next
+            level, index = 0, self._now & self._mask
+        else:
+            expires = timer.expires if delay < self._span else self._now + self._span - 1
+            delay = expires - self._now
+            level = 0
+            while delay >> (self._bits * (level + 1)):
+                level += 1
+            index = (expires >> (self._bits * level)) & self._mask
+        
+        slot = self._levels[level][index]
+        slot[timer] = None
+        timer.slot = slot
+    
+    def schedule(self, delay: float, callback: Callable[..., Any], *args: Any) -> Timer:
+        """
+        Call ``callback(*args)`` after a delay.
+        
+        Args:
+            delay: Seconds from now
+            callback: Function to call
+            *args: Arguments for the callback
+        
+        Returns:
+            Timer handle for cancel
+        """
+        with self._lock:
+            expires = int((self._clock() - self._origin + max(0.0, delay)) / self.tick) + 1
+            timer = Timer(max(expires, self._now + 1), callback, args)
+            self._place(timer)
+            self._count += 1
+        return timer
+    
+    def cancel(self, timer: Timer) -> bool:
+        """
+        Cancel a timer.
+        
+        Args:
+            timer: Handle returned by schedule
+        
+        Returns:
+            True if the timer was pending, False if it had fired or was cancelled
+        """
+        with self._lock:
+            if timer.slot is None:
+                return False
+            del timer.slot[timer]
+            timer.slot = None
+            self._count -= 1
+            return True
+    
+    def advance(self, now: Optional[float] = None) -> int:
+        """
+        Fire every timer that is due.
+        
+        Args:
+            now: Clock reading to advance to (defaults to the clock)
+        
+        Returns:
+            Number of callbacks run
+        """
+        if now is None:
+            now = self._clock()
+        target = int((now - self._origin) / self.tick)
+        fired = 0
+        while True:
+            with self._lock:
+                if self._now >= target:
+                    return fired
+                self._now += 1
+                due = self._expire_tick()
+            
+            for timer in due:
+                try:
+                    timer.callback(*timer.args)
+                except Exception:
+                    logger.exception("Timer callback %r failed", timer.callback)
+            fired += len(due)
+    
+    def _expire_tick(self) -> List[Timer]:
+        """Cascade the higher levels and take the current tick's timers (lock held)."""
+        tick = self._now
+        for level in range(1, len(self._levels)):
+            if tick & ((1 << (self._bits * level)) - 1):
+                break
+            index = (tick >> (self._bits * level)) & self._mask
+            slot = self._levels[level][index]
+            if slot:
+                self._levels[level][index] = {}
+                for timer in slot:
+                    self._place(timer)
+        
+        index = tick & self._mask
+        slot = self._levels[0][index]
+        if not slot:
+            return []
+        self._levels[0][index] = {}
+        due = list(slot)
+        for timer in due:
+            timer.slot = None
+        self._count -= len(due)
+        return due
+    
+    def start(self) -> None:
+        """Advance the wheel from a daemon thread once per tick (idempotent)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name='timer-wheel', daemon=True)
+            self._thread.start()
+    
+    def stop(self) -> None:
+        """Stop the background thread; pending timers are kept."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._stopped.set()
+        if thread is not threading.current_thread():
+            thread.join()
+    
+    def _run(self) -> None:
+        while not self._stopped.wait(self.tick):
+            self.advance()
@@ -103,7 +103,7 @@ def get_default_word_list() -> List[str]:
         "SPEND", "SPENT", "SPLIT", "SPOKE", "SPORT", "STAFF", "STAGE", "STAKE",
         "STAND", "START", "STATE", "STEAM", "STEEL", "STEEP", "STEER", "STEMS",
         "STEPS", "STICK", "STILL", "STOCK", "STONE", "STOOD", "STORE", "STORM",
-        "STORY", "STRIP", "STRUCK", "STUCK", "STUDY", "STUFF", "STYLE", "SUGAR",
+        "STORY", "STRIP", "STUCK", "STUDY", "STUFF", "STYLE", "SUGAR",
         "SUITE", "SUPER", "SWEET", "TABLE", "TAKEN", "TASTE", "TAXES", "TEACH",
         "TEETH", "TERRY", "TEXAS", "THANK", "THEFT", "THEIR", "THEME", "THERE",
         "THESE", "THICK", "THING", "THINK", "THIRD", "THOSE", "THREE", "THREW",
@@ -0,0 +1,110 @@
+"""
+Tests for admission control.
+
+This module contains unit tests for token buckets, per-client rate
+limiting and the in-flight guard, and for how the server applies them.
+"""
+
+import pytest
+from src.server.admission import TokenBucket, RateLimiter, InFlightLimiter
+from src.game_modes.server_client import ServerGame
+
+
+WORD_LIST = ['HELLO', 'WORLD', 'SPACE', 'BEACH', 'DREAM']
+
+
+class TestTokenBucket:
+    """Test cases for the TokenBucket class."""
+    
+    def test_burst_then_reject(self):
+        """Test that a full bucket allows a burst and then rejects."""
+        bucket = TokenBucket(rate=1, capacity=3)
+        now = bucket.updated
+        
+        assert [bucket.try_acquire(now) for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.try_acquire(now) == pytest.approx(1.0)
+    
+    def test_refill_over_time(self):
+        """Test that tokens are refilled at the configured rate."""
+        bucket = TokenBucket(rate=10, capacity=1)
+        now = bucket.updated
+        bucket.try_acquire(now)
+        
+        assert bucket.try_acquire(now + 0.05) > 0
+        assert bucket.try_acquire(now + 0.2) == 0.0
+    
+    def test_invalid_parameters(self):
+        """Test that a non-positive rate is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0, capacity=1)
+
+
+class TestRateLimiter:
+    """Test cases for the RateLimiter class."""
+    
+    def test_clients_are_limited_independently(self):
+        """Test that one client's usage does not affect another."""
+        limiter = RateLimiter(rate=0.001, burst=1)
+        
+        assert limiter.allow('a') == 0.0
+        assert limiter.allow('a') > 0
+        assert limiter.allow('b') == 0.0
+    
+    def test_client_buckets_are_bounded(self):
+        """Test that the number of tracked clients never exceeds the limit."""
+        limiter = RateLimiter(rate=1, burst=1, max_clients=100)
+        for i in range(1000):
+            limiter.allow(f'client{i}')
+        
+        assert len(limiter) == 100
+
+
+class TestInFlightLimiter:
+    """Test cases for the InFlightLimiter class."""
+    
+    def test_rejects_when_full(self):
+        """Test that acquiring beyond the cap fails without blocking."""
+        limiter = InFlightLimiter(max_in_flight=1)
+        
+        assert limiter.try_acquire() is True
+        assert limiter.try_acquire() is False
+        limiter.release()
+        assert limiter.try_acquire() is True
+
+
+class TestServerAdmission:
+    """Test cases for admission control on the server routes."""
+    
+    def test_start_is_rate_limited_per_client(self):
+        """Test that a client exceeding its start budget gets 429."""
+        server = ServerGame(WORD_LIST)
+        server.server.start_limiter = RateLimiter(rate=0.001, burst=2)
+        client = server.app.test_client()
+        
+        statuses = [client.post('/api/game/start', json={}).status_code for _ in range(3)]
+        
+        assert statuses == [200, 200, 429]
+        assert len(server.active_games) == 2
+    
+    def test_rate_limited_response_has_retry_after(self):
+        """Test that 429 responses tell the client when to retry."""
+        server = ServerGame(WORD_LIST)
+        server.server.start_limiter = RateLimiter(rate=0.001, burst=1)
+        client = server.app.test_client()
+        client.post('/api/game/start', json={})
+        
+        response = client.post('/api/game/start', json={})
+        
+        assert response.status_code == 429
+        assert int(response.headers['Retry-After']) >= 1
+        assert response.get_json()['reason'] == 'client_rate'
+    
+    def test_cheating_start_is_shed_when_overloaded(self):
+        """Test that heavy routes return 503 when no in-flight slot is free."""
+        server = ServerGame(WORD_LIST)
+        server.server.heavy_requests = InFlightLimiter(max_in_flight=1)
+        server.server.heavy_requests.try_acquire()
+        client = server.app.test_client()
+        
+        assert client.post('/api/game/start', json={'mode': 'cheating'}).status_code == 503
+        assert client.post('/api/game/start', json={'mode': 'single'}).status_code == 200
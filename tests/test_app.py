@@ -0,0 +1,136 @@
+"""
+Tests for the API app factory.
+
+This module contains unit tests for the shared lexicon, create_app and the
+precomputed tables it warms before serving.
+"""
+
+import pytest
+from src.server.app import create_app, serve_app
+from src.utils.lexicon import Lexicon
+from src.game_modes.single_player import SinglePlayerGame
+from src.game_modes.cheating_host import CheatingHostGame, FIRST_PARTITION_CACHE
+
+
+WORD_LIST = ['HELLO', 'WORLD', 'SPACE', 'BEACH', 'DREAM']
+
+
+class TestLexicon:
+    """Test cases for the Lexicon class."""
+    
+    def test_words_are_normalized(self):
+        """Test that words are upper-cased and membership is case-insensitive."""
+        lexicon = Lexicon(['hello', 'World'])
+        
+        assert lexicon.words == ['HELLO', 'WORLD']
+        assert 'hello' in lexicon
+        assert 'SPACE' not in lexicon
+        assert len(lexicon) == 2
+    
+    def test_invalid_words_rejected(self):
+        """Test that empty lists and invalid words are rejected once, up front."""
+        with pytest.raises(ValueError):
+            Lexicon([])
+        with pytest.raises(ValueError):
+            Lexicon(['HELLO', 'PYTHON'])
+    
+    def test_table_built_once(self):
+        """Test that a named table is built on first use and then shared."""
+        lexicon = Lexicon(WORD_LIST)
+        calls = []
+        
+        def build():
+            calls.append(1)
+            return {'built': True}
+        
+        assert lexicon.table('example', build) is lexicon.table('example', build)
+        assert len(calls) == 1
+    
+    def test_games_share_lexicon(self):
+        """Test that games built from a lexicon reuse it instead of copying."""
+        lexicon = Lexicon(WORD_LIST)
+        first = SinglePlayerGame(lexicon)
+        second = CheatingHostGame(lexicon)
+        
+        assert first.lexicon is lexicon
+        assert second.lexicon is lexicon
+        assert first.game.word_list is lexicon.words
+
+
+class TestCreateApp:
+    """Test cases for the create_app factory."""
+    
+    def test_lexicon_loaded_once(self):
+        """Test that the app's games all use the lexicon loaded at startup."""
+        app = create_app({'WORD_LIST': WORD_LIST, 'WARM_UP': False})
+        server = app.extensions['wordle']
+        client = app.test_client()
+        
+        session_id = client.post('/api/game/start', json={'mode': 'single'}).get_json()['session_id']
+        
+        assert server.sessions[session_id].lexicon is server.lexicon
+        assert client.get('/api/health').get_json()['words'] == len(WORD_LIST)
+    
+    def test_warm_up_precomputes_first_partitions(self):
+        """Test that warming up fills the cheating host table before any request."""
+        app = create_app({'WORD_LIST': WORD_LIST, 'WARM_UP_PARTITIONS': True})
+        table = app.extensions['wordle'].lexicon.table('cheating_first_partition', dict)
+        
+        assert set(table) == set(WORD_LIST)
+    
+    def test_partitions_are_lazy_by_default(self):
+        """Test that the default warm-up does not score every first guess."""
+        app = create_app({'WORD_LIST': WORD_LIST})
+        table = app.extensions['wordle'].lexicon.table('cheating_first_partition', dict)
+        
+        assert len(table) < len(WORD_LIST)
+    
+    def test_warm_table_serves_first_guess(self):
+        """Test that a cheating game's first guess is answered from the table."""
+        app = create_app({'WORD_LIST': WORD_LIST, 'WARM_UP_PARTITIONS': True})
+        client = app.test_client()
+        hits = FIRST_PARTITION_CACHE.hits.value()
+        
+        session_id = client.post('/api/game/start', json={'mode': 'cheating'}).get_json()['session_id']
+        response = client.post('/api/game/guess', json={'session_id': session_id, 'guess': 'HELLO'})
+        
+        assert response.status_code == 200
+        assert response.get_json()['success'] is True
+        assert FIRST_PARTITION_CACHE.hits.value() == hits + 1
+    
+    def test_config_overrides(self):
+        """Test that config values override the defaults."""
+        app = create_app({'WORD_LIST': WORD_LIST, 'MAX_ROUNDS': 3, 'WARM_UP': False})
+        client = app.test_client()
+        
+        data = client.post('/api/game/start', json={}).get_json()
+        
+        assert data['game_state']['max_rounds'] == 3
+        assert app.config['SESSION_SHARDS'] == 16
+    
+    def test_invalid_mode(self):
+        """Test that an unknown game mode is rejected."""
+        client = create_app({'WORD_LIST': WORD_LIST, 'WARM_UP': False}).test_client()
+        
+        response = client.post('/api/game/start', json={'mode': 'unknown'})
+        
+        assert response.status_code == 400
+    
+    def test_taken_session_id_is_refused(self):
+        """Test that a client-supplied session id never replaces a running game."""
+        app = create_app({'WORD_LIST': WORD_LIST, 'WARM_UP': False})
+        client = app.test_client()
+        client.post('/api/game/start', json={'session_id': 'mine'})
+        game = app.extensions['wordle'].sessions['mine']
+        
+        response = client.post('/api/game/start', json={'session_id': 'mine'})
+        
+        assert response.status_code == 409
+        assert app.extensions['wordle'].sessions['mine'] is game
+    
+    def test_serving_needs_one_process(self):
+        """Test that the app refuses to be split over processes that cannot share games."""
+        app = create_app({'WORD_LIST': WORD_LIST, 'WARM_UP': False})
+        
+        with pytest.raises(ValueError):
+            serve_app(app, '127.0.0.1', 0, processes=2)
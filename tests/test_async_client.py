@@ -0,0 +1,128 @@
+"""
+Tests for the asyncio game client.
+
+This module contains tests for the pooled connections and for many
+concurrent AsyncClientGame sessions against an in-process server.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from src.game_modes.async_client import AsyncConnectionPool, AsyncClientGame
+from src.server.app import create_app
+from src.server.serving import PooledWSGIServer
+
+
+WORD_LIST = ['HELLO', 'WORLD', 'SPACE', 'BEACH', 'DREAM']
+
+
+@pytest.fixture
+def server_url():
+    """Serve the game API on a free port with admission limits raised."""
+    app = create_app({
+        'WORD_LIST': WORD_LIST,
+        'START_RATE': 1e6,
+        'START_BURST': 1e6,
+        'WARM_UP': False
+    })
+    server = PooledWSGIServer('127.0.0.1', 0, app, threads=4)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.bound_port}"
+    server.stop()
+    thread.join(5)
+
+
+class TestAsyncClientGame:
+    """Test cases for the AsyncClientGame class."""
+    
+    def test_full_game(self, server_url):
+        """Test the start/guess/state/reset flow of one session."""
+        async def play():
+            async with AsyncConnectionPool(server_url) as pool:
+                game = AsyncClientGame(pool)
+                await game.start_game()
+                result = await game.make_guess('HELLO')
+                state = await game.get_game_state()
+                await game.reset_game()
+                return result, state, game.game_state
+        
+        result, state, after_reset = asyncio.run(play())
+        
+        assert result['success'] is True
+        assert state['guesses'] == ['HELLO']
+        assert after_reset['guesses'] == []
+    
+    def test_many_sessions_share_pool(self, server_url):
+        """Test that hundreds of concurrent sessions run over a few connections."""
+        async def play():
+            async with AsyncConnectionPool(server_url, max_connections=8) as pool:
+                games = [AsyncClientGame(pool) for _ in range(300)]
+                await asyncio.gather(*(game.start_game() for game in games))
+                await asyncio.gather(*(game.make_guess('WORLD') for game in games))
+                opened = len(pool._idle)
+            return games, opened
+        
+        games, opened = asyncio.run(play())
+        
+        assert len({game.session_id for game in games}) == 300
+        assert all(game.game_state['current_round'] == 1 for game in games)
+        assert opened <= 8
+    
+    def test_errors_raise(self, server_url):
+        """Test that error statuses raise and cached state survives outages."""
+        async def play():
+            async with AsyncConnectionPool(server_url) as pool:
+                game = AsyncClientGame(pool)
+                with pytest.raises(RuntimeError):
+                    await game.make_guess('HELLO')
+                game.session_id = 'missing'
+                with pytest.raises(RuntimeError):
+                    await game.reset_game()
+                return await game.get_game_state()
+        
+        assert asyncio.run(play())['game_state'] == 'waiting'
+
+
+class TestAsyncConnectionPool:
+    """Test cases for retries in the AsyncConnectionPool class."""
+    
+    def test_idempotent_requests_retried(self):
+        """Test that GET requests are retried on 503 but POST requests are not."""
+        calls = {'GET': 0, 'POST': 0}
+        
+        def flaky_app(environ, start_response):
+            method = environ['REQUEST_METHOD']
+            calls[method] += 1
+            if calls[method] <= 2:
+                start_response('503 Service Unavailable', [('Content-Type', 'application/json')])
+                return [b'{"error": "busy"}']
+            start_response('200 OK', [('Content-Type', 'application/json')])
+            return [b'{"ok": true}']
+        
+        server = PooledWSGIServer('127.0.0.1', 0, flaky_app, threads=2)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        
+        async def run():
+            async with AsyncConnectionPool(f"http://127.0.0.1:{server.bound_port}",
+                                           backoff=0) as pool:
+                return await pool.request('GET', '/'), await pool.request('POST', '/', {})
+        
+        try:
+            get, post = asyncio.run(run())
+        finally:
+            server.stop()
+        
+        assert get == (200, {'ok': True})
+        assert post[0] == 503
+        assert calls == {'GET': 3, 'POST': 1}
+    
+    def test_connection_refused(self):
+        """Test that an unreachable server fails after the retries."""
+        async def run():
+            pool = AsyncConnectionPool('http://127.0.0.1:1', retries=1, backoff=0)
+            await pool.request('POST', '/api/game/start', {})
+        
+        with pytest.raises(OSError):
+            asyncio.run(run())
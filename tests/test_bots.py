@@ -0,0 +1,266 @@
+"""
+Tests for bot players.
+
+This module contains unit tests for the shared candidate tree, the BotPool
+and bot players in hosted rooms.
+"""
+
+import time
+
+import pytest
+
+from src.core.game_engine import encode_result, score_guess
+from src.game_modes.bots import BotPool, candidate_tree
+from src.game_modes.multiplayer import MultiplayerGame
+from src.server.app import create_app
+from src.server.rooms import RoomError, RoomManager
+from src.server.snapshot import load_snapshot, save_snapshot
+from src.utils.lexicon import Lexicon
+from src.utils.ranking import Leaderboard
+from src.utils.timer_wheel import TimerWheel
+from src.utils.word_loader import get_default_word_list
+
+
+WORD_LIST = ['HELLO', 'WORLD', 'SPACE', 'BEACH', 'DREAM']
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestCandidateTree:
+    """Test cases for the CandidateTree class."""
+    
+    def setup_method(self):
+        self.lexicon = Lexicon(get_default_word_list())
+        self.tree = candidate_tree(self.lexicon)
+    
+    def test_narrow_keeps_consistent_words(self):
+        """Test that narrowing keeps exactly the words that give the same result."""
+        pattern = encode_result(score_guess('PLANT', 'HOUSE'))
+        
+        node = self.tree.narrow(self.tree.root, 'PLANT', pattern)
+        
+        expected = [word for word in self.lexicon.words
+                    if encode_result(score_guess('PLANT', word)) == pattern]
+        assert [self.tree.words[i] for i in node.indices] == expected
+        assert self.tree.narrow(self.tree.root, 'PLANT', pattern) is node
+    
+    def test_tree_is_shared(self):
+        """Test that every pool on a lexicon shares one tree."""
+        wheel = TimerWheel()
+        
+        assert BotPool(self.lexicon, wheel).tree is BotPool(self.lexicon, wheel).tree
+    
+    def test_best_guess_is_a_candidate(self):
+        """Test that the best guess is one of the remaining candidates."""
+        node = self.tree.narrow(self.tree.root, 'PLANT', encode_result(score_guess('PLANT', 'HOUSE')))
+        
+        best = self.tree.best_guess(node)
+        
+        assert self.tree.index[best] in node.indices
+
+
+class TestBotPool:
+    """Test cases for the BotPool class."""
+    
+    def setup_method(self):
+        self.lexicon = Lexicon(get_default_word_list())
+        self.clock = FakeClock()
+        self.wheel = TimerWheel(tick=0.1, clock=self.clock)
+        self.pool = BotPool(self.lexicon, self.wheel, seed=7)
+    
+    def new_room(self, max_players=4):
+        room = MultiplayerGame(self.lexicon, max_rounds=6, max_players=max_players)
+        room.clock = self.clock
+        return room
+    
+    def run(self, seconds, step=0.5):
+        end = self.clock.now + seconds
+        while self.clock.now < end:
+            self.clock.now += step
+            self.wheel.advance()
+    
+    def test_bots_play_until_game_over(self):
+        """Test that bots guess every round until the game ends."""
+        room = self.new_room()
+        for i in range(4):
+            self.pool.add('room', room, f'bot{i}', skill=0.5, think_time=2.0)
+        room.start_game(answer='PLANT')
+        
+        self.run(60)
+        
+        assert room.is_game_over()
+        assert len(self.wheel) == 0
+        assert all(room.players[f'bot{i}'].guesses for i in range(4))
+    
+    def test_skilled_bots_use_their_results(self):
+        """Test that a bot of skill 1 only plays words consistent with its results."""
+        room = self.new_room(max_players=2)
+        self.pool.add('room', room, 'bot', skill=1.0, think_time=1.0)
+        self.pool.add('room', room, 'other', skill=1.0, think_time=1.0)
+        room.start_game(answer='PLANT')
+        
+        self.run(60)
+        
+        player = room.players['bot']
+        for n, guess in enumerate(player.guesses):
+            for earlier, result in zip(player.guesses[:n], player.results[:n]):
+                assert score_guess(earlier, guess) == result
+    
+    def test_think_time(self):
+        """Test that a bot guesses between half and one and a half think times."""
+        room = self.new_room(max_players=2)
+        self.pool.add('room', room, 'bot', think_time=10.0)
+        room.add_player('human', 'Ada')
+        room.start_game(answer='PLANT')
+        
+        self.run(4.9, step=0.1)
+        assert room.players['bot'].guesses == []
+        self.run(10.3, step=0.1)
+        assert len(room.players['bot'].guesses) == 1
+    
+    def test_leaving_bot_is_dropped(self):
+        """Test that a bot removed from its room stops playing."""
+        room = self.new_room(max_players=3)
+        self.pool.add('room', room, 'bot', think_time=1.0)
+        room.add_player('a', 'Ada')
+        room.add_player('b', 'Bob')
+        room.start_game(answer='PLANT')
+        
+        room.remove_player('bot')
+        
+        assert len(self.pool) == 0
+        assert len(self.wheel) == 0
+    
+    def test_rejects_bad_skill(self):
+        """Test that skill must be between 0 and 1."""
+        with pytest.raises(ValueError):
+            self.pool.adopt('room', self.new_room(), 'bot', skill=1.5)
+    
+    def test_many_bots(self):
+        """Test that thousands of bots in large rooms play their games out."""
+        rooms = []
+        for r in range(5):
+            room = self.new_room(max_players=1000)
+            for i in range(1000):
+                self.pool.add(f'room{r}', room, f'bot{r}-{i}', skill=i / 1000, think_time=3.0)
+            room.start_game()
+            rooms.append(room)
+        
+        assert len(self.pool) == 5000
+        self.run(200)
+        
+        assert all(room.is_game_over() for room in rooms)
+        assert len(self.wheel) == 0
+
+
+class TestRoomBots:
+    """Test cases for bot players in RoomManager rooms."""
+    
+    def make_manager(self):
+        return RoomManager(Lexicon(WORD_LIST), timers=TimerWheel(tick=0.01),
+                           leaderboard=Leaderboard())
+    
+    def test_bots_fill_the_room(self):
+        """Test that bots take the free seats, start the game and play it."""
+        manager = self.make_manager()
+        room_id, created = manager.create_room('Ada')
+        
+        added = manager.add_bots(room_id, created['player_id'], created['player_token'],
+                                 skill=1.0, think_time=0.02)
+        room = manager.rooms[room_id]
+        deadline = time.monotonic() + 5
+        while not any(room.players[bot_id].guesses for bot_id in added['bot_ids']):
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        
+        assert len(added['bot_ids']) == 3
+        assert added['game_state']['player_count'] == 4
+        assert room.answer is not None
+        assert not any(bot_id in manager.leaderboard for bot_id in added['bot_ids'])
+    
+    def test_room_with_only_bots_is_closed(self):
+        """Test that the last human leaving closes the room and drops its bots."""
+        manager = self.make_manager()
+        room_id, created = manager.create_room('Ada', max_players=6)
+        manager.add_bots(room_id, created['player_id'], created['player_token'], count=2)
+        
+        manager.leave(room_id, created['player_id'], created['player_token'])
+        
+        assert room_id not in manager
+        assert len(manager.bots) == 0
+    
+    def test_bots_survive_a_snapshot(self, tmp_path):
+        """Test that restored rooms get their bots back, and the bots keep guessing."""
+        path = str(tmp_path / 'snapshot.bin')
+        lexicon = Lexicon(WORD_LIST)
+        manager = self.make_manager()
+        room_id, created = manager.create_room('Ada', max_players=3)
+        ada = (created['player_id'], created['player_token'])
+        bot_id = manager.add_bots(room_id, *ada, count=1, skill=0.7, think_time=10)['bot_ids'][0]
+        manager.start(room_id, *ada)
+        save_snapshot(path, lexicon, [], manager.items())
+        
+        _, rooms = load_snapshot(path, lexicon)
+        room = dict(rooms)[room_id]
+        assert room.bots == {bot_id: (0.7, 10)}
+        room.bots[bot_id] = (0.7, 0.02)  # Keep the test short
+        restored = RoomManager(lexicon, timers=TimerWheel(tick=0.01), leaderboard=Leaderboard(),
+                               secret=manager._secret)
+        restored.restore(rooms)
+        
+        deadline = time.monotonic() + 5
+        while not room.players[bot_id].guesses and not room.is_game_over():
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        assert room.players[bot_id].guesses
+        assert restored.bots.is_bot(room_id, bot_id)
+        assert bot_id not in restored.leaderboard
+        
+        restored.leave(room_id, *ada)
+        assert room_id not in restored
+    
+    def test_add_bots_errors(self):
+        """Test that bots are refused to outsiders, in full rooms and in running games."""
+        manager = self.make_manager()
+        room_id, created = manager.create_room('Ada', max_players=3)
+        ada = (created['player_id'], created['player_token'])
+        
+        with pytest.raises(RoomError) as error:
+            manager.add_bots(room_id, 'stranger', manager.player_token('stranger'))
+        assert error.value.status == 403
+        with pytest.raises(RoomError) as error:
+            manager.add_bots(room_id, *ada, count=3)
+        assert error.value.status == 409
+        manager.add_bots(room_id, *ada, think_time=10)
+        with pytest.raises(RoomError) as error:
+            manager.add_bots(room_id, *ada, count=1)
+        assert error.value.status == 409
+
+
+class TestBotRoutes:
+    """Test cases for the room bots route."""
+    
+    def test_add_bots(self):
+        """Test that bots can be added to a room over the API."""
+        client = create_app({'WORD_LIST': WORD_LIST, 'WARM_UP': False}).test_client()
+        created = client.post('/api/rooms', json={'player_name': 'Ada', 'max_players': 3}).get_json()
+        
+        response = client.post(f"/api/rooms/{created['room_id']}/bots", json={
+            'player_id': created['player_id'], 'player_token': created['player_token'],
+            'skill': 0.8, 'think_time': 2
+        })
+        
+        data = response.get_json()
+        assert response.status_code == 200
+        assert len(data['bot_ids']) == 2
+        assert data['game_state']['game_state'] == 'playing'
+        assert client.post(f"/api/rooms/{created['room_id']}/bots", json={
+            'player_id': created['player_id'], 'player_token': created['player_token'],
+            'skill': 'high'
+        }).status_code == 400
@@ -0,0 +1,143 @@
+"""
+Tests for the daily puzzle Wordle game mode.
+
+This module contains unit tests for the daily answer choice, the shared
+feedback tables and daily games on the server.
+"""
+
+import time
+from datetime import date, timedelta
+
+from src.core.game_engine import score_guess
+from src.game_modes.daily import DAILY_EPOCH, DailyGame, daily_puzzle, utc_today
+from src.server.app import create_app
+from src.server.snapshot import save_snapshot, load_snapshot
+from src.utils.lexicon import Lexicon
+
+
+WORD_LIST = ['HELLO', 'WORLD', 'SPACE', 'BEACH', 'DREAM']
+DAY = date(2024, 3, 1)
+
+
+class TestDailyPuzzle:
+    """Test cases for daily_puzzle."""
+    
+    def test_answer_is_deterministic(self):
+        """Test that separately built lexicons agree on the daily answer."""
+        first = daily_puzzle(Lexicon(WORD_LIST), DAY)
+        second = daily_puzzle(Lexicon(WORD_LIST), DAY)
+        
+        assert first.answer == second.answer
+        assert first.number == second.number
+    
+    def test_answers_cycle_through_lexicon(self):
+        """Test that consecutive days use every word before repeating."""
+        lexicon = Lexicon(WORD_LIST)
+        answers = {daily_puzzle(lexicon, DAY + timedelta(days=i)).answer for i in range(5)}
+        
+        assert answers == set(WORD_LIST)
+    
+    def test_feedback_table(self):
+        """Test that the table holds the score of every word against the answer."""
+        puzzle = daily_puzzle(Lexicon(WORD_LIST), DAY)
+        
+        for word in WORD_LIST:
+            assert puzzle.feedback[word] == score_guess(word, puzzle.answer)
+    
+    def test_puzzle_shared_and_next_day_prebuilt(self):
+        """Test that today's puzzle is cached and tomorrow's is built ahead."""
+        lexicon = Lexicon(WORD_LIST)
+        today = utc_today()
+        
+        puzzle = daily_puzzle(lexicon)
+        
+        assert daily_puzzle(lexicon, today) is puzzle
+        puzzles = lexicon.table('daily_puzzles', dict)
+        deadline = time.monotonic() + 5
+        while today + timedelta(days=1) not in puzzles and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert today + timedelta(days=1) in puzzles
+    
+    def test_build_ahead_stops_at_tomorrow(self):
+        """Test that building ahead caches tomorrow's puzzle and no further."""
+        lexicon = Lexicon(WORD_LIST)
+        today = utc_today()
+        
+        daily_puzzle(lexicon)
+        puzzles = lexicon.table('daily_puzzles', dict)
+        pending = lexicon.table('daily_pending', set)
+        deadline = time.monotonic() + 5
+        while (pending or today + timedelta(days=1) not in puzzles) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        
+        assert not pending
+        assert sorted(puzzles) == [today, today + timedelta(days=1)]
+    
+    def test_other_days_are_not_kept(self):
+        """Test that puzzles far from today are built but not cached."""
+        lexicon = Lexicon(WORD_LIST)
+        
+        puzzle = daily_puzzle(lexicon, DAY)
+        
+        assert puzzle.day == DAY
+        assert DAY not in lexicon.table('daily_puzzles', dict)
+
+
+class TestDailyGame:
+    """Test cases for the DailyGame class."""
+    
+    def test_games_share_answer(self):
+        """Test that every game of the day has the same answer."""
+        lexicon = Lexicon(WORD_LIST)
+        games = [DailyGame(lexicon) for _ in range(3)]
+        for game in games:
+            game.start_game(day=DAY)
+        
+        assert len({game.game.answer for game in games}) == 1
+        assert games[0].get_game_state()['puzzle_number'] == (DAY - DAILY_EPOCH).days
+    
+    def test_guess_uses_shared_feedback(self):
+        """Test that guesses are scored from the puzzle's table."""
+        game = DailyGame(Lexicon(WORD_LIST))
+        game.start_game(day=DAY)
+        answer = game.puzzle.answer
+        wrong = next(word for word in WORD_LIST if word != answer)
+        
+        result = game.make_guess(wrong.lower())
+        
+        assert result['result'] is game.puzzle.feedback[wrong]
+        assert game.make_guess(answer)['is_correct'] is True
+        assert game.get_game_state()['game_state'] == 'won'
+    
+    def test_snapshot_round_trip(self, tmp_path):
+        """Test that a daily game resumes on its own day's puzzle."""
+        lexicon = Lexicon(WORD_LIST)
+        game = DailyGame(lexicon)
+        game.start_game(day=DAY, player_name='Ada')
+        game.make_guess(next(word for word in WORD_LIST if word != game.puzzle.answer))
+        path = str(tmp_path / 'snapshot.bin')
+        
+        save_snapshot(path, lexicon, [('d1', game)])
+        [(_, restored)], _ = load_snapshot(path, lexicon)
+        
+        assert isinstance(restored, DailyGame)
+        assert restored.get_game_state() == game.get_game_state()
+        assert restored.make_guess(game.puzzle.answer)['is_correct'] is True
+
+
+class TestDailyRoute:
+    """Test cases for daily games on the server."""
+    
+    def test_start_daily_game(self):
+        """Test that daily sessions started on the server share today's answer."""
+        app = create_app({'WORD_LIST': WORD_LIST, 'WARM_UP': False})
+        client = app.test_client()
+        
+        ids = [client.post('/api/game/start', json={'mode': 'daily'}).get_json()['session_id']
+               for _ in range(2)]
+        sessions = app.extensions['wordle'].sessions
+        
+        assert sessions[ids[0]].game.answer == sessions[ids[1]].game.answer
+        state = client.get(f'/api/game/state/{ids[0]}').get_json()
+        assert state['puzzle_number'] == (utc_today() - DAILY_EPOCH).days
@@ -0,0 +1,220 @@
+"""
+Tests for Server-Sent Events support.
+
+This module contains unit tests for the event broker, the session
+event stream route and streams detached onto the pooled server's hub.
+"""
+
+import http.client
+import json
+import socket
+import threading
+import time
+import pytest
+from src.server.app import create_app
+from src.server.events import EventBroker, HEARTBEAT, format_sse, room_channel
+from src.server.serving import PooledWSGIServer
+from src.game_modes.multiplayer import MultiplayerGame
+from src.game_modes.server_client import ServerGame
+
+
+WORD_LIST = ['HELLO', 'WORLD', 'SPACE', 'BEACH', 'DREAM']
+
+
+class TestEventBroker:
+    """Test cases for the EventBroker class."""
+    
+    def test_format_sse(self):
+        """Test the SSE wire format."""
+        assert format_sse('state', {'a': 1}, 7) == b'id: 7\nevent: state\ndata: {"a":1}\n\n'
+    
+    def test_publish_without_subscribers_is_dropped(self):
+        """Test that publishing to an unfollowed channel does nothing."""
+        broker = EventBroker()
+        
+        assert broker.publish('session:x', 'state', {}) is None
+        assert not broker.has_subscribers('session:x')
+    
+    def test_stream_yields_initial_then_published_events(self):
+        """Test that subscribers receive the snapshot and later events."""
+        broker = EventBroker(heartbeat_interval=5)
+        stream = broker.stream('session:x', initial=('state', {'v': 0}))
+        
+        assert b'event: state' in next(stream)
+        broker.publish('session:x', 'guess', {'v': 1})
+        
+        assert b'"v":1' in next(stream)
+        stream.close()
+        assert not broker.has_subscribers('session:x')
+    
+    def test_idle_stream_sends_heartbeat(self):
+        """Test that an idle stream emits heartbeats."""
+        broker = EventBroker(heartbeat_interval=0.01)
+        stream = broker.stream('session:x')
+        
+        assert next(stream) == HEARTBEAT
+        stream.close()
+    
+    def test_resume_with_last_event_id(self):
+        """Test that a reconnecting client receives buffered events it missed."""
+        broker = EventBroker(heartbeat_interval=5)
+        follower = broker.stream('session:x')
+        threading.Thread(target=lambda: next(follower)).start()
+        while not broker.has_subscribers('session:x'):
+            pass
+        broker.publish('session:x', 'guess', {'n': 1})
+        broker.publish('session:x', 'guess', {'n': 2})
+        
+        resumed = broker.stream('session:x', last_event_id=1)
+        chunk = next(resumed)
+        
+        assert b'"n":2' in chunk
+        assert b'"n":1' not in chunk
+        resumed.close()
+    
+    def test_close_ends_streams(self):
+        """Test that closing the broker terminates open streams."""
+        broker = EventBroker(heartbeat_interval=5)
+        stream = broker.stream('session:x')
+        broker.close()
+        
+        with pytest.raises(StopIteration):
+            next(stream)
+    
+    def test_bind_room_forwards_multiplayer_events(self):
+        """Test that room events reach the room's channel."""
+        broker = EventBroker(heartbeat_interval=5)
+        game = MultiplayerGame(WORD_LIST, max_rounds=6, max_players=4)
+        broker.bind_room('r1', game)
+        stream = broker.stream(room_channel('r1'), initial=('state', {}))
+        next(stream)
+        
+        game.add_player('player1', 'Alice')
+        
+        assert b'event: player_joined' in next(stream)
+        stream.close()
+
+
+class TestSessionEventRoute:
+    """Test cases for the session SSE route."""
+    
+    def test_unknown_session_returns_404(self):
+        """Test that streaming an unknown session fails fast."""
+        client = ServerGame(WORD_LIST).app.test_client()
+        
+        assert client.get('/api/events/session/missing').status_code == 404
+    
+    def test_stream_receives_guess_events(self):
+        """Test that a guess is pushed to the session's stream."""
+        server = ServerGame(WORD_LIST)
+        client = server.app.test_client()
+        session_id = client.post('/api/game/start', json={}).get_json()['session_id']
+        
+        response = client.get(f'/api/events/session/{session_id}', buffered=False)
+        chunks = iter(response.response)
+        
+        assert response.mimetype == 'text/event-stream'
+        assert b'event: state' in next(chunks)
+        client.post('/api/game/guess', json={'session_id': session_id, 'guess': 'WORLD'})
+        assert b'"guesses":["WORLD"]' in next(chunks)
+        response.close()
+
+
+class EventStreamClient:
+    """Blocking reader of one event stream on a real server."""
+    
+    def __init__(self, port: int, path: str):
+        self.sock = socket.create_connection(('127.0.0.1', port), timeout=5)
+        self.sock.sendall(f'GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n'.encode('ascii'))
+        self.buffer = b''
+        while b'\r\n\r\n' not in self.buffer:
+            self.buffer += self.sock.recv(4096)
+        self.head, self.buffer = self.buffer.split(b'\r\n\r\n', 1)
+    
+    def event(self) -> bytes:
+        """Read the next event or heartbeat."""
+        while b'\n\n' not in self.buffer:
+            data = self.sock.recv(4096)
+            if not data:
+                raise ConnectionError('Stream closed')
+            self.buffer += data
+        event, self.buffer = self.buffer.split(b'\n\n', 1)
+        return event + b'\n\n'
+    
+    def close(self):
+        self.sock.close()
+
+
+@pytest.fixture
+def served():
+    """Run the game app on a two-thread pooled server."""
+    app = create_app({'WORD_LIST': WORD_LIST, 'WARM_UP': False, 'SSE_HEARTBEAT': 0.05})
+    server = PooledWSGIServer('127.0.0.1', 0, app, threads=2, graceful_timeout=2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield app, server.bound_port
+    app.extensions['wordle'].drain()
+    server.stop()
+    thread.join(5)
+
+
+def request(port: int, method: str, path: str, body=None):
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+    connection.request(method, path, json.dumps(body) if body is not None else None,
+                       {'Content-Type': 'application/json'})
+    response = connection.getresponse()
+    data = json.loads(response.read())
+    connection.close()
+    return response.status, data
+
+
+class TestDetachedStreams:
+    """Test cases for event streams served by the hub thread."""
+    
+    def test_streams_hold_no_worker(self, served):
+        """Test that open streams leave the workers free for other requests."""
+        app, port = served
+        _, started = request(port, 'POST', '/api/game/start', {})
+        session_id = started['session_id']
+        streams = [EventStreamClient(port, f'/api/events/session/{session_id}') for _ in range(3)]
+        
+        status, _ = request(port, 'GET', '/api/health')
+        request(port, 'POST', '/api/game/guess', {'session_id': session_id, 'guess': 'WORLD'})
+        
+        assert status == 200
+        for stream in streams:
+            assert stream.head.startswith(b'HTTP/1.1 200')
+            assert b'text/event-stream' in stream.head
+            assert b'Transfer-Encoding' not in stream.head
+            assert b'event: state' in stream.event()
+            event = stream.event()
+            while event == HEARTBEAT:
+                event = stream.event()
+            assert b'"guesses":["WORLD"]' in event
+            stream.close()
+    
+    def test_heartbeats_and_close(self, served):
+        """Test that idle streams get heartbeats and are counted until they close."""
+        app, port = served
+        _, created = request(port, 'POST', '/api/rooms', {'player_name': 'Ada'})
+        stream = EventStreamClient(port, f"/api/events/room/{created['room_id']}?player_id="
+                                         f"{created['player_id']}&player_token={created['player_token']}")
+        broker = app.extensions['wordle'].events
+        
+        assert b'event: state' in stream.event()
+        assert stream.event() == HEARTBEAT
+        assert broker.subscriber_count() == 1
+        stream.close()
+        deadline = time.monotonic() + 5
+        while broker.subscriber_count():
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+    
+    def test_unknown_room(self, served):
+        """Test that an unknown room is refused before subscribing."""
+        app, port = served
+        
+        status, _ = request(port, 'GET', '/api/events/room/nope?player_id=p&player_token=t')
+        
+        assert status == 404
+        assert app.extensions['wordle'].events.subscriber_count() == 0
@@ -5,7 +5,9 @@ This module contains unit tests for the core game engine functionality.
 """
 
 import pytest
-from src.core.game_engine import WordleGame, GameState, LetterResult
+from src.core.game_engine import (
+    WordleGame, GameState, LetterResult, encode_result, score_code, score_guess
+)
 
 
 class TestWordleGame:
@@ -131,6 +133,14 @@ class TestLetterResult:
         assert str(LetterResult.HIT.value) == 'hit'
         assert str(LetterResult.PRESENT.value) == 'present'
         assert str(LetterResult.MISS.value) == 'miss'
+    
+    def test_score_code_matches_result(self):
+        """Test that score_code gives the pattern code of score_guess."""
+        words = ['HELLO', 'WORLD', 'LLAMA', 'ALLOW', 'SPEED', 'ERASE', 'EERIE', 'LEVEL']
+        
+        for guess in words:
+            for answer in words:
+                assert score_code(guess, answer) == encode_result(score_guess(guess, answer))
 
 
 class TestGameState:
@@ -0,0 +1,68 @@
+"""
+Tests for the load generator.
+
+This module contains tests for latency statistics and a short run of
+virtual players against an in-process server.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from src.server.app import create_app
+from src.server.serving import PooledWSGIServer
+from src.tools.load_generator import EndpointStats, LoadGenerator
+
+
+WORD_LIST = ['HELLO', 'WORLD', 'SPACE', 'BEACH', 'DREAM']
+
+
+class TestEndpointStats:
+    """Test cases for the EndpointStats class."""
+    
+    def test_percentiles(self):
+        """Test nearest-rank percentiles."""
+        stats = EndpointStats()
+        for ms in range(1, 101):
+            stats.record(200, ms / 1000)
+        
+        assert stats.percentile(0.50) == pytest.approx(0.050)
+        assert stats.percentile(0.99) == pytest.approx(0.099)
+        assert stats.percentile(1.0) == pytest.approx(0.100)
+        assert stats.statuses[200] == 100
+    
+    def test_empty(self):
+        """Test that an endpoint without requests reports zero."""
+        assert EndpointStats().percentile(0.99) == 0.0
+
+
+class TestLoadGenerator:
+    """Test cases for the LoadGenerator class."""
+    
+    def test_short_run(self):
+        """Test that virtual players complete games over keep-alive connections."""
+        app = create_app({
+            'WORD_LIST': WORD_LIST,
+            'START_RATE': 1000,
+            'START_BURST': 1000,
+            'WARM_UP': False
+        })
+        server = PooledWSGIServer('127.0.0.1', 0, app, threads=2)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            generator = LoadGenerator(
+                f"http://127.0.0.1:{server.bound_port}", WORD_LIST,
+                players=3, duration=0.5, cheating_ratio=0.5, seed=7
+            )
+            asyncio.run(generator.run())
+        finally:
+            server.stop()
+            thread.join(5)
+        
+        summary = generator.summary()
+        assert summary['start']['requests'] > 0
+        assert summary['guess']['requests'] >= summary['start']['requests'] - 3
+        for row in summary.values():
+            assert set(row['statuses']) <= {200}
+        assert 'p99 ms' in generator.format_report()
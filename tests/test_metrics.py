@@ -0,0 +1,140 @@
+"""
+Tests for metrics collection and the metrics endpoint.
+
+This module contains unit tests for the lock-free metric types, the
+Prometheus text rendering and the server's /metrics route.
+"""
+
+import threading
+import pytest
+from src.utils.metrics import MetricsRegistry, CacheStats, Histogram
+from src.game_modes.server_client import ServerGame
+
+
+WORD_LIST = ['HELLO', 'WORLD', 'SPACE', 'BEACH', 'DREAM']
+
+
+class TestMetricTypes:
+    """Test cases for counters, gauges and histograms."""
+    
+    def test_counter_sums_across_threads(self):
+        """Test that per-thread cells add up to the exact total."""
+        registry = MetricsRegistry()
+        counter = registry.counter('test_total', 'Test counter')
+        
+        def work():
+            for _ in range(1000):
+                counter.inc()
+        
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert counter.value() == 8000
+    
+    def test_gauge_inc_and_dec(self):
+        """Test that a gauge goes up and down."""
+        gauge = MetricsRegistry().gauge('test_gauge', 'Test gauge')
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+        
+        assert gauge.value() == 1
+    
+    def test_histogram_buckets_are_cumulative(self):
+        """Test bucket placement and cumulative counts."""
+        histogram = Histogram(buckets=(1, 5))
+        for value in (0.5, 3, 3, 10):
+            histogram.observe(value)
+        
+        buckets, count, total = histogram.snapshot()
+        
+        assert buckets == [(1, 1), (5, 3), (float('inf'), 4)]
+        assert count == 4
+        assert total == 16.5
+    
+    def test_labels_must_match(self):
+        """Test that the wrong number of label values is rejected."""
+        family = MetricsRegistry().counter('test_total', 'Test', ('route',))
+        
+        with pytest.raises(ValueError):
+            family.labels('a', 'b')
+    
+    def test_conflicting_kind_is_rejected(self):
+        """Test that a name cannot be reused for another metric type."""
+        registry = MetricsRegistry()
+        registry.counter('test_metric', 'Test')
+        
+        with pytest.raises(ValueError):
+            registry.gauge('test_metric', 'Test')
+    
+    def test_cache_stats_hit_ratio(self):
+        """Test the cache hit ratio helper."""
+        stats = CacheStats(MetricsRegistry(), 'test')
+        assert stats.hit_ratio() is None
+        
+        stats.hit()
+        stats.hit()
+        stats.hit()
+        stats.miss()
+        
+        assert stats.hit_ratio() == 0.75
+
+
+class TestRendering:
+    """Test cases for the Prometheus text format."""
+    
+    def test_render_counter_with_labels(self):
+        """Test rendering of a labelled counter."""
+        registry = MetricsRegistry()
+        registry.counter('test_total', 'Test counter', ('route',)).labels('/a').inc(2)
+        
+        text = registry.render()
+        
+        assert '# TYPE test_total counter' in text
+        assert 'test_total{route="/a"} 2' in text
+    
+    def test_render_histogram(self):
+        """Test rendering of histogram buckets, count and sum."""
+        registry = MetricsRegistry()
+        registry.histogram('test_seconds', 'Test', buckets=(0.1,)).observe(0.05)
+        
+        text = registry.render()
+        
+        assert 'test_seconds_bucket{le="0.1"} 1' in text
+        assert 'test_seconds_bucket{le="+Inf"} 1' in text
+        assert 'test_seconds_count 1' in text
+    
+    def test_render_function_metrics(self):
+        """Test gauges and counters computed at scrape time."""
+        registry = MetricsRegistry()
+        registry.gauge_function('test_size', 'Size', lambda: 3)
+        registry.counter_function('test_evictions_total', 'Evictions', lambda: 7)
+        
+        text = registry.render()
+        
+        assert 'test_size 3' in text
+        assert '# TYPE test_evictions_total counter' in text
+
+
+class TestMetricsEndpoint:
+    """Test cases for the server's /metrics route."""
+    
+    def test_metrics_endpoint_reports_routes_and_engine(self):
+        """Test that request latency, sessions and engine counters are exposed."""
+        server = ServerGame(WORD_LIST)
+        client = server.app.test_client()
+        session_id = client.post('/api/game/start', json={}).get_json()['session_id']
+        client.post('/api/game/guess', json={'session_id': session_id, 'guess': 'WORLD'})
+        
+        response = client.get('/metrics')
+        text = response.get_data(as_text=True)
+        
+        assert response.status_code == 200
+        assert response.mimetype == 'text/plain'
+        assert 'wordle_http_request_duration_seconds_count{route="/api/game/guess",method="POST"} 1' in text
+        assert 'wordle_sessions_active 1' in text
+        assert 'wordle_guesses_scored_total' in text
+        assert 'wordle_http_requests_in_flight 1' in text
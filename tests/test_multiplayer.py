@@ -275,6 +275,117 @@ class TestMultiplayerGame:
         
         # Player1 should be the winner
         assert game.get_winner() == 'player1'
+    
+    def test_state_is_cached_until_changed(self):
+        """Test that the room state is rebuilt only for changed players."""
+        game = MultiplayerGame(['HELLO', 'WORLD', 'SPACE'], max_rounds=6, max_players=4)
+        game.add_player('player1', 'Alice')
+        game.add_player('player2', 'Bob')
+        game.start_game()
+        game.answer = 'HELLO'
+        
+        first = game.get_game_state()
+        second = game.get_game_state()
+        assert second['players'] is first['players']
+        
+        game.make_guess('WORLD', 'player1')
+        third = game.get_game_state()
+        
+        assert third['state_version'] > first['state_version']
+        assert third['players'][0]['guesses_made'] == 1
+        assert first['players'][0]['guesses_made'] == 0
+        assert third['players'][1] is first['players'][1]
+        assert game.get_player_state('player2')['game_state']['players'] is third['players']
+    
+    def test_state_follows_room_changes(self):
+        """Test that joins, leaves and the end of the game show in the state."""
+        game = MultiplayerGame(['HELLO', 'WORLD', 'SPACE'], max_rounds=6, max_players=4)
+        game.add_player('player1', 'Alice')
+        game.add_player('player2', 'Bob')
+        game.get_game_state()
+        
+        game.add_player('player3', 'Cy')
+        assert game.get_game_state()['player_count'] == 3
+        game.remove_player('player3')
+        assert [p['id'] for p in game.get_game_state()['players']] == ['player1', 'player2']
+        
+        game.start_game()
+        game.answer = 'HELLO'
+        game.make_guess('HELLO', 'player2')
+        state = game.get_game_state()
+        
+        assert state['is_game_over'] is True
+        assert state['answer'] == 'HELLO'
+        assert state['players'][1]['has_won'] is True
+    
+    def test_large_room_rounds(self):
+        """Test that a 1000-player round ends once every player has guessed."""
+        game = MultiplayerGame(['HELLO', 'WORLD', 'SPACE'], max_rounds=6, max_players=1000)
+        for i in range(1000):
+            game.add_player(f'p{i}', f'Player {i}')
+        game.start_game()
+        game.answer = 'HELLO'
+        
+        for i in range(999):
+            game.make_guess('WORLD', f'p{i}')
+        assert game.current_round == 0
+        assert game.round_guesses == 999
+        
+        game.remove_player('p0')
+        game.make_guess('SPACE', 'p999')
+        
+        assert game.current_round == 1
+        assert game.round_guesses == 0
+        assert game.players['p1']['results'][0] is game.players['p2']['results'][0]
+    
+    def test_player_records(self):
+        """Test that player records are slotted and readable by field name."""
+        game = MultiplayerGame(['HELLO', 'WORLD', 'SPACE'], max_rounds=6, max_players=4)
+        game.add_player('player1', 'Alice')
+        player = game.players['player1']
+        
+        player['score'] = 7
+        
+        assert player.score == 7
+        assert not hasattr(player, '__dict__')
+        with pytest.raises(KeyError):
+            player['missing']
+    
+    def test_missed_round_eliminates(self):
+        """Test that players who let a round end without guessing are counted out and cannot guess."""
+        game = MultiplayerGame(['HELLO', 'WORLD', 'SPACE'], max_rounds=6, max_players=3)
+        for i in range(3):
+            game.add_player(f'p{i}', f'Player {i}')
+        game.start_game(answer='HELLO')
+        game.make_guess('WORLD', 'p0')
+        game.make_guess('WORLD', 'p1')
+        game.expire_round(0)
+        
+        assert game.eliminated == 1
+        assert game.get_game_state()['eliminated_players'] == 1
+        assert game.make_guess('SPACE', 'p2')['success'] is False
+        
+        game.make_guess('SPACE', 'p0')
+        game.make_guess('SPACE', 'p1')
+        assert game.current_round == 2
+        
+        game.remove_player('p2')
+        assert game.eliminated == 0
+    
+    def test_game_ends_once_everyone_is_eliminated(self):
+        """Test that a round nobody guessed in ends the game."""
+        game = MultiplayerGame(['HELLO', 'WORLD', 'SPACE'], max_rounds=6, max_players=2)
+        game.add_player('p0', 'Alice')
+        game.add_player('p1', 'Bob')
+        game.start_game(answer='HELLO')
+        game.make_guess('WORLD', 'p0')
+        
+        game.expire_round(0)
+        game.expire_round(1)
+        
+        assert game.is_game_over()
+        assert game.current_round == 2
+        assert game.get_winner() == 'p0'
 
 
 if __name__ == '__main__':
@@ -0,0 +1,99 @@
+"""
+Tests for sampled request profiling.
+
+This module contains tests for the RequestProfiler class and the admin
+profile route.
+"""
+
+import marshal
+
+from src.server.app import create_app
+from src.server.profiling import RequestProfiler
+
+
+WORD_LIST = ['HELLO', 'WORLD', 'SPACE', 'BEACH', 'DREAM']
+
+
+def make_client(**config):
+    """Create a test client for an app with the given settings."""
+    settings = {'WORD_LIST': WORD_LIST, 'WARM_UP': False}
+    settings.update(config)
+    return create_app(settings).test_client()
+
+
+def play(client, games=2):
+    """Start a few games and make one guess in each."""
+    for _ in range(games):
+        session_id = client.post('/api/game/start', json={}).get_json()['session_id']
+        client.post('/api/game/guess', json={'session_id': session_id, 'guess': 'HELLO'})
+        client.get(f'/api/game/state/{session_id}')
+
+
+class TestRequestProfiler:
+    """Test cases for the RequestProfiler class."""
+    
+    def test_sampling_rate(self):
+        """Test that one request in every sample_rate is profiled."""
+        profiler = RequestProfiler(4)
+        decisions = [profiler.should_sample() for _ in range(12)]
+        
+        assert decisions.count(True) == 3
+        assert decisions[0] is True
+    
+    def test_empty_report(self):
+        """Test that a profiler without samples reports nothing."""
+        profiler = RequestProfiler(1)
+        
+        assert profiler.report() == "No samples collected\n"
+        assert profiler.dump() == b''
+
+
+class TestProfileRoute:
+    """Test cases for the /api/admin/profile route."""
+    
+    def test_disabled_by_default(self):
+        """Test that the route is unavailable unless profiling is enabled."""
+        client = make_client()
+        
+        assert client.get('/api/admin/profile').status_code == 404
+    
+    def test_text_report(self):
+        """Test that sampled game requests show up in the text report."""
+        client = make_client(PROFILE_SAMPLE_RATE=1)
+        play(client)
+        
+        response = client.get('/api/admin/profile?route=make_guess&sort=tottime&limit=500')
+        
+        assert response.status_code == 200
+        assert response.mimetype == 'text/plain'
+        text = response.get_data(as_text=True)
+        assert 'make_guess=2' in text
+        assert 'score_guess' in text
+    
+    def test_pstats_dump_and_reset(self):
+        """Test the binary pstats format and clearing the statistics."""
+        client = make_client(PROFILE_SAMPLE_RATE=1)
+        play(client, games=1)
+        
+        response = client.get('/api/admin/profile?format=pstats&reset=1')
+        
+        assert response.mimetype == 'application/octet-stream'
+        stats = marshal.loads(response.data)
+        assert any(name == 'score_guess' for _, _, name in stats)
+        assert 'Samples: none' in client.get('/api/admin/profile').get_data(as_text=True)
+    
+    def test_invalid_arguments(self):
+        """Test that unknown routes and sort keys are rejected."""
+        client = make_client(PROFILE_SAMPLE_RATE=1)
+        play(client, games=1)
+        
+        assert client.get('/api/admin/profile?route=health_check').status_code == 400
+        assert client.get('/api/admin/profile?sort=bogus').status_code == 400
+    
+    def test_admin_only(self):
+        """Test that the profile route checks the admin token."""
+        client = make_client(PROFILE_SAMPLE_RATE=1, ADMIN_TOKEN='secret')
+        
+        assert client.get('/api/admin/profile').status_code == 403
+        response = client.get('/api/admin/profile', headers={'X-Admin-Token': 'secret'})
+        assert response.status_code == 200
@@ -0,0 +1,124 @@
+"""
+Tests for incrementally maintained rankings.
+
+This module contains unit tests for the indexed skip list and the
+Leaderboard, including its snapshots.
+"""
+
+import bisect
+import random
+
+import pytest
+
+from src.game_modes.multiplayer import MultiplayerGame
+from src.utils.ranking import IndexedSkipList, Leaderboard
+
+
+class TestIndexedSkipList:
+    """Test cases for the IndexedSkipList class."""
+    
+    def test_matches_sorted_list(self):
+        """Test order, positions and lookups against a sorted list under churn."""
+        rng = random.Random(3)
+        skip_list = IndexedSkipList(seed=5)
+        reference = []
+        for step in range(5000):
+            if reference and rng.random() < 0.4:
+                key = rng.choice(reference)
+                skip_list.remove(key)
+                reference.remove(key)
+            else:
+                key = rng.random()
+                skip_list.insert(key)
+                bisect.insort(reference, key)
+            
+            if step % 250 == 0:
+                assert list(skip_list) == reference
+                for i in range(0, len(reference), 5):
+                    assert skip_list[i] == reference[i]
+                    assert skip_list.index(reference[i]) == i
+                middle = len(reference) // 2
+                assert list(skip_list.iter_from(middle)) == reference[middle:]
+        assert len(skip_list) == len(reference)
+    
+    def test_missing_keys(self):
+        """Test that missing keys and positions raise."""
+        skip_list = IndexedSkipList()
+        skip_list.insert(1)
+        
+        with pytest.raises(KeyError):
+            skip_list.remove(2)
+        with pytest.raises(KeyError):
+            skip_list.index(0)
+        with pytest.raises(IndexError):
+            skip_list[1]
+
+
+class TestLeaderboard:
+    """Test cases for the Leaderboard class."""
+    
+    def test_ranks_follow_updates(self):
+        """Test that ranks and the top list follow score changes."""
+        board = Leaderboard()
+        board.update('ada', 10)
+        board.update('bob', 20)
+        board.update('cy', 15)
+        
+        assert board.top(2) == [('bob', 20), ('cy', 15)]
+        assert board.rank('ada') == 3
+        
+        board.add('ada', 15)
+        
+        assert board.top() == [('ada', 25), ('bob', 20), ('cy', 15)]
+        assert board.rank('bob') == 2
+        assert board.top(2, start=1) == [('bob', 20), ('cy', 15)]
+    
+    def test_ties(self):
+        """Test that ties go to the lower tiebreak, then to the earlier arrival."""
+        board = Leaderboard()
+        board.update('ada', 10, 3)
+        board.update('bob', 10, 2)
+        board.update('cy', 10, 3)
+        
+        assert [member for member, _ in board.top()] == ['bob', 'ada', 'cy']
+    
+    def test_remove(self):
+        """Test that removed members are no longer ranked."""
+        board = Leaderboard()
+        board.update('ada', 1)
+        board.update('bob', 2)
+        
+        assert board.remove('bob') is True
+        assert board.remove('bob') is False
+        assert board.rank('bob') is None
+        assert board.rank('ada') == 1
+        assert len(board) == 1
+    
+    def test_save_and_load(self, tmp_path):
+        """Test that a saved leaderboard loads with the same order and scores."""
+        board = Leaderboard()
+        for i in range(1000):
+            board.add(f'p{i % 300}', i % 17)
+        path = str(tmp_path / 'leaderboard.bin')
+        
+        assert board.save(path) == 300
+        loaded = Leaderboard.load(path)
+        
+        assert loaded.top() == board.top()
+        assert loaded.rank('p7') == board.rank('p7')
+    
+    def test_room_leaderboard(self):
+        """Test that a room's leaderboard is kept ranked as players score."""
+        game = MultiplayerGame(['HELLO', 'WORLD', 'HELPS', 'SPACE'], max_rounds=6)
+        game.add_player('p1', 'Ada')
+        game.add_player('p2', 'Bob')
+        game.start_game()
+        game.answer = 'HELLO'
+        
+        game.make_guess('SPACE', 'p1')
+        game.make_guess('HELPS', 'p2')
+        leaderboard = game.get_leaderboard()
+        
+        assert [entry['player_id'] for entry in leaderboard] == ['p2', 'p1']
+        assert [entry['rank'] for entry in leaderboard] == [1, 2]
+        assert leaderboard[0]['score'] == game.players['p2']['score']
@@ -0,0 +1,220 @@
+"""
+Tests for multiplayer room event logs.
+
+This module contains unit tests for writing, reading and replaying room
+logs, and for recovering rooms when the app starts.
+"""
+
+import os
+
+import pytest
+
+from src.core.game_engine import encode_result, score_guess
+from src.game_modes.multiplayer import MultiplayerGame
+from src.server.app import create_app
+from src.server.room_log import RoomLog, read_room_log, replay_room_log
+from src.utils.lexicon import Lexicon
+
+
+WORD_LIST = ['HELLO', 'WORLD', 'SPACE', 'BEACH', 'DREAM']
+
+
+def room_state(room):
+    state = room.get_game_state()
+    del state['remaining_time']
+    return state
+
+
+def play(room):
+    """Join three players, start and make some guesses and changes."""
+    room.add_player('p2', 'Bob')
+    room.add_player('p3', 'Cy')
+    room.start_game(answer='HELLO')
+    room.make_guess('WORLD', 'p1')
+    room.make_guess('SPACE', 'p2')
+    room.expire_round(0)
+    room.make_guess('BEACH', 'p2')
+    room.remove_player('p3')
+    room.make_guess('DREAM', 'p1')
+
+
+class TestRoomLog:
+    """Test cases for the RoomLog class."""
+    
+    def setup_method(self):
+        self.lexicon = Lexicon(WORD_LIST)
+    
+    def new_room(self, log, room_id='room_a'):
+        room = MultiplayerGame(self.lexicon, max_rounds=6, max_players=4)
+        room.add_player('p1', 'Ada')
+        log.attach(room_id, room)
+        return room
+    
+    def test_replay_rebuilds_room(self, tmp_path):
+        """Test that replaying a log gives back the room as it was."""
+        log = RoomLog(str(tmp_path), self.lexicon)
+        room = self.new_room(log)
+        play(room)
+        log.flush()
+        
+        replayed, closed = replay_room_log(log.path('room_a'), self.lexicon)
+        
+        assert closed is False
+        assert room_state(replayed) == room_state(room)
+        assert replayed.players['p1']['guesses'] == ['WORLD', 'DREAM']
+        assert replayed.get_leaderboard() == room.get_leaderboard()
+    
+    def test_replay_keeps_bots(self, tmp_path):
+        """Test that a replayed room knows which players are bots, with their settings."""
+        log = RoomLog(str(tmp_path), self.lexicon, checkpoint_interval=2)
+        room = self.new_room(log)
+        room.set_bot('b1', 0.5, 3.0)
+        room.add_player('b1', 'Bot 2')
+        room.set_bot('b2', 1.0, 1.0)
+        room.add_player('b2', 'Bot 3')
+        room.remove_player('b2')
+        log.flush()
+        
+        replayed, _ = replay_room_log(log.path('room_a'), self.lexicon)
+        
+        assert replayed.bots == {'b1': (0.5, 3.0)}
+    
+    def test_records_for_analytics(self, tmp_path):
+        """Test that the records of a kept closed log can be read back with words and patterns."""
+        log = RoomLog(str(tmp_path), self.lexicon, keep_closed=True)
+        room = self.new_room(log)
+        play(room)
+        log.close('room_a', room)
+        
+        records = list(read_room_log(log.closed_path('room_a'), self.lexicon))
+        
+        actions = [record[0] for record in records]
+        assert actions == ['checkpoint', 'join', 'join', 'start', 'guess', 'guess',
+                           'expire', 'guess', 'leave', 'guess', 'close']
+        assert records[4][2:] == ('p1', 'WORLD', encode_result(score_guess('WORLD', 'HELLO')))
+        assert records[8][2:] == ('p3',)
+    
+    def test_guess_records_are_small(self, tmp_path):
+        """Test that each guess adds 18 bytes to the log."""
+        log = RoomLog(str(tmp_path), self.lexicon)
+        room = self.new_room(log)
+        room.add_player('p2', 'Bob')
+        room.start_game(answer='HELLO')
+        log.flush()
+        size = os.path.getsize(log.path('room_a'))
+        
+        room.make_guess('WORLD', 'p1')
+        log.flush()
+        
+        assert os.path.getsize(log.path('room_a')) - size == 18
+    
+    def test_checkpoints(self, tmp_path):
+        """Test that checkpoints are written periodically and replays start from the last one."""
+        log = RoomLog(str(tmp_path), self.lexicon, checkpoint_interval=3)
+        room = self.new_room(log)
+        play(room)
+        log.flush()
+        
+        records = list(read_room_log(log.path('room_a'), self.lexicon))
+        checkpoints = [i for i, record in enumerate(records) if record[0] == 'checkpoint']
+        replayed, _ = replay_room_log(log.path('room_a'), self.lexicon)
+        
+        assert len(checkpoints) == 3
+        assert len(records) - checkpoints[-1] - 1 <= 3
+        assert room_state(replayed) == room_state(room)
+    
+    def test_cut_log(self, tmp_path):
+        """Test that a record cut short by a crash is ignored."""
+        log = RoomLog(str(tmp_path), self.lexicon)
+        room = self.new_room(log)
+        room.add_player('p2', 'Bob')
+        room.start_game(answer='HELLO')
+        log.flush()
+        expected = room_state(room)
+        room.make_guess('WORLD', 'p1')
+        log.flush()
+        
+        path = log.path('room_a')
+        with open(path, 'r+b') as f:
+            f.truncate(os.path.getsize(path) - 5)
+        replayed, _ = replay_room_log(path, self.lexicon)
+        
+        assert room_state(replayed) == expected
+    
+    def test_recover_open_rooms(self, tmp_path):
+        """Test that only rooms that were not closed are recovered."""
+        log = RoomLog(str(tmp_path), self.lexicon)
+        open_room = self.new_room(log, 'room_open')
+        open_room.add_player('p2', 'Bob')
+        closed_room = self.new_room(log, 'room_closed')
+        log.close('room_closed', closed_room)
+        log.shutdown()
+        
+        recovered = RoomLog(str(tmp_path), self.lexicon).recover()
+        
+        assert [room_id for room_id, _ in recovered] == ['room_open']
+        assert list(recovered[0][1].players) == ['p1', 'p2']
+    
+    def test_closed_logs_are_deleted(self, tmp_path):
+        """Test that closing a room deletes its log, and recovery retires closed logs."""
+        log = RoomLog(str(tmp_path), self.lexicon)
+        room = self.new_room(log)
+        room.add_player('p2', 'Bob')
+        log.close('room_a', room)
+        kept = RoomLog(str(tmp_path), self.lexicon, keep_closed=True)
+        kept.close('room_b', self.new_room(kept, 'room_b'))
+        os.replace(kept.closed_path('room_b'), kept.path('room_b'))
+        
+        assert not os.path.exists(log.path('room_a'))
+        assert RoomLog(str(tmp_path), self.lexicon).recover() == []
+        assert os.listdir(tmp_path) == ['closed']
+    
+    def test_open_files_are_bounded(self, tmp_path):
+        """Test that logging many rooms keeps a bounded number of files open."""
+        log = RoomLog(str(tmp_path), self.lexicon, max_open_files=8, buffer_size=64)
+        rooms = {f'room_{i}': self.new_room(log, f'room_{i}') for i in range(50)}
+        for room in rooms.values():
+            play(room)
+        
+        assert log.open_files() <= 8
+        log.shutdown()
+        assert log.open_files() == 0
+        recovered = dict(RoomLog(str(tmp_path), self.lexicon).recover())
+        assert len(recovered) == 50
+        assert all(room_state(recovered[room_id]) == room_state(room)
+                   for room_id, room in rooms.items())
+    
+    def test_other_word_list(self, tmp_path):
+        """Test that a log cannot be read with another word list."""
+        log = RoomLog(str(tmp_path), self.lexicon)
+        self.new_room(log)
+        log.shutdown()
+        
+        with pytest.raises(ValueError):
+            list(read_room_log(log.path('room_a'), Lexicon(WORD_LIST[:4])))
+
+
+class TestRoomRecovery:
+    """Test cases for recovering rooms when the app starts."""
+    
+    def test_rooms_survive_a_crash(self, tmp_path):
+        """Test that a new app replays the rooms a crashed app left open."""
+        config = {'WORD_LIST': WORD_LIST, 'WARM_UP': False, 'ROOM_LOG_DIR': str(tmp_path)}
+        app = create_app(config)
+        client = app.test_client()
+        created = client.post('/api/rooms', json={'player_name': 'Ada', 'max_players': 2}).get_json()
+        room_id = created['room_id']
+        client.post(f'/api/rooms/{room_id}/join', json={'player_name': 'Bob'})
+        client.post(f'/api/rooms/{room_id}/guess', json={
+            'player_id': created['player_id'], 'player_token': created['player_token'], 'guess': 'WORLD'
+        })
+        before = client.get(f'/api/rooms/{room_id}').get_json()['state']
+        # A crash: buffered records were flushed, but nothing was closed
+        app.extensions['wordle'].room_log.flush()
+        
+        recovered = create_app(config).test_client()
+        after = recovered.get(f'/api/rooms/{room_id}').get_json()['state']
+        
+        assert after['players'] == before['players']
+        assert after['current_round'] == before['current_round']
+        assert after['state_version'] == before['state_version']
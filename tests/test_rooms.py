@@ -0,0 +1,329 @@
+"""
+Tests for multiplayer room hosting.
+
+This module contains unit tests for the RoomManager and the room API routes.
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.server.app import create_app
+from src.server.rooms import RoomError, RoomManager
+from src.utils.lexicon import Lexicon
+from src.utils.timer_wheel import TimerWheel
+
+
+WORD_LIST = ['HELLO', 'WORLD', 'SPACE', 'BEACH', 'DREAM']
+
+
+def make_manager(**options) -> RoomManager:
+    return RoomManager(Lexicon(WORD_LIST), **options)
+
+
+class TestRoomManager:
+    """Test cases for the RoomManager class."""
+    
+    def test_create_and_join(self):
+        """Test that a room starts once its last seat is taken."""
+        manager = make_manager(max_players=2)
+        room_id, created = manager.create_room('Ada')
+        
+        joined = manager.join(room_id, 'Bob')
+        
+        assert created['success'] and joined['success']
+        assert joined['game_state']['player_count'] == 2
+        assert manager.rooms[room_id].answer is not None
+        with pytest.raises(RoomError) as error:
+            manager.join(room_id, 'Cy')
+        assert error.value.status == 409
+    
+    def test_unknown_room(self):
+        """Test that operations on a missing room raise a 404 RoomError."""
+        manager = make_manager()
+        
+        with pytest.raises(RoomError) as error:
+            manager.guess('missing', 'p1', manager.player_token('p1'), 'HELLO')
+        assert error.value.status == 404
+    
+    def test_guess_before_start(self):
+        """Test that guesses are refused until the game has started."""
+        manager = make_manager()
+        room_id, created = manager.create_room('Ada')
+        
+        with pytest.raises(RoomError):
+            manager.guess(room_id, created['player_id'], created['player_token'], 'HELLO')
+    
+    def test_actions_need_the_player_token(self):
+        """Test that a player id alone cannot act for, read or remove a player."""
+        manager = make_manager(max_players=2)
+        room_id, ada = manager.create_room('Ada')
+        bob = manager.join(room_id, 'Bob')
+        
+        for action in (lambda token: manager.guess(room_id, ada['player_id'], token, 'HELLO'),
+                       lambda token: manager.state(room_id, ada['player_id'], token),
+                       lambda token: manager.leave(room_id, ada['player_id'], token)):
+            for token in (None, 'forged', bob['player_token']):
+                with pytest.raises(RoomError) as error:
+                    action(token)
+                assert error.value.status == 403
+        
+        assert ada['player_token'] != bob['player_token']
+        assert manager.guess(room_id, ada['player_id'], ada['player_token'], 'HELLO')['success']
+    
+    def test_existing_id_needs_its_token(self):
+        """Test that joining under an existing player id needs that player's token."""
+        manager = make_manager()
+        _, ada = manager.create_room('Ada')
+        room_id, _ = manager.create_room('Bob')
+        
+        with pytest.raises(RoomError) as error:
+            manager.join(room_id, 'Mallory', ada['player_id'])
+        assert error.value.status == 403
+        joined = manager.join(room_id, 'Ada', ada['player_id'], ada['player_token'])
+        assert joined['player_id'] == ada['player_id']
+        assert joined['player_token'] == ada['player_token']
+    
+    def test_create_rolls_back_when_binding_fails(self):
+        """Test that a room whose log cannot be created is not left registered."""
+        def on_create(room_id, room):
+            raise OSError(24, 'Too many open files')
+        manager = make_manager(on_create=on_create)
+        
+        with pytest.raises(RoomError) as error:
+            manager.create_room('Ada')
+        
+        assert error.value.status == 503
+        assert len(manager) == 0
+        assert manager.lobby_size() == 0
+    
+    def test_quick_match_fills_oldest_room(self):
+        """Test that quick match fills rooms in order and opens new ones when full."""
+        manager = make_manager(max_players=3)
+        
+        placements = [manager.quick_match(f'P{i}')[0] for i in range(7)]
+        
+        assert placements[:3] == [placements[0]] * 3
+        assert placements[3:6] == [placements[3]] * 3
+        assert len(set(placements)) == 3
+        assert manager.rooms[placements[0]].answer is not None
+        assert manager.lobby_size() == 1
+    
+    def test_quick_match_skips_started_rooms(self):
+        """Test that rooms started early are not offered by quick match."""
+        manager = make_manager(max_players=4)
+        room_id, first = manager.quick_match('Ada')
+        manager.quick_match('Bob')
+        manager.start(room_id, first['player_id'], first['player_token'])
+        
+        other_id, _ = manager.quick_match('Cy')
+        
+        assert other_id != room_id
+        assert manager.lobby_size() == 1
+    
+    def test_last_player_out_closes_room(self):
+        """Test that an empty room is removed from the manager and the lobby."""
+        manager = make_manager()
+        room_id, created = manager.quick_match('Ada')
+        
+        manager.leave(room_id, created['player_id'], created['player_token'])
+        
+        assert room_id not in manager
+        assert manager.lobby_size() == 0
+        assert manager.quick_match('Bob')[0] != room_id
+    
+    def test_idle_rooms_reclaimed(self):
+        """Test that idle rooms are closed and skipped by quick match."""
+        evicted = []
+        manager = make_manager(shard_count=1, idle_timeout=0.05,
+                               on_evict=lambda room_id, room: evicted.append(room_id))
+        room_id, _ = manager.quick_match('Ada')
+        
+        time.sleep(0.1)
+        other_id, _ = manager.create_room('Bob')
+        
+        assert evicted == [room_id]
+        assert room_id not in manager
+        assert manager.quick_match('Cy')[0] == other_id
+    
+    def test_rounds_expire_without_requests(self):
+        """Test that the timer wheel advances quiet rounds and ends the game."""
+        manager = make_manager(max_players=2, timers=TimerWheel(tick=0.01))
+        room_id, created = manager.create_room('Ada')
+        room = manager.rooms[room_id]
+        room.round_duration = 0.05
+        room.max_rounds = 2
+        manager.join(room_id, 'Bob')
+        guess = next(word for word in WORD_LIST if word != room.answer)
+        manager.guess(room_id, created['player_id'], created['player_token'], guess)
+        
+        deadline = time.monotonic() + 5
+        while not room.is_game_over() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        
+        assert room.is_game_over()
+        assert room.current_round == 2
+        assert len(manager.timers) == 0
+    
+    def test_concurrent_quick_match(self):
+        """Test that concurrent quick matches never overfill a room."""
+        manager = make_manager(max_players=4, shard_count=4)
+        placements = []
+        
+        def play(n):
+            for i in range(50):
+                placements.append(manager.quick_match(f'{n}-{i}')[0])
+        
+        threads = [threading.Thread(target=play, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(placements) == 400
+        assert len(manager) == 100
+        assert all(len(room.players) == 4 for _, room in manager.items())
+
+
+class TestRoomRoutes:
+    """Test cases for the room API routes."""
+    
+    def setup_method(self):
+        """Set up a test client."""
+        self.app = create_app({'WORD_LIST': WORD_LIST, 'WARM_UP': False,
+                               'START_RATE': 1000, 'START_BURST': 1000})
+        self.client = self.app.test_client()
+        self.server = self.app.extensions['wordle']
+    
+    def test_play_room(self):
+        """Test creating, joining and winning a room over the API."""
+        created = self.client.post('/api/rooms', json={'player_name': 'Ada', 'max_players': 2})
+        room_id = created.get_json()['room_id']
+        ada = created.get_json()['player_id']
+        token = created.get_json()['player_token']
+        joined = self.client.post(f'/api/rooms/{room_id}/join', json={'player_name': 'Bob'})
+        answer = self.server.rooms.rooms[room_id].answer
+        
+        guess = self.client.post(f'/api/rooms/{room_id}/guess',
+                                 json={'player_id': ada, 'player_token': token, 'guess': answer.lower()})
+        state = self.client.get(f'/api/rooms/{room_id}?player_id={ada}&player_token={token}')
+        
+        assert created.status_code == 201
+        assert joined.get_json()['game_state']['player_count'] == 2
+        assert guess.get_json()['is_correct'] is True
+        assert state.get_json()['state']['has_won'] is True
+    
+    def test_room_errors(self):
+        """Test that room errors are JSON responses with their status."""
+        missing = self.client.post('/api/rooms/nope/guess', json={
+            'player_id': 'p', 'player_token': 't', 'guess': 'HELLO'
+        })
+        incomplete = self.client.post('/api/rooms/nope/guess', json={})
+        
+        assert missing.status_code == 404
+        assert missing.get_json()['error'] == 'Room not found'
+        assert incomplete.status_code == 400
+    
+    def test_player_routes_need_token(self):
+        """Test that per-player routes refuse missing and forged tokens."""
+        created = self.client.post('/api/rooms', json={'player_name': 'Ada'}).get_json()
+        room_id, ada = created['room_id'], created['player_id']
+        
+        missing = self.client.post(f'/api/rooms/{room_id}/leave', json={'player_id': ada})
+        forged = self.client.get(f'/api/rooms/{room_id}?player_id={ada}&player_token=x')
+        summary = self.client.get(f'/api/rooms/{room_id}')
+        
+        assert missing.status_code == 400
+        assert forged.status_code == 403
+        assert summary.status_code == 200
+        assert room_id in self.server.rooms
+    
+    def test_room_size_config(self):
+        """Test that the default room size and the size limit come from the config."""
+        app = create_app({'WORD_LIST': WORD_LIST, 'WARM_UP': False,
+                          'ROOM_MAX_PLAYERS': 6, 'ROOM_PLAYER_LIMIT': 8})
+        client = app.test_client()
+        
+        default = client.post('/api/rooms', json={'player_name': 'Ada'}).get_json()
+        too_big = client.post('/api/rooms', json={'player_name': 'Bob', 'max_players': 9})
+        
+        assert default['game_state']['max_players'] == 6
+        assert too_big.status_code == 400
+        with pytest.raises(ValueError):
+            make_manager(max_players=9, player_limit=8)
+    
+    def test_quick_match_route(self):
+        """Test that quick match places players in a shared room."""
+        first = self.client.post('/api/rooms/quickmatch', json={'player_name': 'Ada'}).get_json()
+        second = self.client.post('/api/rooms/quickmatch', json={'player_name': 'Bob'}).get_json()
+        
+        assert first['room_id'] == second['room_id']
+        assert first['player_id'] != second['player_id']
+    
+    def test_global_leaderboard(self, tmp_path):
+        """Test that points from every room add up on the global leaderboard."""
+        ada = {}
+        for opponent in ('Bob', 'Cy'):
+            created = self.client.post('/api/rooms', json={
+                'player_name': 'Ada', 'max_players': 2, **ada
+            }).get_json()
+            ada = {'player_id': created['player_id'], 'player_token': created['player_token']}
+            room_id = created['room_id']
+            self.client.post(f'/api/rooms/{room_id}/join', json={'player_name': opponent})
+            answer = self.server.rooms.rooms[room_id].answer
+            self.client.post(f'/api/rooms/{room_id}/guess', json={**ada, 'guess': answer})
+        ada = ada['player_id']
+        
+        top = self.client.get('/api/leaderboard?limit=5').get_json()
+        rank = self.client.get(f'/api/leaderboard/{ada}').get_json()
+        
+        assert top['leaderboard'][0] == {'rank': 1, 'player_id': ada, 'score': 100}
+        assert rank['rank'] == 1 and rank['score'] == 100
+        assert self.client.get('/api/leaderboard/nobody').status_code == 404
+        
+        path = str(tmp_path / 'leaderboard.bin')
+        self.server.leaderboard_path = path
+        self.server.save_leaderboard()
+        app = create_app({'WORD_LIST': WORD_LIST, 'WARM_UP': False, 'LEADERBOARD_PATH': path})
+        assert app.extensions['wordle'].leaderboard.score(ada) == 100
+    
+    def test_rooms_in_snapshot(self, tmp_path):
+        """Test that rooms survive a snapshot and restore."""
+        path = str(tmp_path / 'snapshot.bin')
+        created = self.client.post('/api/rooms', json={'player_name': 'Ada'}).get_json()
+        self.server.save_snapshot(path)
+        
+        app = create_app({'WORD_LIST': WORD_LIST, 'WARM_UP': False, 'SNAPSHOT_PATH': path})
+        rooms = app.extensions['wordle'].rooms
+        
+        assert created['room_id'] in rooms
+        assert rooms.quick_match('Bob')[0] == created['room_id']
+    
+    def test_tokens_survive_restore(self, tmp_path):
+        """Test that restored rooms accept the tokens issued before the restart."""
+        path = str(tmp_path / 'snapshot.bin')
+        config = {'WORD_LIST': WORD_LIST, 'WARM_UP': False, 'SNAPSHOT_PATH': path}
+        before = create_app(config)
+        client = before.test_client()
+        created = client.post('/api/rooms', json={'player_name': 'Ada', 'max_players': 2}).get_json()
+        client.post(f"/api/rooms/{created['room_id']}/join", json={'player_name': 'Bob'})
+        before.extensions['wordle'].drain()
+        before.extensions['wordle'].save_snapshot()
+        
+        after = create_app(config).test_client()
+        guess = after.post(f"/api/rooms/{created['room_id']}/guess", json={
+            'player_id': created['player_id'], 'player_token': created['player_token'],
+            'guess': 'WORLD'
+        })
+        
+        assert guess.status_code == 200
+        assert guess.get_json()['success'] is True
+    
+    def test_configured_token_secret(self):
+        """Test that a configured secret signs the same tokens in every process."""
+        config = {'WORD_LIST': WORD_LIST, 'WARM_UP': False, 'PLAYER_TOKEN_SECRET': 'shh'}
+        first = create_app(config).extensions['wordle'].rooms
+        second = create_app(config).extensions['wordle'].rooms
+        
+        assert first.player_token('player_1') == second.player_token('player_1')
@@ -11,6 +11,8 @@ from unittest.mock import patch, MagicMock
 from src.game_modes.server_client import ServerGame, ClientGame
 from src.game_modes.single_player import SinglePlayerGame
 from src.game_modes.cheating_host import CheatingHostGame
+from src.server.app import create_app
+from src.server.serving import PooledWSGIServer
 
 
 class TestServerGame:
@@ -74,7 +76,7 @@ class TestClientGame:
         assert state['remaining_rounds'] == 6
         assert state['is_game_over'] is False
     
-    @patch('src.game_modes.server_client.requests.get')
+    @patch('src.game_modes.server_client.requests.Session.request')
     def test_client_make_request_get(self, mock_get):
         """Test that the client can make GET requests."""
         word_list = ['HELLO', 'WORLD', 'PYTHON']
@@ -89,9 +91,10 @@ class TestClientGame:
         result = client._make_request('/api/health', 'GET')
         
         assert result == {'status': 'success'}
-        mock_get.assert_called_once_with('http://localhost:5000/api/health')
+        mock_get.assert_called_once_with('GET', 'http://localhost:5000/api/health',
+                                         json=None, timeout=client.timeout)
     
-    @patch('src.game_modes.server_client.requests.post')
+    @patch('src.game_modes.server_client.requests.Session.request')
     def test_client_make_request_post(self, mock_post):
         """Test that the client can make POST requests."""
         word_list = ['HELLO', 'WORLD', 'PYTHON']
@@ -107,9 +110,10 @@ class TestClientGame:
         result = client._make_request('/api/test', 'POST', data)
         
         assert result == {'status': 'success'}
-        mock_post.assert_called_once_with('http://localhost:5000/api/test', json=data)
+        mock_post.assert_called_once_with('POST', 'http://localhost:5000/api/test',
+                                          json=data, timeout=client.timeout)
     
-    @patch('src.game_modes.server_client.requests.post')
+    @patch('src.game_modes.server_client.requests.Session.request')
     def test_client_start_game(self, mock_post):
         """Test that the client can start a game."""
         word_list = ['HELLO', 'WORLD', 'PYTHON']
@@ -133,7 +137,7 @@ class TestClientGame:
         assert client.session_id == 'test_session'
         assert client.game_state['game_state'] == 'playing'
     
-    @patch('src.game_modes.server_client.requests.post')
+    @patch('src.game_modes.server_client.requests.Session.request')
     def test_client_make_guess(self, mock_post):
         """Test that the client can make a guess."""
         word_list = ['HELLO', 'WORLD', 'PYTHON']
@@ -178,7 +182,7 @@ class TestServerClientIntegration:
         assert server is not None
         assert client is not None
     
-    @patch('src.game_modes.server_client.requests.get')
+    @patch('src.game_modes.server_client.requests.Session.request')
     def test_client_handles_server_error(self, mock_get):
         """Test that client handles server errors gracefully."""
         word_list = ['HELLO', 'WORLD', 'PYTHON']
@@ -193,5 +197,224 @@ class TestServerClientIntegration:
         assert state == client.game_state
 
 
+class TestVersionedState:
+    """Test cases for versioned game state, ETags and delta responses."""
+    
+    WORD_LIST = ['HELLO', 'WORLD', 'SPACE', 'BEACH', 'DREAM']
+    
+    def _start(self):
+        server = ServerGame(self.WORD_LIST, max_rounds=6, port=5000)
+        client = server.app.test_client()
+        response = client.post('/api/game/start', json={'mode': 'single'})
+        session_id = response.get_json()['session_id']
+        # Pin the answer so the guesses below never end the game
+        server.active_games[session_id].start_game(answer='HELLO')
+        return client, session_id
+    
+    def test_version_increases_on_guess(self):
+        """Test that each successful guess bumps the state version."""
+        client, session_id = self._start()
+        before = client.get(f'/api/game/state/{session_id}').get_json()['state_version']
+        
+        client.post('/api/game/guess', json={'session_id': session_id, 'guess': 'WORLD'})
+        after = client.get(f'/api/game/state/{session_id}').get_json()['state_version']
+        
+        assert after == before + 1
+    
+    def test_if_none_match_returns_304(self):
+        """Test that an unchanged state is answered with 304 Not Modified."""
+        client, session_id = self._start()
+        first = client.get(f'/api/game/state/{session_id}')
+        
+        second = client.get(f'/api/game/state/{session_id}',
+                            headers={'If-None-Match': first.headers['ETag']})
+        
+        assert second.status_code == 304
+        assert second.data == b''
+    
+    def test_etag_changes_after_guess(self):
+        """Test that a guess invalidates the previous ETag."""
+        client, session_id = self._start()
+        etag = client.get(f'/api/game/state/{session_id}').headers['ETag']
+        
+        client.post('/api/game/guess', json={'session_id': session_id, 'guess': 'WORLD'})
+        response = client.get(f'/api/game/state/{session_id}', headers={'If-None-Match': etag})
+        
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+    
+    def test_since_returns_only_new_guesses(self):
+        """Test that since=<version> returns a delta with only the new guesses."""
+        client, session_id = self._start()
+        client.post('/api/game/guess', json={'session_id': session_id, 'guess': 'WORLD'})
+        version = client.get(f'/api/game/state/{session_id}').get_json()['state_version']
+        client.post('/api/game/guess', json={'session_id': session_id, 'guess': 'SPACE'})
+        
+        delta = client.get(f'/api/game/state/{session_id}?since={version}').get_json()
+        
+        assert delta['since'] == version
+        assert delta['guesses'] == ['SPACE']
+        assert len(delta['results']) == 1
+        assert delta['current_round'] == 2
+    
+    def test_delta_has_its_own_etag(self):
+        """Test that a delta and the full state of the same version have different ETags."""
+        client, session_id = self._start()
+        client.post('/api/game/guess', json={'session_id': session_id, 'guess': 'WORLD'})
+        version = client.get(f'/api/game/state/{session_id}').get_json()['state_version']
+        client.post('/api/game/guess', json={'session_id': session_id, 'guess': 'SPACE'})
+        
+        full = client.get(f'/api/game/state/{session_id}')
+        delta = client.get(f'/api/game/state/{session_id}?since={version}')
+        cached = client.get(f'/api/game/state/{session_id}?since={version}',
+                            headers={'If-None-Match': delta.headers['ETag']})
+        
+        assert delta.get_json()['since'] == version
+        assert delta.headers['ETag'] != full.headers['ETag']
+        assert cached.status_code == 304
+        assert cached.headers['ETag'] == delta.headers['ETag']
+    
+    def test_since_before_reset_returns_full_state(self):
+        """Test that a version from before a reset falls back to the full state."""
+        client, session_id = self._start()
+        client.post('/api/game/guess', json={'session_id': session_id, 'guess': 'WORLD'})
+        client.post(f'/api/game/reset/{session_id}')
+        
+        state = client.get(f'/api/game/state/{session_id}?since=1').get_json()
+        
+        assert 'since' not in state
+        assert state['guesses'] == []
+
+
 if __name__ == '__main__':
-    pytest.main([__file__]) 
\ No newline at end of file
+    pytest.main([__file__]) 
+
+class TestPooledClient:
+    """Test cases for the client's pooled, retrying HTTP session."""
+    
+    WORD_LIST = ['HELLO', 'WORLD', 'SPACE', 'BEACH', 'DREAM']
+    
+    def _serve(self, app):
+        """Serve a WSGI app on a free port and return the server."""
+        server = PooledWSGIServer('127.0.0.1', 0, app, threads=2)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+    
+    def test_connection_reused(self):
+        """Test that a whole game is played over a single connection."""
+        app = create_app({'WORD_LIST': self.WORD_LIST, 'WARM_UP': False})
+        server = self._serve(app)
+        url = f"http://127.0.0.1:{server.bound_port}"
+        client = ClientGame(self.WORD_LIST, server_url=url)
+        try:
+            client.start_game()
+            # Pin the answer so none of the guesses ends the game
+            app.extensions['wordle'].sessions[client.session_id].start_game(answer='DREAM')
+            for guess in self.WORD_LIST[:3]:
+                client.make_guess(guess)
+            client.get_game_state(refresh=True)
+            
+            pools = client.session.get_adapter(url).poolmanager.pools
+            [pool] = [pools[key] for key in pools.keys()]
+            assert pool.num_connections == 1
+            assert pool.num_requests == 5
+        finally:
+            client.close()
+            server.stop()
+    
+    def test_idempotent_requests_retried(self):
+        """Test that GET requests are retried on 503 but guesses are not."""
+        calls = {'GET': 0, 'POST': 0}
+        
+        def flaky_app(environ, start_response):
+            method = environ['REQUEST_METHOD']
+            calls[method] += 1
+            if calls[method] <= 2:
+                start_response('503 Service Unavailable', [('Content-Type', 'application/json')])
+                return [b'{"error": "busy"}']
+            start_response('200 OK', [('Content-Type', 'application/json')])
+            return [b'{"game_state": "playing"}']
+        
+        server = self._serve(flaky_app)
+        client = ClientGame(self.WORD_LIST, server_url=f"http://127.0.0.1:{server.bound_port}",
+                            backoff=0)
+        client.session_id = 'retry'
+        try:
+            assert client.get_game_state() == {'game_state': 'playing'}
+            assert calls['GET'] == 3
+            
+            with pytest.raises(RuntimeError):
+                client.make_guess('HELLO')
+            assert calls['POST'] == 1
+        finally:
+            client.close()
+            server.stop()
+
+
+class TestClientLocalState:
+    """Test cases for local validation and cached state in ClientGame."""
+    
+    WORD_LIST = ['HELLO', 'WORLD', 'SPACE', 'BEACH', 'DREAM']
+    
+    def _client(self, **options):
+        client = ClientGame(self.WORD_LIST, server_url='http://localhost:5000', **options)
+        client.session_id = 'test_session'
+        return client
+    
+    def _guess_response(self, is_game_over=False):
+        response = MagicMock()
+        response.json.return_value = {
+            'result': {'success': True, 'result': ['miss'] * 5, 'is_correct': False},
+            'game_state': {'game_state': 'playing', 'current_round': 1,
+                           'remaining_rounds': 5, 'is_game_over': is_game_over}
+        }
+        return response
+    
+    @patch('src.game_modes.server_client.requests.Session.request')
+    def test_invalid_guess_not_sent(self, mock_request):
+        """Test that a word outside the word list is rejected locally."""
+        client = self._client()
+        
+        result = client.make_guess('QUERY')
+        
+        assert result['success'] is False
+        assert result['error'] == 'Invalid guess: QUERY'
+        mock_request.assert_not_called()
+    
+    @patch('src.game_modes.server_client.requests.Session.request')
+    def test_state_served_from_last_guess(self, mock_request):
+        """Test that the state returned by a guess is reused until refreshed."""
+        client = self._client()
+        mock_request.return_value = self._guess_response()
+        
+        client.make_guess('world')
+        state = client.get_game_state()
+        
+        assert state['current_round'] == 1
+        assert mock_request.call_count == 1
+        
+        client.get_game_state(refresh=True)
+        assert mock_request.call_count == 2
+    
+    @patch('src.game_modes.server_client.requests.Session.request')
+    def test_stale_state_refreshed(self, mock_request):
+        """Test that a state older than state_ttl is fetched again."""
+        client = self._client(state_ttl=0)
+        mock_request.return_value = self._guess_response()
+        
+        client.make_guess('WORLD')
+        client.get_game_state()
+        
+        assert mock_request.call_count == 2
+    
+    @patch('src.game_modes.server_client.requests.Session.request')
+    def test_guess_after_game_over_not_sent(self, mock_request):
+        """Test that guesses after the game ended are rejected locally."""
+        client = self._client()
+        mock_request.return_value = self._guess_response(is_game_over=True)
+        
+        client.make_guess('WORLD')
+        result = client.make_guess('SPACE')
+        
+        assert result['error'] == 'Game is already over'
+        assert mock_request.call_count == 1
@@ -0,0 +1,118 @@
+"""
+Tests for the production server.
+
+This module contains tests for keep-alive handling, load shedding and
+graceful shutdown in PooledWSGIServer.
+"""
+
+import http.client
+import socket
+import threading
+import time
+
+import pytest
+from src.server.serving import PooledWSGIServer
+
+
+# Set once a /slow request is being handled
+slow_started = threading.Event()
+
+
+def app(environ, start_response):
+    """Minimal WSGI app: /slow sleeps, /stream has no Content-Length."""
+    path = environ['PATH_INFO']
+    if path == '/slow':
+        slow_started.set()
+        time.sleep(0.3)
+    if path == '/stream':
+        start_response('200 OK', [('Content-Type', 'text/plain')])
+        return [b'one', b'two']
+    start_response('200 OK', [('Content-Type', 'text/plain'), ('Content-Length', '2')])
+    return [b'ok']
+
+
+@pytest.fixture
+def server():
+    """Run a server on a free port for the duration of a test."""
+    server = PooledWSGIServer('127.0.0.1', 0, app, threads=2, keep_alive=2, graceful_timeout=2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.stop()
+    thread.join(5)
+
+
+class TestPooledWSGIServer:
+    """Test cases for the PooledWSGIServer class."""
+    
+    def test_keep_alive_reuses_connection(self, server):
+        """Test that several requests are answered over one connection."""
+        conn = http.client.HTTPConnection('127.0.0.1', server.bound_port)
+        conn.request('GET', '/')
+        conn.getresponse().read()
+        sock = conn.sock
+        
+        for path in ('/', '/stream', '/'):
+            conn.request('GET', path)
+            response = conn.getresponse()
+            assert response.status == 200
+            response.read()
+        
+        assert conn.sock is sock
+    
+    def test_unread_body_is_skipped(self, server):
+        """Test that a body the app ignores does not corrupt the next request."""
+        conn = http.client.HTTPConnection('127.0.0.1', server.bound_port)
+        conn.request('POST', '/', body=b'x' * 1000)
+        assert conn.getresponse().read() == b'ok'
+        
+        conn.request('GET', '/')
+        assert conn.getresponse().read() == b'ok'
+    
+    def test_full_queue_is_shed(self):
+        """Test that connections beyond the queue limit get an immediate 503."""
+        server = PooledWSGIServer('127.0.0.1', 0, app, threads=1, max_queued=1)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            busy = http.client.HTTPConnection('127.0.0.1', server.bound_port)
+            busy.request('GET', '/slow')
+            time.sleep(0.05)
+            queued = socket.create_connection(('127.0.0.1', server.bound_port))
+            time.sleep(0.05)
+            
+            shed = http.client.HTTPConnection('127.0.0.1', server.bound_port)
+            shed.request('GET', '/')
+            assert shed.getresponse().status == 503
+            assert server.rejected == 1
+            
+            queued.close()
+            assert busy.getresponse().read() == b'ok'
+        finally:
+            server.stop()
+            thread.join(5)
+    
+    def test_stop_finishes_in_flight_requests(self, server):
+        """Test that stopping lets a running request complete and closes the connection."""
+        slow_started.clear()
+        conn = http.client.HTTPConnection('127.0.0.1', server.bound_port)
+        conn.request('GET', '/slow')
+        assert slow_started.wait(5)
+        
+        server.stop()
+        response = conn.getresponse()
+        
+        assert response.read() == b'ok'
+        assert response.getheader('Connection') == 'close'
+    
+    def test_stop_closes_idle_connections(self, server):
+        """Test that idle keep-alive connections do not hold up shutdown."""
+        conn = http.client.HTTPConnection('127.0.0.1', server.bound_port)
+        conn.request('GET', '/')
+        conn.getresponse().read()
+        
+        start = time.monotonic()
+        server.stop()
+        while server._workers and any(worker.is_alive() for worker in server._workers):
+            time.sleep(0.01)
+            assert time.monotonic() - start < 1.5
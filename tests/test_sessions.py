@@ -0,0 +1,129 @@
+"""
+Tests for session id generation and the sharded session registry.
+
+This module contains unit tests for the server session infrastructure.
+"""
+
+import threading
+import time
+import pytest
+from src.server.sessions import SessionRegistry, generate_session_id
+
+
+class TestGenerateSessionId:
+    """Test cases for generate_session_id."""
+    
+    def test_session_id_has_prefix(self):
+        """Test that generated ids carry the requested prefix."""
+        session_id = generate_session_id('client')
+        
+        assert session_id.startswith('client_')
+        assert len(session_id) == len('client_') + 26
+    
+    def test_session_ids_are_unique(self):
+        """Test that ids generated in a tight loop never collide."""
+        ids = {generate_session_id() for _ in range(10000)}
+        
+        assert len(ids) == 10000
+    
+    def test_session_ids_sort_by_time(self):
+        """Test that the timestamp prefix orders ids by creation time."""
+        first = generate_session_id()
+        threading.Event().wait(0.002)
+        second = generate_session_id()
+        
+        assert first[:18] <= second[:18]
+
+
+class TestSessionRegistry:
+    """Test cases for the SessionRegistry class."""
+    
+    def test_registry_behaves_like_dict(self):
+        """Test basic mapping operations."""
+        registry = SessionRegistry(shard_count=4)
+        registry['a'] = 1
+        registry['b'] = 2
+        
+        assert len(registry) == 2
+        assert 'a' in registry
+        assert registry['b'] == 2
+        assert registry.get('missing') is None
+        assert sorted(registry.keys()) == ['a', 'b']
+        
+        del registry['a']
+        assert 'a' not in registry
+        assert registry.pop('b') == 2
+        assert len(registry) == 0
+    
+    def test_shard_count_rounds_to_power_of_two(self):
+        """Test that the shard count is rounded up to a power of two."""
+        registry = SessionRegistry(shard_count=5)
+        
+        assert registry.shard_count == 8
+    
+    def test_invalid_shard_count(self):
+        """Test that a non-positive shard count is rejected."""
+        with pytest.raises(ValueError):
+            SessionRegistry(shard_count=0)
+    
+    def test_add_does_not_overwrite(self):
+        """Test that add refuses to replace an existing session."""
+        registry = SessionRegistry()
+        
+        assert registry.add('session', 'first') is True
+        assert registry.add('session', 'second') is False
+        assert registry['session'] == 'first'
+    
+    def test_concurrent_inserts(self):
+        """Test that concurrent inserts from many threads are all kept."""
+        registry = SessionRegistry()
+        
+        def insert_many():
+            for _ in range(500):
+                registry[generate_session_id()] = True
+        
+        threads = [threading.Thread(target=insert_many) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(registry) == 4000
+        assert sum(registry.shard_sizes()) == 4000
+    
+    def test_idle_sessions_are_evicted(self):
+        """Test that sessions idle past the timeout are evicted and counted."""
+        evicted = []
+        registry = SessionRegistry(shard_count=1, idle_timeout=0.01,
+                                   on_evict=lambda session_id, game: evicted.append(session_id))
+        registry['old'] = 1
+        time.sleep(0.02)
+        registry['new'] = 2
+        
+        assert 'old' not in registry
+        assert 'new' in registry
+        assert registry.evictions == 1
+        assert evicted == ['old']
+    
+    def test_access_keeps_session_alive(self):
+        """Test that reading a session refreshes its idle timer."""
+        registry = SessionRegistry(shard_count=1, idle_timeout=0.5)
+        registry['a'] = 1
+        registry['b'] = 2
+        time.sleep(0.3)
+        registry.get('a')
+        time.sleep(0.3)
+        
+        assert registry.evict_idle() == 1
+        assert 'a' in registry
+        assert 'b' not in registry
+    
+    def test_touch_skips_removed_sessions(self):
+        """Test that recording an access does not resurrect a removed session's timer."""
+        registry = SessionRegistry(shard_count=1, idle_timeout=5)
+        registry['a'] = 1
+        del registry['a']
+        
+        registry._touch(0, 'a')
+        
+        assert registry._last_access[0] == {}
@@ -0,0 +1,135 @@
+"""
+Tests for session snapshots and drain mode.
+
+This module contains tests for saving and restoring games of every mode
+and for draining the server before a restart.
+"""
+
+import os
+
+import pytest
+from src.server.app import create_app
+from src.server.snapshot import save_snapshot, load_snapshot
+from src.utils.lexicon import Lexicon
+from src.game_modes.single_player import SinglePlayerGame
+from src.game_modes.cheating_host import CheatingHostGame
+from src.game_modes.multiplayer import MultiplayerGame
+
+
+WORD_LIST = ['HELLO', 'WORLD', 'SPACE', 'BEACH', 'DREAM']
+
+
+def round_trip(tmp_path, lexicon, sessions, rooms=()):
+    """Save games to a snapshot and load them back."""
+    path = str(tmp_path / 'snapshot.bin')
+    save_snapshot(path, lexicon, sessions, rooms)
+    return load_snapshot(path, lexicon)
+
+
+class TestSnapshot:
+    """Test cases for save_snapshot and load_snapshot."""
+    
+    def test_single_player_round_trip(self, tmp_path):
+        """Test that a single player game resumes where it left off."""
+        lexicon = Lexicon(WORD_LIST)
+        game = SinglePlayerGame(lexicon)
+        game.start_game(answer='HELLO', player_name='Ada')
+        game.make_guess('WORLD')
+        
+        [(session_id, restored)], _ = round_trip(tmp_path, lexicon, [('s1', game)])
+        
+        assert session_id == 's1'
+        assert restored.get_game_state() == game.get_game_state()
+        assert restored.make_guess('HELLO')['is_correct'] is True
+    
+    def test_cheating_host_round_trip(self, tmp_path):
+        """Test that the cheating host keeps its remaining candidates."""
+        lexicon = Lexicon(WORD_LIST)
+        fresh = CheatingHostGame(lexicon)
+        fresh.start_game()
+        guessed = CheatingHostGame(lexicon)
+        guessed.start_game()
+        guessed.make_guess('HELLO')
+        
+        sessions, _ = round_trip(tmp_path, lexicon, [('a', fresh), ('b', guessed)])
+        restored = dict(sessions)
+        
+        assert restored['a'].candidate_words == fresh.candidate_words
+        assert restored['b'].candidate_words == guessed.candidate_words
+        assert restored['b'].get_game_state() == guessed.get_game_state()
+    
+    def test_multiplayer_round_trip(self, tmp_path):
+        """Test that a multiplayer room keeps its players and progress."""
+        lexicon = Lexicon(WORD_LIST)
+        room = MultiplayerGame(lexicon, max_players=2)
+        room.add_player('p1', 'Alice')
+        room.add_player('p2', 'Bob')
+        room.start_game()
+        room.make_guess('WORLD' if room.answer != 'WORLD' else 'HELLO', 'p1')
+        
+        _, [(room_id, restored)] = round_trip(tmp_path, lexicon, [], [('r1', room)])
+        
+        assert room_id == 'r1'
+        assert restored.answer == room.answer
+        assert restored.players['p1']['guesses'] == room.players['p1']['guesses']
+        assert restored.players['p1']['results'] == room.players['p1']['results']
+        assert restored.players['p2']['score'] == 0
+    
+    def test_different_word_list_rejected(self, tmp_path):
+        """Test that a snapshot cannot be restored on another word list."""
+        path = str(tmp_path / 'snapshot.bin')
+        save_snapshot(path, Lexicon(WORD_LIST), [])
+        
+        with pytest.raises(ValueError):
+            load_snapshot(path, Lexicon(WORD_LIST[:4]))
+
+
+class TestDrain:
+    """Test cases for drain mode and restoring on startup."""
+    
+    def make_app(self, tmp_path, **config):
+        """Create an app with a snapshot path in a temporary directory."""
+        settings = {
+            'WORD_LIST': WORD_LIST,
+            'WARM_UP': False,
+            'SNAPSHOT_PATH': str(tmp_path / 'sessions.bin')
+        }
+        settings.update(config)
+        return create_app(settings)
+    
+    def test_drain_stops_new_games(self, tmp_path):
+        """Test that a drained server refuses new games but finishes running ones."""
+        client = self.make_app(tmp_path).test_client()
+        session_id = client.post('/api/game/start', json={}).get_json()['session_id']
+        
+        response = client.post('/api/admin/drain')
+        assert response.status_code == 200
+        assert response.get_json()['active_games'] == 1
+        
+        assert client.post('/api/game/start', json={}).status_code == 503
+        assert client.get('/api/health').get_json()['status'] == 'draining'
+        guess = client.post('/api/game/guess', json={'session_id': session_id, 'guess': 'HELLO'})
+        assert guess.status_code == 200
+    
+    def test_restart_restores_sessions(self, tmp_path):
+        """Test that sessions snapshotted by one app are served by the next."""
+        app = self.make_app(tmp_path)
+        client = app.test_client()
+        session_id = client.post('/api/game/start', json={}).get_json()['session_id']
+        client.post('/api/game/guess', json={'session_id': session_id, 'guess': 'HELLO'})
+        before = client.get(f'/api/game/state/{session_id}').get_json()
+        app.extensions['wordle'].save_snapshot()
+        
+        restarted = self.make_app(tmp_path)
+        after = restarted.test_client().get(f'/api/game/state/{session_id}').get_json()
+        
+        assert after == before
+        assert not os.path.exists(tmp_path / 'sessions.bin')
+    
+    def test_admin_token_required(self, tmp_path):
+        """Test that the drain route checks the admin token when one is set."""
+        client = self.make_app(tmp_path, ADMIN_TOKEN='secret').test_client()
+        
+        assert client.post('/api/admin/drain').status_code == 403
+        response = client.post('/api/admin/drain', headers={'X-Admin-Token': 'secret'})
+        assert response.status_code == 200
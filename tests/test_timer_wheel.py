@@ -0,0 +1,124 @@
+"""
+Tests for the hierarchical timer wheel.
+
+This module contains unit tests for scheduling, cancelling and firing
+timers, driven by a fake clock.
+"""
+
+import random
+import time
+
+from src.utils.timer_wheel import TimerWheel
+
+
+class FakeClock:
+    """Manually advanced clock."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_wheel(**options):
+    clock = FakeClock()
+    return TimerWheel(clock=clock, **options), clock
+
+
+class TestTimerWheel:
+    """Test cases for the TimerWheel class."""
+    
+    def test_fires_after_delay(self):
+        """Test that a timer fires on the first tick at or after its deadline."""
+        wheel, clock = make_wheel(tick=0.1)
+        fired = []
+        wheel.schedule(0.25, fired.append, 'a')
+        
+        clock.now += 0.2
+        wheel.advance()
+        assert fired == []
+        
+        clock.now += 0.2
+        assert wheel.advance() == 1
+        assert fired == ['a']
+        assert len(wheel) == 0
+    
+    def test_cancel(self):
+        """Test that cancelled timers never fire and cancel reports pending state."""
+        wheel, clock = make_wheel(tick=0.1)
+        fired = []
+        timer = wheel.schedule(1, fired.append, 'a')
+        
+        assert wheel.cancel(timer) is True
+        assert wheel.cancel(timer) is False
+        clock.now += 2
+        wheel.advance()
+        
+        assert fired == []
+        assert not timer.pending
+    
+    def test_long_delays_cascade(self):
+        """Test that timers on every level fire in deadline order, never early."""
+        wheel, clock = make_wheel(tick=1, slot_bits=2, levels=3)
+        fired = []
+        delays = [1, 3, 4, 5, 15, 16, 17, 63, 64, 65, 200]
+        for delay in delays:
+            wheel.schedule(delay, lambda d=delay: fired.append((d, clock.now - 1000)))
+        
+        for _ in range(250):
+            clock.now += 1
+            wheel.advance()
+        
+        assert [d for d, _ in fired] == delays
+        assert all(d <= at <= d + 1 for d, at in fired)
+    
+    def test_many_timers(self):
+        """Test that 100k timers with random cancels all fire exactly once."""
+        wheel, clock = make_wheel(tick=0.1)
+        rng = random.Random(7)
+        fired = []
+        timers = [wheel.schedule(rng.uniform(0, 120), fired.append, i) for i in range(100000)]
+        cancelled = set(rng.sample(range(len(timers)), 20000))
+        for i in cancelled:
+            wheel.cancel(timers[i])
+        assert len(wheel) == 80000
+        
+        clock.now += 121
+        wheel.advance()
+        
+        assert len(fired) == 80000
+        assert set(fired).isdisjoint(cancelled)
+        assert len(wheel) == 0
+    
+    def test_callbacks_can_reschedule(self):
+        """Test that a callback may schedule another timer."""
+        wheel, clock = make_wheel(tick=0.1)
+        fired = []
+        
+        def again(n):
+            fired.append(n)
+            if n < 3:
+                wheel.schedule(0.1, again, n + 1)
+        
+        wheel.schedule(0.1, again, 1)
+        for _ in range(10):
+            clock.now += 0.1
+            wheel.advance()
+        
+        assert fired == [1, 2, 3]
+    
+    def test_background_thread(self):
+        """Test that a started wheel fires timers by itself."""
+        wheel = TimerWheel(tick=0.01)
+        fired = []
+        wheel.schedule(0.02, fired.append, 'a')
+        wheel.start()
+        try:
+            deadline = time.monotonic() + 2
+            while not fired and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            wheel.stop()
+        
+        assert fired == ['a']
@@ -0,0 +1,133 @@
+"""
+Tests for tournaments.
+
+This module contains unit tests for the Tournament bracket, match play
+and the TournamentRunner.
+"""
+
+import pytest
+
+from src.game_modes.bots import candidate_tree
+from src.game_modes.tournament import Tournament, TournamentRunner, play_match
+from src.utils.lexicon import Lexicon
+from src.utils.word_loader import get_default_word_list
+
+
+def entrants(count):
+    return [f'e{i}' for i in range(count)]
+
+
+class TestTournament:
+    """Test cases for the Tournament class."""
+    
+    def setup_method(self):
+        self.lexicon = Lexicon(get_default_word_list())
+    
+    def test_bracket(self):
+        """Test that entrants are spread over first-round matches by seed."""
+        tournament = Tournament(entrants(16), self.lexicon, match_size=4, advance=2)
+        
+        ready = tournament.take_ready()
+        
+        assert tournament.rounds == 3
+        assert len(tournament.matches) == 7
+        assert [match.entrants for match in ready] == [
+            ['e0', 'e4', 'e8', 'e12'], ['e1', 'e5', 'e9', 'e13'],
+            ['e2', 'e6', 'e10', 'e14'], ['e3', 'e7', 'e11', 'e15']
+        ]
+        assert all(len(board) == 3 for board in tournament.boards)
+    
+    def test_matches_advance_as_feeders_finish(self):
+        """Test that a match is ready once the matches feeding it are recorded."""
+        tournament = Tournament(entrants(8), self.lexicon, match_size=4, advance=2)
+        first, second = tournament.take_ready()
+        
+        tournament.record(first.match_id, {'e0': 5, 'e2': 9, 'e4': 7, 'e6': 1})
+        assert tournament.take_ready() == []
+        tournament.record(second.match_id, {'e1': 3, 'e3': 3, 'e5': 8, 'e7': 2})
+        final, = tournament.take_ready()
+        
+        assert final.entrants == ['e1', 'e2', 'e4', 'e5']
+        tournament.record(final.match_id, {'e1': 1, 'e2': 2, 'e4': 3, 'e5': 0})
+        assert tournament.champion == 'e4'
+        assert tournament.is_finished
+        assert tournament.standings.top(3) == [('e4', 2), ('e2', 1), ('e5', 1)]
+        assert tournament.points['e2'] == 11
+    
+    def test_bye(self):
+        """Test that a lone entrant goes through without a match."""
+        tournament = Tournament(entrants(3), self.lexicon, match_size=2, advance=1)
+        
+        ready = tournament.take_ready()
+        
+        assert [match.entrants for match in ready] == [['e0', 'e2']]
+        tournament.record(ready[0].match_id, {'e0': 1, 'e2': 4})
+        final, = tournament.take_ready()
+        assert final.entrants == ['e1', 'e2']
+    
+    def test_record_errors(self):
+        """Test that only matches being played can be recorded."""
+        tournament = Tournament(entrants(8), self.lexicon)
+        first = tournament.take_ready()[0]
+        tournament.record(first.match_id, {})
+        
+        with pytest.raises(ValueError):
+            tournament.record(first.match_id, {})
+        with pytest.raises(ValueError):
+            tournament.record(len(tournament.matches) - 1, {})
+    
+    def test_invalid_format(self):
+        """Test that invalid entrants and formats are rejected."""
+        with pytest.raises(ValueError):
+            Tournament(['a', 'a'], self.lexicon)
+        with pytest.raises(ValueError):
+            Tournament(entrants(8), self.lexicon, match_size=4, advance=3)
+        with pytest.raises(ValueError):
+            Tournament(entrants(8), self.lexicon, mode='daily')
+
+
+class TestPlayMatch:
+    """Test cases for playing matches."""
+    
+    def setup_method(self):
+        self.tree = candidate_tree(Lexicon(get_default_word_list()))
+    
+    @pytest.mark.parametrize('mode', ['multiplayer', 'single'])
+    def test_match_points(self, mode):
+        """Test that every entrant gets points and a seeded match is repeatable."""
+        spec = (0, mode, ('a', 'b', 'c'), (1.0, 0.5, 0.0), ('ABOUT', 'HOUSE'), 6, 42)
+        
+        points = play_match(self.tree, spec)
+        
+        assert set(points) == {'a', 'b', 'c'}
+        assert points['a'] > 0
+        assert play_match(self.tree, spec) == points
+
+
+class TestTournamentRunner:
+    """Test cases for the TournamentRunner class."""
+    
+    def play(self, workers):
+        lexicon = Lexicon(get_default_word_list())
+        tournament = Tournament(entrants(64), lexicon, boards=2, seed=9)
+        skills = {entrant: i / 63 for i, entrant in enumerate(entrants(64))}
+        runner = TournamentRunner(tournament, skills, workers=workers, batch_size=4)
+        runner.run()
+        return runner
+    
+    def test_inline(self):
+        """Test that a tournament is played through to a champion."""
+        runner = self.play(workers=0)
+        
+        assert runner.tournament.is_finished
+        assert runner.matches_played == 31
+        assert len(runner.tournament.standings) == 64
+    
+    def test_worker_processes(self):
+        """Test that worker processes give the same results as playing inline."""
+        inline = self.play(workers=0)
+        pooled = self.play(workers=2)
+        
+        assert pooled.tournament.champion == inline.tournament.champion
+        assert pooled.tournament.standings.top() == inline.tournament.standings.top()
+        assert pooled.summary()['matches'] == 31
@@ -0,0 +1,223 @@
+"""
+Tests for WebSocket room events.
+
+This module contains unit tests for the frame codec and end-to-end tests
+of room sockets served by PooledWSGIServer.
+"""
+
+import http.client
+import json
+import os
+import socket
+import struct
+import threading
+from urllib.parse import urlencode
+
+import pytest
+
+from src.core.game_engine import score_guess, encode_result
+from src.server.app import create_app
+from src.server.serving import PooledWSGIServer
+from src.server.websocket import (
+    FrameParser, accept_key, compact_event, encode_frame, OP_CLOSE, OP_PING, OP_PONG, OP_TEXT
+)
+
+
+WORD_LIST = ['HELLO', 'WORLD', 'SPACE', 'BEACH', 'DREAM']
+
+
+def mask_frame(opcode: int, payload: bytes, fin: bool = True) -> bytes:
+    """Build a masked client frame."""
+    mask = os.urandom(4)
+    masked = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+    return struct.pack('!BB', (0x80 if fin else 0) | opcode, 0x80 | len(payload)) + mask + masked
+
+
+class WebSocketClient:
+    """Blocking test client for one room socket."""
+    
+    def __init__(self, port: int, room_id: str, player: dict):
+        query = urlencode({'player_id': player.get('player_id', ''),
+                           'player_token': player.get('player_token', '')})
+        self.sock = socket.create_connection(('127.0.0.1', port), timeout=5)
+        self.sock.sendall(
+            f'GET /api/ws/room/{room_id}?{query} HTTP/1.1\r\nHost: localhost\r\n'
+            'Upgrade: websocket\r\nConnection: Upgrade\r\n'
+            'Sec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\nSec-WebSocket-Version: 13\r\n\r\n'
+            .encode('ascii')
+        )
+        self.buffer = b''
+        while b'\r\n\r\n' not in self.buffer:
+            self.buffer += self.sock.recv(4096)
+        self.head, self.buffer = self.buffer.split(b'\r\n\r\n', 1)
+    
+    def _read(self, size: int) -> bytes:
+        while len(self.buffer) < size:
+            data = self.sock.recv(65536)
+            if not data:
+                raise ConnectionError('Socket closed')
+            self.buffer += data
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
+    
+    def frame(self):
+        """Read one server frame as (opcode, payload)."""
+        first, length = self._read(2)
+        if length == 126:
+            length = struct.unpack('!H', self._read(2))[0]
+        elif length == 127:
+            length = struct.unpack('!Q', self._read(8))[0]
+        return first & 0x0F, self._read(length)
+    
+    def event(self):
+        """Read the next text frame as a decoded event."""
+        while True:
+            opcode, payload = self.frame()
+            if opcode == OP_TEXT:
+                return json.loads(payload)
+    
+    def close(self):
+        self.sock.close()
+
+
+@pytest.fixture
+def served():
+    """Run the game app on the pooled server for the duration of a test."""
+    app = create_app({'WORD_LIST': WORD_LIST, 'WARM_UP': False,
+                      'START_RATE': 1000, 'START_BURST': 1000})
+    server = PooledWSGIServer('127.0.0.1', 0, app, threads=4, graceful_timeout=2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield app, server.bound_port
+    app.extensions['wordle'].drain()
+    server.stop()
+    thread.join(5)
+
+
+def post(port: int, path: str, body: dict) -> dict:
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+    connection.request('POST', path, json.dumps(body), {'Content-Type': 'application/json'})
+    response = connection.getresponse()
+    data = json.loads(response.read())
+    connection.close()
+    return data
+
+
+class TestFrames:
+    """Test cases for the handshake and frame codec."""
+    
+    def test_accept_key(self):
+        """Test the handshake example from RFC 6455."""
+        assert accept_key('dGhlIHNhbXBsZSBub25jZQ==') == 's3pPLMBiTxaQ9kYGzzhZRbK+xOo='
+    
+    def test_encode_lengths(self):
+        """Test the three payload length encodings."""
+        assert encode_frame(OP_TEXT, b'hi') == b'\x81\x02hi'
+        assert encode_frame(OP_TEXT, b'x' * 200)[:4] == b'\x81\x7e\x00\xc8'
+        assert encode_frame(OP_TEXT, b'x' * 70000)[:10] == b'\x81\x7f' + struct.pack('!Q', 70000)
+    
+    def test_parser_unmasks_and_reassembles(self):
+        """Test that split, masked and fragmented frames are decoded."""
+        parser = FrameParser()
+        data = (mask_frame(OP_TEXT, b'hel', fin=False) + mask_frame(0, b'lo')
+                + mask_frame(OP_PING, b'p'))
+        
+        messages = parser.feed(data[:5]) + parser.feed(data[5:])
+        
+        assert messages == [(OP_TEXT, b'hello'), (OP_PING, b'p')]
+    
+    def test_parser_rejects_unmasked(self):
+        """Test that unmasked client frames are a protocol error."""
+        with pytest.raises(ValueError):
+            FrameParser().feed(encode_frame(OP_TEXT, b'hi'))
+    
+    def test_compact_guess_event(self):
+        """Test that guess results are sent as pattern codes."""
+        result = score_guess('WORLD', 'HELLO')
+        
+        frame = compact_event('guess', {'player_id': 'p1', 'result': result})
+        
+        message = json.loads(frame[2:])
+        assert message == {'type': 'guess', 'player_id': 'p1', 'pattern': encode_result(result)}
+
+
+class TestRoomSockets:
+    """Test cases for room sockets on the pooled server."""
+    
+    def test_room_events(self, served):
+        """Test that a subscriber gets the room state and then each event."""
+        app, port = served
+        created = post(port, '/api/rooms', {'player_name': 'Ada', 'max_players': 2})
+        room_id = created['room_id']
+        client = WebSocketClient(port, room_id, created)
+        
+        post(port, f'/api/rooms/{room_id}/join', {'player_name': 'Bob'})
+        answer = app.extensions['wordle'].rooms.rooms[room_id].answer
+        post(port, f'/api/rooms/{room_id}/guess', {
+            'player_id': created['player_id'], 'player_token': created['player_token'], 'guess': answer
+        })
+        
+        assert client.head.startswith(b'HTTP/1.1 101')
+        assert b's3pPLMBiTxaQ9kYGzzhZRbK+xOo=' in client.head
+        assert client.event()['type'] == 'state'
+        assert client.event()['type'] == 'player_joined'
+        assert client.event()['type'] == 'game_started'
+        guess = client.event()
+        assert guess['type'] == 'guess' and guess['pattern'] == 242
+        assert client.event() == {'type': 'game_over', 'winner': created['player_id'], 'answer': answer}
+        client.close()
+    
+    def test_fan_out(self, served):
+        """Test that one event reaches every subscriber of a room."""
+        _, port = served
+        created = post(port, '/api/rooms', {'player_name': 'Ada'})
+        room_id = created['room_id']
+        clients = [WebSocketClient(port, room_id, created) for _ in range(50)]
+        for client in clients:
+            assert client.event()['type'] == 'state'
+        
+        post(port, f'/api/rooms/{room_id}/join', {'player_name': 'Bob'})
+        
+        for client in clients:
+            assert client.event()['player_name'] == 'Bob'
+            client.close()
+    
+    def test_ping_and_close(self, served):
+        """Test that pings are answered and a close is echoed."""
+        _, port = served
+        created = post(port, '/api/rooms', {'player_name': 'Ada'})
+        client = WebSocketClient(port, created['room_id'], created)
+        client.event()
+        
+        client.sock.sendall(mask_frame(OP_PING, b'hi'))
+        assert client.frame() == (OP_PONG, b'hi')
+        
+        client.sock.sendall(mask_frame(OP_CLOSE, struct.pack('!H', 1000)))
+        assert client.frame() == (OP_CLOSE, struct.pack('!H', 1000))
+        assert client.sock.recv(1) == b''
+    
+    def test_needs_upgrade(self, served):
+        """Test that plain requests and unknown rooms are refused."""
+        _, port = served
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+        connection.request('GET', '/api/ws/room/nope')
+        assert connection.getresponse().status == 400
+        connection.close()
+        
+        client = WebSocketClient(port, 'nope', {'player_id': 'p', 'player_token': 't'})
+        assert client.head.startswith(b'HTTP/1.1 404')
+        client.close()
+    
+    def test_needs_player_token(self, served):
+        """Test that only players of a room holding their token may follow it."""
+        _, port = served
+        created = post(port, '/api/rooms', {'player_name': 'Ada'})
+        room_id = created['room_id']
+        
+        anonymous = WebSocketClient(port, room_id, {})
+        forged = WebSocketClient(port, room_id, {'player_id': created['player_id'], 'player_token': 'x'})
+        
+        assert anonymous.head.startswith(b'HTTP/1.1 400')
+        assert forged.head.startswith(b'HTTP/1.1 403')
+        anonymous.close()
+        forged.close()
@@ -0,0 +1,183 @@
+"""
+Tests for the game API wire formats.
+
+This module contains unit tests for pattern codes, the MessagePack codec
+and content negotiation on the server routes.
+"""
+
+import gzip
+import json
+import zlib
+
+import pytest
+from src.core.game_engine import LetterResult, encode_result, decode_result
+from src.server import wire
+from src.server.app import create_app
+from src.game_modes.server_client import ServerGame
+
+
+WORD_LIST = ['HELLO', 'WORLD', 'SPACE', 'BEACH', 'DREAM']
+
+
+class TestPatternCodes:
+    """Test cases for result pattern codes."""
+    
+    def test_all_misses_and_all_hits(self):
+        """Test the extreme pattern codes."""
+        assert encode_result([LetterResult.MISS] * 5) == 0
+        assert encode_result([LetterResult.HIT] * 5) == 242
+    
+    def test_round_trip_every_code(self):
+        """Test that every code decodes and re-encodes to itself."""
+        for code in range(243):
+            assert encode_result(decode_result(code)) == code
+    
+    def test_first_position_is_least_significant(self):
+        """Test the documented digit order."""
+        result = [LetterResult.PRESENT] + [LetterResult.MISS] * 4
+        
+        assert encode_result(result) == 1
+
+
+class TestMessagePackCodec:
+    """Test cases for the MessagePack encoder and decoder."""
+    
+    @pytest.mark.parametrize('value', [
+        None, True, False, 0, 127, 128, -1, -33, 70000, -70000, 2 ** 40, -(2 ** 40),
+        1.5, '', 'HELLO', 'x' * 300, b'\x00\x01', [], [1, [2, 3]], list(range(20)),
+        {'a': 1, 'b': [None, 'c']}, {str(i): i for i in range(20)}
+    ])
+    def test_round_trip(self, value):
+        """Test that values survive a pack/unpack round trip."""
+        assert wire.unpackb(wire.packb(value)) == value
+    
+    def test_builtin_codec_matches_spec(self, monkeypatch):
+        """Test the built-in encoder against known MessagePack bytes."""
+        monkeypatch.setattr(wire, '_msgpack', None)
+        
+        assert wire.packb({'a': [1, -1, None]}) == b'\x81\xa1a\x93\x01\xff\xc0'
+        assert wire.unpackb(b'\x81\xa1a\x93\x01\xff\xc0') == {'a': [1, -1, None]}
+    
+    def test_truncated_data_is_rejected(self, monkeypatch):
+        """Test that malformed input raises ValueError."""
+        monkeypatch.setattr(wire, '_msgpack', None)
+        
+        with pytest.raises(ValueError):
+            wire.unpackb(b'\x92\x01')
+    
+    def test_compact_packs_results(self):
+        """Test that compact() replaces results with pattern codes."""
+        payload = {
+            'result': [LetterResult.HIT] * 5,
+            'results': [[LetterResult.MISS] * 5],
+            'guesses': ['HELLO']
+        }
+        
+        assert wire.compact(payload) == {'result': 242, 'results': [0], 'guesses': ['HELLO']}
+
+
+class TestContentNegotiation:
+    """Test cases for response format negotiation on the server."""
+    
+    def _start(self, client, **headers):
+        response = client.post('/api/game/start', json={'mode': 'single'}, headers=headers)
+        assert response.status_code == 200
+        return response
+    
+    def test_json_is_default(self):
+        """Test that clients without an Accept header receive JSON."""
+        client = ServerGame(WORD_LIST).app.test_client()
+        session_id = self._start(client).get_json()['session_id']
+        
+        response = client.post('/api/game/guess', json={'session_id': session_id, 'guess': 'HELLO'})
+        
+        assert response.status_code == 200
+        assert response.mimetype == 'application/json'
+        assert len(response.get_json()['result']['result']) == 5
+    
+    def test_msgpack_when_requested(self):
+        """Test that MessagePack is returned with packed pattern codes."""
+        client = ServerGame(WORD_LIST).app.test_client()
+        session_id = wire.unpackb(
+            self._start(client, Accept='application/msgpack').data
+        )['session_id']
+        
+        response = client.post('/api/game/guess', json={'session_id': session_id, 'guess': 'HELLO'},
+                               headers={'Accept': 'application/msgpack'})
+        payload = wire.unpackb(response.data)
+        
+        assert response.mimetype == 'application/msgpack'
+        assert isinstance(payload['result']['result'], int)
+        assert payload['game_state']['results'] == [payload['result']['result']]
+
+
+class TestCompression:
+    """Test cases for compressed and trimmed responses."""
+    
+    def _play(self, client, guesses, **fields):
+        """Start a game with a known answer, make the guesses and return the last response."""
+        session_id = client.post('/api/game/start', json={}).get_json()['session_id']
+        client.application.extensions['wordle'].sessions[session_id].start_game(answer='HELLO')
+        response = None
+        for guess in guesses:
+            response = client.post('/api/game/guess',
+                                   json=dict(session_id=session_id, guess=guess, **fields))
+        return session_id, response
+    
+    def _client(self):
+        return create_app({'WORD_LIST': WORD_LIST, 'WARM_UP': False,
+                           'COMPRESS_MIN_SIZE': 200}).test_client()
+    
+    def test_gzip_above_threshold(self):
+        """Test that large responses are gzipped when the client accepts it."""
+        client = self._client()
+        session_id, _ = self._play(client, ['WORLD', 'SPACE', 'BEACH'])
+        
+        response = client.get(f'/api/game/state/{session_id}',
+                              headers={'Accept-Encoding': 'gzip, deflate'})
+        
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in response.vary
+        assert response.get_etag()[1] is True
+        assert json.loads(gzip.decompress(response.data))['guesses'] == ['WORLD', 'SPACE', 'BEACH']
+    
+    def test_deflate_and_identity(self):
+        """Test deflate negotiation and uncompressed small or unaccepted bodies."""
+        client = self._client()
+        session_id, _ = self._play(client, ['WORLD', 'SPACE', 'BEACH'])
+        url = f'/api/game/state/{session_id}'
+        
+        deflated = client.get(url, headers={'Accept-Encoding': 'gzip;q=0, deflate'})
+        plain = client.get(url)
+        small = client.get('/api/health', headers={'Accept-Encoding': 'gzip'})
+        
+        assert deflated.headers['Content-Encoding'] == 'deflate'
+        assert json.loads(zlib.decompress(deflated.data)) == plain.get_json()
+        assert 'Content-Encoding' not in plain.headers
+        assert 'Content-Encoding' not in small.headers
+    
+    def test_not_modified_is_not_compressed(self):
+        """Test that a weakened ETag still matches and 304s carry no encoding."""
+        client = self._client()
+        session_id, _ = self._play(client, ['WORLD', 'SPACE', 'BEACH'])
+        url = f'/api/game/state/{session_id}'
+        etag = client.get(url, headers={'Accept-Encoding': 'gzip'}).headers['ETag']
+        
+        response = client.get(url, headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+        
+        assert response.status_code == 304
+        assert 'Content-Encoding' not in response.headers
+    
+    def test_minimal_guess_response(self):
+        """Test that fields=minimal returns the result and counters only."""
+        client = self._client()
+        _, full = self._play(client, ['WORLD', 'SPACE', 'BEACH', 'DREAM'])
+        _, minimal = self._play(client, ['WORLD', 'SPACE', 'BEACH', 'DREAM'], fields='minimal')
+        
+        payload = minimal.get_json()
+        assert 'guesses' not in payload
+        assert payload['result'] == full.get_json()['result']
+        assert payload['current_round'] == 4
+        assert payload['state_version'] == full.get_json()['game_state']['state_version']
+        assert payload['is_game_over'] is False
+        assert len(minimal.data) < len(full.data) / 2